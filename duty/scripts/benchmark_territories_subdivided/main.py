@@ -0,0 +1,139 @@
+"""Duty script to compare spatial predicates on whole and subdivided territories geometries"""
+
+import asyncio
+import time
+from textwrap import dedent
+
+import click
+import structlog
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.sql import text
+
+from idu_api.common.db.connection.manager import PostgresConnectionManager
+from idu_api.urban_api.config import DBConfig, UrbanAPIConfig
+
+PREPARE_STATEMENTS = (
+    # synthetic "region" with a lot of vertices (similar to real territories with detailed borders)
+    """
+    CREATE TEMPORARY TABLE benchmark_territories AS
+    SELECT 1 AS territory_id, ST_Buffer(ST_SetSRID(ST_MakePoint(30.3, 59.9), 4326), 1, :quad_segs) AS geometry
+    """,
+    "CREATE INDEX ON benchmark_territories USING gist (geometry)",
+    """
+    CREATE TEMPORARY TABLE benchmark_territories_subdivided AS
+    SELECT territory_id, ST_Subdivide(geometry, 256) AS geometry
+    FROM benchmark_territories
+    """,
+    "CREATE INDEX ON benchmark_territories_subdivided USING gist (geometry)",
+    """
+    CREATE TEMPORARY TABLE benchmark_points AS
+    SELECT ST_SetSRID(ST_MakePoint(29.3 + random() * 2, 58.9 + random() * 2), 4326) AS geometry
+    FROM generate_series(1, :points)
+    """,
+    "ANALYZE benchmark_territories",
+    "ANALYZE benchmark_territories_subdivided",
+    "ANALYZE benchmark_points",
+)
+
+BENCHMARK_STATEMENTS = {
+    "intersects (whole geometry)": """
+        SELECT count(*)
+        FROM benchmark_points p
+        WHERE EXISTS (SELECT 1 FROM benchmark_territories t WHERE ST_Intersects(t.geometry, p.geometry))
+    """,
+    "intersects (subdivided geometry)": """
+        SELECT count(*)
+        FROM benchmark_points p
+        WHERE EXISTS (SELECT 1 FROM benchmark_territories_subdivided t WHERE ST_Intersects(t.geometry, p.geometry))
+    """,
+    "covers (whole geometry)": """
+        SELECT count(*)
+        FROM benchmark_points p
+        WHERE EXISTS (SELECT 1 FROM benchmark_territories t WHERE ST_Covers(t.geometry, p.geometry))
+    """,
+    "covers (subdivided candidates + whole geometry)": """
+        SELECT count(*)
+        FROM benchmark_points p
+        JOIN benchmark_territories t ON ST_Covers(t.geometry, p.geometry)
+        WHERE t.territory_id IN (
+            SELECT s.territory_id FROM benchmark_territories_subdivided s WHERE ST_Intersects(s.geometry, p.geometry)
+        )
+    """,
+}
+
+
+async def run_benchmark(conn: AsyncConnection, repeats: int, logger: structlog.stdlib.BoundLogger) -> None:
+    """Execute every benchmark statement several times and log the best and the average timings."""
+    for name, statement in BENCHMARK_STATEMENTS.items():
+        timings = []
+        count = None
+        for _ in range(repeats):
+            start = time.perf_counter()
+            count = (await conn.execute(text(dedent(statement)))).scalar_one()
+            timings.append(time.perf_counter() - start)
+        logger.info(
+            "benchmark finished",
+            statement=name,
+            matched=count,
+            best_ms=round(min(timings) * 1000, 2),
+            avg_ms=round(sum(timings) / len(timings) * 1000, 2),
+        )
+
+
+async def async_main(
+    connection_manager: PostgresConnectionManager,
+    logger: structlog.stdlib.BoundLogger,
+    vertices: int,
+    points: int,
+    repeats: int,
+):
+    """Prepare synthetic geometries in temporary tables and run the benchmark."""
+    async with connection_manager.get_connection() as conn:
+        for statement in PREPARE_STATEMENTS:
+            await conn.execute(
+                text(dedent(statement)), {"quad_segs": f"quad_segs={max(vertices // 4, 1)}", "points": points}
+            )
+        pieces = (await conn.execute(text("SELECT count(*) FROM benchmark_territories_subdivided"))).scalar_one()
+        logger.info("prepared benchmark data", vertices=vertices, pieces=pieces, points=points)
+
+        await run_benchmark(conn, repeats, logger)
+        await conn.rollback()
+
+
+@click.command("benchmark-territories-subdivided")
+@click.option(
+    "--config_path",
+    envvar="CONFIG_PATH",
+    default="../../../urban-api.config.yaml",
+    type=click.Path(exists=True, dir_okay=False, path_type=str),
+    show_default=True,
+    show_envvar=True,
+    help="Path to YAML configuration file",
+)
+@click.option("--vertices", type=int, default=200_000, show_default=True, help="Vertices in synthetic territory")
+@click.option("--points", type=int, default=10_000, show_default=True, help="Number of points to check")
+@click.option("--repeats", type=int, default=5, show_default=True, help="Number of runs of every statement")
+def main(config_path: str, vertices: int, points: int, repeats: int):
+    """Run the benchmark-territories-subdivided script using the parameters from the console and loading
+    configuration."""
+    config = UrbanAPIConfig.load(config_path)
+    logger = structlog.getLogger("benchmark-territories-subdivided")
+    connection_manager = PostgresConnectionManager(
+        master=DBConfig(
+            host=config.db.master.host,
+            port=config.db.master.port,
+            database=config.db.master.database,
+            user=config.db.master.user,
+            password=config.db.master.password,
+            pool_size=1,
+        ),
+        replicas=[],
+        logger=logger,
+        application_name="duty_benchmark_territories_subdivided",
+    )
+
+    asyncio.run(async_main(connection_manager, logger, vertices, points, repeats))
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
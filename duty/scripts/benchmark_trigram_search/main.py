@@ -0,0 +1,133 @@
+"""Duty script to compare name search with and without trigram GIN index on a synthetic table"""
+
+import asyncio
+import time
+from textwrap import dedent
+
+import click
+import structlog
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.sql import text
+
+from idu_api.common.db.connection.manager import PostgresConnectionManager
+from idu_api.urban_api.config import DBConfig, UrbanAPIConfig
+
+PREPARE_STATEMENTS = (
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    # synthetic names of three pseudo-words (similar to real objects names like "street house building")
+    """
+    CREATE TEMPORARY TABLE benchmark_names AS
+    SELECT
+        i AS id,
+        concat_ws(
+            ' ',
+            substr(md5(i::text), 1, 6 + i % 5),
+            substr(md5((i * 7)::text), 1, 5 + i % 3),
+            substr(md5((i * 13)::text), 1, 4 + i % 4)
+        ) AS name
+    FROM generate_series(1, :rows) AS i
+    """,
+    "ANALYZE benchmark_names",
+)
+
+INDEX_STATEMENTS = (
+    "CREATE INDEX ON benchmark_names USING gin (name gin_trgm_ops)",
+    "ANALYZE benchmark_names",
+)
+
+BENCHMARK_STATEMENTS = {
+    "substring": "SELECT count(*) FROM benchmark_names WHERE name ILIKE '%' || :query || '%'",
+    "prefix": "SELECT count(*) FROM benchmark_names WHERE name ILIKE :query || '%'",
+    "fuzzy": "SELECT count(*) FROM benchmark_names WHERE name % :query",
+    "ranked substring (top 20)": """
+        SELECT count(*) FROM (
+            SELECT id
+            FROM benchmark_names
+            WHERE name ILIKE '%' || :query || '%'
+            ORDER BY similarity(name, :query) DESC, id
+            LIMIT 20
+        ) AS found
+    """,
+}
+
+
+async def run_benchmark(
+    conn: AsyncConnection, query: str, repeats: int, indexed: bool, logger: structlog.stdlib.BoundLogger
+) -> None:
+    """Execute every benchmark statement several times and log the best and the average timings."""
+    for name, statement in BENCHMARK_STATEMENTS.items():
+        timings = []
+        count = None
+        for _ in range(repeats):
+            start = time.perf_counter()
+            count = (await conn.execute(text(dedent(statement)), {"query": query})).scalar_one()
+            timings.append(time.perf_counter() - start)
+        logger.info(
+            "benchmark finished",
+            statement=name,
+            indexed=indexed,
+            matched=count,
+            best_ms=round(min(timings) * 1000, 2),
+            avg_ms=round(sum(timings) / len(timings) * 1000, 2),
+        )
+
+
+async def async_main(
+    connection_manager: PostgresConnectionManager,
+    logger: structlog.stdlib.BoundLogger,
+    rows: int,
+    query: str | None,
+    repeats: int,
+):
+    """Prepare synthetic names in temporary table and run the benchmark without and with trigram index."""
+    async with connection_manager.get_connection() as conn:
+        for statement in PREPARE_STATEMENTS:
+            await conn.execute(text(dedent(statement)), {"rows": rows})
+        if query is None:
+            # part of an existing name, so that both exact and fuzzy searches find something
+            query = (await conn.execute(text("SELECT substr(name, 2, 5) FROM benchmark_names LIMIT 1"))).scalar_one()
+        logger.info("prepared benchmark data", rows=rows, query=query)
+
+        await run_benchmark(conn, query, repeats, False, logger)
+        for statement in INDEX_STATEMENTS:
+            await conn.execute(text(statement))
+        await run_benchmark(conn, query, repeats, True, logger)
+        await conn.rollback()
+
+
+@click.command("benchmark-trigram-search")
+@click.option(
+    "--config_path",
+    envvar="CONFIG_PATH",
+    default="../../../urban-api.config.yaml",
+    type=click.Path(exists=True, dir_okay=False, path_type=str),
+    show_default=True,
+    show_envvar=True,
+    help="Path to YAML configuration file",
+)
+@click.option("--rows", type=int, default=1_000_000, show_default=True, help="Number of rows in synthetic table")
+@click.option("--query", type=str, default=None, help="Search query (part of a generated name by default)")
+@click.option("--repeats", type=int, default=5, show_default=True, help="Number of runs of every statement")
+def main(config_path: str, rows: int, query: str | None, repeats: int):
+    """Run the benchmark-trigram-search script using the parameters from the console and loading configuration."""
+    config = UrbanAPIConfig.load(config_path)
+    logger = structlog.getLogger("benchmark-trigram-search")
+    connection_manager = PostgresConnectionManager(
+        master=DBConfig(
+            host=config.db.master.host,
+            port=config.db.master.port,
+            database=config.db.master.database,
+            user=config.db.master.user,
+            password=config.db.master.password,
+            pool_size=1,
+        ),
+        replicas=[],
+        logger=logger,
+        application_name="duty_benchmark_trigram_search",
+    )
+
+    asyncio.run(async_main(connection_manager, logger, rows, query, repeats))
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
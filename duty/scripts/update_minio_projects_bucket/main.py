@@ -42,17 +42,17 @@ async def update_project_file_structure(
         # Define image identifier
         image_id = str(uuid.uuid4())
 
-        # Copy existing preview image to new folders and remove old
-        old_key = f"projects/{project_id}/preview.jpg"
+        # Copy existing preview and original images to new folders
+        old_preview_key = f"projects/{project_id}/preview.jpg"
         new_gallery_key = f"{project_id}/gallery/preview/{image_id}.jpg"
-        await minio_client.copy_object(session, old_key, new_gallery_key, logger)
-        await minio_client.delete_file(session, old_key, logger)
+        await minio_client.copy_object(session, old_preview_key, new_gallery_key, logger)
 
-        # Copy existing original image to new folder and remove old
-        old_key = f"projects/{project_id}/image.jpg"
+        old_image_key = f"projects/{project_id}/image.jpg"
         new_gallery_key = f"{project_id}/gallery/original/{image_id}.jpg"
-        await minio_client.copy_object(session, old_key, new_gallery_key, logger)
-        await minio_client.delete_file(session, old_key, logger)
+        await minio_client.copy_object(session, old_image_key, new_gallery_key, logger)
+
+        # Remove old images with a single batched request
+        await minio_client.delete_files(session, [old_preview_key, old_image_key], logger)
 
         # Create metadata.json file
         metadata = {"main_image_id": image_id, "gallery_images": [image_id]}
@@ -4,7 +4,7 @@ from idu_api.city_api.dto.services import CityServiceDTO
 from idu_api.city_api.dto.services_count import ServiceCountDTO
 from idu_api.city_api.services.objects.urban_objects import (
     get_services_by_territory_ids,
-    get_services_types_by_territory_ids,
+    get_services_types_by_territory_id,
 )
 from idu_api.city_api.services.territories.territories import get_ca_territory_by_id, get_territory_ids_by_parent_id
 
@@ -26,7 +26,5 @@ class ServicesService:
         _ = await get_ca_territory_by_id(self.conn, city_id)
         territory = await get_ca_territory_by_id(self.conn, territory_id)
 
-        children: list[int] = await get_territory_ids_by_parent_id(self.conn, territory_id)
-        children.append(territory.territory_id)
-        result: list[ServiceCountDTO] = await get_services_types_by_territory_ids(self.conn, children)
+        result: list[ServiceCountDTO] = await get_services_types_by_territory_id(self.conn, territory.territory_id)
         return result
@@ -1,8 +1,7 @@
 from geoalchemy2.functions import ST_AsGeoJSON
-from sqlalchemy import and_, cast, null, select, text
+from sqlalchemy import and_, cast, null, select
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncConnection
-from sqlalchemy.sql.functions import count
 
 from idu_api.city_api.dto.physical_objects import PhysicalObjectsDTO
 from idu_api.city_api.dto.services import CityServiceDTO
@@ -12,44 +11,36 @@ from idu_api.common.db.entities import (
     physical_objects_data,
     service_types_dict,
     services_data,
+    territory_services_rollup_data,
     urban_objects_data,
 )
 
 
-async def get_services_types_by_territory_ids(
-    conn: AsyncConnection, ids: list[int], service_type: int | None = None
+async def get_services_types_by_territory_id(
+    conn: AsyncConnection, territory_id: int, service_type: int | None = None
 ) -> list[ServiceCountDTO]:
-    statement = select(
-        service_types_dict.c.service_type_id,
-        service_types_dict.c.name,
-        service_types_dict.c.code,
-        service_types_dict.c.urban_function_id,
-        count(text("*")).label("count"),
-    ).select_from(
-        urban_objects_data.join(
-            physical_objects_data, urban_objects_data.c.physical_object_id == physical_objects_data.c.physical_object_id
+    statement = (
+        select(
+            service_types_dict.c.service_type_id,
+            service_types_dict.c.name,
+            service_types_dict.c.code,
+            service_types_dict.c.urban_function_id,
+            territory_services_rollup_data.c.count,
         )
-        .join(
-            object_geometries_data,
-            object_geometries_data.c.object_geometry_id == urban_objects_data.c.object_geometry_id,
-        )
-        .join(services_data, services_data.c.service_id == urban_objects_data.c.service_id)
-        .join(service_types_dict, services_data.c.service_type_id == service_types_dict.c.service_type_id)
-    )
-    if service_type:
-        statement = statement.where(
-            and_(
-                urban_objects_data.c.service_id != null(),
-                object_geometries_data.c.territory_id.in_(ids),
-                services_data.c.service_type_id == service_type,
+        .select_from(
+            territory_services_rollup_data.join(
+                service_types_dict,
+                service_types_dict.c.service_type_id == territory_services_rollup_data.c.service_type_id,
             )
         )
-    else:
-        statement = statement.where(
-            and_(urban_objects_data.c.service_id != null(), object_geometries_data.c.territory_id.in_(ids))
+        .where(
+            territory_services_rollup_data.c.territory_id == territory_id,
+            territory_services_rollup_data.c.count > 0,
         )
+    )
+    if service_type:
+        statement = statement.where(territory_services_rollup_data.c.service_type_id == service_type)
 
-    statement = statement.group_by(service_types_dict.c.service_type_id)
     result = (await conn.execute(statement)).mappings().all()
 
     return [ServiceCountDTO(**elem) for elem in result]
@@ -3,7 +3,17 @@ Module responsible for managing database connections.
 """
 
 from idu_api.common.db.connection.manager import PostgresConnectionManager
+from idu_api.common.db.connection.statistics import (
+    PoolStatistics,
+    QueriesStatistics,
+    get_queries_statistics,
+    start_queries_statistics,
+)
 
 __all__ = [
     "PostgresConnectionManager",
+    "PoolStatistics",
+    "QueriesStatistics",
+    "get_queries_statistics",
+    "start_queries_statistics",
 ]
@@ -1,15 +1,25 @@
 """Connection manager class and get_connection function are defined here."""
 
+import re
+import time
 from asyncio import Lock
 from contextlib import asynccontextmanager
 from itertools import cycle
-from typing import Any, AsyncIterator
+from typing import Any, AsyncIterator, Callable
 
 import structlog
-from sqlalchemy import select, text
+from sqlalchemy import Connection, event, select, text
+from sqlalchemy.engine.interfaces import DBAPICursor, ExecutionContext
 from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
 
 from idu_api.common.db.config import DBConfig
+from idu_api.common.db.connection.statistics import PoolStatistics, get_queries_statistics
+
+# statements like `SELECT public.process_buffers_queue($1) AS process_buffers_queue_1` call side-effecting
+# database functions and have no plan worth logging
+_FUNCTION_CALL_STATEMENT = re.compile(
+    r"^\s*SELECT\s+(?!.*\bFROM\b)[\w.\"]+\s*\(.*\)(\s+AS\s+[\w\"]+)?\s*$", re.IGNORECASE | re.DOTALL
+)
 
 
 class PostgresConnectionManager:
@@ -22,8 +32,17 @@ class PostgresConnectionManager:
         logger: structlog.stdlib.BoundLogger,
         engine_options: dict[str, Any] | None = None,
         application_name: str | None = None,
+        slow_query_threshold: float | None = None,
+        explain_slow_queries: bool = False,
+        pool_wait_observer: Callable[[str, float], None] | None = None,
     ) -> None:
-        """Initialize connection manager entity."""
+        """Initialize connection manager entity.
+
+        Queries executed longer than `slow_query_threshold` seconds are logged with their SQL and parameters
+        (and `EXPLAIN` output for SELECT queries if `explain_slow_queries` is set). Queries are not executed
+        again to be explained, so the plan is the estimated one.
+        `pool_wait_observer` is called with engine name and time spent on acquiring each connection.
+        """
         self._master_engine: AsyncEngine | None = None
         self._replica_engines: list[AsyncEngine] = []
         self._master = master
@@ -32,6 +51,10 @@ class PostgresConnectionManager:
         self._logger = logger
         self._engine_options = engine_options or {}
         self._application_name = application_name
+        self._slow_query_threshold = slow_query_threshold
+        self._explain_slow_queries = explain_slow_queries
+        self._pool_wait_observer = pool_wait_observer
+        self._engines_names: dict[AsyncEngine, str] = {}
         # Iterator for round-robin through replicas
         self._replica_cycle = None
 
@@ -42,6 +65,9 @@ class PostgresConnectionManager:
         logger: structlog.stdlib.BoundLogger | None = None,
         application_name: str | None = None,
         engine_options: dict[str, Any] | None = None,
+        slow_query_threshold: float | None = None,
+        explain_slow_queries: bool | None = None,
+        pool_wait_observer: Callable[[str, float], None] | None = None,
     ) -> None:
         """Initialize connection manager entity."""
         async with self._lock:
@@ -50,6 +76,10 @@ class PostgresConnectionManager:
             self._logger = logger or self._logger
             self._application_name = application_name or self._application_name
             self._engine_options = engine_options or self._engine_options
+            self._slow_query_threshold = slow_query_threshold or self._slow_query_threshold
+            if explain_slow_queries is not None:
+                self._explain_slow_queries = explain_slow_queries
+            self._pool_wait_observer = pool_wait_observer or self._pool_wait_observer
 
             if self.initialized:
                 await self.refresh()
@@ -78,6 +108,7 @@ class PostgresConnectionManager:
             max_overflow=5,
             **self._engine_options,
         )
+        self._register_events(self._master_engine, "master")
         try:
             async with self._master_engine.connect() as conn:
                 cur = await conn.execute(select(1))
@@ -103,6 +134,7 @@ class PostgresConnectionManager:
                     max_overflow=5,
                     **self._engine_options,
                 )
+                self._register_events(replica_engine, f"replica {replica.host}:{replica.port}")
                 try:
                     async with replica_engine.connect() as conn:
                         cur = await conn.execute(select(1))
@@ -128,6 +160,7 @@ class PostgresConnectionManager:
         for engine in self._replica_engines:
             await engine.dispose()
         self._replica_engines.clear()
+        self._engines_names.clear()
 
     @asynccontextmanager
     async def get_connection(self) -> AsyncIterator[AsyncConnection]:
@@ -136,7 +169,9 @@ class PostgresConnectionManager:
             async with self._lock:
                 if not self.initialized:
                     await self.refresh()
+        time_begin = time.perf_counter()
         async with self._master_engine.connect() as conn:
+            self._add_pool_wait_time(self._master_engine, time.perf_counter() - time_begin)
             if self._application_name is not None:
                 await conn.execute(text(f'SET application_name TO "{self._application_name}"'))
                 await conn.commit()
@@ -161,7 +196,9 @@ class PostgresConnectionManager:
         engine = next(self._replica_cycle)  # pylint: disable=stop-iteration-return
         conn = None
         try:
+            time_begin = time.perf_counter()
             conn = await engine.connect()
+            self._add_pool_wait_time(engine, time.perf_counter() - time_begin)
             if self._application_name is not None:
                 await conn.execute(text(f'SET application_name TO "{self._application_name}"'))
                 await conn.commit()
@@ -182,3 +219,100 @@ class PostgresConnectionManager:
             yield conn
         finally:
             await conn.close()
+
+    def get_pools_statistics(self) -> list[PoolStatistics]:
+        """Get current state of connection pools of master and all available replicas engines."""
+        engines = ([self._master_engine] if self._master_engine is not None else []) + self._replica_engines
+        return [
+            PoolStatistics(
+                engine=self._engines_names[engine],
+                size=engine.pool.size(),
+                checked_out=engine.pool.checkedout(),
+                idle=engine.pool.checkedin(),
+                overflow=max(engine.pool.overflow(), 0),
+            )
+            for engine in engines
+        ]
+
+    def _register_events(self, engine: AsyncEngine, name: str) -> None:
+        """Register listeners collecting queries statistics and logging slow queries."""
+        self._engines_names[engine] = name
+        event.listen(engine.sync_engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine.sync_engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def _add_pool_wait_time(self, engine: AsyncEngine, wait_time: float) -> None:
+        if self._pool_wait_observer is not None:
+            self._pool_wait_observer(self._engines_names[engine], wait_time)
+        statistics = get_queries_statistics()
+        if statistics is not None:
+            statistics.pool_wait_time += wait_time
+
+    @staticmethod
+    def _before_cursor_execute(  # pylint: disable=too-many-arguments
+        conn: Connection,
+        _cursor: DBAPICursor,
+        _statement: str,
+        _parameters: Any,
+        _context: ExecutionContext | None,
+        _executemany: bool,
+    ) -> None:
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    def _after_cursor_execute(  # pylint: disable=too-many-arguments
+        self,
+        conn: Connection,
+        cursor: DBAPICursor,
+        statement: str,
+        parameters: Any,
+        _context: ExecutionContext | None,
+        executemany: bool,
+    ) -> None:
+        duration = time.perf_counter() - conn.info["query_start_time"].pop()
+
+        statistics = get_queries_statistics()
+        if statistics is not None:
+            statistics.queries += 1
+            statistics.db_time += duration
+            statistics.rows += max(cursor.rowcount, 0)
+
+        if self._slow_query_threshold is None or duration < self._slow_query_threshold:
+            return
+
+        plan = None
+        if (
+            self._explain_slow_queries
+            and not executemany
+            and statement.lstrip().upper().startswith("SELECT")
+            and _FUNCTION_CALL_STATEMENT.match(statement) is None
+        ):
+            plan = self._explain(conn, statement, parameters)
+
+        self._logger.warning(
+            "slow query",
+            duration=round(duration, 3),
+            statement=statement,
+            parameters=parameters,
+            plan=plan,
+        )
+
+    @staticmethod
+    def _explain(conn: Connection, statement: str, parameters: Any) -> str:
+        """Get estimated plan of the statement without executing it.
+
+        `EXPLAIN` is run inside a savepoint, so its failure does not abort the transaction of the caller.
+        """
+        explain_cursor = conn.connection.cursor()
+        try:
+            explain_cursor.execute("SAVEPOINT explain_slow_query")
+            try:
+                explain_cursor.execute(f"EXPLAIN {statement}", parameters)
+                plan = "\n".join(row[0] for row in explain_cursor.fetchall())
+                explain_cursor.execute("RELEASE SAVEPOINT explain_slow_query")
+            except Exception as exc:  # pylint: disable=broad-except
+                explain_cursor.execute("ROLLBACK TO SAVEPOINT explain_slow_query")
+                plan = f"could not explain query: {exc!r}"
+        except Exception as exc:  # pylint: disable=broad-except
+            plan = f"could not explain query: {exc!r}"
+        finally:
+            explain_cursor.close()
+        return plan
@@ -0,0 +1,40 @@
+"""Per-request database queries statistics are defined here."""
+
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+
+@dataclass
+class QueriesStatistics:
+    """Database usage accumulated during the current request (or any other unit of work)."""
+
+    queries: int = 0
+    db_time: float = 0.0
+    rows: int = 0
+    pool_wait_time: float = 0.0
+
+
+_queries_statistics: ContextVar[QueriesStatistics | None] = ContextVar("queries_statistics", default=None)
+
+
+def start_queries_statistics() -> QueriesStatistics:
+    """Start accumulating database queries statistics in the current context."""
+    statistics = QueriesStatistics()
+    _queries_statistics.set(statistics)
+    return statistics
+
+
+def get_queries_statistics() -> QueriesStatistics | None:
+    """Get database queries statistics of the current context if they were started."""
+    return _queries_statistics.get()
+
+
+@dataclass(frozen=True)
+class PoolStatistics:
+    """Connection pool state of a single database engine."""
+
+    engine: str
+    size: int
+    checked_out: int
+    idle: int
+    overflow: int
@@ -13,7 +13,9 @@ from sqlalchemy import (
     Table,
     UniqueConstraint,
     false,
+    func,
 )
+from sqlalchemy.dialects.postgresql import TIMESTAMP
 
 from idu_api.common.db import metadata
 from idu_api.common.db.entities.physical_object_types import physical_object_types_dict
@@ -97,3 +99,21 @@ Buffers Data:
 - geometry geometry
 - is_custom bool
 """
+
+buffers_queue_data = Table(
+    "buffers_queue_data",
+    metadata,
+    Column(
+        "urban_object_id",
+        Integer,
+        ForeignKey(urban_objects_data.c.urban_object_id, ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column("queued_at", TIMESTAMP(timezone=True), server_default=func.now(), nullable=False),
+)
+
+"""
+Buffers Queue Data (urban objects which default buffers should be recalculated by background worker):
+- urban_object_id int (Primary Key, Foreign Key to urban_objects_data, ondelete CASCADE)
+- queued_at timestamp
+"""
@@ -27,6 +27,17 @@ class IndicatorValueType(str, Enum):
     target = "target"
 
 
+# pylint: disable=invalid-name
+class IndicatorAggregationType(str, Enum):
+    """
+    Enumeration of indicator values aggregation types.
+    """
+
+    sum = "sum"
+    avg = "avg"
+    weighted_avg = "weighted_avg"
+
+
 class InfrastructureType(str, Enum):
     """
     Enumeration of infrastructure types.
@@ -1,5 +1,6 @@
 from geoalchemy2 import Geometry
-from sqlalchemy.sql.expression import false
+from sqlalchemy.dialects.postgresql import TIMESTAMP
+from sqlalchemy.sql.expression import false, func
 from sqlalchemy.sql.schema import Column, ForeignKey, PrimaryKeyConstraint, Table
 from sqlalchemy.sql.sqltypes import Boolean, Integer
 
@@ -31,3 +32,22 @@ Buffers Data:
 - geometry geometry
 - is_custom bool
 """
+
+buffers_queue_data = Table(
+    "buffers_queue_data",
+    metadata,
+    Column(
+        "urban_object_id",
+        Integer,
+        ForeignKey(urban_objects_data.c.urban_object_id, ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column("queued_at", TIMESTAMP(timezone=True), server_default=func.now(), nullable=False),
+    schema="user_projects",
+)
+
+"""
+Buffers Queue Data (scenario urban objects which default buffers should be recalculated by background worker):
+- urban_object_id int (Primary Key, Foreign Key to urban_objects_data, ondelete CASCADE)
+- queued_at timestamp
+"""
@@ -0,0 +1,68 @@
+"""Projects context geometry tables are defined here."""
+
+from typing import Callable
+
+from geoalchemy2.types import Geometry
+from sqlalchemy import TIMESTAMP, Column, ForeignKey, Integer, Sequence, Table, func
+
+from idu_api.common.db import metadata
+from idu_api.common.db.entities.projects.projects import projects_data
+
+func: Callable
+
+projects_context_data = Table(
+    "projects_context_data",
+    metadata,
+    Column(
+        "project_id",
+        Integer,
+        ForeignKey(projects_data.c.project_id, ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column(
+        "geometry",
+        Geometry(spatial_index=False, from_text="ST_GeomFromEWKT", name="geometry"),
+        nullable=False,
+    ),
+    Column("updated_at", TIMESTAMP(timezone=True), server_default=func.now(), nullable=False),
+    schema="user_projects",
+)
+
+"""
+Projects context data (union of all project's context territories, maintained by triggers):
+- project_id foreign key int
+- geometry geometry
+- updated_at timestamp
+"""
+
+projects_context_subdivided_data_id_seq = Sequence("projects_context_subdivided_data_id_seq", schema="user_projects")
+
+projects_context_subdivided_data = Table(
+    "projects_context_subdivided_data",
+    metadata,
+    Column(
+        "context_piece_id",
+        Integer,
+        primary_key=True,
+        server_default=projects_context_subdivided_data_id_seq.next_value(),
+    ),
+    Column(
+        "project_id",
+        Integer,
+        ForeignKey(projects_data.c.project_id, ondelete="CASCADE"),
+        nullable=False,
+    ),
+    Column(
+        "geometry",
+        Geometry(spatial_index=False, from_text="ST_GeomFromEWKT", name="geometry"),
+        nullable=False,
+    ),
+    schema="user_projects",
+)
+
+"""
+Projects context subdivided data (`ST_Subdivide` pieces of project's context geometry, maintained by triggers):
+- context_piece_id int
+- project_id foreign key int
+- geometry geometry
+"""
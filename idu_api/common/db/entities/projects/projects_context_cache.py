@@ -0,0 +1,101 @@
+"""Projects context cached (clipped by context geometry) layers tables are defined here."""
+
+from geoalchemy2.types import Geometry
+from sqlalchemy import TIMESTAMP, BigInteger, Column, ForeignKey, Integer, PrimaryKeyConstraint, String, Table
+
+from idu_api.common.db import metadata
+from idu_api.common.db.entities.projects.projects import projects_data
+
+projects_context_cache_data = Table(
+    "projects_context_cache_data",
+    metadata,
+    Column("project_id", Integer, ForeignKey(projects_data.c.project_id, ondelete="CASCADE"), nullable=False),
+    Column("layer", String(32), nullable=False),
+    Column("version", BigInteger, nullable=False, server_default="0"),
+    Column("built_version", BigInteger, nullable=True),
+    Column("context_updated_at", TIMESTAMP(timezone=True), nullable=True),
+    Column("built_at", TIMESTAMP(timezone=True), nullable=True),
+    PrimaryKeyConstraint("project_id", "layer"),
+    schema="user_projects",
+)
+
+"""
+Projects context cache data (state of the cached layers, see `user_projects.refresh_project_context_cache`):
+- project_id foreign key int
+- layer varchar(32)
+- version bigint (incremented by triggers when public objects intersecting the project context are changed)
+- built_version bigint (`version` at the moment of the last build, layer is out of date if they differ)
+- context_updated_at timestamp (`updated_at` of the project context geometry at the moment of the last build)
+- built_at timestamp
+"""
+
+projects_context_object_geometries_data = Table(
+    "projects_context_object_geometries_data",
+    metadata,
+    Column("project_id", Integer, ForeignKey(projects_data.c.project_id, ondelete="CASCADE"), nullable=False),
+    Column("object_geometry_id", Integer, nullable=False),
+    Column(
+        "geometry",
+        Geometry(spatial_index=False, from_text="ST_GeomFromEWKT", name="geometry"),
+        nullable=False,
+    ),
+    Column(
+        "centre_point",
+        Geometry("POINT", spatial_index=False, from_text="ST_GeomFromEWKT", name="geometry"),
+        nullable=False,
+    ),
+    PrimaryKeyConstraint("project_id", "object_geometry_id"),
+    schema="user_projects",
+)
+
+"""
+Projects context object geometries data (public object geometries clipped by the project context geometry):
+- project_id foreign key int
+- object_geometry_id int
+- geometry geometry
+- centre_point geometry point
+"""
+
+projects_context_buffers_data = Table(
+    "projects_context_buffers_data",
+    metadata,
+    Column("project_id", Integer, ForeignKey(projects_data.c.project_id, ondelete="CASCADE"), nullable=False),
+    Column("buffer_type_id", Integer, nullable=False),
+    Column("urban_object_id", Integer, nullable=False),
+    Column(
+        "geometry",
+        Geometry(spatial_index=False, from_text="ST_GeomFromEWKT", name="geometry"),
+        nullable=False,
+    ),
+    PrimaryKeyConstraint("project_id", "buffer_type_id", "urban_object_id"),
+    schema="user_projects",
+)
+
+"""
+Projects context buffers data (public buffers of urban objects in the project context clipped by context geometry):
+- project_id foreign key int
+- buffer_type_id int
+- urban_object_id int
+- geometry geometry
+"""
+
+projects_context_functional_zones_data = Table(
+    "projects_context_functional_zones_data",
+    metadata,
+    Column("project_id", Integer, ForeignKey(projects_data.c.project_id, ondelete="CASCADE"), nullable=False),
+    Column("functional_zone_id", Integer, nullable=False),
+    Column(
+        "geometry",
+        Geometry(spatial_index=False, from_text="ST_GeomFromEWKT", name="geometry"),
+        nullable=False,
+    ),
+    PrimaryKeyConstraint("project_id", "functional_zone_id"),
+    schema="user_projects",
+)
+
+"""
+Projects context functional zones data (public functional zones clipped by the project context geometry):
+- project_id foreign key int
+- functional_zone_id int
+- geometry geometry
+"""
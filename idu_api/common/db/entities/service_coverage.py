@@ -0,0 +1,75 @@
+"""Service coverage (union of buffers) cache tables are defined here."""
+
+from typing import Callable
+
+from geoalchemy2.types import Geometry
+from sqlalchemy import TIMESTAMP, BigInteger, Column, Float, ForeignKey, Integer, PrimaryKeyConstraint, Table, func
+
+from idu_api.common.db import metadata
+from idu_api.common.db.entities.buffers import buffer_types_dict
+from idu_api.common.db.entities.service_types import service_types_dict
+from idu_api.common.db.entities.territories import territories_data
+
+func: Callable
+
+service_coverage_data = Table(
+    "service_coverage_data",
+    metadata,
+    Column(
+        "territory_id",
+        Integer,
+        ForeignKey(territories_data.c.territory_id, ondelete="CASCADE"),
+        nullable=False,
+    ),
+    Column(
+        "service_type_id",
+        Integer,
+        ForeignKey(service_types_dict.c.service_type_id, ondelete="CASCADE"),
+        nullable=False,
+    ),
+    Column(
+        "buffer_type_id",
+        Integer,
+        ForeignKey(buffer_types_dict.c.buffer_type_id, ondelete="CASCADE"),
+        nullable=False,
+    ),
+    Column("geometry", Geometry(spatial_index=False, from_text="ST_GeomFromEWKT", name="geometry"), nullable=True),
+    Column("territory_area", Float(53), nullable=False),
+    Column("covered_area", Float(53), nullable=False),
+    Column("services_count", Integer, nullable=False),
+    Column("built_version", BigInteger, nullable=False),
+    Column("built_at", TIMESTAMP(timezone=True), server_default=func.now(), nullable=False),
+    PrimaryKeyConstraint("territory_id", "service_type_id", "buffer_type_id"),
+)
+
+"""
+Service coverage data (union of buffers of services of the given type located in the territory and its descendants,
+clipped by the territory geometry, see `public.refresh_service_coverage`):
+- territory_id foreign key int
+- service_type_id foreign key int
+- buffer_type_id foreign key int
+- geometry geometry (null if there are no buffers)
+- territory_area float (square meters)
+- covered_area float (square meters)
+- services_count int
+- built_version bigint (`version` of the territory at the moment of build, coverage is out of date if they differ)
+- built_at timestamp
+"""
+
+service_coverage_versions_data = Table(
+    "service_coverage_versions_data",
+    metadata,
+    Column(
+        "territory_id",
+        Integer,
+        ForeignKey(territories_data.c.territory_id, ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column("version", BigInteger, nullable=False, server_default="0"),
+)
+
+"""
+Service coverage versions data (incremented by triggers when objects intersecting the territory are changed):
+- territory_id foreign key int
+- version bigint
+"""
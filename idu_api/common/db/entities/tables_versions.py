@@ -0,0 +1,24 @@
+"""Tables versions counters are defined here."""
+
+from typing import Callable
+
+from sqlalchemy import TIMESTAMP, BigInteger, Column, String, Table, func
+
+from idu_api.common.db import metadata
+
+func: Callable
+
+tables_versions_data = Table(
+    "tables_versions_data",
+    metadata,
+    Column("table_name", String(64), primary_key=True),
+    Column("version", BigInteger, nullable=False, server_default="0"),
+    Column("updated_at", TIMESTAMP(timezone=True), server_default=func.now(), nullable=False),
+)
+
+"""
+Tables versions data (counters incremented by statement-level triggers on every write to the tracked table):
+- table_name varchar(64)
+- version bigint
+- updated_at timestamp
+"""
@@ -3,7 +3,21 @@
 from typing import Callable
 
 from geoalchemy2.types import Geometry
-from sqlalchemy import TIMESTAMP, Boolean, Column, ForeignKey, Integer, Sequence, String, Table, Text, false, func, text
+from sqlalchemy import (
+    TIMESTAMP,
+    Boolean,
+    Column,
+    Float,
+    ForeignKey,
+    Integer,
+    Sequence,
+    String,
+    Table,
+    Text,
+    false,
+    func,
+    text,
+)
 from sqlalchemy.dialects.postgresql import JSONB
 
 from idu_api.common.db import metadata
@@ -90,3 +104,59 @@ Territories:
 - created_at timestamp
 - updated_at timestamp
 """
+
+territories_subdivided_data_id_seq = Sequence("territories_subdivided_data_id_seq")
+
+territories_subdivided_data = Table(
+    "territories_subdivided_data",
+    metadata,
+    Column(
+        "territory_piece_id",
+        Integer,
+        primary_key=True,
+        server_default=territories_subdivided_data_id_seq.next_value(),
+    ),
+    Column(
+        "territory_id",
+        Integer,
+        ForeignKey(territories_data.c.territory_id, ondelete="CASCADE"),
+        nullable=False,
+    ),
+    Column(
+        "geometry",
+        Geometry(spatial_index=False, from_text="ST_GeomFromEWKT", name="geometry", nullable=False),
+        nullable=False,
+    ),
+)
+
+"""
+Territories subdivided (`ST_Subdivide` pieces of territory geometry, maintained by trigger):
+- territory_piece_id int
+- territory_id foreign key int
+- geometry geometry
+"""
+
+territories_simplified_data = Table(
+    "territories_simplified_data",
+    metadata,
+    Column(
+        "territory_id",
+        Integer,
+        ForeignKey(territories_data.c.territory_id, ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column("tolerance", Float(precision=53), primary_key=True),
+    Column(
+        "geometry",
+        Geometry(spatial_index=False, from_text="ST_GeomFromEWKT", name="geometry", nullable=False),
+        nullable=False,
+    ),
+)
+
+"""
+Territories simplified (`ST_SimplifyPreserveTopology` of territory geometry with a few fixed tolerances,
+maintained by trigger):
+- territory_id foreign key int
+- tolerance float
+- geometry geometry
+"""
@@ -2,10 +2,22 @@
 
 from typing import Callable
 
-from sqlalchemy import TIMESTAMP, Column, Date, Enum, Float, ForeignKey, Integer, Sequence, String, Table, func
+from sqlalchemy import (
+    TIMESTAMP,
+    Column,
+    Date,
+    Enum,
+    Float,
+    ForeignKey,
+    Integer,
+    Sequence,
+    String,
+    Table,
+    func,
+)
 
 from idu_api.common.db import metadata
-from idu_api.common.db.entities.enums import DateFieldType, IndicatorValueType
+from idu_api.common.db.entities.enums import DateFieldType, IndicatorAggregationType, IndicatorValueType
 from idu_api.common.db.entities.indicators_dict import indicators_dict
 from idu_api.common.db.entities.territories import territories_data
 
@@ -13,6 +25,7 @@ func: Callable
 
 DateFieldTypeEnum = Enum(DateFieldType, name="date_field_type")
 IndicatorValueTypeEnum = Enum(IndicatorValueType, name="indicator_value_type")
+IndicatorAggregationTypeEnum = Enum(IndicatorAggregationType, name="indicator_aggregation_type")
 
 territory_indicators_data_id_seq = Sequence("territory_indicators_data_id_seq")
 territory_indicators_data = Table(
@@ -49,3 +62,42 @@ Territory indicators:
 - created_at timestamp
 - updated_at timestamp
 """
+
+territory_indicators_aggregates_data = Table(
+    "territory_indicators_aggregates_data",
+    metadata,
+    Column(
+        "territory_id",
+        Integer,
+        ForeignKey(territories_data.c.territory_id, ondelete="CASCADE"),
+        nullable=False,
+    ),
+    Column(
+        "indicator_id",
+        Integer,
+        ForeignKey(indicators_dict.c.indicator_id, ondelete="CASCADE"),
+        nullable=False,
+    ),
+    Column("value_type", IndicatorValueTypeEnum, nullable=False),
+    Column("aggregation_type", IndicatorAggregationTypeEnum, nullable=False),
+    Column("weight_indicator_id", Integer, ForeignKey(indicators_dict.c.indicator_id, ondelete="CASCADE")),
+    Column("value", Float(53)),
+    Column("territories_count", Integer, nullable=False),
+    Column("date_value", Date),
+    Column("built_at", TIMESTAMP(timezone=True), server_default=func.now(), nullable=False),
+)
+
+"""
+Territory indicators aggregates (last indicator values aggregated up the territories hierarchy; rows are removed
+by triggers when values of the territory or any of its descendants are changed; unique by territory_id,
+indicator_id, value_type, aggregation_type and coalesce(weight_indicator_id, 0)):
+- territory_id foreign key int
+- indicator_id foreign key int
+- value_type enum
+- aggregation_type enum
+- weight_indicator_id foreign key int (for weighted average only)
+- value float(53) (null if there are no values)
+- territories_count int (number of territories which values were aggregated)
+- date_value date (the latest date of aggregated values)
+- built_at timestamp
+"""
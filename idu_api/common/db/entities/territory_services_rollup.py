@@ -0,0 +1,36 @@
+"""Territory services rollup table is defined here."""
+
+from sqlalchemy import BigInteger, Column, ForeignKey, Integer, PrimaryKeyConstraint, Table
+
+from idu_api.common.db import metadata
+from idu_api.common.db.entities.service_types import service_types_dict
+from idu_api.common.db.entities.territories import territories_data
+
+territory_services_rollup_data = Table(
+    "territory_services_rollup_data",
+    metadata,
+    Column(
+        "territory_id",
+        Integer,
+        ForeignKey(territories_data.c.territory_id, ondelete="CASCADE"),
+        nullable=False,
+    ),
+    Column(
+        "service_type_id",
+        Integer,
+        ForeignKey(service_types_dict.c.service_type_id, ondelete="CASCADE"),
+        nullable=False,
+    ),
+    Column("count", Integer, nullable=False),
+    Column("capacity", BigInteger, nullable=False),
+    PrimaryKeyConstraint("territory_id", "service_type_id"),
+)
+
+"""
+Territory services rollup data (number and summary capacity of services located in the territory and all its
+descendants, maintained incrementally by triggers, see `public.apply_territory_services_rollup_delta`):
+- territory_id foreign key int
+- service_type_id foreign key int
+- count int (number of urban objects with services of the given type)
+- capacity bigint
+"""
@@ -0,0 +1,46 @@
+"""Vector tiles invalidations table is defined here."""
+
+from typing import Callable
+
+from geoalchemy2.types import Geometry
+from sqlalchemy import TIMESTAMP, BigInteger, Column, Sequence, String, Table, func, text
+
+from idu_api.common.db import metadata
+
+func: Callable
+
+tiles_invalidations_data_id_seq = Sequence("tiles_invalidations_data_id_seq")
+
+tiles_invalidations_data = Table(
+    "tiles_invalidations_data",
+    metadata,
+    Column(
+        "invalidation_id",
+        BigInteger,
+        primary_key=True,
+        server_default=tiles_invalidations_data_id_seq.next_value(),
+    ),
+    Column(
+        "transaction_id",
+        BigInteger,
+        server_default=text("pg_current_xact_id()::text::bigint"),
+        nullable=False,
+    ),
+    Column("table_name", String(128), nullable=False),
+    Column(
+        "bbox",
+        Geometry(spatial_index=False, from_text="ST_GeomFromEWKT", name="geometry", nullable=False),
+        nullable=False,
+    ),
+    Column("created_at", TIMESTAMP(timezone=True), server_default=func.now(), nullable=False),
+)
+
+"""
+Tiles invalidations data (bounding boxes of rows changed by a single statement, registered by statement-level triggers
+on tables used to build vector tiles, rows older than a day are removed periodically):
+- invalidation_id bigint
+- transaction_id bigint (identifier of the writing transaction, used as commit-ordered watermark)
+- table_name varchar(128) (schema-qualified)
+- bbox geometry
+- created_at timestamp
+"""
@@ -0,0 +1,112 @@
+# pylint: disable=no-member,invalid-name,missing-function-docstring,too-many-statements
+"""territories simplified
+
+Revision ID: 3d8f6b2a91c7
+Revises: 7a3f5c1e8d24
+Create Date: 2026-10-18 21:14:37.518204
+
+"""
+from textwrap import dedent
+from typing import Sequence, Union
+
+import geoalchemy2
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3d8f6b2a91c7"
+down_revision: Union[str, None] = "7a3f5c1e8d24"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # create `public.territories_simplified_data` table
+    op.create_table(
+        "territories_simplified_data",
+        sa.Column("territory_id", sa.Integer(), nullable=False),
+        sa.Column("tolerance", sa.Float(precision=53), nullable=False),
+        sa.Column(
+            "geometry",
+            geoalchemy2.types.Geometry(spatial_index=False, from_text="ST_GeomFromEWKT", name="geometry"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["territory_id"],
+            ["territories_data.territory_id"],
+            name=op.f("territories_simplified_data_fk_territory_id__territories_data"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("territory_id", "tolerance", name=op.f("territories_simplified_data_pk")),
+    )
+
+    # create trigger on insert/update `public.territories_data` (if territory geometry was changed),
+    # tolerances must be the same as `SIMPLIFIED_TERRITORIES_TOLERANCES` in the application
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE OR REPLACE FUNCTION public.trigger_refresh_territory_simplified_geometry()
+                RETURNS TRIGGER AS $$
+                BEGIN
+                    IF TG_OP = 'UPDATE' AND NEW.geometry IS NOT DISTINCT FROM OLD.geometry THEN
+                        RETURN NULL;
+                    END IF;
+
+                    DELETE FROM public.territories_simplified_data WHERE territory_id = NEW.territory_id;
+
+                    INSERT INTO public.territories_simplified_data (territory_id, tolerance, geometry)
+                    SELECT NEW.territory_id, tolerance, ST_SimplifyPreserveTopology(NEW.geometry, tolerance)
+                    FROM unnest(ARRAY[0.0001, 0.001, 0.01]::float8[]) AS tolerance;
+
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql;
+                """
+            )
+        )
+    )
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE TRIGGER refresh_territory_simplified_geometry_trigger
+                AFTER INSERT OR UPDATE OF geometry ON public.territories_data
+                FOR EACH ROW
+                EXECUTE FUNCTION public.trigger_refresh_territory_simplified_geometry();
+                """
+            )
+        )
+    )
+
+    # fill simplified geometries for existing territories
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                INSERT INTO public.territories_simplified_data (territory_id, tolerance, geometry)
+                SELECT t.territory_id, tolerance, ST_SimplifyPreserveTopology(t.geometry, tolerance)
+                FROM public.territories_data t
+                    CROSS JOIN unnest(ARRAY[0.0001, 0.001, 0.01]::float8[]) AS tolerance;
+                """
+            )
+        )
+    )
+
+
+def downgrade() -> None:
+    # drop trigger
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                DROP TRIGGER IF EXISTS refresh_territory_simplified_geometry_trigger
+                ON public.territories_data;
+                """
+            )
+        )
+    )
+    op.execute(sa.text(dedent("DROP FUNCTION IF EXISTS public.trigger_refresh_territory_simplified_geometry();")))
+
+    # drop table
+    op.drop_table("territories_simplified_data")
@@ -0,0 +1,282 @@
+# pylint: disable=no-member,invalid-name,missing-function-docstring,too-many-statements
+"""tiles invalidations
+
+Revision ID: b5e1c7a04f93
+Revises: 3d8f6b2a91c7
+Create Date: 2026-10-18 22:41:09.305718
+
+"""
+from textwrap import dedent
+from typing import Sequence, Union
+
+import geoalchemy2
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b5e1c7a04f93"
+down_revision: Union[str, None] = "3d8f6b2a91c7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# tables with `geometry` column which are used to build vector tiles
+GEOMETRY_TABLES = [
+    "public.territories_data",
+    "public.object_geometries_data",
+    "public.functional_zones_data",
+    "user_projects.object_geometries_data",
+    "user_projects.functional_zones_data",
+]
+
+# tables linking objects to geometries which are used to build vector tiles
+URBAN_OBJECTS_TABLES = [
+    "public.urban_objects_data",
+    "user_projects.urban_objects_data",
+]
+
+# tables which attributes are put to vector tiles of linked object geometries (with identifier column name)
+OBJECTS_TABLES = [
+    ("public.services_data", "service_id"),
+    ("public.physical_objects_data", "physical_object_id"),
+    ("public.service_types_dict", "service_type_id"),
+    ("public.physical_object_types_dict", "physical_object_type_id"),
+]
+
+
+def upgrade() -> None:
+    # create `public.tiles_invalidations_data` table
+    op.execute(sa.schema.CreateSequence(sa.Sequence("tiles_invalidations_data_id_seq")))
+    op.create_table(
+        "tiles_invalidations_data",
+        sa.Column(
+            "invalidation_id",
+            sa.BigInteger(),
+            server_default=sa.text("nextval('tiles_invalidations_data_id_seq')"),
+            nullable=False,
+        ),
+        sa.Column(
+            "transaction_id",
+            sa.BigInteger(),
+            server_default=sa.text("pg_current_xact_id()::text::bigint"),
+            nullable=False,
+        ),
+        sa.Column("table_name", sa.String(length=128), nullable=False),
+        sa.Column(
+            "bbox",
+            geoalchemy2.types.Geometry(spatial_index=False, from_text="ST_GeomFromEWKT", name="geometry"),
+            nullable=False,
+        ),
+        sa.Column("created_at", sa.TIMESTAMP(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint("invalidation_id", name=op.f("tiles_invalidations_data_pk")),
+    )
+
+    # create indexes
+    op.create_index(
+        "tiles_invalidations_data_bbox_idx",
+        "tiles_invalidations_data",
+        ["bbox"],
+        postgresql_using="gist",
+    )
+    op.create_index("tiles_invalidations_data_created_at_idx", "tiles_invalidations_data", ["created_at"])
+    op.create_index("tiles_invalidations_data_transaction_id_idx", "tiles_invalidations_data", ["transaction_id"])
+
+    # create statement-level triggers registering bounding box of changed rows,
+    # invalidations older than a day are removed periodically by the application (tiles cache TTL must be less)
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE OR REPLACE FUNCTION public.register_tiles_invalidation(p_table_name text, p_bbox geometry)
+                RETURNS void AS $$
+                BEGIN
+                    IF p_bbox IS NOT NULL THEN
+                        INSERT INTO public.tiles_invalidations_data (table_name, bbox)
+                        VALUES (p_table_name, ST_SetSRID(p_bbox, 4326));
+                    END IF;
+                END;
+                $$ LANGUAGE plpgsql;
+                """
+            )
+        )
+    )
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE OR REPLACE FUNCTION public.trigger_register_tiles_invalidation()
+                RETURNS TRIGGER AS $$
+                DECLARE
+                    v_bbox geometry;
+                BEGIN
+                    IF TG_OP = 'INSERT' THEN
+                        SELECT ST_Extent(geometry)::geometry INTO v_bbox FROM new_rows;
+                    ELSIF TG_OP = 'UPDATE' THEN
+                        SELECT ST_Extent(geometry)::geometry INTO v_bbox
+                        FROM (
+                            SELECT geometry FROM old_rows
+                            UNION ALL
+                            SELECT geometry FROM new_rows
+                        ) changed_rows;
+                    ELSE
+                        SELECT ST_Extent(geometry)::geometry INTO v_bbox FROM old_rows;
+                    END IF;
+
+                    PERFORM public.register_tiles_invalidation(TG_TABLE_SCHEMA || '.' || TG_TABLE_NAME, v_bbox);
+
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql;
+                """
+            )
+        )
+    )
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE OR REPLACE FUNCTION public.trigger_register_urban_objects_tiles_invalidation()
+                RETURNS TRIGGER AS $$
+                DECLARE
+                    v_ids integer[];
+                    v_public_ids integer[];
+                    v_bbox geometry;
+                BEGIN
+                    -- `public_object_geometry_id` column exists only in `user_projects.urban_objects_data`
+                    IF TG_OP <> 'DELETE' THEN
+                        SELECT
+                            array_agg((to_jsonb(r) ->> 'object_geometry_id')::integer),
+                            array_agg((to_jsonb(r) ->> 'public_object_geometry_id')::integer)
+                        INTO v_ids, v_public_ids
+                        FROM new_rows r;
+                    END IF;
+                    IF TG_OP <> 'INSERT' THEN
+                        SELECT
+                            v_ids || array_agg((to_jsonb(r) ->> 'object_geometry_id')::integer),
+                            v_public_ids || array_agg((to_jsonb(r) ->> 'public_object_geometry_id')::integer)
+                        INTO v_ids, v_public_ids
+                        FROM old_rows r;
+                    END IF;
+
+                    IF TG_TABLE_SCHEMA = 'user_projects' THEN
+                        SELECT ST_Extent(geometry)::geometry INTO v_bbox
+                        FROM (
+                            SELECT geometry FROM user_projects.object_geometries_data
+                            WHERE object_geometry_id = ANY(v_ids)
+                            UNION ALL
+                            SELECT geometry FROM public.object_geometries_data
+                            WHERE object_geometry_id = ANY(v_public_ids)
+                        ) changed_geometries;
+                    ELSE
+                        SELECT ST_Extent(geometry)::geometry INTO v_bbox
+                        FROM public.object_geometries_data
+                        WHERE object_geometry_id = ANY(v_ids);
+                    END IF;
+
+                    PERFORM public.register_tiles_invalidation(TG_TABLE_SCHEMA || '.' || TG_TABLE_NAME, v_bbox);
+
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql;
+                """
+            )
+        )
+    )
+    # services and physical objects (with their types) attributes are put to tiles of linked geometries,
+    # so their changes invalidate extent of these geometries
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE OR REPLACE FUNCTION public.trigger_register_objects_tiles_invalidation()
+                RETURNS TRIGGER AS $$
+                DECLARE
+                    v_ids integer[];
+                    v_bbox geometry;
+                BEGIN
+                    -- identifier column name is passed as the trigger argument
+                    IF TG_OP <> 'DELETE' THEN
+                        SELECT array_agg((to_jsonb(r) ->> TG_ARGV[0])::integer) INTO v_ids FROM new_rows r;
+                    END IF;
+                    IF TG_OP <> 'INSERT' THEN
+                        SELECT v_ids || array_agg((to_jsonb(r) ->> TG_ARGV[0])::integer) INTO v_ids FROM old_rows r;
+                    END IF;
+
+                    IF TG_TABLE_NAME = 'services_data' THEN
+                        SELECT ST_Extent(og.geometry)::geometry INTO v_bbox
+                        FROM public.urban_objects_data u
+                            JOIN public.object_geometries_data og ON og.object_geometry_id = u.object_geometry_id
+                        WHERE u.service_id = ANY(v_ids);
+                    ELSIF TG_TABLE_NAME = 'physical_objects_data' THEN
+                        SELECT ST_Extent(og.geometry)::geometry INTO v_bbox
+                        FROM public.urban_objects_data u
+                            JOIN public.object_geometries_data og ON og.object_geometry_id = u.object_geometry_id
+                        WHERE u.physical_object_id = ANY(v_ids);
+                    ELSIF TG_TABLE_NAME = 'service_types_dict' THEN
+                        SELECT ST_Extent(og.geometry)::geometry INTO v_bbox
+                        FROM public.services_data s
+                            JOIN public.urban_objects_data u ON u.service_id = s.service_id
+                            JOIN public.object_geometries_data og ON og.object_geometry_id = u.object_geometry_id
+                        WHERE s.service_type_id = ANY(v_ids);
+                    ELSE
+                        SELECT ST_Extent(og.geometry)::geometry INTO v_bbox
+                        FROM public.physical_objects_data p
+                            JOIN public.urban_objects_data u ON u.physical_object_id = p.physical_object_id
+                            JOIN public.object_geometries_data og ON og.object_geometry_id = u.object_geometry_id
+                        WHERE p.physical_object_type_id = ANY(v_ids);
+                    END IF;
+
+                    PERFORM public.register_tiles_invalidation(TG_TABLE_SCHEMA || '.' || TG_TABLE_NAME, v_bbox);
+
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql;
+                """
+            )
+        )
+    )
+
+    # transition tables can be used only in triggers on a single event
+    for tables, function in (
+        ([(table, "") for table in GEOMETRY_TABLES], "trigger_register_tiles_invalidation"),
+        ([(table, "") for table in URBAN_OBJECTS_TABLES], "trigger_register_urban_objects_tiles_invalidation"),
+        ([(table, f"'{column}'") for table, column in OBJECTS_TABLES], "trigger_register_objects_tiles_invalidation"),
+    ):
+        for table, argument in tables:
+            for event, transition_tables in (
+                ("INSERT", "NEW TABLE AS new_rows"),
+                ("UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+                ("DELETE", "OLD TABLE AS old_rows"),
+            ):
+                op.execute(
+                    sa.text(
+                        dedent(
+                            f"""
+                            CREATE TRIGGER register_tiles_invalidation_{event.lower()}_trigger
+                            AFTER {event} ON {table}
+                            REFERENCING {transition_tables}
+                            FOR EACH STATEMENT
+                            EXECUTE FUNCTION public.{function}({argument});
+                            """
+                        )
+                    )
+                )
+
+
+def downgrade() -> None:
+    # drop triggers
+    for table in GEOMETRY_TABLES + URBAN_OBJECTS_TABLES + [table for table, _ in OBJECTS_TABLES]:
+        for event in ("insert", "update", "delete"):
+            op.execute(sa.text(f"DROP TRIGGER IF EXISTS register_tiles_invalidation_{event}_trigger ON {table};"))
+    op.execute(sa.text(dedent("DROP FUNCTION IF EXISTS public.trigger_register_objects_tiles_invalidation();")))
+    op.execute(sa.text(dedent("DROP FUNCTION IF EXISTS public.trigger_register_urban_objects_tiles_invalidation();")))
+    op.execute(sa.text(dedent("DROP FUNCTION IF EXISTS public.trigger_register_tiles_invalidation();")))
+    op.execute(sa.text(dedent("DROP FUNCTION IF EXISTS public.register_tiles_invalidation(text, geometry);")))
+
+    # drop indexes
+    op.drop_index("tiles_invalidations_data_transaction_id_idx", "tiles_invalidations_data")
+    op.drop_index("tiles_invalidations_data_created_at_idx", "tiles_invalidations_data")
+    op.drop_index("tiles_invalidations_data_bbox_idx", "tiles_invalidations_data")
+
+    # drop table
+    op.drop_table("tiles_invalidations_data")
+    op.execute(sa.schema.DropSequence(sa.Sequence("tiles_invalidations_data_id_seq")))
@@ -0,0 +1,51 @@
+# pylint: disable=no-member,invalid-name,missing-function-docstring
+"""types hierarchy versions
+
+Revision ID: 9c4e1f7b2a60
+Revises: b5e1c7a04f93
+Create Date: 2026-10-18 23:52:16.904731
+
+"""
+from textwrap import dedent
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9c4e1f7b2a60"
+down_revision: Union[str, None] = "b5e1c7a04f93"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+VERSIONED_TABLES = (
+    "urban_functions_dict",
+    "service_types_dict",
+    "physical_object_functions_dict",
+    "physical_object_types_dict",
+)
+
+
+def upgrade() -> None:
+    # track versions of the functions and types dictionaries which cached types hierarchies are built from
+    for table in VERSIONED_TABLES:
+        op.execute(sa.text(f"INSERT INTO public.tables_versions_data (table_name) VALUES ('{table}')"))
+        op.execute(
+            sa.text(
+                dedent(
+                    f"""
+                    CREATE TRIGGER increment_table_version_trigger
+                    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON public.{table}
+                    FOR EACH STATEMENT
+                    EXECUTE FUNCTION public.trigger_increment_table_version();
+                    """
+                )
+            )
+        )
+
+
+def downgrade() -> None:
+    # drop version triggers
+    for table in VERSIONED_TABLES:
+        op.execute(sa.text(f"DROP TRIGGER IF EXISTS increment_table_version_trigger ON public.{table};"))
+        op.execute(sa.text(f"DELETE FROM public.tables_versions_data WHERE table_name = '{table}'"))
@@ -0,0 +1,46 @@
+# pylint: disable=no-member,invalid-name,missing-function-docstring
+"""territories tree versions
+
+Revision ID: e6a2d8f13b75
+Revises: 9c4e1f7b2a60
+Create Date: 2026-10-19 00:37:48.611209
+
+"""
+from textwrap import dedent
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e6a2d8f13b75"
+down_revision: Union[str, None] = "9c4e1f7b2a60"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+VERSIONED_TABLES = ("territory_types_dict", "target_city_types_dict")
+
+
+def upgrade() -> None:
+    # track versions of the dictionaries which cached territories tree is built from (in addition to territories_data)
+    for table in VERSIONED_TABLES:
+        op.execute(sa.text(f"INSERT INTO public.tables_versions_data (table_name) VALUES ('{table}')"))
+        op.execute(
+            sa.text(
+                dedent(
+                    f"""
+                    CREATE TRIGGER increment_table_version_trigger
+                    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON public.{table}
+                    FOR EACH STATEMENT
+                    EXECUTE FUNCTION public.trigger_increment_table_version();
+                    """
+                )
+            )
+        )
+
+
+def downgrade() -> None:
+    # drop version triggers
+    for table in VERSIONED_TABLES:
+        op.execute(sa.text(f"DROP TRIGGER IF EXISTS increment_table_version_trigger ON public.{table};"))
+        op.execute(sa.text(f"DELETE FROM public.tables_versions_data WHERE table_name = '{table}'"))
@@ -0,0 +1,50 @@
+# pylint: disable=no-member,invalid-name,missing-function-docstring
+"""trigram name indexes
+
+Revision ID: 4f7b0c9e2d13
+Revises: e6a2d8f13b75
+Create Date: 2026-10-19 01:24:05.735518
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4f7b0c9e2d13"
+down_revision: Union[str, None] = "e6a2d8f13b75"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (schema, table, column) searched with `ILIKE '%value%'` or by similarity, dictionaries are small enough
+# to be scanned sequentially
+TRIGRAM_INDEXED_COLUMNS = (
+    ("public", "territories_data", "name"),
+    ("public", "physical_objects_data", "name"),
+    ("public", "services_data", "name"),
+    ("public", "territory_indicators_data", "information_source"),
+    ("user_projects", "projects_data", "name"),
+)
+
+
+def upgrade() -> None:
+    op.execute(sa.text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
+    # trigram GIN indexes are used by ILIKE with leading wildcard and by similarity operators
+    for schema, table, column in TRIGRAM_INDEXED_COLUMNS:
+        op.create_index(
+            f"{table}_{column}_trgm_idx",
+            table,
+            [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+            schema=schema,
+        )
+
+
+def downgrade() -> None:
+    for schema, table, column in TRIGRAM_INDEXED_COLUMNS:
+        op.drop_index(f"{table}_{column}_trgm_idx", table, schema=schema)
+
+    # extension is not dropped, as it could have been installed before
@@ -0,0 +1,259 @@
+# pylint: disable=no-member,invalid-name,missing-function-docstring,too-many-statements
+"""projects context geometry
+
+Revision ID: a76bd3554fee
+Revises: 01ceb2ef5830
+Create Date: 2026-10-18 10:12:41.318502
+
+"""
+from textwrap import dedent
+from typing import Sequence, Union
+
+import geoalchemy2
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a76bd3554fee"
+down_revision: Union[str, None] = "01ceb2ef5830"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # create `user_projects.projects_context_data` table
+    op.create_table(
+        "projects_context_data",
+        sa.Column("project_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "geometry",
+            geoalchemy2.types.Geometry(spatial_index=False, from_text="ST_GeomFromEWKT", name="geometry"),
+            nullable=False,
+        ),
+        sa.Column("updated_at", sa.TIMESTAMP(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["project_id"],
+            ["user_projects.projects_data.project_id"],
+            name=op.f("projects_context_data_fk_project_id__projects_data"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("project_id", name=op.f("projects_context_data_pk")),
+        schema="user_projects",
+    )
+
+    # create `user_projects.projects_context_subdivided_data` table
+    op.execute(sa.schema.CreateSequence(sa.Sequence("projects_context_subdivided_data_id_seq", schema="user_projects")))
+    op.create_table(
+        "projects_context_subdivided_data",
+        sa.Column(
+            "context_piece_id",
+            sa.Integer(),
+            server_default=sa.text("nextval('user_projects.projects_context_subdivided_data_id_seq')"),
+            nullable=False,
+        ),
+        sa.Column("project_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "geometry",
+            geoalchemy2.types.Geometry(spatial_index=False, from_text="ST_GeomFromEWKT", name="geometry"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["project_id"],
+            ["user_projects.projects_data.project_id"],
+            name=op.f("projects_context_subdivided_data_fk_project_id__projects_data"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("context_piece_id", name=op.f("projects_context_subdivided_data_pk")),
+        schema="user_projects",
+    )
+
+    # create indexes
+    op.create_index(
+        "projects_context_subdivided_data_project_id_idx",
+        "projects_context_subdivided_data",
+        ["project_id"],
+        schema="user_projects",
+    )
+    op.create_index(
+        "projects_context_subdivided_data_geometry_idx",
+        "projects_context_subdivided_data",
+        ["geometry"],
+        postgresql_using="gist",
+        schema="user_projects",
+    )
+
+    # create function to recalculate context geometry of the given project
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE OR REPLACE FUNCTION user_projects.refresh_project_context_geometry(p_project_id INT)
+                RETURNS void AS $$
+                DECLARE
+                    v_context_geom GEOMETRY;
+                BEGIN
+                    SELECT ST_Union(t.geometry)
+                    INTO v_context_geom
+                    FROM public.territories_data t
+                    WHERE t.territory_id IN (
+                        SELECT jsonb_array_elements_text(p.properties -> 'context')::int
+                        FROM user_projects.projects_data p
+                        WHERE p.project_id = p_project_id
+                          AND jsonb_typeof(p.properties -> 'context') = 'array'
+                    );
+
+                    DELETE FROM user_projects.projects_context_subdivided_data WHERE project_id = p_project_id;
+
+                    IF v_context_geom IS NULL THEN
+                        DELETE FROM user_projects.projects_context_data WHERE project_id = p_project_id;
+                        RETURN;
+                    END IF;
+
+                    INSERT INTO user_projects.projects_context_data (project_id, geometry, updated_at)
+                    VALUES (p_project_id, v_context_geom, now())
+                    ON CONFLICT (project_id) DO UPDATE
+                    SET geometry = EXCLUDED.geometry, updated_at = EXCLUDED.updated_at;
+
+                    INSERT INTO user_projects.projects_context_subdivided_data (project_id, geometry)
+                    SELECT p_project_id, ST_Subdivide(v_context_geom, 256);
+                END;
+                $$ LANGUAGE plpgsql;
+                """
+            )
+        )
+    )
+
+    # create trigger on insert/update `user_projects.projects_data` (if context territories were changed)
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE OR REPLACE FUNCTION user_projects.trigger_refresh_project_context_geometry()
+                RETURNS TRIGGER AS $$
+                BEGIN
+                    IF NEW.is_regional THEN
+                        RETURN NULL;
+                    END IF;
+
+                    IF TG_OP = 'INSERT' OR (NEW.properties -> 'context') IS DISTINCT FROM (OLD.properties -> 'context') THEN
+                        PERFORM user_projects.refresh_project_context_geometry(NEW.project_id);
+                    END IF;
+
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql;
+                """
+            )
+        )
+    )
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE TRIGGER refresh_project_context_geometry_trigger
+                AFTER INSERT OR UPDATE OF properties ON user_projects.projects_data
+                FOR EACH ROW
+                EXECUTE FUNCTION user_projects.trigger_refresh_project_context_geometry();
+                """
+            )
+        )
+    )
+
+    # create trigger on update/delete `public.territories_data` (if territory geometry was changed)
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE OR REPLACE FUNCTION public.trigger_refresh_projects_context_on_territory_change()
+                RETURNS TRIGGER AS $$
+                DECLARE
+                    v_project_id INT;
+                BEGIN
+                    IF TG_OP = 'UPDATE' AND NEW.geometry IS NOT DISTINCT FROM OLD.geometry THEN
+                        RETURN NULL;
+                    END IF;
+
+                    FOR v_project_id IN
+                        SELECT p.project_id
+                        FROM user_projects.projects_data p
+                        WHERE NOT p.is_regional
+                          AND jsonb_typeof(p.properties -> 'context') = 'array'
+                          AND p.properties -> 'context' @> to_jsonb(OLD.territory_id)
+                    LOOP
+                        PERFORM user_projects.refresh_project_context_geometry(v_project_id);
+                    END LOOP;
+
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql;
+                """
+            )
+        )
+    )
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE TRIGGER refresh_projects_context_on_territory_change_trigger
+                AFTER UPDATE OF geometry OR DELETE ON public.territories_data
+                FOR EACH ROW
+                EXECUTE FUNCTION public.trigger_refresh_projects_context_on_territory_change();
+                """
+            )
+        )
+    )
+
+    # fill context geometries for existing projects
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                SELECT user_projects.refresh_project_context_geometry(project_id)
+                FROM user_projects.projects_data
+                WHERE NOT is_regional;
+                """
+            )
+        )
+    )
+
+
+def downgrade() -> None:
+    # drop triggers
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                DROP TRIGGER IF EXISTS refresh_projects_context_on_territory_change_trigger
+                ON public.territories_data;
+                """
+            )
+        )
+    )
+    op.execute(
+        sa.text(dedent("DROP FUNCTION IF EXISTS public.trigger_refresh_projects_context_on_territory_change();"))
+    )
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                DROP TRIGGER IF EXISTS refresh_project_context_geometry_trigger
+                ON user_projects.projects_data;
+                """
+            )
+        )
+    )
+    op.execute(sa.text(dedent("DROP FUNCTION IF EXISTS user_projects.trigger_refresh_project_context_geometry();")))
+    op.execute(sa.text(dedent("DROP FUNCTION IF EXISTS user_projects.refresh_project_context_geometry(INT);")))
+
+    # drop indexes
+    op.drop_index(
+        "projects_context_subdivided_data_geometry_idx", "projects_context_subdivided_data", schema="user_projects"
+    )
+    op.drop_index(
+        "projects_context_subdivided_data_project_id_idx", "projects_context_subdivided_data", schema="user_projects"
+    )
+
+    # drop tables
+    op.drop_table("projects_context_subdivided_data", schema="user_projects")
+    op.execute(sa.schema.DropSequence(sa.Sequence("projects_context_subdivided_data_id_seq", schema="user_projects")))
+    op.drop_table("projects_context_data", schema="user_projects")
@@ -0,0 +1,472 @@
+# pylint: disable=no-member,invalid-name,missing-function-docstring,too-many-statements
+"""projects context cache
+
+Revision ID: 5c0e9b1f7d42
+Revises: a76bd3554fee
+Create Date: 2026-10-18 14:37:09.611204
+
+"""
+from textwrap import dedent
+from typing import Sequence, Union
+
+import geoalchemy2
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5c0e9b1f7d42"
+down_revision: Union[str, None] = "a76bd3554fee"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, cached layers of the projects contexts built from it)
+CONTEXT_SOURCE_TABLES = (
+    ("object_geometries_data", ("object_geometries", "buffers")),
+    ("buffers_data", ("buffers",)),
+    ("functional_zones_data", ("functional_zones",)),
+)
+
+
+def upgrade() -> None:
+    # create `public.tables_versions_data` table (counters of the rarely changed tables cached by the application)
+    op.create_table(
+        "tables_versions_data",
+        sa.Column("table_name", sa.String(length=64), nullable=False),
+        sa.Column("version", sa.BigInteger(), server_default=sa.text("0"), nullable=False),
+        sa.Column("updated_at", sa.TIMESTAMP(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint("table_name", name=op.f("tables_versions_data_pk")),
+    )
+
+    # create function for statement-level triggers incrementing version of the table on every write
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE OR REPLACE FUNCTION public.trigger_increment_table_version()
+                RETURNS TRIGGER AS $$
+                BEGIN
+                    INSERT INTO public.tables_versions_data (table_name, version, updated_at)
+                    VALUES (TG_TABLE_NAME, 1, now())
+                    ON CONFLICT (table_name) DO UPDATE
+                    SET version = public.tables_versions_data.version + 1, updated_at = now();
+
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql;
+                """
+            )
+        )
+    )
+
+    # create `user_projects.projects_context_cache_data` table
+    op.create_table(
+        "projects_context_cache_data",
+        sa.Column("project_id", sa.Integer(), nullable=False),
+        sa.Column("layer", sa.String(length=32), nullable=False),
+        sa.Column("version", sa.BigInteger(), server_default=sa.text("0"), nullable=False),
+        sa.Column("built_version", sa.BigInteger(), nullable=True),
+        sa.Column("context_updated_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("built_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["project_id"],
+            ["user_projects.projects_data.project_id"],
+            name=op.f("projects_context_cache_data_fk_project_id__projects_data"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("project_id", "layer", name=op.f("projects_context_cache_data_pk")),
+        schema="user_projects",
+    )
+
+    # create `user_projects.projects_context_object_geometries_data` table
+    op.create_table(
+        "projects_context_object_geometries_data",
+        sa.Column("project_id", sa.Integer(), nullable=False),
+        sa.Column("object_geometry_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "geometry",
+            geoalchemy2.types.Geometry(spatial_index=False, from_text="ST_GeomFromEWKT", name="geometry"),
+            nullable=False,
+        ),
+        sa.Column(
+            "centre_point",
+            geoalchemy2.types.Geometry("POINT", spatial_index=False, from_text="ST_GeomFromEWKT", name="geometry"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["project_id"],
+            ["user_projects.projects_data.project_id"],
+            name=op.f("projects_context_object_geometries_data_fk_project_id__projects_data"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint(
+            "project_id", "object_geometry_id", name=op.f("projects_context_object_geometries_data_pk")
+        ),
+        schema="user_projects",
+    )
+
+    # create `user_projects.projects_context_buffers_data` table
+    op.create_table(
+        "projects_context_buffers_data",
+        sa.Column("project_id", sa.Integer(), nullable=False),
+        sa.Column("buffer_type_id", sa.Integer(), nullable=False),
+        sa.Column("urban_object_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "geometry",
+            geoalchemy2.types.Geometry(spatial_index=False, from_text="ST_GeomFromEWKT", name="geometry"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["project_id"],
+            ["user_projects.projects_data.project_id"],
+            name=op.f("projects_context_buffers_data_fk_project_id__projects_data"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint(
+            "project_id", "buffer_type_id", "urban_object_id", name=op.f("projects_context_buffers_data_pk")
+        ),
+        schema="user_projects",
+    )
+
+    # create `user_projects.projects_context_functional_zones_data` table
+    op.create_table(
+        "projects_context_functional_zones_data",
+        sa.Column("project_id", sa.Integer(), nullable=False),
+        sa.Column("functional_zone_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "geometry",
+            geoalchemy2.types.Geometry(spatial_index=False, from_text="ST_GeomFromEWKT", name="geometry"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["project_id"],
+            ["user_projects.projects_data.project_id"],
+            name=op.f("projects_context_functional_zones_data_fk_project_id__projects_data"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint(
+            "project_id", "functional_zone_id", name=op.f("projects_context_functional_zones_data_pk")
+        ),
+        schema="user_projects",
+    )
+
+    # create functions calculating layers of public objects clipped by the project context geometry
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE OR REPLACE FUNCTION user_projects.calculate_project_context_object_geometries(p_project_id INT)
+                RETURNS TABLE (object_geometry_id INT, geometry GEOMETRY, centre_point GEOMETRY) AS $$
+                    SELECT
+                        o.object_geometry_id,
+                        CASE WHEN ST_Within(o.geometry, c.geometry)
+                            THEN o.geometry
+                            ELSE clipped.geometry
+                        END,
+                        CASE WHEN ST_Within(o.geometry, c.geometry)
+                            THEN o.centre_point
+                            ELSE ST_Centroid(clipped.geometry)
+                        END
+                    FROM user_projects.projects_context_data c
+                        CROSS JOIN LATERAL (
+                            SELECT DISTINCT og.object_geometry_id
+                            FROM public.object_geometries_data og
+                                JOIN user_projects.projects_context_subdivided_data s
+                                    ON s.project_id = c.project_id AND ST_Intersects(og.geometry, s.geometry)
+                        ) ids
+                        JOIN public.object_geometries_data o ON o.object_geometry_id = ids.object_geometry_id
+                        CROSS JOIN LATERAL (SELECT ST_Intersection(o.geometry, c.geometry) AS geometry) clipped
+                    WHERE c.project_id = p_project_id AND NOT ST_IsEmpty(clipped.geometry);
+                $$ LANGUAGE sql STABLE;
+                """
+            )
+        )
+    )
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE OR REPLACE FUNCTION user_projects.calculate_project_context_buffers(p_project_id INT)
+                RETURNS TABLE (buffer_type_id INT, urban_object_id INT, geometry GEOMETRY) AS $$
+                    SELECT b.buffer_type_id, b.urban_object_id, ST_Intersection(b.geometry, c.geometry)
+                    FROM user_projects.projects_context_data c
+                        CROSS JOIN LATERAL (
+                            SELECT DISTINCT u.urban_object_id
+                            FROM public.object_geometries_data og
+                                JOIN public.urban_objects_data u ON u.object_geometry_id = og.object_geometry_id
+                                JOIN user_projects.projects_context_subdivided_data s
+                                    ON s.project_id = c.project_id AND ST_Intersects(og.geometry, s.geometry)
+                        ) ids
+                        JOIN public.buffers_data b ON b.urban_object_id = ids.urban_object_id
+                    WHERE c.project_id = p_project_id;
+                $$ LANGUAGE sql STABLE;
+                """
+            )
+        )
+    )
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE OR REPLACE FUNCTION user_projects.calculate_project_context_functional_zones(p_project_id INT)
+                RETURNS TABLE (functional_zone_id INT, geometry GEOMETRY) AS $$
+                    SELECT
+                        f.functional_zone_id,
+                        CASE WHEN ST_Within(f.geometry, c.geometry)
+                            THEN f.geometry
+                            ELSE ST_Intersection(f.geometry, c.geometry)
+                        END
+                    FROM user_projects.projects_context_data c
+                        CROSS JOIN LATERAL (
+                            SELECT DISTINCT fz.functional_zone_id
+                            FROM public.functional_zones_data fz
+                                JOIN user_projects.projects_context_subdivided_data s
+                                    ON s.project_id = c.project_id AND ST_Intersects(fz.geometry, s.geometry)
+                        ) ids
+                        JOIN public.functional_zones_data f ON f.functional_zone_id = ids.functional_zone_id
+                    WHERE c.project_id = p_project_id;
+                $$ LANGUAGE sql STABLE;
+                """
+            )
+        )
+    )
+
+    # create function to rebuild cached layer of the project context (if it is out of date),
+    # it is called by the application in background, so that reading requests do not write anything
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE OR REPLACE FUNCTION user_projects.refresh_project_context_cache(p_project_id INT, p_layer TEXT)
+                RETURNS boolean AS $$
+                DECLARE
+                    v_version BIGINT;
+                    v_context_updated_at TIMESTAMPTZ;
+                BEGIN
+                    IF p_layer NOT IN ('object_geometries', 'buffers', 'functional_zones') THEN
+                        RAISE EXCEPTION 'unknown project context layer: %', p_layer;
+                    END IF;
+
+                    PERFORM pg_advisory_xact_lock(hashtext('projects_context_cache'), p_project_id);
+
+                    IF NOT EXISTS (SELECT 1 FROM user_projects.projects_data WHERE project_id = p_project_id) THEN
+                        RETURN false;
+                    END IF;
+
+                    -- invalidating transactions upsert the same row, so they wait for this one if the row is new
+                    INSERT INTO user_projects.projects_context_cache_data (project_id, layer)
+                    VALUES (p_project_id, p_layer)
+                    ON CONFLICT (project_id, layer) DO NOTHING;
+
+                    SELECT updated_at
+                    INTO v_context_updated_at
+                    FROM user_projects.projects_context_data
+                    WHERE project_id = p_project_id;
+
+                    -- version is read before the layer is built, so any concurrent invalidation leaves it out of date
+                    SELECT c.version
+                    INTO v_version
+                    FROM user_projects.projects_context_cache_data c
+                    WHERE c.project_id = p_project_id
+                      AND c.layer = p_layer
+                      AND (
+                        c.built_version IS DISTINCT FROM c.version
+                        OR c.context_updated_at IS DISTINCT FROM v_context_updated_at
+                      );
+                    IF NOT FOUND THEN
+                        RETURN false;
+                    END IF;
+
+                    IF p_layer = 'object_geometries' THEN
+                        DELETE FROM user_projects.projects_context_object_geometries_data
+                        WHERE project_id = p_project_id;
+
+                        INSERT INTO user_projects.projects_context_object_geometries_data
+                            (project_id, object_geometry_id, geometry, centre_point)
+                        SELECT p_project_id, l.object_geometry_id, l.geometry, l.centre_point
+                        FROM user_projects.calculate_project_context_object_geometries(p_project_id) l;
+
+                    ELSIF p_layer = 'buffers' THEN
+                        DELETE FROM user_projects.projects_context_buffers_data
+                        WHERE project_id = p_project_id;
+
+                        INSERT INTO user_projects.projects_context_buffers_data
+                            (project_id, buffer_type_id, urban_object_id, geometry)
+                        SELECT p_project_id, l.buffer_type_id, l.urban_object_id, l.geometry
+                        FROM user_projects.calculate_project_context_buffers(p_project_id) l;
+
+                    ELSE
+                        DELETE FROM user_projects.projects_context_functional_zones_data
+                        WHERE project_id = p_project_id;
+
+                        INSERT INTO user_projects.projects_context_functional_zones_data
+                            (project_id, functional_zone_id, geometry)
+                        SELECT p_project_id, l.functional_zone_id, l.geometry
+                        FROM user_projects.calculate_project_context_functional_zones(p_project_id) l;
+                    END IF;
+
+                    UPDATE user_projects.projects_context_cache_data
+                    SET built_version = v_version,
+                        context_updated_at = v_context_updated_at,
+                        built_at = now()
+                    WHERE project_id = p_project_id AND layer = p_layer;
+
+                    RETURN true;
+                END;
+                $$ LANGUAGE plpgsql;
+                """
+            )
+        )
+    )
+
+    # create function to invalidate cached layers only of the projects which context intersects changed objects
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE OR REPLACE FUNCTION user_projects.invalidate_projects_context_cache(
+                    p_layers TEXT[],
+                    p_bbox GEOMETRY
+                )
+                RETURNS void AS $$
+                BEGIN
+                    IF p_bbox IS NULL THEN
+                        RETURN;
+                    END IF;
+
+                    -- rows are locked in the same order by concurrent transactions to avoid deadlocks
+                    INSERT INTO user_projects.projects_context_cache_data (project_id, layer, version)
+                    SELECT projects.project_id, layers.layer, 1
+                    FROM (
+                        SELECT DISTINCT s.project_id
+                        FROM user_projects.projects_context_subdivided_data s
+                        WHERE s.geometry && ST_SetSRID(p_bbox, 4326)
+                    ) projects
+                        CROSS JOIN unnest(p_layers) AS layers(layer)
+                    ORDER BY projects.project_id, layers.layer
+                    ON CONFLICT (project_id, layer) DO UPDATE
+                    SET version = user_projects.projects_context_cache_data.version + 1;
+                END;
+                $$ LANGUAGE plpgsql;
+                """
+            )
+        )
+    )
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE OR REPLACE FUNCTION user_projects.trigger_invalidate_projects_context_cache()
+                RETURNS TRIGGER AS $$
+                DECLARE
+                    v_bbox geometry;
+                BEGIN
+                    IF TG_OP = 'INSERT' THEN
+                        SELECT ST_Extent(geometry)::geometry INTO v_bbox FROM new_rows;
+                    ELSIF TG_OP = 'UPDATE' THEN
+                        SELECT ST_Extent(geometry)::geometry INTO v_bbox
+                        FROM (
+                            SELECT geometry FROM old_rows
+                            UNION ALL
+                            SELECT geometry FROM new_rows
+                        ) changed_rows;
+                    ELSE
+                        SELECT ST_Extent(geometry)::geometry INTO v_bbox FROM old_rows;
+                    END IF;
+
+                    -- trigger arguments are the names of the layers built from the table
+                    PERFORM user_projects.invalidate_projects_context_cache(TG_ARGV, v_bbox);
+
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql;
+                """
+            )
+        )
+    )
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE OR REPLACE FUNCTION user_projects.trigger_invalidate_projects_context_buffers()
+                RETURNS TRIGGER AS $$
+                DECLARE
+                    v_ids integer[];
+                    v_bbox geometry;
+                BEGIN
+                    IF TG_OP <> 'DELETE' THEN
+                        SELECT array_agg(object_geometry_id) INTO v_ids FROM new_rows;
+                    END IF;
+                    IF TG_OP <> 'INSERT' THEN
+                        SELECT v_ids || array_agg(object_geometry_id) INTO v_ids FROM old_rows;
+                    END IF;
+
+                    SELECT ST_Extent(geometry)::geometry INTO v_bbox
+                    FROM public.object_geometries_data
+                    WHERE object_geometry_id = ANY(v_ids);
+
+                    PERFORM user_projects.invalidate_projects_context_cache(ARRAY['buffers'], v_bbox);
+
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql;
+                """
+            )
+        )
+    )
+
+    # transition tables can be used only in triggers on a single event
+    triggers = [
+        (table, "trigger_invalidate_projects_context_cache", ", ".join(f"'{layer}'" for layer in layers))
+        for table, layers in CONTEXT_SOURCE_TABLES
+    ]
+    triggers.append(("urban_objects_data", "trigger_invalidate_projects_context_buffers", ""))
+    for table, function, arguments in triggers:
+        for event, transition_tables in (
+            ("INSERT", "NEW TABLE AS new_rows"),
+            ("UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+            ("DELETE", "OLD TABLE AS old_rows"),
+        ):
+            op.execute(
+                sa.text(
+                    dedent(
+                        f"""
+                        CREATE TRIGGER invalidate_projects_context_cache_{event.lower()}_trigger
+                        AFTER {event} ON public.{table}
+                        REFERENCING {transition_tables}
+                        FOR EACH STATEMENT
+                        EXECUTE FUNCTION user_projects.{function}({arguments});
+                        """
+                    )
+                )
+            )
+
+
+def downgrade() -> None:
+    # drop invalidation triggers
+    for table in (*(table for table, _ in CONTEXT_SOURCE_TABLES), "urban_objects_data"):
+        for event in ("insert", "update", "delete"):
+            op.execute(
+                sa.text(f"DROP TRIGGER IF EXISTS invalidate_projects_context_cache_{event}_trigger ON public.{table};")
+            )
+
+    # drop functions
+    op.execute(sa.text(dedent("DROP FUNCTION IF EXISTS user_projects.trigger_invalidate_projects_context_buffers();")))
+    op.execute(sa.text(dedent("DROP FUNCTION IF EXISTS user_projects.trigger_invalidate_projects_context_cache();")))
+    op.execute(
+        sa.text(dedent("DROP FUNCTION IF EXISTS user_projects.invalidate_projects_context_cache(TEXT[], GEOMETRY);"))
+    )
+    op.execute(sa.text(dedent("DROP FUNCTION IF EXISTS user_projects.refresh_project_context_cache(INT, TEXT);")))
+    for layer in ("object_geometries", "buffers", "functional_zones"):
+        op.execute(sa.text(f"DROP FUNCTION IF EXISTS user_projects.calculate_project_context_{layer}(INT);"))
+
+    # drop cache tables
+    op.drop_table("projects_context_functional_zones_data", schema="user_projects")
+    op.drop_table("projects_context_buffers_data", schema="user_projects")
+    op.drop_table("projects_context_object_geometries_data", schema="user_projects")
+    op.drop_table("projects_context_cache_data", schema="user_projects")
+
+    # drop version function
+    op.execute(sa.text(dedent("DROP FUNCTION IF EXISTS public.trigger_increment_table_version();")))
+
+    # drop `public.tables_versions_data` table
+    op.drop_table("tables_versions_data")
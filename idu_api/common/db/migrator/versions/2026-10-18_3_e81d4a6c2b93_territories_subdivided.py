@@ -0,0 +1,129 @@
+# pylint: disable=no-member,invalid-name,missing-function-docstring,too-many-statements
+"""territories subdivided
+
+Revision ID: e81d4a6c2b93
+Revises: 5c0e9b1f7d42
+Create Date: 2026-10-18 17:52:26.104937
+
+"""
+from textwrap import dedent
+from typing import Sequence, Union
+
+import geoalchemy2
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e81d4a6c2b93"
+down_revision: Union[str, None] = "5c0e9b1f7d42"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # create `public.territories_subdivided_data` table
+    op.execute(sa.schema.CreateSequence(sa.Sequence("territories_subdivided_data_id_seq")))
+    op.create_table(
+        "territories_subdivided_data",
+        sa.Column(
+            "territory_piece_id",
+            sa.Integer(),
+            server_default=sa.text("nextval('territories_subdivided_data_id_seq')"),
+            nullable=False,
+        ),
+        sa.Column("territory_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "geometry",
+            geoalchemy2.types.Geometry(spatial_index=False, from_text="ST_GeomFromEWKT", name="geometry"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["territory_id"],
+            ["territories_data.territory_id"],
+            name=op.f("territories_subdivided_data_fk_territory_id__territories_data"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("territory_piece_id", name=op.f("territories_subdivided_data_pk")),
+    )
+
+    # create indexes
+    op.create_index("territories_subdivided_data_territory_id_idx", "territories_subdivided_data", ["territory_id"])
+    op.create_index(
+        "territories_subdivided_data_geometry_idx",
+        "territories_subdivided_data",
+        ["geometry"],
+        postgresql_using="gist",
+    )
+
+    # create trigger on insert/update `public.territories_data` (if territory geometry was changed)
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE OR REPLACE FUNCTION public.trigger_refresh_territory_subdivided_geometry()
+                RETURNS TRIGGER AS $$
+                BEGIN
+                    IF TG_OP = 'UPDATE' AND NEW.geometry IS NOT DISTINCT FROM OLD.geometry THEN
+                        RETURN NULL;
+                    END IF;
+
+                    DELETE FROM public.territories_subdivided_data WHERE territory_id = NEW.territory_id;
+
+                    INSERT INTO public.territories_subdivided_data (territory_id, geometry)
+                    SELECT NEW.territory_id, ST_Subdivide(NEW.geometry, 256);
+
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql;
+                """
+            )
+        )
+    )
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE TRIGGER refresh_territory_subdivided_geometry_trigger
+                AFTER INSERT OR UPDATE OF geometry ON public.territories_data
+                FOR EACH ROW
+                EXECUTE FUNCTION public.trigger_refresh_territory_subdivided_geometry();
+                """
+            )
+        )
+    )
+
+    # fill subdivided geometries for existing territories
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                INSERT INTO public.territories_subdivided_data (territory_id, geometry)
+                SELECT territory_id, ST_Subdivide(geometry, 256)
+                FROM public.territories_data;
+                """
+            )
+        )
+    )
+
+
+def downgrade() -> None:
+    # drop trigger
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                DROP TRIGGER IF EXISTS refresh_territory_subdivided_geometry_trigger
+                ON public.territories_data;
+                """
+            )
+        )
+    )
+    op.execute(sa.text(dedent("DROP FUNCTION IF EXISTS public.trigger_refresh_territory_subdivided_geometry();")))
+
+    # drop indexes
+    op.drop_index("territories_subdivided_data_geometry_idx", "territories_subdivided_data")
+    op.drop_index("territories_subdivided_data_territory_id_idx", "territories_subdivided_data")
+
+    # drop table
+    op.drop_table("territories_subdivided_data")
+    op.execute(sa.schema.DropSequence(sa.Sequence("territories_subdivided_data_id_seq")))
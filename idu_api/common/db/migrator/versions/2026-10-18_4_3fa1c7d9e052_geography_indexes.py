@@ -0,0 +1,43 @@
+# pylint: disable=no-member,invalid-name,missing-function-docstring,too-many-statements
+"""geography indexes
+
+Revision ID: 3fa1c7d9e052
+Revises: e81d4a6c2b93
+Create Date: 2026-10-18 19:04:11.527390
+
+"""
+from textwrap import dedent
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3fa1c7d9e052"
+down_revision: Union[str, None] = "e81d4a6c2b93"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXED_TABLES = ("object_geometries_data", "functional_zones_data")
+
+
+def upgrade() -> None:
+    # create geography expression indexes for `ST_DWithin` and KNN (`<->`) proximity search
+    for table in INDEXED_TABLES:
+        op.execute(
+            sa.text(
+                dedent(
+                    f"""
+                    CREATE INDEX IF NOT EXISTS {table}_geography_idx
+                    ON public.{table}
+                    USING gist ((geometry::geography(Geometry, 4326)));
+                    """
+                )
+            )
+        )
+
+
+def downgrade() -> None:
+    # drop indexes
+    for table in INDEXED_TABLES:
+        op.execute(sa.text(dedent(f"DROP INDEX IF EXISTS public.{table}_geography_idx;")))
@@ -0,0 +1,1023 @@
+# pylint: disable=no-member,invalid-name,missing-function-docstring,too-many-statements
+"""buffers queue
+
+Revision ID: 9d2e6b4a1f37
+Revises: 3fa1c7d9e052
+Create Date: 2026-10-18 21:15:37.861024
+
+"""
+from textwrap import dedent
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9d2e6b4a1f37"
+down_revision: Union[str, None] = "3fa1c7d9e052"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # create `buffers_queue_data` tables
+    for schema in ("public", "user_projects"):
+        op.create_table(
+            "buffers_queue_data",
+            sa.Column("urban_object_id", sa.Integer(), nullable=False),
+            sa.Column("queued_at", sa.TIMESTAMP(timezone=True), server_default=sa.func.now(), nullable=False),
+            sa.ForeignKeyConstraint(
+                ["urban_object_id"],
+                [f"{schema}.urban_objects_data.urban_object_id"],
+                name=op.f("buffers_queue_data_fk_urban_object_id__urban_objects_data"),
+                ondelete="CASCADE",
+            ),
+            sa.PrimaryKeyConstraint("urban_object_id", name=op.f("buffers_queue_data_pk")),
+            schema=schema,
+        )
+        op.create_index("buffers_queue_data_queued_at_idx", "buffers_queue_data", ["queued_at"], schema=schema)
+
+    # drop row-level triggers which recalculate buffers inside the writing transaction
+    for schema in ("public", "user_projects"):
+        for trigger, table, function in (
+            (
+                "update_buffers_on_urban_object_trigger",
+                "urban_objects_data",
+                "trigger_update_buffers_for_urban_object",
+            ),
+            (
+                "update_buffer_on_update_physical_object_trigger",
+                "physical_objects_data",
+                "trigger_update_buffer_on_update_physical_object",
+            ),
+            (
+                "update_buffer_on_update_service_trigger",
+                "services_data",
+                "trigger_update_buffer_on_update_service",
+            ),
+        ):
+            op.execute(sa.text(dedent(f"DROP TRIGGER IF EXISTS {trigger} ON {schema}.{table};")))
+            op.execute(sa.text(dedent(f"DROP FUNCTION IF EXISTS {schema}.{function}();")))
+
+    # create statement-level triggers on insert/update `urban_objects_data` to enqueue changed urban objects
+    for schema in ("public", "user_projects"):
+        condition = "" if schema == "public" else "WHERE public_urban_object_id IS NULL"
+        op.execute(
+            sa.text(
+                dedent(
+                    f"""
+                    CREATE OR REPLACE FUNCTION {schema}.trigger_enqueue_buffers_for_urban_objects()
+                    RETURNS TRIGGER AS $$
+                    BEGIN
+                        INSERT INTO {schema}.buffers_queue_data (urban_object_id)
+                        SELECT DISTINCT urban_object_id
+                        FROM new_rows
+                        {condition}
+                        ON CONFLICT (urban_object_id) DO NOTHING;
+
+                        RETURN NULL;
+                    END;
+                    $$ LANGUAGE plpgsql;
+                    """
+                )
+            )
+        )
+        for operation in ("INSERT", "UPDATE"):
+            op.execute(
+                sa.text(
+                    dedent(
+                        f"""
+                        CREATE TRIGGER enqueue_buffers_on_{operation.lower()}_urban_objects_trigger
+                        AFTER {operation} ON {schema}.urban_objects_data
+                        REFERENCING NEW TABLE AS new_rows
+                        FOR EACH STATEMENT
+                        EXECUTE FUNCTION {schema}.trigger_enqueue_buffers_for_urban_objects();
+                        """
+                    )
+                )
+            )
+
+    # create statement-level triggers on update `physical_objects_data` (if physical_object_type were changed)
+    for schema in ("public", "user_projects"):
+        changed = (
+            "SELECT n.physical_object_id FROM new_rows n JOIN old_rows o ON o.physical_object_id = n.physical_object_id"
+            " WHERE n.physical_object_type_id IS DISTINCT FROM o.physical_object_type_id"
+        )
+        if schema == "public":
+            enqueue_logic = f"""
+                INSERT INTO public.buffers_queue_data (urban_object_id)
+                WITH changed AS ({changed})
+                SELECT DISTINCT uod.urban_object_id
+                FROM changed c
+                JOIN public.urban_objects_data uod ON uod.physical_object_id = c.physical_object_id
+                WHERE uod.service_id IS NULL
+                ON CONFLICT (urban_object_id) DO NOTHING;
+
+                INSERT INTO user_projects.buffers_queue_data (urban_object_id)
+                WITH changed AS ({changed})
+                SELECT DISTINCT uod.urban_object_id
+                FROM changed c
+                JOIN user_projects.urban_objects_data uod ON uod.public_physical_object_id = c.physical_object_id
+                WHERE uod.service_id IS NULL AND uod.public_service_id IS NULL
+                ON CONFLICT (urban_object_id) DO NOTHING;
+            """
+        else:
+            enqueue_logic = f"""
+                INSERT INTO user_projects.buffers_queue_data (urban_object_id)
+                WITH changed AS ({changed})
+                SELECT DISTINCT uod.urban_object_id
+                FROM changed c
+                JOIN user_projects.urban_objects_data uod ON uod.physical_object_id = c.physical_object_id
+                WHERE uod.service_id IS NULL AND uod.public_service_id IS NULL
+                ON CONFLICT (urban_object_id) DO NOTHING;
+            """
+
+        op.execute(
+            sa.text(
+                dedent(
+                    f"""
+                    CREATE OR REPLACE FUNCTION {schema}.trigger_enqueue_buffers_on_update_physical_objects()
+                    RETURNS TRIGGER AS $$
+                    BEGIN
+                        {enqueue_logic}
+
+                        RETURN NULL;
+                    END;
+                    $$ LANGUAGE plpgsql;
+                    """
+                )
+            )
+        )
+        op.execute(
+            sa.text(
+                dedent(
+                    f"""
+                    CREATE TRIGGER enqueue_buffers_on_update_physical_objects_trigger
+                    AFTER UPDATE ON {schema}.physical_objects_data
+                    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+                    FOR EACH STATEMENT
+                    EXECUTE FUNCTION {schema}.trigger_enqueue_buffers_on_update_physical_objects();
+                    """
+                )
+            )
+        )
+
+    # create statement-level triggers on update `services_data` (if service_type were changed)
+    for schema in ("public", "user_projects"):
+        changed = (
+            "SELECT n.service_id FROM new_rows n JOIN old_rows o ON o.service_id = n.service_id"
+            " WHERE n.service_type_id IS DISTINCT FROM o.service_type_id"
+        )
+        if schema == "public":
+            enqueue_logic = f"""
+                INSERT INTO public.buffers_queue_data (urban_object_id)
+                WITH changed AS ({changed})
+                SELECT DISTINCT uod.urban_object_id
+                FROM changed c
+                JOIN public.urban_objects_data uod ON uod.service_id = c.service_id
+                ON CONFLICT (urban_object_id) DO NOTHING;
+
+                INSERT INTO user_projects.buffers_queue_data (urban_object_id)
+                WITH changed AS ({changed})
+                SELECT DISTINCT uod.urban_object_id
+                FROM changed c
+                JOIN user_projects.urban_objects_data uod ON uod.public_service_id = c.service_id
+                ON CONFLICT (urban_object_id) DO NOTHING;
+            """
+        else:
+            enqueue_logic = f"""
+                INSERT INTO user_projects.buffers_queue_data (urban_object_id)
+                WITH changed AS ({changed})
+                SELECT DISTINCT uod.urban_object_id
+                FROM changed c
+                JOIN user_projects.urban_objects_data uod ON uod.service_id = c.service_id
+                ON CONFLICT (urban_object_id) DO NOTHING;
+            """
+
+        op.execute(
+            sa.text(
+                dedent(
+                    f"""
+                    CREATE OR REPLACE FUNCTION {schema}.trigger_enqueue_buffers_on_update_services()
+                    RETURNS TRIGGER AS $$
+                    BEGIN
+                        {enqueue_logic}
+
+                        RETURN NULL;
+                    END;
+                    $$ LANGUAGE plpgsql;
+                    """
+                )
+            )
+        )
+        op.execute(
+            sa.text(
+                dedent(
+                    f"""
+                    CREATE TRIGGER enqueue_buffers_on_update_services_trigger
+                    AFTER UPDATE ON {schema}.services_data
+                    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+                    FOR EACH STATEMENT
+                    EXECUTE FUNCTION {schema}.trigger_enqueue_buffers_on_update_services();
+                    """
+                )
+            )
+        )
+
+    # create functions to recalculate buffers of a batch of queued urban objects set-wise
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE OR REPLACE FUNCTION public.process_buffers_queue(p_batch_size INT)
+                RETURNS INT AS $$
+                DECLARE
+                    v_ids INT[];
+                BEGIN
+                    WITH batch AS (
+                        DELETE FROM public.buffers_queue_data
+                        WHERE urban_object_id IN (
+                            SELECT urban_object_id
+                            FROM public.buffers_queue_data
+                            ORDER BY queued_at
+                            LIMIT p_batch_size
+                            FOR UPDATE SKIP LOCKED
+                        )
+                        RETURNING urban_object_id
+                    )
+                    SELECT array_agg(urban_object_id) INTO v_ids FROM batch;
+
+                    IF v_ids IS NULL THEN
+                        RETURN 0;
+                    END IF;
+
+                    INSERT INTO public.buffers_data (buffer_type_id, urban_object_id, geometry)
+                    SELECT
+                        d.buffer_type_id,
+                        uod.urban_object_id,
+                        ST_Difference(
+                            ST_Transform(
+                                ST_Buffer(ogd.geometry::geography, d.buffer_value)::geometry,
+                                ST_SRID(ogd.geometry)
+                            ),
+                            ogd.geometry
+                        )
+                    FROM public.urban_objects_data uod
+                    JOIN public.object_geometries_data ogd ON ogd.object_geometry_id = uod.object_geometry_id
+                    LEFT JOIN public.physical_objects_data pod ON pod.physical_object_id = uod.physical_object_id
+                    LEFT JOIN public.services_data sd ON sd.service_id = uod.service_id
+                    JOIN public.default_buffer_values_dict d ON (
+                        (uod.service_id IS NULL AND d.physical_object_type_id = pod.physical_object_type_id)
+                        OR (uod.service_id IS NOT NULL AND d.service_type_id = sd.service_type_id)
+                    )
+                    WHERE uod.urban_object_id = ANY(v_ids)
+                    ON CONFLICT (buffer_type_id, urban_object_id) DO UPDATE
+                    SET geometry = EXCLUDED.geometry
+                    WHERE NOT public.buffers_data.is_custom;
+
+                    RETURN array_length(v_ids, 1);
+                END;
+                $$ LANGUAGE plpgsql;
+                """
+            )
+        )
+    )
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE OR REPLACE FUNCTION user_projects.process_buffers_queue(p_batch_size INT)
+                RETURNS INT AS $$
+                DECLARE
+                    v_ids INT[];
+                BEGIN
+                    WITH batch AS (
+                        DELETE FROM user_projects.buffers_queue_data
+                        WHERE urban_object_id IN (
+                            SELECT urban_object_id
+                            FROM user_projects.buffers_queue_data
+                            ORDER BY queued_at
+                            LIMIT p_batch_size
+                            FOR UPDATE SKIP LOCKED
+                        )
+                        RETURNING urban_object_id
+                    )
+                    SELECT array_agg(urban_object_id) INTO v_ids FROM batch;
+
+                    IF v_ids IS NULL THEN
+                        RETURN 0;
+                    END IF;
+
+                    INSERT INTO user_projects.buffers_data (buffer_type_id, urban_object_id, geometry)
+                    SELECT
+                        b.buffer_type_id,
+                        b.urban_object_id,
+                        CASE
+                            WHEN b.is_regional THEN b.geometry
+                            ELSE ST_Intersection(b.geometry, b.project_geometry)
+                        END
+                    FROM (
+                        SELECT
+                            d.buffer_type_id,
+                            o.urban_object_id,
+                            o.is_regional,
+                            o.project_geometry,
+                            ST_Difference(
+                                ST_Transform(
+                                    ST_Buffer(o.geometry::geography, d.buffer_value)::geometry,
+                                    ST_SRID(o.geometry)
+                                ),
+                                o.geometry
+                            ) AS geometry
+                        FROM (
+                            SELECT
+                                uod.urban_object_id,
+                                COALESCE(up_ogd.geometry, pub_ogd.geometry) AS geometry,
+                                CASE
+                                    WHEN uod.service_id IS NULL AND uod.public_service_id IS NULL
+                                    THEN COALESCE(pod.physical_object_type_id, p_pod.physical_object_type_id)
+                                END AS physical_object_type_id,
+                                COALESCE(sd.service_type_id, p_sd.service_type_id) AS service_type_id,
+                                p.is_regional,
+                                ptd.geometry AS project_geometry
+                            FROM user_projects.urban_objects_data uod
+                            LEFT JOIN user_projects.object_geometries_data up_ogd
+                                ON up_ogd.object_geometry_id = uod.object_geometry_id
+                            LEFT JOIN public.object_geometries_data pub_ogd
+                                ON pub_ogd.object_geometry_id = uod.public_object_geometry_id
+                            LEFT JOIN user_projects.physical_objects_data pod
+                                ON pod.physical_object_id = uod.physical_object_id
+                            LEFT JOIN public.physical_objects_data p_pod
+                                ON p_pod.physical_object_id = uod.public_physical_object_id
+                            LEFT JOIN user_projects.services_data sd ON sd.service_id = uod.service_id
+                            LEFT JOIN public.services_data p_sd ON p_sd.service_id = uod.public_service_id
+                            JOIN user_projects.scenarios_data s ON s.scenario_id = uod.scenario_id
+                            JOIN user_projects.projects_data p ON p.project_id = s.project_id
+                            LEFT JOIN user_projects.projects_territory_data ptd ON ptd.project_id = p.project_id
+                            WHERE uod.urban_object_id = ANY(v_ids) AND uod.public_urban_object_id IS NULL
+                        ) o
+                        JOIN public.default_buffer_values_dict d ON (
+                            (o.physical_object_type_id IS NOT NULL AND d.physical_object_type_id = o.physical_object_type_id)
+                            OR (o.service_type_id IS NOT NULL AND d.service_type_id = o.service_type_id)
+                        )
+                        WHERE o.geometry IS NOT NULL AND (o.is_regional OR o.project_geometry IS NOT NULL)
+                    ) b
+                    ON CONFLICT (buffer_type_id, urban_object_id) DO UPDATE
+                    SET geometry = EXCLUDED.geometry
+                    WHERE NOT user_projects.buffers_data.is_custom;
+
+                    RETURN array_length(v_ids, 1);
+                END;
+                $$ LANGUAGE plpgsql;
+                """
+            )
+        )
+    )
+
+
+def downgrade() -> None:
+    # drop queue processing functions
+    for schema in ("public", "user_projects"):
+        op.execute(sa.text(dedent(f"DROP FUNCTION IF EXISTS {schema}.process_buffers_queue(INT);")))
+
+    # drop enqueue triggers
+    for schema in ("public", "user_projects"):
+        for trigger, table in (
+            ("enqueue_buffers_on_insert_urban_objects_trigger", "urban_objects_data"),
+            ("enqueue_buffers_on_update_urban_objects_trigger", "urban_objects_data"),
+            ("enqueue_buffers_on_update_physical_objects_trigger", "physical_objects_data"),
+            ("enqueue_buffers_on_update_services_trigger", "services_data"),
+        ):
+            op.execute(sa.text(dedent(f"DROP TRIGGER IF EXISTS {trigger} ON {schema}.{table};")))
+        for function in (
+            "trigger_enqueue_buffers_for_urban_objects",
+            "trigger_enqueue_buffers_on_update_physical_objects",
+            "trigger_enqueue_buffers_on_update_services",
+        ):
+            op.execute(sa.text(dedent(f"DROP FUNCTION IF EXISTS {schema}.{function}();")))
+
+    # drop tables
+    for schema in ("public", "user_projects"):
+        op.drop_index("buffers_queue_data_queued_at_idx", "buffers_queue_data", schema=schema)
+        op.drop_table("buffers_queue_data", schema=schema)
+
+    # restore row-level triggers of revision 01ceb2ef5830 which recalculate buffers inside the writing transaction
+
+    # create triggers on insert/update `urban_objects_data` (if default buffer radius exists)
+    for schema in ("public", "user_projects"):
+        if schema == "public":
+            geometry_logic = """
+                SELECT geometry INTO v_object_geom
+                FROM public.object_geometries_data
+                WHERE object_geometry_id = NEW.object_geometry_id;
+            """
+            buffer_type_logic = """
+                IF NEW.service_id IS NOT NULL THEN
+                    SELECT service_type_id INTO v_service_type_id
+                    FROM public.services_data
+                    WHERE service_id = NEW.service_id;
+                    v_physical_object_type_id := NULL;
+                ELSE
+                    SELECT physical_object_type_id INTO v_physical_object_type_id
+                    FROM public.physical_objects_data
+                    WHERE physical_object_id = NEW.physical_object_id;
+                    v_service_type_id := NULL;
+                END IF;
+            """
+
+            project_geometry_logic = ""
+
+            result_geom = """
+                result_geom := ST_Difference(
+                    ST_Transform(
+                        ST_Buffer(v_object_geom::geography, v_buffer_value)::geometry,
+                        ST_SRID(v_object_geom)
+                    ),
+                    v_object_geom
+                );
+            """
+        else:
+            geometry_logic = """
+                IF NEW.public_urban_object_id IS NOT NULL THEN
+                    RETURN NULL;
+                ELSIF NEW.public_object_geometry_id IS NOT NULL THEN
+                    SELECT geometry INTO v_object_geom
+                    FROM public.object_geometries_data
+                    WHERE object_geometry_id = NEW.public_object_geometry_id;
+                ELSE
+                    SELECT geometry INTO v_object_geom
+                    FROM user_projects.object_geometries_data
+                    WHERE object_geometry_id = NEW.object_geometry_id;
+                END IF;
+            """
+
+            buffer_type_logic = """
+                IF NEW.public_service_id IS NOT NULL THEN
+                    SELECT service_type_id INTO v_service_type_id
+                    FROM public.services_data
+                    WHERE service_id = NEW.public_service_id;
+                    v_physical_object_type_id := NULL;
+                ELSIF NEW.service_id IS NOT NULL THEN
+                    SELECT service_type_id INTO v_service_type_id
+                    FROM user_projects.services_data
+                    WHERE service_id = NEW.service_id;
+                    v_physical_object_type_id := NULL;
+                ELSIF NEW.public_physical_object_id IS NOT NULL THEN
+                    SELECT physical_object_type_id INTO v_physical_object_type_id
+                    FROM public.physical_objects_data
+                    WHERE physical_object_id = NEW.public_physical_object_id;
+                    v_service_type_id := NULL;
+                ELSE
+                    SELECT physical_object_type_id INTO v_physical_object_type_id
+                    FROM user_projects.physical_objects_data
+                    WHERE physical_object_id = NEW.physical_object_id;
+                    v_service_type_id := NULL;
+                END IF;
+            """
+
+            project_geometry_logic = """
+                SELECT ptd.geometry, p.is_regional
+                INTO v_project_geom, v_is_regional
+                FROM user_projects.urban_objects_data uod
+                JOIN user_projects.scenarios_data s ON uod.scenario_id = s.scenario_id
+                JOIN user_projects.projects_data p ON s.project_id = p.project_id
+                JOIN user_projects.projects_territory_data ptd ON p.project_id = ptd.project_id
+                WHERE uod.urban_object_id = NEW.urban_object_id;
+                    
+                IF v_project_geom IS NULL AND NOT v_is_regional THEN
+                    RAISE EXCEPTION 'Could not find project territory geometry for urban_object_id=%', NEW.urban_object_id;
+                END IF;
+            """
+
+            result_geom = """
+                IF NOT v_is_regional THEN 
+                    result_geom := ST_Intersection(
+                        ST_Difference(
+                            ST_Transform(
+                                ST_Buffer(v_object_geom::geography, v_buffer_value)::geometry,
+                                ST_SRID(v_object_geom)
+                            ),
+                            v_object_geom
+                        ),
+                        v_project_geom
+                    );
+                ELSE
+                    result_geom := ST_Difference(
+                        ST_Transform(
+                            ST_Buffer(v_object_geom::geography, v_buffer_value)::geometry,
+                            ST_SRID(v_object_geom)
+                        ),
+                        v_object_geom
+                    );
+                END IF;
+            """
+
+        op.execute(
+            sa.text(
+                dedent(
+                    f"""
+                    CREATE OR REPLACE FUNCTION {schema}.trigger_update_buffers_for_urban_object()
+                    RETURNS TRIGGER AS $$
+                    DECLARE
+                        v_object_geom GEOMETRY;
+                        v_physical_object_type_id INT;
+                        v_service_type_id INT;
+                        v_buffer_type_id INT;
+                        v_buffer_value FLOAT;
+                        srid INT;
+                        result_geom GEOMETRY;
+                        v_project_geom GEOMETRY;
+                        v_is_regional BOOLEAN;
+                    BEGIN
+                        -- 1. Get the geometry
+                        {geometry_logic}
+                    
+                        IF v_object_geom IS NULL THEN
+                            RAISE EXCEPTION 'Cannot find geometry for urban_object_id = %, schema = %', NEW.urban_object_id, TG_TABLE_SCHEMA;
+                        END IF;
+                        
+                        -- 1.1 Get the project's territory geometry
+                        {project_geometry_logic}
+                    
+                        -- 2. Get the type of object or service
+                        {buffer_type_logic}
+                        
+                        -- 3. Iterate through buffer values
+                        FOR v_buffer_type_id, v_buffer_value IN
+                            SELECT buffer_type_id, buffer_value
+                            FROM default_buffer_values_dict
+                            WHERE
+                                (physical_object_type_id = v_physical_object_type_id AND v_physical_object_type_id IS NOT NULL)
+                                OR
+                                (service_type_id = v_service_type_id AND v_service_type_id IS NOT NULL)
+                        LOOP
+                            srid := ST_SRID(v_object_geom);
+                            
+                            {result_geom}
+                
+                            IF result_geom IS NULL THEN
+                                RAISE EXCEPTION 'Resulting geometry is NULL for urban_object_id=%, buffer_type_id=%', NEW.urban_object_id, v_buffer_type_id;
+                            END IF;
+                
+                            PERFORM 1 FROM {schema}.buffers_data
+                            WHERE buffer_type_id = v_buffer_type_id AND urban_object_id = NEW.urban_object_id;
+                
+                            IF FOUND THEN
+                                UPDATE {schema}.buffers_data
+                                SET geometry = result_geom
+                                WHERE buffer_type_id = v_buffer_type_id AND urban_object_id = NEW.urban_object_id;
+                            ELSE
+                                INSERT INTO {schema}.buffers_data (buffer_type_id, urban_object_id, geometry)
+                                VALUES (v_buffer_type_id, NEW.urban_object_id, result_geom);
+                            END IF;
+                        END LOOP;
+                    
+                        RETURN NULL;
+                    END;
+                    $$ LANGUAGE plpgsql;
+                    """
+                )
+            )
+        )
+
+        op.execute(
+            sa.text(
+                dedent(
+                    f"""
+                    CREATE TRIGGER update_buffers_on_urban_object_trigger
+                    AFTER INSERT OR UPDATE ON {schema}.urban_objects_data
+                    FOR EACH ROW
+                    EXECUTE FUNCTION {schema}.trigger_update_buffers_for_urban_object();
+                    """
+                )
+            )
+        )
+
+    # create triggers on update `physical_objects_data` (if physical_object_type were changed)
+    for schema in ("public", "user_projects"):
+        if schema == "public":
+            urban_objects = """
+                SELECT uod.urban_object_id, ogd.geometry, ST_SRID(ogd.geometry)
+                FROM public.urban_objects_data uod
+                JOIN public.object_geometries_data ogd ON uod.object_geometry_id = ogd.object_geometry_id
+                WHERE uod.physical_object_id = v_physical_object_id and uod.service_id is NULL 
+            """
+
+            project_geometry_logic = ""
+
+            result_geom = """
+                result_geom := ST_Difference(
+                    ST_Transform(
+                        ST_Buffer(v_object_geom::geography, v_buffer_value)::geometry,
+                        ST_SRID(v_object_geom)
+                    ),
+                    v_object_geom
+                );
+                
+                IF result_geom IS NULL THEN
+                    RAISE EXCEPTION 'Resulting geometry is NULL for urban_object_id=%, buffer_type_id=%', NEW.urban_object_id, v_buffer_type_id;
+                END IF;
+            """
+
+            user_projects_logic = f"""
+                FOR v_urban_object_id, v_object_geom, v_srid IN
+                    SELECT 
+                        uod.urban_object_id, 
+                        CASE
+                            WHEN uod.object_geometry_id IS NULL THEN pub_ogd.geometry
+                            ELSE up_ogd.geometry
+                        END,
+                        CASE
+                            WHEN uod.object_geometry_id IS NULL THEN ST_SRID(pub_ogd.geometry)
+                            ELSE ST_SRID(up_ogd.geometry)
+                        END
+                    FROM user_projects.urban_objects_data uod
+                    LEFT JOIN user_projects.object_geometries_data up_ogd ON uod.object_geometry_id = up_ogd.object_geometry_id
+                    LEFT JOIN public.object_geometries_data pub_ogd ON uod.public_object_geometry_id = pub_ogd.object_geometry_id
+                    WHERE uod.public_physical_object_id = v_physical_object_id and uod.service_id is NULL and uod.public_service_id is NULL
+                
+                LOOP
+                
+                    {project_geometry_logic}
+                
+                    FOR v_buffer_type_id, v_buffer_value IN
+                        SELECT b.buffer_type_id, d.buffer_value
+                        FROM user_projects.buffers_data b
+                        JOIN public.default_buffer_values_dict d
+                          ON b.buffer_type_id = d.buffer_type_id
+                         AND d.physical_object_type_id = v_physical_object_type_id
+                        WHERE b.urban_object_id = v_urban_object_id
+                    LOOP
+                    
+                        IF NOT v_is_regional THEN 
+                            result_geom := ST_Intersection(
+                                ST_Difference(
+                                    ST_Transform(
+                                        ST_Buffer(v_object_geom::geography, v_buffer_value)::geometry,
+                                        ST_SRID(v_object_geom)
+                                    ),
+                                    v_object_geom
+                                ),
+                                v_project_geom
+                            );
+                        ELSE
+                            result_geom := ST_Difference(
+                                ST_Transform(
+                                    ST_Buffer(v_object_geom::geography, v_buffer_value)::geometry,
+                                    ST_SRID(v_object_geom)
+                                ),
+                                v_object_geom
+                            );
+                        END IF;
+        
+                        UPDATE user_projects.buffers_data
+                        SET geometry = result_geom
+                        WHERE urban_object_id = v_urban_object_id AND buffer_type_id = v_buffer_type_id;
+                    END LOOP;
+                END LOOP;
+            """
+        else:
+            urban_objects = """
+                SELECT 
+                    uod.urban_object_id, 
+                    CASE
+                        WHEN uod.object_geometry_id IS NULL THEN pub_ogd.geometry
+                        ELSE up_ogd.geometry
+                    END,
+                    CASE
+                        WHEN uod.object_geometry_id IS NULL THEN ST_SRID(pub_ogd.geometry)
+                        ELSE ST_SRID(up_ogd.geometry)
+                    END
+                FROM user_projects.urban_objects_data uod
+                LEFT JOIN user_projects.object_geometries_data up_ogd ON uod.object_geometry_id = up_ogd.object_geometry_id
+                LEFT JOIN public.object_geometries_data pub_ogd ON uod.public_object_geometry_id = pub_ogd.object_geometry_id
+                WHERE uod.physical_object_id = v_physical_object_id and uod.service_id is NULL and uod.public_service_id is NULL
+            """
+
+            project_geometry_logic = """
+                SELECT ptd.geometry, p.is_regional
+                INTO v_project_geom, v_is_regional
+                FROM user_projects.urban_objects_data uod
+                JOIN user_projects.scenarios_data s ON uod.scenario_id = s.scenario_id
+                JOIN user_projects.projects_data p ON s.project_id = p.project_id
+                JOIN user_projects.projects_territory_data ptd ON p.project_id = ptd.project_id
+                WHERE uod.urban_object_id = v_urban_object_id;
+                    
+                IF v_project_geom IS NULL AND NOT v_is_regional THEN
+                    RAISE EXCEPTION 'Could not find project territory geometry for urban_object_id=%', NEW.urban_object_id;
+                END IF;
+            """
+
+            result_geom = """
+                IF NOT v_is_regional THEN 
+                    result_geom := ST_Intersection(
+                        ST_Difference(
+                            ST_Transform(
+                                ST_Buffer(v_object_geom::geography, v_buffer_value)::geometry,
+                                ST_SRID(v_object_geom)
+                            ),
+                            v_object_geom
+                        ),
+                        v_project_geom
+                    );
+                ELSE
+                    result_geom := ST_Difference(
+                        ST_Transform(
+                            ST_Buffer(v_object_geom::geography, v_buffer_value)::geometry,
+                            ST_SRID(v_object_geom)
+                        ),
+                        v_object_geom
+                    );
+                END IF;
+                
+                IF result_geom IS NULL  THEN
+                    RAISE EXCEPTION 'Resulting geometry is NULL for urban_object_id=%, buffer_type_id=%', NEW.urban_object_id, v_buffer_type_id;
+                END IF;
+            """
+
+            user_projects_logic = ""
+
+        op.execute(
+            sa.text(
+                dedent(
+                    f"""
+                    CREATE OR REPLACE FUNCTION {schema}.trigger_update_buffer_on_update_physical_object()
+                    RETURNS TRIGGER AS $$
+                    DECLARE
+                        v_physical_object_id INT := NEW.physical_object_id;
+                        v_physical_object_type_id INT := NEW.physical_object_type_id;
+                    
+                        v_urban_object_id INT;
+                        v_buffer_type_id INT;
+                        v_buffer_value FLOAT;
+                        v_object_geom GEOMETRY;
+                        v_srid INT;
+                        result_geom GEOMETRY;
+                        v_project_geom GEOMETRY;
+                        v_is_regional BOOLEAN;
+                    BEGIN
+                        -- Go through all urban_object_ids associated with the changed physical_object_id and not having a service_id.
+                        FOR v_urban_object_id, v_object_geom, v_srid IN
+                            {urban_objects}
+                        LOOP
+                            
+                            {project_geometry_logic}
+                            
+                            -- Updating buffers associated with this urban_object_id and non-custom ones
+                            FOR v_buffer_type_id, v_buffer_value IN
+                                SELECT b.buffer_type_id, d.buffer_value
+                                FROM {schema}.buffers_data b
+                                JOIN public.default_buffer_values_dict d
+                                  ON b.buffer_type_id = d.buffer_type_id AND d.physical_object_type_id = v_physical_object_type_id
+                                WHERE b.urban_object_id = v_urban_object_id AND b.is_custom = false
+                            LOOP                    
+                                
+                                {result_geom}
+                            
+                                -- Update buffer geometry
+                                UPDATE public.buffers_data
+                                SET geometry = result_geom
+                                WHERE urban_object_id = v_urban_object_id AND buffer_type_id = v_buffer_type_id;
+                            END LOOP;
+                        END LOOP;
+    
+                        {user_projects_logic}
+                        
+                    RETURN NEW;
+                    END;
+                    $$ LANGUAGE plpgsql;
+                    """
+                )
+            )
+        )
+
+        op.execute(
+            sa.text(
+                dedent(
+                    f"""
+                    CREATE TRIGGER update_buffer_on_update_physical_object_trigger
+                    AFTER UPDATE OF physical_object_type_id ON {schema}.physical_objects_data
+                    FOR EACH ROW
+                    WHEN (OLD.physical_object_type_id IS DISTINCT FROM NEW.physical_object_type_id)
+                    EXECUTE FUNCTION {schema}.trigger_update_buffer_on_update_physical_object();
+                    """
+                )
+            )
+        )
+
+    # create triggers on update `services_data` (if service_type were changed)
+    for schema in ("public", "user_projects"):
+        if schema == "public":
+            urban_objects = """
+                SELECT uod.urban_object_id, ogd.geometry, ST_SRID(ogd.geometry) 
+                FROM public.urban_objects_data uod 
+                JOIN public.object_geometries_data ogd ON uod.object_geometry_id = ogd.object_geometry_id 
+                WHERE uod.service_id = v_service_id 
+             """
+
+            project_geometry_logic = ""
+
+            result_geom = """
+                result_geom := ST_Difference(
+                    ST_Transform(
+                        ST_Buffer(v_object_geom::geography, v_buffer_value)::geometry,
+                        ST_SRID(v_object_geom)
+                    ),
+                    v_object_geom
+                );
+
+                IF result_geom IS NULL THEN
+                    RAISE EXCEPTION 'Resulting geometry is NULL for urban_object_id=%, buffer_type_id=%', NEW.urban_object_id, v_buffer_type_id;
+                END IF;
+            """
+
+            user_projects_logic = f"""
+                FOR v_urban_object_id, v_object_geom, v_srid IN
+                    SELECT 
+                        uod.urban_object_id, 
+                        CASE
+                            WHEN uod.object_geometry_id IS NULL THEN pub_ogd.geometry
+                            ELSE up_ogd.geometry
+                        END,
+                        CASE
+                            WHEN uod.object_geometry_id IS NULL THEN ST_SRID(pub_ogd.geometry)
+                            ELSE ST_SRID(up_ogd.geometry)
+                        END
+                    FROM user_projects.urban_objects_data uod
+                    LEFT JOIN user_projects.object_geometries_data up_ogd ON uod.object_geometry_id = up_ogd.object_geometry_id
+                    LEFT JOIN public.object_geometries_data pub_ogd ON uod.public_object_geometry_id = pub_ogd.object_geometry_id
+                    WHERE uod.public_service_id = v_service_id
+
+                LOOP
+
+                    {project_geometry_logic}
+
+                    FOR v_buffer_type_id, v_buffer_value IN
+                        SELECT b.buffer_type_id, d.buffer_value
+                        FROM user_projects.buffers_data b
+                        JOIN public.default_buffer_values_dict d
+                          ON b.buffer_type_id = d.buffer_type_id
+                         AND d.service_type_id = v_service_type_id
+                        WHERE b.urban_object_id = v_urban_object_id
+                    LOOP
+
+                        IF NOT v_is_regional THEN 
+                            result_geom := ST_Intersection(
+                                ST_Difference(
+                                    ST_Transform(
+                                        ST_Buffer(v_object_geom::geography, v_buffer_value)::geometry,
+                                        ST_SRID(v_object_geom)
+                                    ),
+                                    v_object_geom
+                                ),
+                                v_project_geom
+                            );
+                        ELSE
+                            result_geom := ST_Difference(
+                                ST_Transform(
+                                    ST_Buffer(v_object_geom::geography, v_buffer_value)::geometry,
+                                    ST_SRID(v_object_geom)
+                                ),
+                                v_object_geom
+                            );
+                        END IF;
+        
+                        IF result_geom IS NULL  THEN
+                            RAISE EXCEPTION 'Resulting geometry is NULL for urban_object_id=%, buffer_type_id=%', NEW.urban_object_id, v_buffer_type_id;
+                        END IF;
+
+                        UPDATE user_projects.buffers_data
+                        SET geometry = result_geom
+                        WHERE urban_object_id = v_urban_object_id AND buffer_type_id = v_buffer_type_id;
+                    END LOOP;
+                END LOOP;
+            """
+        else:
+            urban_objects = """
+            SELECT uod.urban_object_id, 
+                   CASE 
+                       WHEN uod.object_geometry_id IS NULL THEN pub_ogd.geometry 
+                       ELSE up_ogd.geometry 
+                    END, 
+                   CASE 
+                       WHEN uod.object_geometry_id IS NULL THEN ST_SRID(pub_ogd.geometry) 
+                       ELSE ST_SRID(up_ogd.geometry) 
+                    END
+            FROM user_projects.urban_objects_data uod
+                     LEFT JOIN user_projects.object_geometries_data up_ogd 
+                               ON uod.object_geometry_id = up_ogd.object_geometry_id
+                     LEFT JOIN public.object_geometries_data pub_ogd 
+                               ON uod.public_object_geometry_id = pub_ogd.object_geometry_id
+            WHERE uod.service_id = v_service_id 
+            """
+
+            project_geometry_logic = """
+                SELECT ptd.geometry, p.is_regional
+                INTO v_project_geom, v_is_regional
+                FROM user_projects.urban_objects_data uod
+                JOIN user_projects.scenarios_data s ON uod.scenario_id = s.scenario_id
+                JOIN user_projects.projects_data p ON s.project_id = p.project_id
+                JOIN user_projects.projects_territory_data ptd ON p.project_id = ptd.project_id
+                WHERE uod.urban_object_id = v_urban_object_id;
+    
+                IF v_project_geom IS NULL AND NOT v_is_regional THEN
+                    RAISE EXCEPTION 'Could not find project territory geometry for urban_object_id=%', NEW.urban_object_id;
+                END IF; 
+             """
+
+            result_geom = """
+                IF NOT v_is_regional THEN 
+                    result_geom := ST_Intersection(
+                        ST_Difference(
+                            ST_Transform(
+                                ST_Buffer(v_object_geom::geography, v_buffer_value)::geometry,
+                                ST_SRID(v_object_geom)
+                            ),
+                            v_object_geom
+                        ),
+                        v_project_geom
+                    );
+                ELSE
+                    result_geom := ST_Difference(
+                        ST_Transform(
+                            ST_Buffer(v_object_geom::geography, v_buffer_value)::geometry,
+                            ST_SRID(v_object_geom)
+                        ),
+                        v_object_geom
+                    );
+                END IF;
+
+                IF result_geom IS NULL  THEN
+                    RAISE EXCEPTION 'Resulting geometry is NULL for urban_object_id=%, buffer_type_id=%', NEW.urban_object_id, v_buffer_type_id;
+                END IF;
+            """
+
+            user_projects_logic = ""
+
+        op.execute(
+            sa.text(
+                dedent(
+                    f"""
+                    CREATE OR REPLACE FUNCTION {schema}.trigger_update_buffer_on_update_service()
+                    RETURNS TRIGGER AS $$
+                    DECLARE
+                        v_service_id INT := NEW.service_id;
+                        v_service_type_id INT := NEW.service_type_id;
+
+                        v_urban_object_id INT;
+                        v_buffer_type_id INT;
+                        v_buffer_value FLOAT;
+                        v_object_geom GEOMETRY;
+                        v_srid INT;
+                        result_geom GEOMETRY;
+                        v_project_geom GEOMETRY;
+                        v_is_regional BOOLEAN;
+                    BEGIN
+                        -- Go through all urban_object_ids associated with the changed service_id and not having a service_id.
+                        FOR v_urban_object_id, v_object_geom, v_srid IN
+                            {urban_objects}
+                        LOOP
+
+                            {project_geometry_logic}
+
+                            -- Updating buffers associated with this urban_object_id and non-custom ones
+                            FOR v_buffer_type_id, v_buffer_value IN
+                                SELECT b.buffer_type_id, d.buffer_value
+                                FROM {schema}.buffers_data b
+                                JOIN public.default_buffer_values_dict d
+                                  ON b.buffer_type_id = d.buffer_type_id AND d.service_type_id = v_service_type_id
+                                WHERE b.urban_object_id = v_urban_object_id AND b.is_custom = false
+                            LOOP                    
+
+                                {result_geom}
+
+                                -- Update buffer geometry
+                                UPDATE public.buffers_data
+                                SET geometry = result_geom
+                                WHERE urban_object_id = v_urban_object_id AND buffer_type_id = v_buffer_type_id;
+                            END LOOP;
+                        END LOOP;
+
+                        {user_projects_logic}
+
+                    RETURN NEW;
+                    END;
+                    $$ LANGUAGE plpgsql;
+                    """
+                )
+            )
+        )
+
+        op.execute(
+            sa.text(
+                dedent(
+                    f"""
+                    CREATE TRIGGER update_buffer_on_update_service_trigger
+                    AFTER UPDATE OF service_type_id ON {schema}.services_data
+                    FOR EACH ROW
+                    WHEN (OLD.service_type_id IS DISTINCT FROM NEW.service_type_id)
+                    EXECUTE FUNCTION {schema}.trigger_update_buffer_on_update_service();
+                    """
+                )
+            )
+        )
@@ -0,0 +1,424 @@
+# pylint: disable=no-member,invalid-name,missing-function-docstring,too-many-statements
+"""service coverage
+
+Revision ID: 6b3f0e8a2d51
+Revises: 9d2e6b4a1f37
+Create Date: 2026-10-18 23:04:12.530817
+
+"""
+from textwrap import dedent
+from typing import Sequence, Union
+
+import geoalchemy2
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6b3f0e8a2d51"
+down_revision: Union[str, None] = "9d2e6b4a1f37"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+VERSIONED_TABLES = ("territories_data",)
+
+# tables with `geometry` column which service coverage depends on
+COVERAGE_GEOMETRY_TABLES = ("territories_data", "object_geometries_data", "buffers_data")
+
+
+def upgrade() -> None:
+    # track versions of territories (cached by the application)
+    for table in VERSIONED_TABLES:
+        op.execute(sa.text(f"INSERT INTO public.tables_versions_data (table_name) VALUES ('{table}')"))
+        op.execute(
+            sa.text(
+                dedent(
+                    f"""
+                    CREATE TRIGGER increment_table_version_trigger
+                    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON public.{table}
+                    FOR EACH STATEMENT
+                    EXECUTE FUNCTION public.trigger_increment_table_version();
+                    """
+                )
+            )
+        )
+
+    # create `public.service_coverage_data` table
+    op.create_table(
+        "service_coverage_data",
+        sa.Column("territory_id", sa.Integer(), nullable=False),
+        sa.Column("service_type_id", sa.Integer(), nullable=False),
+        sa.Column("buffer_type_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "geometry",
+            geoalchemy2.types.Geometry(spatial_index=False, from_text="ST_GeomFromEWKT", name="geometry"),
+            nullable=True,
+        ),
+        sa.Column("territory_area", sa.Float(precision=53), nullable=False),
+        sa.Column("covered_area", sa.Float(precision=53), nullable=False),
+        sa.Column("services_count", sa.Integer(), nullable=False),
+        sa.Column("built_version", sa.BigInteger(), nullable=False),
+        sa.Column("built_at", sa.TIMESTAMP(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["territory_id"],
+            ["territories_data.territory_id"],
+            name=op.f("service_coverage_data_fk_territory_id__territories_data"),
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["service_type_id"],
+            ["service_types_dict.service_type_id"],
+            name=op.f("service_coverage_data_fk_service_type_id__service_types_dict"),
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["buffer_type_id"],
+            ["buffer_types_dict.buffer_type_id"],
+            name=op.f("service_coverage_data_fk_buffer_type_id__buffer_types_dict"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint(
+            "territory_id", "service_type_id", "buffer_type_id", name=op.f("service_coverage_data_pk")
+        ),
+    )
+
+    # create `public.service_coverage_versions_data` table
+    op.create_table(
+        "service_coverage_versions_data",
+        sa.Column("territory_id", sa.Integer(), nullable=False),
+        sa.Column("version", sa.BigInteger(), server_default=sa.text("0"), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["territory_id"],
+            ["territories_data.territory_id"],
+            name=op.f("service_coverage_versions_data_fk_territory_id__territories_data"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("territory_id", name=op.f("service_coverage_versions_data_pk")),
+    )
+
+    # create function to calculate service coverage of the territory
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE OR REPLACE FUNCTION public.calculate_service_coverage(
+                    p_territory_id INT,
+                    p_service_type_id INT,
+                    p_buffer_type_id INT
+                )
+                RETURNS TABLE (
+                    geometry GEOMETRY,
+                    territory_area DOUBLE PRECISION,
+                    covered_area DOUBLE PRECISION,
+                    services_count INT
+                ) AS $$
+                    -- buffers are stored without the object geometry itself, so polygonal geometries are added back;
+                    -- aggregate ST_Union performs cascaded union of all the pieces at once
+                    WITH RECURSIVE territories AS (
+                        SELECT territory_id FROM public.territories_data WHERE territory_id = p_territory_id
+                        UNION ALL
+                        SELECT t.territory_id
+                        FROM public.territories_data t
+                            JOIN territories ON t.parent_id = territories.territory_id
+                    ),
+                    objects AS (
+                        SELECT DISTINCT u.urban_object_id, s.service_id, og.geometry
+                        FROM public.services_data s
+                            JOIN public.urban_objects_data u ON u.service_id = s.service_id
+                            JOIN public.object_geometries_data og ON og.object_geometry_id = u.object_geometry_id
+                        WHERE s.service_type_id = p_service_type_id
+                          AND og.territory_id IN (SELECT territory_id FROM territories)
+                          AND EXISTS (
+                            SELECT 1
+                            FROM public.buffers_data b
+                            WHERE b.urban_object_id = u.urban_object_id AND b.buffer_type_id = p_buffer_type_id
+                          )
+                    ),
+                    pieces AS (
+                        SELECT b.geometry
+                        FROM objects o
+                            JOIN public.buffers_data b
+                                ON b.urban_object_id = o.urban_object_id AND b.buffer_type_id = p_buffer_type_id
+                        UNION ALL
+                        SELECT o.geometry
+                        FROM objects o
+                        WHERE GeometryType(o.geometry) IN ('POLYGON', 'MULTIPOLYGON')
+                    )
+                    SELECT
+                        CASE WHEN NOT ST_IsEmpty(coverage.geometry) THEN coverage.geometry END,
+                        coalesce(ST_Area(t.geometry::geography), 0),
+                        coalesce(ST_Area(coverage.geometry::geography), 0),
+                        -- service can be located in several objects
+                        (SELECT count(DISTINCT o.service_id) FROM objects o)::int
+                    FROM public.territories_data t
+                        CROSS JOIN LATERAL (
+                            SELECT ST_CollectionExtract(ST_Intersection(ST_Union(pieces.geometry), t.geometry), 3)
+                                AS geometry
+                            FROM pieces
+                        ) coverage
+                    WHERE t.territory_id = p_territory_id;
+                $$ LANGUAGE sql STABLE;
+                """
+            )
+        )
+    )
+
+    # create function to rebuild service coverage of the territory (if it is out of date),
+    # it is called by the application in background, so that reading requests do not write anything
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE OR REPLACE FUNCTION public.refresh_service_coverage(
+                    p_territory_id INT,
+                    p_service_type_id INT,
+                    p_buffer_type_id INT
+                )
+                RETURNS boolean AS $$
+                DECLARE
+                    v_version BIGINT;
+                BEGIN
+                    PERFORM pg_advisory_xact_lock(
+                        hashtext('service_coverage'),
+                        hashtext(format('%s:%s:%s', p_territory_id, p_service_type_id, p_buffer_type_id))
+                    );
+
+                    -- identifiers could have been deleted since the rebuild was requested
+                    IF NOT EXISTS (
+                        SELECT 1
+                        FROM public.territories_data t, public.service_types_dict st, public.buffer_types_dict bt
+                        WHERE t.territory_id = p_territory_id
+                          AND st.service_type_id = p_service_type_id
+                          AND bt.buffer_type_id = p_buffer_type_id
+                    ) THEN
+                        RETURN false;
+                    END IF;
+
+                    -- invalidating transactions upsert the same row, so they wait for this one if the row is new
+                    INSERT INTO public.service_coverage_versions_data (territory_id)
+                    VALUES (p_territory_id)
+                    ON CONFLICT (territory_id) DO NOTHING;
+
+                    -- version is read before the coverage is built, so concurrent invalidation leaves it out of date
+                    SELECT version
+                    INTO v_version
+                    FROM public.service_coverage_versions_data
+                    WHERE territory_id = p_territory_id;
+
+                    IF EXISTS (
+                        SELECT 1
+                        FROM public.service_coverage_data c
+                        WHERE c.territory_id = p_territory_id
+                          AND c.service_type_id = p_service_type_id
+                          AND c.buffer_type_id = p_buffer_type_id
+                          AND c.built_version = v_version
+                    ) THEN
+                        RETURN false;
+                    END IF;
+
+                    INSERT INTO public.service_coverage_data (
+                        territory_id,
+                        service_type_id,
+                        buffer_type_id,
+                        geometry,
+                        territory_area,
+                        covered_area,
+                        services_count,
+                        built_version,
+                        built_at
+                    )
+                    SELECT
+                        p_territory_id,
+                        p_service_type_id,
+                        p_buffer_type_id,
+                        c.geometry,
+                        c.territory_area,
+                        c.covered_area,
+                        c.services_count,
+                        v_version,
+                        now()
+                    FROM public.calculate_service_coverage(p_territory_id, p_service_type_id, p_buffer_type_id) c
+                    ON CONFLICT (territory_id, service_type_id, buffer_type_id) DO UPDATE
+                    SET geometry = EXCLUDED.geometry,
+                        territory_area = EXCLUDED.territory_area,
+                        covered_area = EXCLUDED.covered_area,
+                        services_count = EXCLUDED.services_count,
+                        built_version = EXCLUDED.built_version,
+                        built_at = EXCLUDED.built_at;
+
+                    RETURN true;
+                END;
+                $$ LANGUAGE plpgsql;
+                """
+            )
+        )
+    )
+
+    # create function to invalidate service coverage only of the territories intersecting changed objects
+    # (ancestors of the territory containing the object are always among them)
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE OR REPLACE FUNCTION public.invalidate_service_coverage(p_bbox GEOMETRY)
+                RETURNS void AS $$
+                BEGIN
+                    IF p_bbox IS NULL THEN
+                        RETURN;
+                    END IF;
+
+                    -- rows are locked in the same order by concurrent transactions to avoid deadlocks
+                    INSERT INTO public.service_coverage_versions_data (territory_id, version)
+                    SELECT t.territory_id, 1
+                    FROM public.territories_data t
+                    WHERE t.geometry && ST_SetSRID(p_bbox, 4326)
+                    ORDER BY t.territory_id
+                    ON CONFLICT (territory_id) DO UPDATE
+                    SET version = public.service_coverage_versions_data.version + 1;
+                END;
+                $$ LANGUAGE plpgsql;
+                """
+            )
+        )
+    )
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE OR REPLACE FUNCTION public.trigger_invalidate_service_coverage()
+                RETURNS TRIGGER AS $$
+                DECLARE
+                    v_bbox geometry;
+                BEGIN
+                    IF TG_OP = 'INSERT' THEN
+                        SELECT ST_Extent(geometry)::geometry INTO v_bbox FROM new_rows;
+                    ELSIF TG_OP = 'UPDATE' THEN
+                        SELECT ST_Extent(geometry)::geometry INTO v_bbox
+                        FROM (
+                            SELECT geometry FROM old_rows
+                            UNION ALL
+                            SELECT geometry FROM new_rows
+                        ) changed_rows;
+                    ELSE
+                        SELECT ST_Extent(geometry)::geometry INTO v_bbox FROM old_rows;
+                    END IF;
+
+                    PERFORM public.invalidate_service_coverage(v_bbox);
+
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql;
+                """
+            )
+        )
+    )
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE OR REPLACE FUNCTION public.trigger_invalidate_urban_objects_service_coverage()
+                RETURNS TRIGGER AS $$
+                DECLARE
+                    v_ids integer[];
+                    v_bbox geometry;
+                BEGIN
+                    IF TG_OP <> 'DELETE' THEN
+                        SELECT array_agg(object_geometry_id) INTO v_ids FROM new_rows;
+                    END IF;
+                    IF TG_OP <> 'INSERT' THEN
+                        SELECT v_ids || array_agg(object_geometry_id) INTO v_ids FROM old_rows;
+                    END IF;
+
+                    SELECT ST_Extent(geometry)::geometry INTO v_bbox
+                    FROM public.object_geometries_data
+                    WHERE object_geometry_id = ANY(v_ids);
+
+                    PERFORM public.invalidate_service_coverage(v_bbox);
+
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql;
+                """
+            )
+        )
+    )
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE OR REPLACE FUNCTION public.trigger_invalidate_services_service_coverage()
+                RETURNS TRIGGER AS $$
+                DECLARE
+                    v_ids integer[];
+                    v_bbox geometry;
+                BEGIN
+                    IF TG_OP <> 'DELETE' THEN
+                        SELECT array_agg(service_id) INTO v_ids FROM new_rows;
+                    END IF;
+                    IF TG_OP <> 'INSERT' THEN
+                        SELECT v_ids || array_agg(service_id) INTO v_ids FROM old_rows;
+                    END IF;
+
+                    SELECT ST_Extent(og.geometry)::geometry INTO v_bbox
+                    FROM public.urban_objects_data u
+                        JOIN public.object_geometries_data og ON og.object_geometry_id = u.object_geometry_id
+                    WHERE u.service_id = ANY(v_ids);
+
+                    PERFORM public.invalidate_service_coverage(v_bbox);
+
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql;
+                """
+            )
+        )
+    )
+
+    # transition tables can be used only in triggers on a single event
+    triggers = [(table, "trigger_invalidate_service_coverage") for table in COVERAGE_GEOMETRY_TABLES]
+    triggers.append(("urban_objects_data", "trigger_invalidate_urban_objects_service_coverage"))
+    triggers.append(("services_data", "trigger_invalidate_services_service_coverage"))
+    for table, function in triggers:
+        for event, transition_tables in (
+            ("INSERT", "NEW TABLE AS new_rows"),
+            ("UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+            ("DELETE", "OLD TABLE AS old_rows"),
+        ):
+            op.execute(
+                sa.text(
+                    dedent(
+                        f"""
+                        CREATE TRIGGER invalidate_service_coverage_{event.lower()}_trigger
+                        AFTER {event} ON public.{table}
+                        REFERENCING {transition_tables}
+                        FOR EACH STATEMENT
+                        EXECUTE FUNCTION public.{function}();
+                        """
+                    )
+                )
+            )
+
+
+def downgrade() -> None:
+    # drop invalidation triggers
+    for table in (*COVERAGE_GEOMETRY_TABLES, "urban_objects_data", "services_data"):
+        for event in ("insert", "update", "delete"):
+            op.execute(
+                sa.text(f"DROP TRIGGER IF EXISTS invalidate_service_coverage_{event}_trigger ON public.{table};")
+            )
+
+    # drop functions
+    op.execute(sa.text(dedent("DROP FUNCTION IF EXISTS public.trigger_invalidate_services_service_coverage();")))
+    op.execute(sa.text(dedent("DROP FUNCTION IF EXISTS public.trigger_invalidate_urban_objects_service_coverage();")))
+    op.execute(sa.text(dedent("DROP FUNCTION IF EXISTS public.trigger_invalidate_service_coverage();")))
+    op.execute(sa.text(dedent("DROP FUNCTION IF EXISTS public.invalidate_service_coverage(GEOMETRY);")))
+    op.execute(sa.text(dedent("DROP FUNCTION IF EXISTS public.refresh_service_coverage(INT, INT, INT);")))
+    op.execute(sa.text(dedent("DROP FUNCTION IF EXISTS public.calculate_service_coverage(INT, INT, INT);")))
+
+    # drop tables
+    op.drop_table("service_coverage_versions_data")
+    op.drop_table("service_coverage_data")
+
+    # drop version triggers
+    for table in VERSIONED_TABLES:
+        op.execute(sa.text(f"DROP TRIGGER IF EXISTS increment_table_version_trigger ON public.{table};"))
+        op.execute(sa.text(f"DELETE FROM public.tables_versions_data WHERE table_name = '{table}'"))
@@ -0,0 +1,446 @@
+# pylint: disable=no-member,invalid-name,missing-function-docstring,too-many-statements
+"""territory services rollup
+
+Revision ID: c4a9e2f71b06
+Revises: 6b3f0e8a2d51
+Create Date: 2026-10-19 09:41:55.207318
+
+"""
+from textwrap import dedent
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4a9e2f71b06"
+down_revision: Union[str, None] = "6b3f0e8a2d51"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # create `public.territory_services_rollup_data` table
+    op.create_table(
+        "territory_services_rollup_data",
+        sa.Column("territory_id", sa.Integer(), nullable=False),
+        sa.Column("service_type_id", sa.Integer(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.Column("capacity", sa.BigInteger(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["territory_id"],
+            ["territories_data.territory_id"],
+            name=op.f("territory_services_rollup_data_fk_territory_id__territories_data"),
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["service_type_id"],
+            ["service_types_dict.service_type_id"],
+            name=op.f("territory_services_rollup_data_fk_service_type_id__service_types_dict"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("territory_id", "service_type_id", name=op.f("territory_services_rollup_data_pk")),
+    )
+
+    # create function to add count/capacity deltas to the given territories and all their ancestors
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE OR REPLACE FUNCTION public.apply_territory_services_rollup_delta(
+                    p_territory_ids INT[],
+                    p_service_type_ids INT[],
+                    p_counts INT[],
+                    p_capacities BIGINT[]
+                )
+                RETURNS void AS $$
+                BEGIN
+                    IF p_territory_ids IS NULL THEN
+                        RETURN;
+                    END IF;
+
+                    WITH RECURSIVE delta AS (
+                        SELECT d.territory_id, d.service_type_id, sum(d.count) AS count, sum(d.capacity) AS capacity
+                        FROM unnest(p_territory_ids, p_service_type_ids, p_counts, p_capacities)
+                            AS d(territory_id, service_type_id, count, capacity)
+                        GROUP BY d.territory_id, d.service_type_id
+                    ),
+                    ancestors AS (
+                        SELECT t.territory_id AS start_id, t.territory_id, t.parent_id
+                        FROM public.territories_data t
+                        WHERE t.territory_id IN (SELECT territory_id FROM delta)
+                        UNION ALL
+                        SELECT a.start_id, t.territory_id, t.parent_id
+                        FROM ancestors a
+                            JOIN public.territories_data t ON t.territory_id = a.parent_id
+                    )
+                    INSERT INTO public.territory_services_rollup_data (territory_id, service_type_id, count, capacity)
+                    SELECT a.territory_id, d.service_type_id, sum(d.count), sum(d.capacity)
+                    FROM delta d
+                        JOIN ancestors a ON a.start_id = d.territory_id
+                    GROUP BY a.territory_id, d.service_type_id
+                    -- rows are locked in the same order by concurrent transactions to avoid deadlocks
+                    ORDER BY a.territory_id, d.service_type_id
+                    ON CONFLICT (territory_id, service_type_id) DO UPDATE
+                    SET count = public.territory_services_rollup_data.count + EXCLUDED.count,
+                        capacity = public.territory_services_rollup_data.capacity + EXCLUDED.capacity;
+                END;
+                $$ LANGUAGE plpgsql;
+                """
+            )
+        )
+    )
+
+    # create function to rebuild the whole rollup (used on hierarchy changes and for initial fill)
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE OR REPLACE FUNCTION public.rebuild_territory_services_rollup()
+                RETURNS void AS $$
+                BEGIN
+                    DELETE FROM public.territory_services_rollup_data;
+
+                    PERFORM public.apply_territory_services_rollup_delta(
+                        array_agg(d.territory_id), array_agg(d.service_type_id), array_agg(d.count), array_agg(d.capacity)
+                    )
+                    FROM (
+                        SELECT
+                            og.territory_id,
+                            s.service_type_id,
+                            count(*)::int AS count,
+                            coalesce(sum(s.capacity), 0)::bigint AS capacity
+                        FROM public.urban_objects_data u
+                            JOIN public.services_data s ON s.service_id = u.service_id
+                            JOIN public.object_geometries_data og ON og.object_geometry_id = u.object_geometry_id
+                        GROUP BY og.territory_id, s.service_type_id
+                    ) d;
+                END;
+                $$ LANGUAGE plpgsql;
+                """
+            )
+        )
+    )
+
+    # create triggers on insert/update/delete `public.urban_objects_data` (if service or geometry link was changed)
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE OR REPLACE FUNCTION public.trigger_update_territory_services_rollup_on_urban_objects()
+                RETURNS TRIGGER AS $$
+                BEGIN
+                    -- links to already deleted services or geometries were subtracted by their own triggers
+                    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                        PERFORM public.apply_territory_services_rollup_delta(
+                            array_agg(og.territory_id),
+                            array_agg(s.service_type_id),
+                            array_agg(-1),
+                            array_agg(-coalesce(s.capacity, 0)::bigint)
+                        )
+                        FROM old_rows o
+                            JOIN public.services_data s ON s.service_id = o.service_id
+                            JOIN public.object_geometries_data og ON og.object_geometry_id = o.object_geometry_id
+                        WHERE TG_OP = 'DELETE' OR EXISTS (
+                            SELECT 1
+                            FROM new_rows n
+                            WHERE n.urban_object_id = o.urban_object_id
+                              AND (
+                                n.service_id IS DISTINCT FROM o.service_id
+                                OR n.object_geometry_id IS DISTINCT FROM o.object_geometry_id
+                              )
+                        );
+                    END IF;
+
+                    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                        PERFORM public.apply_territory_services_rollup_delta(
+                            array_agg(og.territory_id),
+                            array_agg(s.service_type_id),
+                            array_agg(1),
+                            array_agg(coalesce(s.capacity, 0)::bigint)
+                        )
+                        FROM new_rows n
+                            JOIN public.services_data s ON s.service_id = n.service_id
+                            JOIN public.object_geometries_data og ON og.object_geometry_id = n.object_geometry_id
+                        WHERE TG_OP = 'INSERT' OR EXISTS (
+                            SELECT 1
+                            FROM old_rows o
+                            WHERE o.urban_object_id = n.urban_object_id
+                              AND (
+                                n.service_id IS DISTINCT FROM o.service_id
+                                OR n.object_geometry_id IS DISTINCT FROM o.object_geometry_id
+                              )
+                        );
+                    END IF;
+
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql;
+                """
+            )
+        )
+    )
+    for operation, referencing in (
+        ("INSERT", "NEW TABLE AS new_rows"),
+        ("UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+        ("DELETE", "OLD TABLE AS old_rows"),
+    ):
+        op.execute(
+            sa.text(
+                dedent(
+                    f"""
+                    CREATE TRIGGER update_territory_services_rollup_on_{operation.lower()}_urban_objects_trigger
+                    AFTER {operation} ON public.urban_objects_data
+                    REFERENCING {referencing}
+                    FOR EACH STATEMENT
+                    EXECUTE FUNCTION public.trigger_update_territory_services_rollup_on_urban_objects();
+                    """
+                )
+            )
+        )
+
+    # create triggers on update/delete `public.services_data` (if service type or capacity were changed)
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE OR REPLACE FUNCTION public.trigger_update_territory_services_rollup_on_update_services()
+                RETURNS TRIGGER AS $$
+                BEGIN
+                    PERFORM public.apply_territory_services_rollup_delta(
+                        array_agg(og.territory_id),
+                        array_agg(d.service_type_id),
+                        array_agg(d.count),
+                        array_agg(d.capacity)
+                    )
+                    FROM (
+                        SELECT o.service_id, o.service_type_id, -1 AS count, -coalesce(o.capacity, 0)::bigint AS capacity
+                        FROM old_rows o
+                            JOIN new_rows n ON n.service_id = o.service_id
+                        WHERE n.service_type_id IS DISTINCT FROM o.service_type_id
+                           OR n.capacity IS DISTINCT FROM o.capacity
+                        UNION ALL
+                        SELECT n.service_id, n.service_type_id, 1 AS count, coalesce(n.capacity, 0)::bigint AS capacity
+                        FROM old_rows o
+                            JOIN new_rows n ON n.service_id = o.service_id
+                        WHERE n.service_type_id IS DISTINCT FROM o.service_type_id
+                           OR n.capacity IS DISTINCT FROM o.capacity
+                    ) d
+                        JOIN public.urban_objects_data u ON u.service_id = d.service_id
+                        JOIN public.object_geometries_data og ON og.object_geometry_id = u.object_geometry_id;
+
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql;
+                """
+            )
+        )
+    )
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE TRIGGER update_territory_services_rollup_on_update_services_trigger
+                AFTER UPDATE ON public.services_data
+                REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+                FOR EACH STATEMENT
+                EXECUTE FUNCTION public.trigger_update_territory_services_rollup_on_update_services();
+                """
+            )
+        )
+    )
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE OR REPLACE FUNCTION public.trigger_update_territory_services_rollup_on_delete_service()
+                RETURNS TRIGGER AS $$
+                BEGIN
+                    -- urban objects references are set to NULL after the service is deleted, so subtract them here
+                    PERFORM public.apply_territory_services_rollup_delta(
+                        array_agg(og.territory_id),
+                        array_agg(OLD.service_type_id),
+                        array_agg(-1),
+                        array_agg(-coalesce(OLD.capacity, 0)::bigint)
+                    )
+                    FROM public.urban_objects_data u
+                        JOIN public.object_geometries_data og ON og.object_geometry_id = u.object_geometry_id
+                    WHERE u.service_id = OLD.service_id;
+
+                    RETURN OLD;
+                END;
+                $$ LANGUAGE plpgsql;
+                """
+            )
+        )
+    )
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE TRIGGER update_territory_services_rollup_on_delete_service_trigger
+                BEFORE DELETE ON public.services_data
+                FOR EACH ROW
+                EXECUTE FUNCTION public.trigger_update_territory_services_rollup_on_delete_service();
+                """
+            )
+        )
+    )
+
+    # create triggers on update/delete `public.object_geometries_data` (if territory was changed)
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE OR REPLACE FUNCTION public.trigger_update_territory_services_rollup_on_update_geometries()
+                RETURNS TRIGGER AS $$
+                BEGIN
+                    PERFORM public.apply_territory_services_rollup_delta(
+                        array_agg(d.territory_id),
+                        array_agg(s.service_type_id),
+                        array_agg(d.sign),
+                        array_agg(d.sign * coalesce(s.capacity, 0)::bigint)
+                    )
+                    FROM (
+                        SELECT o.object_geometry_id, o.territory_id, -1 AS sign
+                        FROM old_rows o
+                            JOIN new_rows n ON n.object_geometry_id = o.object_geometry_id
+                        WHERE n.territory_id IS DISTINCT FROM o.territory_id
+                        UNION ALL
+                        SELECT n.object_geometry_id, n.territory_id, 1 AS sign
+                        FROM old_rows o
+                            JOIN new_rows n ON n.object_geometry_id = o.object_geometry_id
+                        WHERE n.territory_id IS DISTINCT FROM o.territory_id
+                    ) d
+                        JOIN public.urban_objects_data u ON u.object_geometry_id = d.object_geometry_id
+                        JOIN public.services_data s ON s.service_id = u.service_id;
+
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql;
+                """
+            )
+        )
+    )
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE TRIGGER update_territory_services_rollup_on_update_geometries_trigger
+                AFTER UPDATE ON public.object_geometries_data
+                REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+                FOR EACH STATEMENT
+                EXECUTE FUNCTION public.trigger_update_territory_services_rollup_on_update_geometries();
+                """
+            )
+        )
+    )
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE OR REPLACE FUNCTION public.trigger_update_territory_services_rollup_on_delete_geometry()
+                RETURNS TRIGGER AS $$
+                BEGIN
+                    -- urban objects are deleted in cascade after the geometry is deleted, so subtract them here
+                    PERFORM public.apply_territory_services_rollup_delta(
+                        array_agg(OLD.territory_id),
+                        array_agg(s.service_type_id),
+                        array_agg(-1),
+                        array_agg(-coalesce(s.capacity, 0)::bigint)
+                    )
+                    FROM public.urban_objects_data u
+                        JOIN public.services_data s ON s.service_id = u.service_id
+                    WHERE u.object_geometry_id = OLD.object_geometry_id;
+
+                    RETURN OLD;
+                END;
+                $$ LANGUAGE plpgsql;
+                """
+            )
+        )
+    )
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE TRIGGER update_territory_services_rollup_on_delete_geometry_trigger
+                BEFORE DELETE ON public.object_geometries_data
+                FOR EACH ROW
+                EXECUTE FUNCTION public.trigger_update_territory_services_rollup_on_delete_geometry();
+                """
+            )
+        )
+    )
+
+    # create trigger on update `public.territories_data` (if hierarchy was changed)
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE OR REPLACE FUNCTION public.trigger_rebuild_territory_services_rollup()
+                RETURNS TRIGGER AS $$
+                BEGIN
+                    IF EXISTS (
+                        SELECT 1
+                        FROM old_rows o
+                            JOIN new_rows n ON n.territory_id = o.territory_id
+                        WHERE n.parent_id IS DISTINCT FROM o.parent_id
+                    ) THEN
+                        PERFORM public.rebuild_territory_services_rollup();
+                    END IF;
+
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql;
+                """
+            )
+        )
+    )
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE TRIGGER rebuild_territory_services_rollup_trigger
+                AFTER UPDATE ON public.territories_data
+                REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+                FOR EACH STATEMENT
+                EXECUTE FUNCTION public.trigger_rebuild_territory_services_rollup();
+                """
+            )
+        )
+    )
+
+    # fill rollup for existing services
+    op.execute(sa.text(dedent("SELECT public.rebuild_territory_services_rollup();")))
+
+
+def downgrade() -> None:
+    # drop triggers
+    for trigger, table in (
+        ("rebuild_territory_services_rollup_trigger", "territories_data"),
+        ("update_territory_services_rollup_on_delete_geometry_trigger", "object_geometries_data"),
+        ("update_territory_services_rollup_on_update_geometries_trigger", "object_geometries_data"),
+        ("update_territory_services_rollup_on_delete_service_trigger", "services_data"),
+        ("update_territory_services_rollup_on_update_services_trigger", "services_data"),
+        ("update_territory_services_rollup_on_insert_urban_objects_trigger", "urban_objects_data"),
+        ("update_territory_services_rollup_on_update_urban_objects_trigger", "urban_objects_data"),
+        ("update_territory_services_rollup_on_delete_urban_objects_trigger", "urban_objects_data"),
+    ):
+        op.execute(sa.text(f"DROP TRIGGER IF EXISTS {trigger} ON public.{table};"))
+
+    # drop functions
+    for function in (
+        "trigger_rebuild_territory_services_rollup()",
+        "trigger_update_territory_services_rollup_on_delete_geometry()",
+        "trigger_update_territory_services_rollup_on_update_geometries()",
+        "trigger_update_territory_services_rollup_on_delete_service()",
+        "trigger_update_territory_services_rollup_on_update_services()",
+        "trigger_update_territory_services_rollup_on_urban_objects()",
+        "rebuild_territory_services_rollup()",
+        "apply_territory_services_rollup_delta(INT[], INT[], INT[], BIGINT[])",
+    ):
+        op.execute(sa.text(f"DROP FUNCTION IF EXISTS public.{function};"))
+
+    # drop table
+    op.drop_table("territory_services_rollup_data")
@@ -0,0 +1,46 @@
+# pylint: disable=no-member,invalid-name,missing-function-docstring
+"""provision versions
+
+Revision ID: e2b7d40c9a15
+Revises: c4a9e2f71b06
+Create Date: 2026-10-19 11:27:03.418902
+
+"""
+from textwrap import dedent
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e2b7d40c9a15"
+down_revision: Union[str, None] = "c4a9e2f71b06"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+VERSIONED_TABLES = ("territory_services_rollup_data", "territory_indicators_data", "service_types_normatives_data")
+
+
+def upgrade() -> None:
+    # track versions of the tables which services provision depends on (in addition to the already tracked ones)
+    for table in VERSIONED_TABLES:
+        op.execute(sa.text(f"INSERT INTO public.tables_versions_data (table_name) VALUES ('{table}')"))
+        op.execute(
+            sa.text(
+                dedent(
+                    f"""
+                    CREATE TRIGGER increment_table_version_trigger
+                    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON public.{table}
+                    FOR EACH STATEMENT
+                    EXECUTE FUNCTION public.trigger_increment_table_version();
+                    """
+                )
+            )
+        )
+
+
+def downgrade() -> None:
+    # drop version triggers
+    for table in VERSIONED_TABLES:
+        op.execute(sa.text(f"DROP TRIGGER IF EXISTS increment_table_version_trigger ON public.{table};"))
+        op.execute(sa.text(f"DELETE FROM public.tables_versions_data WHERE table_name = '{table}'"))
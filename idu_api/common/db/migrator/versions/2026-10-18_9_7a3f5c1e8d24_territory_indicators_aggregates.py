@@ -0,0 +1,218 @@
+# pylint: disable=no-member,invalid-name,missing-function-docstring,too-many-statements
+"""territory indicators aggregates
+
+Revision ID: 7a3f5c1e8d24
+Revises: e2b7d40c9a15
+Create Date: 2026-10-19 14:52:40.106633
+
+"""
+from textwrap import dedent
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "7a3f5c1e8d24"
+down_revision: Union[str, None] = "e2b7d40c9a15"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # create `public.territory_indicators_aggregates_data` table
+    op.execute(sa.text("CREATE TYPE indicator_aggregation_type AS ENUM ('sum', 'avg', 'weighted_avg')"))
+    op.create_table(
+        "territory_indicators_aggregates_data",
+        sa.Column("territory_id", sa.Integer(), nullable=False),
+        sa.Column("indicator_id", sa.Integer(), nullable=False),
+        sa.Column("value_type", postgresql.ENUM(name="indicator_value_type", create_type=False), nullable=False),
+        sa.Column(
+            "aggregation_type", postgresql.ENUM(name="indicator_aggregation_type", create_type=False), nullable=False
+        ),
+        sa.Column("weight_indicator_id", sa.Integer(), nullable=True),
+        sa.Column("value", sa.Float(precision=53), nullable=True),
+        sa.Column("territories_count", sa.Integer(), nullable=False),
+        sa.Column("date_value", sa.Date(), nullable=True),
+        sa.Column("built_at", sa.TIMESTAMP(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["territory_id"],
+            ["territories_data.territory_id"],
+            name=op.f("territory_indicators_aggregates_data_fk_territory_id__territories_data"),
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["indicator_id"],
+            ["indicators_dict.indicator_id"],
+            name=op.f("territory_indicators_aggregates_data_fk_indicator_id__indicators_dict"),
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["weight_indicator_id"],
+            ["indicators_dict.indicator_id"],
+            name=op.f("territory_indicators_aggregates_data_fk_weight_indicator_id__indicators_dict"),
+            ondelete="CASCADE",
+        ),
+    )
+    # weighted averages with different weights are stored separately, and nullable `weight_indicator_id`
+    # can not be a part of the primary key
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE UNIQUE INDEX territory_indicators_aggregates_data_unique_idx
+                ON public.territory_indicators_aggregates_data (
+                    territory_id, indicator_id, value_type, aggregation_type, COALESCE(weight_indicator_id, 0)
+                );
+                """
+            )
+        )
+    )
+
+    # create function to remove aggregates of the given territories and all their ancestors
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE OR REPLACE FUNCTION public.invalidate_territory_indicators_aggregates(
+                    p_territory_ids INT[],
+                    p_indicator_ids INT[]
+                )
+                RETURNS void AS $$
+                BEGIN
+                    WITH RECURSIVE changed AS (
+                        SELECT DISTINCT c.territory_id, c.indicator_id
+                        FROM unnest(p_territory_ids, p_indicator_ids) AS c(territory_id, indicator_id)
+                    ),
+                    ancestors AS (
+                        SELECT c.indicator_id, t.territory_id, t.parent_id
+                        FROM changed c
+                            JOIN public.territories_data t ON t.territory_id = c.territory_id
+                        UNION
+                        SELECT a.indicator_id, t.territory_id, t.parent_id
+                        FROM ancestors a
+                            JOIN public.territories_data t ON t.territory_id = a.parent_id
+                    )
+                    DELETE FROM public.territory_indicators_aggregates_data g
+                    USING ancestors a
+                    WHERE g.territory_id = a.territory_id
+                      AND (g.indicator_id = a.indicator_id OR g.weight_indicator_id = a.indicator_id);
+                END;
+                $$ LANGUAGE plpgsql;
+                """
+            )
+        )
+    )
+
+    # create triggers on insert/update/delete `public.territory_indicators_data`
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE OR REPLACE FUNCTION public.trigger_invalidate_territory_indicators_aggregates()
+                RETURNS TRIGGER AS $$
+                BEGIN
+                    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                        PERFORM public.invalidate_territory_indicators_aggregates(
+                            array_agg(territory_id), array_agg(indicator_id)
+                        )
+                        FROM old_rows;
+                    END IF;
+
+                    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                        PERFORM public.invalidate_territory_indicators_aggregates(
+                            array_agg(territory_id), array_agg(indicator_id)
+                        )
+                        FROM new_rows;
+                    END IF;
+
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql;
+                """
+            )
+        )
+    )
+    for operation, referencing in (
+        ("INSERT", "NEW TABLE AS new_rows"),
+        ("UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+        ("DELETE", "OLD TABLE AS old_rows"),
+    ):
+        op.execute(
+            sa.text(
+                dedent(
+                    f"""
+                    CREATE TRIGGER invalidate_territory_indicators_aggregates_on_{operation.lower()}_trigger
+                    AFTER {operation} ON public.territory_indicators_data
+                    REFERENCING {referencing}
+                    FOR EACH STATEMENT
+                    EXECUTE FUNCTION public.trigger_invalidate_territory_indicators_aggregates();
+                    """
+                )
+            )
+        )
+
+    # create trigger on update `public.territories_data` (if hierarchy was changed)
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE OR REPLACE FUNCTION public.trigger_clear_territory_indicators_aggregates()
+                RETURNS TRIGGER AS $$
+                BEGIN
+                    IF EXISTS (
+                        SELECT 1
+                        FROM old_rows o
+                            JOIN new_rows n ON n.territory_id = o.territory_id
+                        WHERE n.parent_id IS DISTINCT FROM o.parent_id
+                    ) THEN
+                        DELETE FROM public.territory_indicators_aggregates_data;
+                    END IF;
+
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql;
+                """
+            )
+        )
+    )
+    op.execute(
+        sa.text(
+            dedent(
+                """
+                CREATE TRIGGER clear_territory_indicators_aggregates_trigger
+                AFTER UPDATE ON public.territories_data
+                REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+                FOR EACH STATEMENT
+                EXECUTE FUNCTION public.trigger_clear_territory_indicators_aggregates();
+                """
+            )
+        )
+    )
+
+
+def downgrade() -> None:
+    # drop triggers
+    op.execute(
+        sa.text("DROP TRIGGER IF EXISTS clear_territory_indicators_aggregates_trigger ON public.territories_data;")
+    )
+    for operation in ("insert", "update", "delete"):
+        op.execute(
+            sa.text(
+                f"DROP TRIGGER IF EXISTS invalidate_territory_indicators_aggregates_on_{operation}_trigger"
+                " ON public.territory_indicators_data;"
+            )
+        )
+
+    # drop functions
+    for function in (
+        "trigger_clear_territory_indicators_aggregates()",
+        "trigger_invalidate_territory_indicators_aggregates()",
+        "invalidate_territory_indicators_aggregates(INT[], INT[])",
+    ):
+        op.execute(sa.text(f"DROP FUNCTION IF EXISTS public.{function};"))
+
+    # drop table
+    op.drop_table("territory_indicators_aggregates_data")
+    op.execute(sa.text("DROP TYPE indicator_aggregation_type"))
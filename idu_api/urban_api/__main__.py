@@ -1,4 +1,7 @@
 import os
+import shutil
+import subprocess
+import sys
 import tempfile
 import typing as tp
 
@@ -35,6 +38,41 @@ def _run_uvicorn(configuration: dict[str, tp.Any]) -> tp.NoReturn:
     )
 
 
+def _run_gunicorn(config: UrbanAPIConfig, config_path: str) -> None:
+    """Run gunicorn master process with the given number of uvicorn workers and preloaded application.
+
+    Gunicorn is started as a subprocess, because prometheus multiprocess mode must be enabled by environment variable
+    before `prometheus_client` is imported, and it is already imported by the launcher.
+    """
+    prometheus_multiproc_dir = tempfile.mkdtemp(prefix="urban_api_prometheus_")
+    env = os.environ | {"CONFIG_PATH": config_path, "PROMETHEUS_MULTIPROC_DIR": prometheus_multiproc_dir}
+    try:
+        subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "gunicorn",
+                "idu_api.urban_api:app",
+                "--config",
+                "python:idu_api.urban_api.gunicorn_conf",
+                "--worker-class",
+                "uvicorn.workers.UvicornWorker",
+                "--workers",
+                str(config.app.workers),
+                "--bind",
+                f"{config.app.host}:{config.app.port}",
+                "--log-level",
+                config.logging.level.lower(),
+            ],
+            env=env,
+            check=True,
+        )
+    except KeyboardInterrupt:
+        pass
+    finally:
+        shutil.rmtree(prometheus_multiproc_dir, ignore_errors=True)
+
+
 @click.command("Run urban api service")
 @click.option(
     "--port",
@@ -58,6 +96,14 @@ def _run_uvicorn(configuration: dict[str, tp.Any]) -> tp.NoReturn:
     show_envvar=True,
     help="Logger verbosity",
 )
+@click.option(
+    "--workers",
+    "-w",
+    envvar="WORKERS",
+    type=int,
+    show_envvar=True,
+    help="Number of worker processes (gunicorn with uvicorn workers is used if more than one)",
+)
 @click.option(
     "--debug",
     envvar="DEBUG",
@@ -77,6 +123,7 @@ def main(
     port: int,
     host: str,
     logger_verbosity: LogLevel,
+    workers: int,
     debug: bool,
     config_path: str,
 ):
@@ -92,6 +139,7 @@ def main(
             port=port or config.app.port,
             debug=debug or config.app.debug,
             name=config.app.name,
+            workers=workers or config.app.workers,
         ),
         db=config.db,
         auth=config.auth,
@@ -100,6 +148,10 @@ def main(
         logging=logging_section,
         prometheus=config.prometheus,
         broker=config.broker,
+        buffers_queue=config.buffers_queue,
+        caches_refresh=config.caches_refresh,
+        slow_queries=config.slow_queries,
+        tiles=config.tiles,
     )
     with tempfile.NamedTemporaryFile(delete=False) as temp_file:
         temp_yaml_config_path = temp_file.name
@@ -115,7 +167,9 @@ def main(
             "log_level": config.logging.level.lower(),
             "env_file": temp_envfile_path,
         }
-        if config.app.debug:
+        if config.app.workers > 1 and not config.app.debug:
+            _run_gunicorn(config, temp_yaml_config_path)
+        elif config.app.debug:
             try:
                 _run_uvicorn(uvicorn_config | {"reload": True})
             except:  # pylint: disable=bare-except
@@ -20,6 +20,7 @@ class AppConfig:
     port: int
     debug: bool
     name: str
+    workers: int = 1
 
     def __post_init__(self):
         self.name = f"urban_api ({api_version})"
@@ -64,6 +65,7 @@ class FileLogger:
 class LoggingConfig:
     level: LoggingLevel
     files: list[FileLogger] = field(default_factory=list)
+    json_console: bool = False
 
     def __post_init__(self):
         if len(self.files) > 0 and isinstance(self.files[0], dict):
@@ -74,6 +76,7 @@ class LoggingConfig:
 class PrometheusConfig:
     port: int = 9000
     disable: bool = False
+    monitor_interval: float = 1.0
 
 
 @dataclass
@@ -85,6 +88,39 @@ class BrokerConfig:
     max_in_flight: int
 
 
+@dataclass
+class BuffersQueueConfig:
+    batch_size: int = 500
+    interval: float = 5.0
+    disable: bool = False
+
+
+@dataclass
+class CachesRefreshConfig:
+    interval: float = 1.0
+    disable: bool = False
+
+
+@dataclass
+class SlowQueriesConfig:
+    threshold: float = 1.0
+    explain: bool = False
+    disable: bool = False
+
+
+@dataclass
+class TilesConfig:
+    bucket: str = "urban.tiles"
+    cache_size: int = 4096
+    cache_ttl: int = 21600
+    disable_storage: bool = False
+    invalidations_cleanup_interval: float = 3600.0
+
+    def __post_init__(self):
+        # invalidations are kept in the database for a day
+        self.cache_ttl = min(self.cache_ttl, 86400)
+
+
 @dataclass
 class UrbanAPIConfig:
     app: AppConfig
@@ -95,6 +131,10 @@ class UrbanAPIConfig:
     logging: LoggingConfig
     prometheus: PrometheusConfig
     broker: BrokerConfig
+    buffers_queue: BuffersQueueConfig = field(default_factory=BuffersQueueConfig)
+    caches_refresh: CachesRefreshConfig = field(default_factory=CachesRefreshConfig)
+    slow_queries: SlowQueriesConfig = field(default_factory=SlowQueriesConfig)
+    tiles: TilesConfig = field(default_factory=TilesConfig)
 
     def to_order_dict(self) -> OrderedDict:
         """OrderDict transformer."""
@@ -122,6 +162,9 @@ class UrbanAPIConfig:
                 ("logging", to_ordered_dict_recursive(self.logging)),
                 ("prometheus", to_ordered_dict_recursive(self.prometheus)),
                 ("broker", to_ordered_dict_recursive(self.broker)),
+                ("buffers_queue", to_ordered_dict_recursive(self.buffers_queue)),
+                ("slow_queries", to_ordered_dict_recursive(self.slow_queries)),
+                ("tiles", to_ordered_dict_recursive(self.tiles)),
             ]
         )
 
@@ -145,7 +188,7 @@ class UrbanAPIConfig:
         """Generate an example of configuration."""
 
         return cls(
-            app=AppConfig(host="0.0.0.0", port=8000, debug=False, name="urban_api"),
+            app=AppConfig(host="0.0.0.0", port=8000, debug=False, name="urban_api", workers=1),
             db=MultipleDBsConfig(
                 master=DBConfig(
                     host="localhost", port=5432, database="urban_db", user="postgres", password="postgres", pool_size=15
@@ -174,8 +217,10 @@ class UrbanAPIConfig:
             external=ExternalServicesConfig(
                 hextech_api="http://localhost:8100", gen_planner_api="http://localhost:8101"
             ),
-            logging=LoggingConfig(level="INFO", files=[FileLogger(filename="logs/info.log", level="INFO")]),
-            prometheus=PrometheusConfig(port=9000, disable=False),
+            logging=LoggingConfig(
+                level="INFO", files=[FileLogger(filename="logs/info.log", level="INFO")], json_console=False
+            ),
+            prometheus=PrometheusConfig(port=9000, disable=False, monitor_interval=1.0),
             broker=BrokerConfig(
                 client_id="urban-api",
                 bootstrap_servers="localhost:9092",
@@ -183,6 +228,16 @@ class UrbanAPIConfig:
                 enable_idempotence=False,
                 max_in_flight=5,
             ),
+            buffers_queue=BuffersQueueConfig(batch_size=500, interval=5.0, disable=False),
+            caches_refresh=CachesRefreshConfig(interval=1.0, disable=False),
+            slow_queries=SlowQueriesConfig(threshold=1.0, explain=False, disable=False),
+            tiles=TilesConfig(
+                bucket="urban.tiles",
+                cache_size=4096,
+                cache_ttl=21600,
+                disable_storage=False,
+                invalidations_cleanup_interval=3600.0,
+            ),
         )
 
     @classmethod
@@ -205,6 +260,10 @@ class UrbanAPIConfig:
                 logging=LoggingConfig(**data.get("logging", {})),
                 prometheus=PrometheusConfig(**data.get("prometheus", {})),
                 broker=BrokerConfig(**data.get("broker", {})),
+                buffers_queue=BuffersQueueConfig(**data.get("buffers_queue", {})),
+                caches_refresh=CachesRefreshConfig(**data.get("caches_refresh", {})),
+                slow_queries=SlowQueriesConfig(**data.get("slow_queries", {})),
+                tiles=TilesConfig(**data.get("tiles", {})),
             )
         except Exception as exc:
             raise ValueError(f"Could not read app config file: {file}") from exc
@@ -1,6 +1,14 @@
 """Data Transfer Objects (much like entities from database) are defined in this module."""
 
-from .buffers import BufferDTO, BufferTypeDTO, DefaultBufferValueDTO, ScenarioBufferDTO
+from .buffers import (
+    BufferDTO,
+    BuffersQueueStatsDTO,
+    BufferTypeDTO,
+    DefaultBufferValueDTO,
+    HexagonServiceCoverageDTO,
+    ScenarioBufferDTO,
+    ServiceCoverageDTO,
+)
 from .buildings import BuildingDTO, BuildingWithGeometryDTO
 from .functional_zones import (
     FunctionalZoneDTO,
@@ -8,8 +16,9 @@ from .functional_zones import (
     FunctionalZoneTypeDTO,
     ScenarioFunctionalZoneDTO,
 )
-from .hexagons import HexagonDTO, HexagonWithIndicatorsDTO
+from .hexagons import HexagonDTO, HexagonsIndicatorsMatrixDTO, HexagonWithIndicatorsDTO
 from .indicators import (
+    AggregatedIndicatorValueDTO,
     IndicatorDTO,
     IndicatorsGroupDTO,
     IndicatorValueDTO,
@@ -36,11 +45,13 @@ from .physical_objects import (
 from .profiles_reclamation import ProfilesReclamationDataDTO, ProfilesReclamationDataMatrixDTO
 from .projects import ProjectDTO, ProjectPhasesDTO, ProjectTerritoryDTO, ProjectWithTerritoryDTO
 from .scenarios import ScenarioDTO
+from .search import SearchResultDTO
 from .service_types import ServiceTypeDTO, ServiceTypesHierarchyDTO, UrbanFunctionDTO
 from .services import (
     ScenarioServiceDTO,
     ScenarioServiceWithGeometryDTO,
     ServiceDTO,
+    ServiceProvisionDTO,
     ServicesCountCapacityDTO,
     ServiceWithGeometryDTO,
     ShortScenarioServiceDTO,
@@ -72,6 +83,7 @@ __all__ = [
     "UserDTO",
     "TokensTuple",
     "ScenarioDTO",
+    "ServiceProvisionDTO",
     "ServicesCountCapacityDTO",
     "ServiceDTO",
     "ServiceTypeDTO",
@@ -80,6 +92,7 @@ __all__ = [
     "IndicatorDTO",
     "IndicatorsGroupDTO",
     "IndicatorValueDTO",
+    "AggregatedIndicatorValueDTO",
     "MeasurementUnitDTO",
     "NormativeDTO",
     "ObjectGeometryDTO",
@@ -112,10 +125,12 @@ __all__ = [
     "ScenarioServiceDTO",
     "ScenarioGeometryWithAllObjectsDTO",
     "ScenarioGeometryDTO",
+    "SearchResultDTO",
     "ShortServiceDTO",
     "ShortPhysicalObjectDTO",
     "HexagonDTO",
     "HexagonWithIndicatorsDTO",
+    "HexagonsIndicatorsMatrixDTO",
     "ShortScenarioIndicatorValueDTO",
     "ScenarioUrbanObjectDTO",
     "FunctionalZoneSourceDTO",
@@ -129,7 +144,10 @@ __all__ = [
     "ScenarioPhysicalObjectWithGeometryDTO",
     "ScenarioServiceWithGeometryDTO",
     "BufferDTO",
+    "BuffersQueueStatsDTO",
     "BufferTypeDTO",
     "DefaultBufferValueDTO",
     "ScenarioBufferDTO",
+    "ServiceCoverageDTO",
+    "HexagonServiceCoverageDTO",
 ]
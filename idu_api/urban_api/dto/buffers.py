@@ -1,10 +1,12 @@
 """Buffers DTOs are defined here."""
 
 from dataclasses import asdict, dataclass
+from datetime import datetime
 from typing import Any
 
 import shapely.geometry as geom
-from shapely.wkb import loads as wkb_loads
+
+from idu_api.urban_api.dto.geometries import WKBGeometry
 
 
 @dataclass(frozen=True)
@@ -24,6 +26,45 @@ class DefaultBufferValueDTO:
     buffer_value: float
 
 
+@dataclass(frozen=True)
+class BuffersQueueStatsDTO:
+    pending: int
+    oldest_queued_at: datetime | None
+    projects_pending: int
+    projects_oldest_queued_at: datetime | None
+
+
+@dataclass(frozen=True)
+class HexagonServiceCoverageDTO:
+    hexagon_id: int
+    hexagon_area: float
+    covered_area: float
+
+    @property
+    def coverage_ratio(self) -> float:
+        return self.covered_area / self.hexagon_area if self.hexagon_area > 0 else 0.0
+
+
+@dataclass
+class ServiceCoverageDTO:
+    territory_id: int
+    territory_name: str
+    service_type_id: int
+    service_type_name: str
+    buffer_type_id: int
+    buffer_type_name: str
+    geometry: geom.Polygon | geom.MultiPolygon | None = WKBGeometry()
+    territory_area: float
+    covered_area: float
+    services_count: int
+    built_at: datetime
+    hexagons: list[HexagonServiceCoverageDTO] | None = None
+
+    @property
+    def coverage_ratio(self) -> float:
+        return self.covered_area / self.territory_area if self.territory_area > 0 else 0.0
+
+
 @dataclass
 class BufferDTO:
     buffer_type_id: int
@@ -40,13 +81,9 @@ class BufferDTO:
     service_name: str | None
     service_type_id: int | None
     service_type_name: str | None
-    geometry: geom.Polygon | geom.MultiPolygon
+    geometry: geom.Polygon | geom.MultiPolygon = WKBGeometry()
     is_custom: bool
 
-    def __post_init__(self) -> None:
-        if isinstance(self.geometry, bytes):
-            self.geometry = wkb_loads(self.geometry)
-
     def to_geojson_dict(self) -> dict[str, Any]:
         buffer = asdict(self)
 
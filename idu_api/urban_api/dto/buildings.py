@@ -4,7 +4,8 @@ from dataclasses import dataclass
 from typing import Any
 
 import shapely.geometry as geom
-from shapely.wkb import loads as wkb_loads
+
+from idu_api.urban_api.dto.geometries import WKBGeometry
 
 
 @dataclass
@@ -27,16 +28,8 @@ class BuildingWithGeometryDTO:  # pylint: disable=too-many-instance-attributes
     object_geometry_id: int
     address: str | None
     osm_id: str | None
-    geometry: geom.Polygon | geom.MultiPolygon | geom.Point
-    centre_point: geom.Point
-
-    def __post_init__(self) -> None:
-        if isinstance(self.centre_point, bytes):
-            self.centre_point = wkb_loads(self.centre_point)
-        if self.geometry is None:
-            self.geometry = self.centre_point
-        if isinstance(self.geometry, bytes):
-            self.geometry = wkb_loads(self.geometry)
+    geometry: geom.Polygon | geom.MultiPolygon | geom.Point = WKBGeometry(fallback="centre_point")
+    centre_point: geom.Point = WKBGeometry()
 
 
 @dataclass(frozen=True)
@@ -5,7 +5,8 @@ from datetime import datetime
 from typing import Any
 
 import shapely.geometry as geom
-from shapely.wkb import loads as wkb_loads
+
+from idu_api.urban_api.dto.geometries import WKBGeometry
 
 
 @dataclass(frozen=True)
@@ -26,17 +27,13 @@ class FunctionalZoneDTO:  # pylint: disable=too-many-instance-attributes
     functional_zone_type_nickname: str
     functional_zone_type_description: str
     name: str | None
-    geometry: geom.Polygon | geom.MultiPolygon
+    geometry: geom.Polygon | geom.MultiPolygon = WKBGeometry()
     year: int
     source: str
     properties: dict[str, Any]
     created_at: datetime
     updated_at: datetime
 
-    def __post_init__(self) -> None:
-        if isinstance(self.geometry, bytes):
-            self.geometry = wkb_loads(self.geometry)
-
     def to_geojson_dict(self) -> dict:
         zone = asdict(self)
         zone["territory"] = {"id": zone.pop("territory_id"), "name": zone.pop("territory_name")}
@@ -59,17 +56,13 @@ class ScenarioFunctionalZoneDTO:  # pylint: disable=too-many-instance-attributes
     functional_zone_type_nickname: str
     functional_zone_type_description: str
     name: str | None
-    geometry: geom.Polygon | geom.MultiPolygon
+    geometry: geom.Polygon | geom.MultiPolygon = WKBGeometry()
     year: int
     source: str
     properties: dict[str, Any]
     created_at: datetime
     updated_at: datetime
 
-    def __post_init__(self) -> None:
-        if isinstance(self.geometry, bytes):
-            self.geometry = wkb_loads(self.geometry)
-
     def to_geojson_dict(self) -> dict:
         profile = asdict(self)
         profile["functional_zone_type"] = {
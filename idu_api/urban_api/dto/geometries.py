@@ -0,0 +1,38 @@
+"""Lazily decoded geometry fields of DTOs are defined here."""
+
+from typing import Any
+
+from shapely.wkb import loads as wkb_loads
+
+
+class WKBGeometry:
+    """Data class field descriptor which keeps geometry as (E)WKB bytes received from the database
+    and decodes it to shapely geometry only on the first access.
+
+    Most of the geometries are only needed to be serialized (or not needed at all, e.g. when only centers are
+    requested), so decoding them eagerly for every row is a waste of time.
+
+    If `fallback` field name is given, its value is returned when the geometry itself is None.
+    """
+
+    def __init__(self, fallback: str | None = None):
+        self._fallback = fallback
+        self._name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            # data class treats a field as one without default value if descriptor raises AttributeError here
+            raise AttributeError(self._name)
+        value = instance.__dict__.get(self._name)
+        if isinstance(value, (bytes, memoryview)):
+            value = wkb_loads(bytes(value))
+            instance.__dict__[self._name] = value
+        if value is None and self._fallback is not None:
+            return getattr(instance, self._fallback)
+        return value
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        instance.__dict__[self._name] = value
@@ -2,7 +2,7 @@
 
 from collections.abc import Iterable
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime
 from typing import Any, Literal
 
 
@@ -53,6 +53,25 @@ class IndicatorValueDTO:  # pylint: disable=too-many-instance-attributes
         return cls.__annotations__.keys()
 
 
+@dataclass(frozen=True)
+class AggregatedIndicatorValueDTO:  # pylint: disable=too-many-instance-attributes
+    territory_id: int
+    territory_name: str
+    indicator_id: int
+    parent_id: int | None
+    name_full: str
+    measurement_unit_id: int | None
+    measurement_unit_name: str | None
+    level: int
+    list_label: str
+    value_type: Literal["real", "forecast", "target"]
+    aggregation_type: Literal["sum", "avg", "weighted_avg"]
+    weight_indicator_id: int | None
+    value: float | None
+    territories_count: int
+    date_value: date | None
+
+
 @dataclass(frozen=True)
 class MeasurementUnitDTO:
     measurement_unit_id: int
@@ -5,7 +5,8 @@ from datetime import datetime
 from typing import Any
 
 import shapely.geometry as geom
-from shapely.wkb import loads as wkb_loads
+
+from idu_api.urban_api.dto.geometries import WKBGeometry
 
 Geom = geom.Polygon | geom.MultiPolygon | geom.Point | geom.LineString | geom.MultiLineString
 
@@ -17,19 +18,11 @@ class ObjectGeometryDTO:
     territory_name: str
     address: str | None
     osm_id: str | None
-    geometry: Geom
-    centre_point: geom.Point
+    geometry: Geom = WKBGeometry(fallback="centre_point")
+    centre_point: geom.Point = WKBGeometry()
     created_at: datetime
     updated_at: datetime
 
-    def __post_init__(self) -> None:
-        if isinstance(self.centre_point, bytes):
-            self.centre_point = wkb_loads(self.centre_point)
-        if self.geometry is None:
-            self.geometry = self.centre_point
-        if isinstance(self.geometry, bytes):
-            self.geometry = wkb_loads(self.geometry)
-
     def to_geojson_dict(self) -> dict[str, Any]:
         geometry = asdict(self)
         geometry["territory"] = {"id": geometry.pop("territory_id"), "name": geometry.pop("territory_name")}
@@ -48,19 +41,11 @@ class GeometryWithAllObjectsDTO:
     territory_name: str
     address: str | None
     osm_id: str | None
-    geometry: Geom
-    centre_point: geom.Point
+    geometry: Geom = WKBGeometry(fallback="centre_point")
+    centre_point: geom.Point = WKBGeometry()
     physical_objects: list[dict[str, Any]]
     services: list[dict[str, Any]]
 
-    def __post_init__(self) -> None:
-        if isinstance(self.centre_point, bytes):
-            self.centre_point = wkb_loads(self.centre_point)
-        if self.geometry is None:
-            self.geometry = self.centre_point
-        if isinstance(self.geometry, bytes):
-            self.geometry = wkb_loads(self.geometry)
-
     def to_geojson_dict(self) -> dict[str, Any]:
         obj = asdict(self)
         obj["territory"] = {"id": obj.pop("territory_id"), "name": obj.pop("territory_name")}
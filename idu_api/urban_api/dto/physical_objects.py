@@ -6,7 +6,8 @@ from datetime import datetime
 from typing import Any
 
 import shapely.geometry as geom
-from shapely.wkb import loads as wkb_loads
+
+from idu_api.urban_api.dto.geometries import WKBGeometry
 
 # pylint: disable=too-many-instance-attributes
 
@@ -66,19 +67,11 @@ class PhysicalObjectWithGeometryDTO:
     object_geometry_id: int
     address: str | None
     osm_id: str | None
-    geometry: Geom
-    centre_point: geom.Point
+    geometry: Geom = WKBGeometry(fallback="centre_point")
+    centre_point: geom.Point = WKBGeometry()
     created_at: datetime
     updated_at: datetime
 
-    def __post_init__(self) -> None:
-        if isinstance(self.centre_point, bytes):
-            self.centre_point = wkb_loads(self.centre_point)
-        if self.geometry is None:
-            self.geometry = self.centre_point
-        if isinstance(self.geometry, bytes):
-            self.geometry = wkb_loads(self.geometry)
-
     def to_geojson_dict(self) -> dict[str, Any]:
         physical_object = asdict(self)
 
@@ -7,7 +7,8 @@ from datetime import date, datetime
 from typing import Any
 
 import shapely.geometry as geom
-from shapely.wkb import loads as wkb_loads
+
+from idu_api.urban_api.dto.geometries import WKBGeometry
 
 
 @dataclass(frozen=True)
@@ -38,18 +39,10 @@ class ProjectTerritoryDTO:
     territory_name: str
     scenario_id: int
     scenario_name: str
-    geometry: geom.Polygon | geom.MultiPolygon
-    centre_point: geom.Point
+    geometry: geom.Polygon | geom.MultiPolygon = WKBGeometry(fallback="centre_point")
+    centre_point: geom.Point = WKBGeometry()
     properties: dict[str, Any] | None
 
-    def __post_init__(self) -> None:
-        if isinstance(self.centre_point, bytes):
-            self.centre_point = wkb_loads(self.centre_point)
-        if self.geometry is None:
-            self.geometry = self.centre_point
-        if isinstance(self.geometry, bytes):
-            self.geometry = wkb_loads(self.geometry)
-
 
 @dataclass
 class ProjectWithTerritoryDTO:
@@ -67,16 +60,8 @@ class ProjectWithTerritoryDTO:
     properties: dict[str, Any]
     created_at: datetime
     updated_at: datetime
-    geometry: geom.Polygon | geom.MultiPolygon
-    centre_point: geom.Point
-
-    def __post_init__(self) -> None:
-        if isinstance(self.centre_point, bytes):
-            self.centre_point = wkb_loads(self.centre_point)
-        if self.geometry is None:
-            self.geometry = self.centre_point
-        if isinstance(self.geometry, bytes):
-            self.geometry = wkb_loads(self.geometry)
+    geometry: geom.Polygon | geom.MultiPolygon = WKBGeometry(fallback="centre_point")
+    centre_point: geom.Point = WKBGeometry()
 
     def to_geojson_dict(self):
         project = asdict(self)
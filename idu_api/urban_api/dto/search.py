@@ -0,0 +1,13 @@
+"""Search DTOs are defined here."""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class SearchResultDTO:
+    """Entity found by name with its similarity to the query."""
+
+    entity_type: str
+    id: int
+    name: str
+    rank: float
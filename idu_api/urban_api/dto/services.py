@@ -6,7 +6,8 @@ from datetime import datetime
 from typing import Any
 
 import shapely.geometry as geom
-from shapely.wkb import loads as wkb_loads
+
+from idu_api.urban_api.dto.geometries import WKBGeometry
 
 Geom = geom.Polygon | geom.MultiPolygon | geom.Point | geom.LineString | geom.MultiLineString
 
@@ -59,19 +60,11 @@ class ServiceWithGeometryDTO:  # pylint: disable=too-many-instance-attributes
     object_geometry_id: int
     address: str | None
     osm_id: str | None
-    geometry: Geom
-    centre_point: geom.Point
+    geometry: Geom = WKBGeometry(fallback="centre_point")
+    centre_point: geom.Point = WKBGeometry()
     created_at: datetime
     updated_at: datetime
 
-    def __post_init__(self) -> None:
-        if isinstance(self.centre_point, bytes):
-            self.centre_point = wkb_loads(self.centre_point)
-        if self.geometry is None:
-            self.geometry = self.centre_point
-        if isinstance(self.geometry, bytes):
-            self.geometry = wkb_loads(self.geometry)
-
     def to_geojson_dict(self) -> dict[str, Any]:
         service = asdict(self)
         territory_type = service.pop("territory_type_id", None), service.pop("territory_type_name", None)
@@ -105,6 +98,24 @@ class ServicesCountCapacityDTO:
     capacity: int
 
 
+@dataclass(frozen=True)
+class ServiceProvisionDTO:  # pylint: disable=too-many-instance-attributes
+    territory_id: int
+    territory_name: str
+    service_type_id: int
+    service_type_name: str
+    year: int
+    population: float | None
+    normative_territory_id: int
+    services_per_1000_normative: float | None
+    services_capacity_per_1000_normative: float | None
+    count: int
+    capacity: int
+    required_count: float | None
+    required_capacity: float | None
+    provision: float | None
+
+
 @dataclass(frozen=True)
 class ShortServiceDTO:
     service_id: int
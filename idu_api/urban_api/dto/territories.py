@@ -5,8 +5,8 @@ from datetime import datetime
 from typing import Any
 
 import shapely.geometry as geom
-from shapely.wkb import loads as wkb_loads
 
+from idu_api.urban_api.dto.geometries import WKBGeometry
 from idu_api.urban_api.dto.indicators import IndicatorValueDTO
 from idu_api.urban_api.dto.normatives import NormativeDTO
 
@@ -38,10 +38,10 @@ class TerritoryDTO:  # pylint: disable=too-many-instance-attributes
     parent_id: int
     parent_name: str
     name: str
-    geometry: geom.Polygon | geom.MultiPolygon | geom.Point
+    geometry: geom.Polygon | geom.MultiPolygon | geom.Point = WKBGeometry(fallback="centre_point")
     level: int
     properties: dict[str, Any] | None
-    centre_point: geom.Point
+    centre_point: geom.Point = WKBGeometry()
     admin_center_id: int | None
     admin_center_name: str | None
     target_city_type_id: int | None
@@ -53,14 +53,6 @@ class TerritoryDTO:  # pylint: disable=too-many-instance-attributes
     created_at: datetime
     updated_at: datetime
 
-    def __post_init__(self) -> None:
-        if isinstance(self.centre_point, bytes):
-            self.centre_point = wkb_loads(self.centre_point)
-        if self.geometry is None:
-            self.geometry = self.centre_point
-        if isinstance(self.geometry, bytes):
-            self.geometry = wkb_loads(self.geometry)
-
     def to_geojson_dict(self) -> dict[str, Any]:
         territory = asdict(self)
         territory["territory_type"] = {
@@ -152,18 +144,10 @@ class TerritoryWithIndicatorsDTO:
 
     territory_id: int
     name: str
-    geometry: geom.Polygon | geom.MultiPolygon | geom.Point
-    centre_point: geom.Point
+    geometry: geom.Polygon | geom.MultiPolygon | geom.Point = WKBGeometry(fallback="centre_point")
+    centre_point: geom.Point = WKBGeometry()
     indicators: list[IndicatorValueDTO]
 
-    def __post_init__(self) -> None:
-        if isinstance(self.centre_point, bytes):
-            self.centre_point = wkb_loads(self.centre_point)
-        if self.geometry is None:
-            self.geometry = self.centre_point
-        if isinstance(self.geometry, bytes):
-            self.geometry = wkb_loads(self.geometry)
-
     def to_geojson_dict(self) -> dict[str, Any]:
         territory = asdict(self)
         for indicator in territory["indicators"]:
@@ -183,18 +167,10 @@ class TerritoryWithNormativesDTO:
 
     territory_id: int
     name: str
-    geometry: geom.Polygon | geom.MultiPolygon | geom.Point
-    centre_point: geom.Point
+    geometry: geom.Polygon | geom.MultiPolygon | geom.Point = WKBGeometry(fallback="centre_point")
+    centre_point: geom.Point = WKBGeometry()
     normatives: list[NormativeDTO]
 
-    def __post_init__(self) -> None:
-        if isinstance(self.centre_point, bytes):
-            self.centre_point = wkb_loads(self.centre_point)
-        if self.geometry is None:
-            self.geometry = self.centre_point
-        if isinstance(self.geometry, bytes):
-            self.geometry = wkb_loads(self.geometry)
-
     def to_geojson_dict(self) -> dict[str, Any]:
         territory = asdict(self)
         for normative in territory["normatives"]:
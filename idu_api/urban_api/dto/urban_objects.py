@@ -5,7 +5,8 @@ from datetime import datetime
 from typing import Any
 
 import shapely.geometry as geom
-from shapely.wkb import loads as wkb_loads
+
+from idu_api.urban_api.dto.geometries import WKBGeometry
 
 Geom = geom.Polygon | geom.MultiPolygon | geom.Point | geom.LineString | geom.MultiLineString
 
@@ -37,8 +38,8 @@ class UrbanObjectDTO:  # pylint: disable=too-many-instance-attributes
     territory_name: str
     address: str | None
     osm_id: str | None
-    geometry: Geom
-    centre_point: geom.Point
+    geometry: Geom = WKBGeometry(fallback="centre_point")
+    centre_point: geom.Point = WKBGeometry()
     object_geometry_created_at: datetime
     object_geometry_updated_at: datetime
     service_id: int | None
@@ -59,14 +60,6 @@ class UrbanObjectDTO:  # pylint: disable=too-many-instance-attributes
     service_created_at: datetime | None
     service_updated_at: datetime | None
 
-    def __post_init__(self) -> None:
-        if isinstance(self.centre_point, bytes):
-            self.centre_point = wkb_loads(self.centre_point)
-        if self.geometry is None:
-            self.geometry = self.centre_point
-        if isinstance(self.geometry, bytes):
-            self.geometry = wkb_loads(self.geometry)
-
 
 @dataclass
 class ScenarioUrbanObjectDTO:  # pylint: disable=too-many-instance-attributes
@@ -98,8 +91,8 @@ class ScenarioUrbanObjectDTO:  # pylint: disable=too-many-instance-attributes
     territory_name: str
     address: str | None
     osm_id: str | None
-    geometry: Geom
-    centre_point: geom.Point
+    geometry: Geom = WKBGeometry(fallback="centre_point")
+    centre_point: geom.Point = WKBGeometry()
     object_geometry_created_at: datetime
     object_geometry_updated_at: datetime
     is_scenario_geometry: bool
@@ -121,11 +114,3 @@ class ScenarioUrbanObjectDTO:  # pylint: disable=too-many-instance-attributes
     service_created_at: datetime | None
     service_updated_at: datetime | None
     is_scenario_service: bool | None
-
-    def __post_init__(self) -> None:
-        if isinstance(self.centre_point, bytes):
-            self.centre_point = wkb_loads(self.centre_point)
-        if self.geometry is None:
-            self.geometry = self.centre_point
-        if isinstance(self.geometry, bytes):
-            self.geometry = wkb_loads(self.geometry)
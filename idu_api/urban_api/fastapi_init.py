@@ -1,5 +1,6 @@
 """FastAPI application initialization is performed here."""
 
+import functools
 import os
 from contextlib import asynccontextmanager
 from typing import Callable
@@ -14,24 +15,35 @@ from otteroad import KafkaProducerClient, KafkaProducerSettings
 from idu_api.common.db.connection.manager import PostgresConnectionManager
 from idu_api.urban_api.config import UrbanAPIConfig
 from idu_api.urban_api.logic.impl.functional_zones import FunctionalZonesServiceImpl
+from idu_api.urban_api.logic.impl.helpers.territories_spatial_index import get_territories_spatial_index
+from idu_api.urban_api.logic.impl.helpers.territories_tree import get_territories_tree
 from idu_api.urban_api.logic.impl.indicators import IndicatorsServiceImpl
 from idu_api.urban_api.logic.impl.object_geometries import ObjectGeometriesServiceImpl
 from idu_api.urban_api.logic.impl.physical_object_types import PhysicalObjectTypesServiceImpl
 from idu_api.urban_api.logic.impl.physical_objects import PhysicalObjectsServiceImpl
 from idu_api.urban_api.logic.impl.projects import UserProjectServiceImpl
+from idu_api.urban_api.logic.impl.search import SearchServiceImpl
 from idu_api.urban_api.logic.impl.service_types import ServiceTypesServiceImpl
 from idu_api.urban_api.logic.impl.services import ServicesDataServiceImpl
 from idu_api.urban_api.logic.impl.soc_groups import SocGroupsServiceImpl
 from idu_api.urban_api.logic.impl.system import SystemServiceImpl
 from idu_api.urban_api.logic.impl.territories import TerritoriesServiceImpl
+from idu_api.urban_api.logic.impl.tiles import TilesServiceImpl
 from idu_api.urban_api.logic.impl.urban_objects import UrbanObjectsServiceImpl
 from idu_api.urban_api.middlewares.authentication import AuthenticationMiddleware
 from idu_api.urban_api.middlewares.dependency_injection import PassServicesDependenciesMiddleware
 from idu_api.urban_api.middlewares.exception_handler import ExceptionHandlerMiddleware
 from idu_api.urban_api.middlewares.logging import LoggingMiddleware
+from idu_api.urban_api.minio.services import TilesStorageManager
 from idu_api.urban_api.prometheus import server as prometheus_server
 from idu_api.urban_api.utils.auth_client import AuthenticationClient
-from idu_api.urban_api.utils.logging import configure_logging
+from idu_api.urban_api.utils.buffers_queue import BuffersQueueWorker
+from idu_api.urban_api.utils.caches_refresh import CachesRefreshWorker
+from idu_api.urban_api.utils.logging import configure_logging, stop_logging
+from idu_api.urban_api.utils.responses import FastJSONResponse
+from idu_api.urban_api.utils.runtime_monitor import RuntimeMetricsMonitor, observe_pool_wait_time
+from idu_api.urban_api.utils.tiles_cache import TilesCache
+from idu_api.urban_api.utils.tiles_invalidations import TilesInvalidationsCleaner
 
 from .handlers import list_of_routers
 from .logic.impl.buffers import BufferServiceImpl
@@ -69,6 +81,7 @@ def get_app(prefix: str = "/api") -> FastAPI:
         contact={"email": "idu@itmo.ru"},
         license_info={"name": "Apache 2.0", "url": "http://www.apache.org/licenses/LICENSE-2.0.html"},
         lifespan=lifespan,
+        default_response_class=FastJSONResponse,
     )
     bind_routes(application, prefix, app_config.app.debug)
 
@@ -105,6 +118,12 @@ def get_app(prefix: str = "/api") -> FastAPI:
 
     application.state.config = app_config
 
+    tiles_cache = TilesCache(
+        app_config.tiles.cache_size,
+        app_config.tiles.cache_ttl,
+        None if app_config.tiles.disable_storage else TilesStorageManager(app_config),
+    )
+
     application.add_middleware(
         PassServicesDependenciesMiddleware,
         connection_manager=connection_manager,  # reinitialized on startup
@@ -114,10 +133,12 @@ def get_app(prefix: str = "/api") -> FastAPI:
         object_geometries_service=ignore_kwargs(ObjectGeometriesServiceImpl),
         physical_object_types_service=ignore_kwargs(PhysicalObjectTypesServiceImpl),
         physical_objects_service=ignore_kwargs(PhysicalObjectsServiceImpl),
+        search_service=ignore_kwargs(SearchServiceImpl),
         service_types_service=ignore_kwargs(ServiceTypesServiceImpl),
         services_data_service=ignore_kwargs(ServicesDataServiceImpl),
         soc_groups_service=ignore_kwargs(SocGroupsServiceImpl),
         territories_service=ignore_kwargs(TerritoriesServiceImpl),
+        tiles_service=functools.partial(TilesServiceImpl, tiles_cache=tiles_cache),
         urban_objects_service=ignore_kwargs(UrbanObjectsServiceImpl),
         user_project_service=UserProjectServiceImpl,
         system_service=SystemServiceImpl,
@@ -145,7 +166,7 @@ async def lifespan(application: FastAPI):
     """
     app_config: UrbanAPIConfig = application.state.config
     loggers_dict = {logger_config.filename: logger_config.level for logger_config in app_config.logging.files}
-    logger = configure_logging(app_config.logging.level, loggers_dict)
+    logger = configure_logging(app_config.logging.level, loggers_dict, json_console=app_config.logging.json_console)
     application.state.logger = logger
     kafka_producer_settings = KafkaProducerSettings.from_custom_config(app_config.broker)
     kafka_producer = KafkaProducerClient(kafka_producer_settings, logger=structlog.getLogger("broker"))
@@ -159,8 +180,14 @@ async def lifespan(application: FastAPI):
                 replicas=app_config.db.replicas,
                 logger=logger,
                 application_name=app_config.app.name,
+                slow_query_threshold=None if app_config.slow_queries.disable else app_config.slow_queries.threshold,
+                explain_slow_queries=app_config.slow_queries.explain,
+                pool_wait_observer=None if app_config.prometheus.disable else observe_pool_wait_time,
             )
             await connection_manager.refresh()
+            async with connection_manager.get_ro_connection() as conn:
+                await get_territories_tree(conn)  # warm up territories tree index
+                await get_territories_spatial_index(conn)  # warm up territories spatial index
         elif middleware.cls == ExceptionHandlerMiddleware:
             middleware.kwargs["debug"][0] = app_config.app.debug
         elif middleware.cls == AuthenticationMiddleware:
@@ -172,13 +199,59 @@ async def lifespan(application: FastAPI):
                 app_config.auth.url,
             )
 
+    runtime_metrics_monitor = None
     if not app_config.prometheus.disable:
-        prometheus_server.start_server(port=app_config.prometheus.port)
+        # in multiprocess mode metrics of all workers are served by gunicorn master process
+        if not prometheus_server.is_multiprocess_mode():
+            prometheus_server.start_server(port=app_config.prometheus.port)
+        runtime_metrics_monitor = RuntimeMetricsMonitor(
+            connection_manager,
+            interval=app_config.prometheus.monitor_interval,
+            logger=structlog.getLogger("runtime_monitor"),
+        )
+        runtime_metrics_monitor.start()
 
     await kafka_producer.start()
 
+    buffers_queue_worker = None
+    if not app_config.buffers_queue.disable:
+        buffers_queue_worker = BuffersQueueWorker(
+            connection_manager,
+            batch_size=app_config.buffers_queue.batch_size,
+            interval=app_config.buffers_queue.interval,
+            logger=structlog.getLogger("buffers_queue"),
+        )
+        buffers_queue_worker.start()
+
+    caches_refresh_worker = None
+    if not app_config.caches_refresh.disable:
+        caches_refresh_worker = CachesRefreshWorker(
+            connection_manager,
+            interval=app_config.caches_refresh.interval,
+            logger=structlog.getLogger("caches_refresh"),
+        )
+        caches_refresh_worker.start()
+
+    tiles_invalidations_cleaner = TilesInvalidationsCleaner(
+        connection_manager,
+        interval=app_config.tiles.invalidations_cleanup_interval,
+        logger=structlog.getLogger("tiles_invalidations"),
+    )
+    tiles_invalidations_cleaner.start()
+
     yield
 
+    await tiles_invalidations_cleaner.stop()
+
+    if caches_refresh_worker is not None:
+        await caches_refresh_worker.stop()
+
+    if buffers_queue_worker is not None:
+        await buffers_queue_worker.stop()
+
+    if runtime_metrics_monitor is not None:
+        await runtime_metrics_monitor.stop()
+
     for middleware in application.user_middleware:
         if middleware.cls == PassServicesDependenciesMiddleware:
             connection_manager: PostgresConnectionManager = middleware.kwargs["connection_manager"]
@@ -189,5 +262,7 @@ async def lifespan(application: FastAPI):
 
     await application.state.kafka_producer.close()
 
+    stop_logging()
+
 
 app = get_app()
@@ -0,0 +1,29 @@
+"""Gunicorn configuration for multi-worker production mode is defined here.
+
+Server settings (bind address, workers number, worker class) are passed by the launcher from command line,
+this module only defines server hooks. Application is preloaded in the master process, so workers share
+its memory (copy-on-write) and each worker initializes its own database pools and background tasks in lifespan.
+Prometheus metrics of all workers are aggregated in `PROMETHEUS_MULTIPROC_DIR` and served by the master process.
+"""
+
+from gunicorn.arbiter import Arbiter
+from gunicorn.workers.base import Worker
+
+from idu_api.urban_api.config import UrbanAPIConfig
+from idu_api.urban_api.prometheus import server as prometheus_server
+
+preload_app = True
+
+
+def when_ready(_server: Arbiter) -> None:
+    app_config = UrbanAPIConfig.from_file_or_default()
+    if not app_config.prometheus.disable:
+        prometheus_server.start_server(port=app_config.prometheus.port)
+
+
+def on_exit(_server: Arbiter) -> None:
+    prometheus_server.stop_server()
+
+
+def child_exit(_server: Arbiter, worker: Worker) -> None:
+    prometheus_server.mark_process_dead(worker.pid)
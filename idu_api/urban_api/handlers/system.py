@@ -1,22 +1,36 @@
 """System endpoints are defined here."""
 
+import asyncio
 import io
 import json
 import os
+import re
 import zipfile
 from typing import Any
 
 import fastapi
 import shapely
-from fastapi import File, HTTPException, Request, UploadFile
-from fastapi.responses import StreamingResponse
+from fastapi import Depends, File, HTTPException, Query, Request, Security, UploadFile
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from fastapi.security import HTTPBearer
 from geojson_pydantic import Feature
 from starlette import status
 
+from idu_api.urban_api.dto.users import UserDTO
 from idu_api.urban_api.exceptions.base import IduApiError
 from idu_api.urban_api.logic.system import SystemService
-from idu_api.urban_api.schemas import PingResponse
+from idu_api.urban_api.prometheus.server import is_multiprocess_mode
+from idu_api.urban_api.schemas import OkResponse, PingResponse
+from idu_api.urban_api.schemas.enums import ProfileFormat
 from idu_api.urban_api.schemas.geometries import AllPossibleGeometry, GeoJSONResponse
+from idu_api.urban_api.utils.auth_client import get_user
+from idu_api.urban_api.utils.profiler import (
+    SampledProfile,
+    StackSampler,
+    requests_profiler,
+    to_collapsed,
+    to_speedscope,
+)
 
 from .routers import system_router
 
@@ -47,6 +61,173 @@ async def raise_error(idu_api_error: bool = True):
     raise RuntimeError("Something really unexpected occured")
 
 
+@system_router.post(
+    "/system/profiler/sample",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Security(HTTPBearer())],
+)
+async def sample_event_loop(
+    duration: float = Query(..., description="sampling duration in seconds", gt=0, le=120),
+    interval: float = Query(0.005, description="sampling interval in seconds", ge=0.001, le=1),
+    output_format: ProfileFormat = Query(ProfileFormat.SPEEDSCOPE, description="report format"),
+    user: UserDTO = Depends(get_user),
+):
+    """
+    ## Sample stacks of the event loop thread for the given number of seconds.
+
+    **NOTE:** Only the event loop of the worker process which received the request can be sampled, so the method
+    is not available when the application is run with several workers.
+
+    **WARNING:** Only a superuser can use this method.
+
+    ### Parameters:
+    - **duration** (float, Query): Sampling duration in seconds.
+    - **interval** (float, Query): Sampling interval in seconds (default: 0.005).
+    - **output_format** (ProfileFormat, Query): `speedscope` (JSON file for https://www.speedscope.app)
+      or `collapsed` (text for flamegraph.pl/inferno).
+
+    ### Returns:
+    - Profile report in the requested format.
+
+    ### Errors:
+    - **403 Forbidden**: If the user is not a superuser.
+    - **409 Conflict**: If the application is run with several worker processes.
+    """
+    _check_superuser(user)
+    _check_single_process()
+
+    sampler = StackSampler("event loop", interval)
+    sampler.start()
+    try:
+        await asyncio.sleep(duration)
+    finally:
+        profile = sampler.stop()
+
+    return _profile_report([profile], output_format)
+
+
+@system_router.post(
+    "/system/profiler/requests",
+    response_model=OkResponse,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Security(HTTPBearer())],
+)
+async def profile_requests(
+    path_pattern: str = Query(..., description="regular expression to search in request path"),
+    count: int = Query(1, description="number of requests to profile", ge=1, le=100),
+    interval: float = Query(0.005, description="sampling interval in seconds", ge=0.001, le=1),
+    user: UserDTO = Depends(get_user),
+) -> OkResponse:
+    """
+    ## Profile the next requests which path matches the given pattern.
+
+    **NOTE:** Previously collected requests profiles are removed. Requests are profiled one at a time,
+    and samples include everything running in the event loop during the request. Profiler state is kept
+    in the worker process, so it is not available when the application is run with several workers.
+
+    **WARNING:** Only a superuser can use this method.
+
+    ### Parameters:
+    - **path_pattern** (str, Query): Regular expression to search in request path.
+    - **count** (int, Query): Number of requests to profile (default: 1).
+    - **interval** (float, Query): Sampling interval in seconds (default: 0.005).
+
+    ### Returns:
+    - **OkResponse**: A confirmation message of the success.
+
+    ### Errors:
+    - **400 Bad Request**: If the path pattern is not a valid regular expression.
+    - **403 Forbidden**: If the user is not a superuser.
+    - **409 Conflict**: If the application is run with several worker processes.
+    """
+    _check_superuser(user)
+    _check_single_process()
+
+    try:
+        requests_profiler.arm(path_pattern, count, interval)
+    except re.error as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid path pattern: {exc}") from exc
+
+    return OkResponse()
+
+
+@system_router.get(
+    "/system/profiler/requests",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Security(HTTPBearer())],
+)
+async def get_requests_profiles(
+    output_format: ProfileFormat = Query(ProfileFormat.SPEEDSCOPE, description="report format"),
+    user: UserDTO = Depends(get_user),
+):
+    """
+    ## Get profiles of requests collected since the last profiling start.
+
+    **WARNING:** Only a superuser can use this method.
+
+    ### Parameters:
+    - **output_format** (ProfileFormat, Query): `speedscope` (JSON file for https://www.speedscope.app)
+      or `collapsed` (text for flamegraph.pl/inferno).
+
+    ### Returns:
+    - Profile report in the requested format with a separate profile for each request.
+
+    ### Errors:
+    - **403 Forbidden**: If the user is not a superuser.
+    """
+    _check_superuser(user)
+
+    return _profile_report(list(requests_profiler.profiles), output_format)
+
+
+@system_router.delete(
+    "/system/profiler/requests",
+    response_model=OkResponse,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Security(HTTPBearer())],
+)
+async def stop_requests_profiling(user: UserDTO = Depends(get_user)) -> OkResponse:
+    """
+    ## Stop waiting for requests to profile and remove collected profiles.
+
+    **WARNING:** Only a superuser can use this method.
+
+    ### Returns:
+    - **OkResponse**: A confirmation message of the success.
+
+    ### Errors:
+    - **403 Forbidden**: If the user is not a superuser.
+    """
+    _check_superuser(user)
+
+    requests_profiler.disarm()
+
+    return OkResponse()
+
+
+def _check_superuser(user: UserDTO | None) -> None:
+    if user is None or not user.is_superuser:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You must be a superuser to use profiler.",
+        )
+
+
+def _check_single_process() -> None:
+    if is_multiprocess_mode():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Profiler is not available with several worker processes,"
+            " as only the worker which received the request would be profiled",
+        )
+
+
+def _profile_report(profiles: list[SampledProfile], output_format: ProfileFormat):
+    if output_format == ProfileFormat.COLLAPSED:
+        return PlainTextResponse(to_collapsed(profiles))
+    return JSONResponse(to_speedscope(profiles))
+
+
 @system_router.post(
     "/fix/geometry",
     response_model=AllPossibleGeometry,
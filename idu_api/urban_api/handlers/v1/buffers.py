@@ -7,6 +7,7 @@ from idu_api.urban_api.logic.buffers import BufferService
 from idu_api.urban_api.schemas import (
     Buffer,
     BufferPut,
+    BuffersQueueStats,
     BufferType,
     BufferTypePost,
     DefaultBufferValue,
@@ -200,3 +201,26 @@ async def delete_buffer(
     await buffers_service.delete_buffer(buffer_type_id, urban_object_id)
 
     return OkResponse()
+
+
+@buffers_router.get(
+    "/buffers/queue",
+    response_model=BuffersQueueStats,
+    status_code=status.HTTP_200_OK,
+)
+async def get_buffers_queue_stats(request: Request) -> BuffersQueueStats:
+    """
+    ## Get statistics of pending default buffers recalculation.
+
+    **NOTE:** Default buffers are recalculated asynchronously by a background worker after urban objects,
+    physical object types or service types are changed. This method shows how much work is still pending.
+
+    ### Returns:
+    - **BuffersQueueStats**: Number of queued urban objects and the time of the oldest one (for public and
+    user projects schemas).
+    """
+    buffers_service: BufferService = request.state.buffers_service
+
+    stats = await buffers_service.get_buffers_queue_stats()
+
+    return BuffersQueueStats.from_dto(stats)
@@ -331,9 +331,10 @@ async def get_functional_zones_intersects_geometry(
     year: int = Query(..., description="to filter by year when zones were uploaded"),
     source: str = Query(..., description="to filter by source from which zones were uploaded"),
     functional_zone_type_id: int | None = Query(None, description="functional zone type identifier", gt=0),
+    buffer_meters: int = Query(0, description="buffer around the area (in meters)", ge=0),
 ) -> list[FunctionalZone]:
     """
-    ## Get functional zones intersects a specified area.
+    ## Get functional zones intersects a specified area (+ optional buffer).
 
     ### Parameters:
     - **geometry** (AllPossibleGeometry, Body): Geometry defining the search area.
@@ -341,9 +342,10 @@ async def get_functional_zones_intersects_geometry(
     - **year** (int, Query): Filters results by the year zones were uploaded.
     - **source** (str, Query): Filters results by the source from which zones were uploaded.
     - **functional_zone_type_id** (int | None, Query): Filters results by functional zone type.
+    - **buffer_meters** (int, Query): Buffer around the area in meters (default: 0).
 
     ### Returns:
-    - **list[FunctionalZone]**: A list of functional zones intersects the specified area.
+    - **list[FunctionalZone]**: A list of functional zones intersects the specified area (+ buffer).
 
     ## Errors:
     - **400 Bad Request**: If an invalid geometry is specified.
@@ -356,7 +358,7 @@ async def get_functional_zones_intersects_geometry(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
 
     zones = await functional_zones_service.get_functional_zones_around(
-        shapely_geom, year, source, functional_zone_type_id
+        shapely_geom, year, source, functional_zone_type_id, buffer_meters
     )
 
     return [FunctionalZone.from_dto(zone) for zone in zones]
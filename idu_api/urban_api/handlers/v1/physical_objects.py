@@ -584,6 +584,48 @@ async def get_physical_objects_around_geometry(
     return [PhysicalObjectWithGeometry.from_dto(obj) for obj in physical_objects_with_geometry_dto]
 
 
+@physical_objects_router.post(
+    "/physical_objects/nearest",
+    response_model=list[PhysicalObjectWithGeometry],
+    status_code=status.HTTP_200_OK,
+)
+async def get_nearest_physical_objects(
+    request: Request,
+    geometry: AllPossibleGeometry,
+    physical_object_type_id: int | None = Query(None, description="physical object type identifier", gt=0),
+    limit: int = Query(10, description="maximum number of objects to return", ge=1, le=1000),
+    max_distance: int | None = Query(None, description="maximum distance to objects (in meters)", gt=0),
+) -> list[PhysicalObjectWithGeometry]:
+    """
+    ## Get the nearest physical objects to a specified geometry (i.e. point).
+
+    ### Parameters:
+    - **geometry** (AllPossibleGeometry, Body): Geometry to search the nearest objects to.
+      NOTE: The geometry must have **SRID=4326**.
+    - **physical_object_type_id** (int | None, Query): Filters results by physical object type.
+    - **limit** (int, Query): Maximum number of objects to return (default: 10).
+    - **max_distance** (int | None, Query): Maximum distance to objects in meters (no limit by default).
+
+    ### Returns:
+    - **list[PhysicalObjectWithGeometry]**: A list of the nearest physical objects sorted by distance
+      (an object is returned once for each of its geometries).
+
+    ## Errors:
+    - **400 Bad Request**: If an invalid geometry is specified.
+    """
+    physical_objects_service: PhysicalObjectsService = request.state.physical_objects_service
+
+    try:
+        shapely_geom = geometry.as_shapely_geometry()
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    physical_objects_with_geometry_dto = await physical_objects_service.get_nearest_physical_objects(
+        shapely_geom, physical_object_type_id, limit, max_distance
+    )
+    return [PhysicalObjectWithGeometry.from_dto(obj) for obj in physical_objects_with_geometry_dto]
+
+
 @physical_objects_router.post(
     "/physical_objects/{object_geometry_id}",
     response_model=UrbanObject,
@@ -19,6 +19,7 @@ from idu_api.urban_api.schemas import (
 )
 from idu_api.urban_api.schemas.geometries import GeoJSONResponse
 from idu_api.urban_api.utils.auth_client import get_user
+from idu_api.urban_api.utils.bbox import BBox, get_bbox
 
 
 @projects_router.get(
@@ -33,6 +34,7 @@ async def get_geometries_by_scenario_id(
     service_id: int | None = Query(None, description="to filter by service", gt=0),
     centers_only: bool = Query(False, description="display only centers"),
     user: UserDTO = Depends(get_user),
+    bbox: BBox | None = Depends(get_bbox),
 ) -> GeoJSONResponse[Feature[Geometry, ScenarioGeometryAttributes]]:
     """
     ## Get geometries for a given scenario in GeoJSON format.
@@ -42,11 +44,13 @@ async def get_geometries_by_scenario_id(
     - **physical_object_id** (int | None, Query): Optional filter by physical object identifier.
     - **service_id** (int | None, Query): Optional filter by service identifier.
     - **centers_only** (bool, Query): If True, returns only center points of geometries (default: false).
+    - **bbox** (str | None, Query): Returns only objects intersecting the bounding box `min_lon,min_lat,max_lon,max_lat` (EPSG:4326).
 
     ### Returns:
     - **GeoJSONResponse[Feature[Geometry, ScenarioGeometryAttributes]]**: A GeoJSON response containing the geometries.
 
     ### Errors:
+    - **400 Bad Request**: If `bbox` is invalid.
     - **403 Forbidden**: If the user does not have access rights.
     - **404 Not Found**: If the scenario does not exist.
 
@@ -60,6 +64,7 @@ async def get_geometries_by_scenario_id(
         user,
         physical_object_id,
         service_id,
+        bbox=bbox,
     )
 
     return await GeoJSONResponse.from_list([obj.to_geojson_dict() for obj in geometries], centers_only)
@@ -79,6 +84,7 @@ async def get_geometries_with_all_objects_by_scenario_id(
     urban_function_id: int | None = Query(None, description="to filter by urban function", gt=0),
     centers_only: bool = Query(False, description="display only centers"),
     user: UserDTO = Depends(get_user),
+    bbox: BBox | None = Depends(get_bbox),
 ) -> GeoJSONResponse[Feature[Geometry, ScenarioAllObjects]]:
     """
     ## Get geometries with associated services and physical objects for a given scenario in GeoJSON format.
@@ -92,12 +98,13 @@ async def get_geometries_with_all_objects_by_scenario_id(
     - **physical_object_function_id** (int | None, Query): Optional filter by physical object function identifier.
     - **urban_function_id** (int | None, Query): Optional filter by urban function identifier.
     - **centers_only** (bool, Query): If True, returns only center points of geometries (default: false).
+    - **bbox** (str | None, Query): Returns only objects intersecting the bounding box `min_lon,min_lat,max_lon,max_lat` (EPSG:4326).
 
     ### Returns:
     - **GeoJSONResponse[Feature[Geometry, ScenarioAllObjects]]**: A GeoJSON response containing the geometries with associated objects in properties.
 
     ### Errors:
-    - **400 Bad Request**: If you set both `physical_object_type_id` and `physical_object_function_id` (or `service_type_id` and `urban_function_id`).
+    - **400 Bad Request**: If `bbox` is invalid or if you set both `physical_object_type_id` and `physical_object_function_id` (or `service_type_id` and `urban_function_id`).
     - **403 Forbidden**: If the user does not have access rights.
     - **404 Not Found**: If the scenario does not exist.
 
@@ -124,6 +131,7 @@ async def get_geometries_with_all_objects_by_scenario_id(
         service_type_id,
         physical_object_function_id,
         urban_function_id,
+        bbox=bbox,
     )
 
     return await GeoJSONResponse.from_list([obj.to_geojson_dict() for obj in geometries], centers_only)
@@ -10,6 +10,7 @@ from idu_api.urban_api.dto.users import UserDTO
 from idu_api.urban_api.handlers.v1.projects.routers import projects_router
 from idu_api.urban_api.logic.projects import UserProjectService
 from idu_api.urban_api.schemas import (
+    HexagonsIndicatorsMatrix,
     HexagonWithIndicators,
     OkResponse,
     ScenarioIndicatorValue,
@@ -327,6 +328,56 @@ async def get_hexagons_with_indicators_values_by_scenario_id(
     return await GeoJSONResponse.from_list([hexagon.to_geojson_dict() for hexagon in hexagons], centers_only)
 
 
+@projects_router.get(
+    "/scenarios/{scenario_id}/indicators_values/hexagons/matrix",
+    response_model=HexagonsIndicatorsMatrix,
+    status_code=status.HTTP_200_OK,
+)
+async def get_hexagons_indicators_matrix_by_scenario_id(
+    request: Request,
+    scenario_id: int = Path(..., description="scenario identifier", gt=0),
+    indicator_ids: str | None = Query(None, description="list of identifiers separated by comma"),
+    indicators_group_id: int | None = Query(None, description="to filter by indicator group (identifier)"),
+    user: UserDTO = Depends(get_user),
+) -> HexagonsIndicatorsMatrix:
+    """
+    ## Get indicator values for a given regional scenario as a matrix of hexagons and indicators (without geometry).
+
+    ### Parameters:
+    - **scenario_id** (int, Path): Unique identifier of the scenario.
+    - **indicator_ids** (str | None, Query): Optional list of indicator identifiers separated by commas.
+    - **indicators_group_id** (int | None, Query): Optional filter by indicator group identifier.
+
+    ### Returns:
+    - **HexagonsIndicatorsMatrix**: Hexagons identifiers (rows), indicators identifiers (columns)
+    and values matrix (null if hexagon has no value for the indicator).
+
+    ### Errors:
+    - **400 Bad Request**: If the indicator_ids is specified in the wrong form.
+    - **403 Forbidden**: If the user does not have access rights.
+    - **404 Not Found**: If the scenario does not exist.
+
+    ### Constraints:
+    - The user must be the owner of the relevant project or the project must be publicly available.
+    """
+    user_project_service: UserProjectService = request.state.user_project_service
+
+    if indicator_ids is not None:
+        try:
+            indicator_ids = {int(ind_id.strip()) for ind_id in indicator_ids.split(",")}
+        except ValueError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Please, pass the indicator identifiers in the correct format separated by comma",
+            ) from exc
+
+    matrix = await user_project_service.get_hexagons_indicators_matrix_by_scenario_id(
+        scenario_id, indicator_ids, indicators_group_id, user
+    )
+
+    return HexagonsIndicatorsMatrix.from_dto(matrix)
+
+
 @projects_router.put(
     "/scenarios/{scenario_id}/all_indicators_values/",
     response_model=OkResponse,
@@ -28,6 +28,10 @@ services_router = APIRouter(tags=["services"], prefix="/v1")
 
 urban_objects_router = APIRouter(tags=["urban_objects"], prefix="/v1")
 
+tiles_router = APIRouter(tags=["tiles"], prefix="/v1")
+
+search_router = APIRouter(tags=["search"], prefix="/v1")
+
 routers_list = [
     buffers_router,
     indicators_router,
@@ -39,6 +43,8 @@ routers_list = [
     service_types_router,
     soc_groups_router,
     urban_objects_router,
+    tiles_router,
+    search_router,
     *territories_routers,
     *projects_routers,
 ]
@@ -0,0 +1,54 @@
+"""Search handlers are defined here."""
+
+from fastapi import Depends, Query, Request
+from starlette import status
+
+from idu_api.urban_api.dto.users import UserDTO
+from idu_api.urban_api.logic.search import SearchService
+from idu_api.urban_api.schemas import SearchResult
+from idu_api.urban_api.schemas.enums import SearchEntity, SearchMode
+from idu_api.urban_api.utils.auth_client import get_user
+from idu_api.urban_api.utils.responses import TrustedJSONResponse
+
+from .routers import search_router
+
+
+@search_router.get(
+    "/search",
+    response_model=list[SearchResult],
+    status_code=status.HTTP_200_OK,
+)
+async def search_by_name(
+    request: Request,
+    query: str = Query(..., description="name or its part to search for", min_length=1, max_length=200),
+    entity_type: SearchEntity | None = Query(None, description="to search only entities of the given type"),
+    mode: SearchMode = Query(SearchMode.SUBSTRING, description="name matching mode"),
+    limit: int = Query(20, description="maximum number of results", ge=1, le=100),
+    user: UserDTO | None = Depends(get_user),
+) -> TrustedJSONResponse:
+    """
+    ## Search territories, physical objects, services and projects by name.
+
+    **NOTE:** Names are matched with trigram indexes, so queries shorter than 3 symbols are slower.
+
+    ### Parameters:
+    - **query** (str, Query): Name or its part to search for.
+    - **entity_type** (SearchEntity | None, Query): Searches only territories, physical_objects, services or projects.
+      If skipped, all of them are searched.
+    - **mode** (SearchMode, Query): Name matching mode - substring (default, case-insensitive),
+      prefix (case-insensitive) or fuzzy (trigram similarity, tolerant to typos).
+    - **limit** (int, Query): Maximum number of results (default: 20).
+
+    ### Returns:
+    - **list[SearchResult]**: Found entities ranked by similarity of the name to the query (the most similar first).
+
+    ### Constraints:
+    - Only public projects and projects of the user are searched.
+    """
+    search_service: SearchService = request.state.search_service
+
+    results = await search_service.search_by_name(
+        query, entity_type.value if entity_type is not None else None, mode.value, limit, user
+    )
+
+    return TrustedJSONResponse([SearchResult.from_dto(result) for result in results])
@@ -1,6 +1,6 @@
 """Services handlers are defined here."""
 
-from fastapi import Path, Query, Request
+from fastapi import HTTPException, Path, Query, Request
 from starlette import status
 
 from idu_api.urban_api.logic.services import ServicesDataService
@@ -10,8 +10,10 @@ from idu_api.urban_api.schemas import (
     ServicePatch,
     ServicePost,
     ServicePut,
+    ServiceWithGeometry,
     UrbanObject,
 )
+from idu_api.urban_api.schemas.geometries import AllPossibleGeometry
 
 from .routers import services_router
 
@@ -44,6 +46,47 @@ async def get_service_by_id(
     return Service.from_dto(service)
 
 
+@services_router.post(
+    "/services/nearest",
+    response_model=list[ServiceWithGeometry],
+    status_code=status.HTTP_200_OK,
+)
+async def get_nearest_services(
+    request: Request,
+    geometry: AllPossibleGeometry,
+    service_type_id: int | None = Query(None, description="service type identifier", gt=0),
+    limit: int = Query(10, description="maximum number of services to return", ge=1, le=1000),
+    max_distance: int | None = Query(None, description="maximum distance to services (in meters)", gt=0),
+) -> list[ServiceWithGeometry]:
+    """
+    ## Get the nearest services to a specified geometry (i.e. point).
+
+    ### Parameters:
+    - **geometry** (AllPossibleGeometry, Body): Geometry to search the nearest services to.
+      NOTE: The geometry must have **SRID=4326**.
+    - **service_type_id** (int | None, Query): Filters results by service type.
+    - **limit** (int, Query): Maximum number of services to return (default: 10).
+    - **max_distance** (int | None, Query): Maximum distance to services in meters (no limit by default).
+
+    ### Returns:
+    - **list[ServiceWithGeometry]**: A list of the nearest services sorted by distance
+      (a service is returned once for each of its geometries).
+
+    ### Errors:
+    - **400 Bad Request**: If an invalid geometry is specified.
+    """
+    services_data_service: ServicesDataService = request.state.services_data_service
+
+    try:
+        shapely_geom = geometry.as_shapely_geometry()
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    services = await services_data_service.get_nearest_services(shapely_geom, service_type_id, limit, max_distance)
+
+    return [ServiceWithGeometry.from_dto(service) for service in services]
+
+
 @services_router.post(
     "/services",
     response_model=Service,
@@ -6,7 +6,7 @@ from geojson_pydantic.geometries import Geometry
 from starlette import status
 
 from idu_api.urban_api.logic.territories import TerritoriesService
-from idu_api.urban_api.schemas import BufferAttributes
+from idu_api.urban_api.schemas import BufferAttributes, ServiceCoverage
 from idu_api.urban_api.schemas.geometries import GeoJSONResponse
 
 from .routers import territories_router
@@ -77,3 +77,45 @@ async def get_buffers_geojson_by_territory_id(
     )
 
     return await GeoJSONResponse.from_list((buffer.to_geojson_dict() for buffer in buffers))
+
+
+@territories_router.get(
+    "/territory/{territory_id}/service_coverage",
+    response_model=ServiceCoverage,
+    status_code=status.HTTP_200_OK,
+)
+async def get_service_coverage_by_territory_id(
+    request: Request,
+    territory_id: int = Path(..., description="territory identifier", gt=0),
+    service_type_id: int = Query(..., description="service type identifier", gt=0),
+    buffer_type_id: int = Query(..., description="buffer type identifier", gt=0),
+    include_hexagons: bool = Query(False, description="to get coverage of every territory hexagon"),
+) -> ServiceCoverage:
+    """
+    ## Get coverage (union of buffers) of services of the given type for a territory.
+
+    **NOTE:** Buffers of services located in the territory and all its child territories are merged into a single
+    geometry clipped by the territory. The result is persisted and recalculated in background after buffers, services,
+    urban objects, object geometries or territories intersecting the territory were changed (until then it is
+    calculated on request).
+
+    ### Parameters:
+    - **territory_id** (int, Path): Unique identifier of the territory.
+    - **service_type_id** (int, Query): Unique identifier of the service type.
+    - **buffer_type_id** (int, Query): Unique identifier of the buffer type.
+    - **include_hexagons** (bool, Query): If True, also returns covered area of every hexagon of the territory
+    (default: false).
+
+    ### Returns:
+    - **ServiceCoverage**: Coverage geometry, covered and territory areas (in square meters) and coverage ratio.
+
+    ### Errors:
+    - **404 Not Found**: If the territory, service type or buffer type does not exist.
+    """
+    territories_service: TerritoriesService = request.state.territories_service
+
+    coverage = await territories_service.get_service_coverage_by_territory_id(
+        territory_id, service_type_id, buffer_type_id, include_hexagons
+    )
+
+    return ServiceCoverage.from_dto(coverage)
@@ -1,6 +1,6 @@
 """Functional zones territories-related handlers are defined here."""
 
-from fastapi import HTTPException, Path, Query, Request
+from fastapi import Depends, HTTPException, Path, Query, Request
 from geojson_pydantic import Feature
 from geojson_pydantic.geometries import Geometry
 from starlette import status
@@ -8,6 +8,7 @@ from starlette import status
 from idu_api.urban_api.logic.territories import TerritoriesService
 from idu_api.urban_api.schemas import FunctionalZone, FunctionalZoneSource, FunctionalZoneWithoutGeometry, OkResponse
 from idu_api.urban_api.schemas.geometries import GeoJSONResponse
+from idu_api.urban_api.utils.bbox import BBox, get_bbox
 
 from .routers import territories_router
 
@@ -70,6 +71,10 @@ async def get_functional_zones_by_territory_id(
         True, description="to get from child territories (unsafe for high level territories)"
     ),
     cities_only: bool = Query(False, description="to get only for cities"),
+    simplify_tolerance: float | None = Query(None, description="geometry simplification tolerance in degrees", gt=0),
+    precision: int | None = Query(None, description="number of decimal digits in coordinates", ge=0, le=15),
+    bbox: BBox | None = Depends(get_bbox),
+    limit: int | None = Query(None, description="maximum number of objects to return", gt=0),
 ) -> list[FunctionalZone]:
     """
     ## Get functional zones for a given territory.
@@ -84,12 +89,16 @@ async def get_functional_zones_by_territory_id(
     - **include_child_territories** (bool, Query): If True, includes data from child territories (default: True).
       Note: This can be unsafe for high-level territories due to potential performance issues.
     - **cities_only** (bool, Query): If True, retrieves data only for cities (default: false).
+    - **simplify_tolerance** (float | None, Query): Simplifies geometries preserving topology with the given tolerance in degrees.
+    - **precision** (int | None, Query): Rounds coordinates to the given number of decimal digits.
+    - **bbox** (str | None, Query): Returns only objects intersecting the bounding box `min_lon,min_lat,max_lon,max_lat` (EPSG:4326).
+    - **limit** (int | None, Query): Returns no more than the given number of objects.
 
     ### Returns:
     - **list[FunctionalZone]**: A list of functional zones matching the filters.
 
     ### Errors:
-    - **400 Bad Request**: If `cities_only` is set to True and `include_child_territories` is set to False.
+    - **400 Bad Request**: If `bbox` is invalid or if `cities_only` is set to True and `include_child_territories` is set to False.
     - **404 Not Found**: If the territory does not exist.
     """
     territories_service: TerritoriesService = request.state.territories_service
@@ -101,7 +110,16 @@ async def get_functional_zones_by_territory_id(
         )
 
     zones = await territories_service.get_functional_zones_by_territory_id(
-        territory_id, year, source, functional_zone_type_id, include_child_territories, cities_only
+        territory_id,
+        year,
+        source,
+        functional_zone_type_id,
+        include_child_territories,
+        cities_only,
+        simplify_tolerance,
+        precision,
+        bbox=bbox,
+        limit=limit,
     )
 
     return [FunctionalZone.from_dto(zone) for zone in zones]
@@ -122,6 +140,10 @@ async def get_functional_zones_geojson_by_territory_id(
         True, description="to get from child territories (unsafe for high level territories)"
     ),
     cities_only: bool = Query(False, description="to get only for cities"),
+    simplify_tolerance: float | None = Query(None, description="geometry simplification tolerance in degrees", gt=0),
+    precision: int | None = Query(None, description="number of decimal digits in coordinates", ge=0, le=15),
+    bbox: BBox | None = Depends(get_bbox),
+    limit: int | None = Query(None, description="maximum number of objects to return", gt=0),
 ) -> GeoJSONResponse[Feature[Geometry, FunctionalZoneWithoutGeometry]]:
     """
     ## Get functional zones in GeoJSON format for a given territory.
@@ -136,12 +158,16 @@ async def get_functional_zones_geojson_by_territory_id(
     - **include_child_territories** (bool, Query): If True, includes data from child territories (default: True).
       Note: This can be unsafe for high-level territories due to potential performance issues.
     - **cities_only** (bool, Query): If True, retrieves data only for cities (default: false).
+    - **simplify_tolerance** (float | None, Query): Simplifies geometries preserving topology with the given tolerance in degrees.
+    - **precision** (int | None, Query): Rounds coordinates to the given number of decimal digits.
+    - **bbox** (str | None, Query): Returns only objects intersecting the bounding box `min_lon,min_lat,max_lon,max_lat` (EPSG:4326).
+    - **limit** (int | None, Query): Returns no more than the given number of objects.
 
     ### Returns:
     - **GeoJSONResponse[Feature[Geometry, FunctionalZoneWithoutGeometry]]**: A GeoJSON response containing functional zones.
 
     ### Errors:
-    - **400 Bad Request**: If `cities_only` is set to True and `include_child_territories` is set to False.
+    - **400 Bad Request**: If `bbox` is invalid or if `cities_only` is set to True and `include_child_territories` is set to False.
     - **404 Not Found**: If the territory does not exist.
     """
     territories_service: TerritoriesService = request.state.territories_service
@@ -153,7 +179,16 @@ async def get_functional_zones_geojson_by_territory_id(
         )
 
     zones = await territories_service.get_functional_zones_by_territory_id(
-        territory_id, year, source, functional_zone_type_id, include_child_territories, cities_only
+        territory_id,
+        year,
+        source,
+        functional_zone_type_id,
+        include_child_territories,
+        cities_only,
+        simplify_tolerance,
+        precision,
+        bbox=bbox,
+        limit=limit,
     )
 
     return await GeoJSONResponse.from_list([zone.to_geojson_dict() for zone in zones])
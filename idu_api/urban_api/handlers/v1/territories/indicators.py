@@ -8,8 +8,8 @@ from geojson_pydantic.geometries import Geometry
 from starlette import status
 
 from idu_api.urban_api.logic.territories import TerritoriesService
-from idu_api.urban_api.schemas import Indicator, IndicatorValue, TerritoryWithIndicators
-from idu_api.urban_api.schemas.enums import ValueType
+from idu_api.urban_api.schemas import AggregatedIndicatorValue, Indicator, IndicatorValue, TerritoryWithIndicators
+from idu_api.urban_api.schemas.enums import AggregationType, ValueType
 from idu_api.urban_api.schemas.geometries import GeoJSONResponse
 
 from .routers import territories_router
@@ -121,6 +121,85 @@ async def get_indicator_values_by_territory_id(
     return [IndicatorValue.from_dto(value) for value in indicator_values]
 
 
+@territories_router.get(
+    "/territory/{territory_id}/indicator_values/aggregated",
+    response_model=list[AggregatedIndicatorValue],
+    status_code=status.HTTP_200_OK,
+)
+async def get_aggregated_indicator_values_by_territory_id(
+    request: Request,
+    territory_id: int = Path(..., description="territory identifier", gt=0),
+    indicator_ids: str = Query(..., description="list of identifiers separated by comma"),
+    level: int | None = Query(None, description="to aggregate for sub-territories at the given level", gt=0),
+    value_type: ValueType = Query(ValueType.REAL, description="value type"),
+    aggregation_type: AggregationType = Query(AggregationType.SUM, description="aggregation type"),
+    weight_indicator_id: int | None = Query(
+        None, description="indicator identifier which values are used as weights (for weighted average)", gt=0
+    ),
+    date_value: date | None = Query(None, description="to aggregate last values not later than the given date"),
+    persistent: bool = Query(False, description="to use (and save) persisted aggregates of the last values"),
+) -> list[AggregatedIndicatorValue]:
+    """
+    ## Get indicator values aggregated up the territories hierarchy.
+
+    Own value of the territory is used if it is present, otherwise last values of the closest descendants
+    which have values are aggregated (sum, average or average weighted by values of another indicator).
+
+    ### Parameters:
+    - **territory_id** (int, Path): Unique identifier of the territory.
+    - **indicator_ids** (str, Query): Comma-separated list of indicator IDs to aggregate.
+    - **level** (int | None, Query): If specified, values are aggregated for each sub-territory at the given level
+      instead of the territory itself.
+    - **value_type** (ValueType, Query): Value type of aggregated values (default: real).
+    - **aggregation_type** (AggregationType, Query): Aggregation type (default: sum).
+    - **weight_indicator_id** (int | None, Query): Indicator which values are used as weights.
+      Required for `weighted_avg` aggregation type.
+    - **date_value** (date | None, Query): If specified, last values not later than the given date are aggregated.
+    - **persistent** (bool, Query): If True, persisted aggregates of the last values are used and missing ones
+      are saved (default: false). Persisted aggregates are removed when values of the territory
+      or its descendants are changed. Ignored if `date_value` is specified.
+
+    ### Returns:
+    - **list[AggregatedIndicatorValue]**: A list of aggregated values for each territory and indicator.
+
+    ### Errors:
+    - **400 Bad Request**: If the indicator_ids is specified in the wrong form
+    or `weight_indicator_id` is not set for `weighted_avg` aggregation type.
+    - **404 Not Found**: If the territory does not exist.
+    """
+    territories_service: TerritoriesService = request.state.territories_service
+
+    try:
+        indicator_ids = {int(ind_id.strip()) for ind_id in indicator_ids.split(",")}
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Please, pass the indicator identifiers in the correct format separated by comma",
+        ) from exc
+
+    if aggregation_type == AggregationType.WEIGHTED_AVG:
+        if weight_indicator_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="You should pass weight_indicator_id to use weighted_avg aggregation type",
+            )
+    else:
+        weight_indicator_id = None
+
+    values = await territories_service.get_aggregated_indicator_values_by_territory_id(
+        territory_id,
+        indicator_ids,
+        level,
+        value_type.value,
+        aggregation_type.value,
+        weight_indicator_id,
+        date_value,
+        persistent,
+    )
+
+    return [AggregatedIndicatorValue.from_dto(value) for value in values]
+
+
 @territories_router.get(
     "/territory/indicator_values",
     response_model=GeoJSONResponse[Feature[Geometry, TerritoryWithIndicators]],
@@ -1,6 +1,6 @@
 """Physical objects territories-related handlers are defined here."""
 
-from fastapi import HTTPException, Path, Query, Request
+from fastapi import Depends, HTTPException, Path, Query, Request
 from geojson_pydantic import Feature
 from geojson_pydantic.geometries import Geometry
 from starlette import status
@@ -10,7 +10,9 @@ from idu_api.urban_api.schemas import PhysicalObject, PhysicalObjectType, Physic
 from idu_api.urban_api.schemas.enums import OrderByField, Ordering
 from idu_api.urban_api.schemas.geometries import GeoJSONResponse
 from idu_api.urban_api.schemas.pages import Page
+from idu_api.urban_api.utils.bbox import BBox, get_bbox
 from idu_api.urban_api.utils.pagination import paginate
+from idu_api.urban_api.utils.responses import TrustedJSONResponse
 
 from .routers import territories_router
 
@@ -79,7 +81,7 @@ async def get_physical_objects_by_territory_id(
     ordering: Ordering = Query(
         Ordering.ASC, description="order type (ascending or descending) if ordering field is set"
     ),
-) -> Page[PhysicalObject]:
+) -> TrustedJSONResponse:
     """
     ## Get physical objects for a given territory.
 
@@ -136,10 +138,12 @@ async def get_physical_objects_by_territory_id(
         paginate=True,
     )
 
-    return paginate(
-        physical_objects.items,
-        physical_objects.total,
-        transformer=lambda x: [PhysicalObject.from_dto(item) for item in x],
+    return TrustedJSONResponse(
+        paginate(
+            physical_objects.items,
+            physical_objects.total,
+            transformer=lambda x: [PhysicalObject.from_dto(item) for item in x],
+        )
     )
 
 
@@ -164,7 +168,8 @@ async def get_physical_objects_with_geometry_by_territory_id(
     ordering: Ordering = Query(
         Ordering.ASC, description="order type (ascending or descending) if ordering field is set"
     ),
-) -> Page[PhysicalObjectWithGeometry]:
+    bbox: BBox | None = Depends(get_bbox),
+) -> TrustedJSONResponse:
     """
     ## Get physical objects with geometry for a given territory.
 
@@ -184,12 +189,13 @@ async def get_physical_objects_with_geometry_by_territory_id(
     - **ordering** (Ordering, Query): Specifies sorting order - ascending (default) or descending.
     - **page** (int, Query): Specifies the page number for retrieving physical objects (default: 1).
     - **page_size** (int, Query): Defines the number of physical objects per page (default: 10).
+    - **bbox** (str | None, Query): Returns only objects intersecting the bounding box `min_lon,min_lat,max_lon,max_lat` (EPSG:4326).
 
     ### Returns:
     - **Page[PhysicalObjectWithGeometry]**: A paginated list of physical objects.
 
     ### Errors:
-    - **400 Bad Request**: If `cities_only` is set to True and `include_child_territories` is set to False or
+    - **400 Bad Request**: If `bbox` is invalid or if `cities_only` is set to True and `include_child_territories` is set to False or
     set both `physical_object_type_id` and `physical_object_function_id`.
     - **404 Not Found**: If the territory does not exist.
     """
@@ -219,12 +225,15 @@ async def get_physical_objects_with_geometry_by_territory_id(
         order_by_value,
         ordering.value,
         paginate=True,
+        bbox=bbox,
     )
 
-    return paginate(
-        physical_objects.items,
-        physical_objects.total,
-        transformer=lambda x: [PhysicalObjectWithGeometry.from_dto(item) for item in x],
+    return TrustedJSONResponse(
+        paginate(
+            physical_objects.items,
+            physical_objects.total,
+            transformer=lambda x: [PhysicalObjectWithGeometry.from_dto(item) for item in x],
+        )
     )
 
 
@@ -244,6 +253,9 @@ async def get_physical_objects_geojson_by_territory_id(
     ),
     cities_only: bool = Query(False, description="to get only for cities"),
     centers_only: bool = Query(False, description="to get only center points of geometries"),
+    with_geometry: bool = Query(True, description="set to false to get features without geometry"),
+    bbox: BBox | None = Depends(get_bbox),
+    limit: int | None = Query(None, description="maximum number of objects to return", gt=0),
 ) -> GeoJSONResponse[Feature[Geometry, PhysicalObject]]:
     """
     ## Get physical objects in GeoJSON format for a given territory.
@@ -261,12 +273,15 @@ async def get_physical_objects_geojson_by_territory_id(
       Note: This can be unsafe for high-level territories due to potential performance issues.
     - **cities_only** (bool, Query): If True, retrieves data only for cities (default: false).
     - **centers_only** (bool, Query): If True, returns only center points of geometries (default: false).
+    - **with_geometry** (bool, Query): If False, returns features only with properties and null geometry (default: true).
+    - **bbox** (str | None, Query): Returns only objects intersecting the bounding box `min_lon,min_lat,max_lon,max_lat` (EPSG:4326).
+    - **limit** (int | None, Query): Returns no more than the given number of objects.
 
     ### Returns:
     - **GeoJSONResponse[Feature[Geometry, PhysicalObject]]**: A GeoJSON response containing physical objects and their geometries.
 
     ### Errors:
-    - **400 Bad Request**: If `cities_only` is set to True and `include_child_territories` is set to False or
+    - **400 Bad Request**: If `bbox` is invalid or if `cities_only` is set to True and `include_child_territories` is set to False or
     set both `physical_object_type_id` and `physical_object_function_id`.
     - **404 Not Found**: If the territory does not exist.
     """
@@ -294,6 +309,10 @@ async def get_physical_objects_geojson_by_territory_id(
         None,
         "asc",
         paginate=False,
+        centers_only=centers_only,
+        with_geometry=with_geometry,
+        bbox=bbox,
+        limit=limit,
     )
 
     return await GeoJSONResponse.from_list((obj.to_geojson_dict() for obj in physical_objects), centers_only)
@@ -1,16 +1,24 @@
 """Services territories-related handlers are defined here."""
 
-from fastapi import HTTPException, Path, Query, Request
+from fastapi import Depends, HTTPException, Path, Query, Request
 from geojson_pydantic import Feature
 from geojson_pydantic.geometries import Geometry
 from starlette import status
 
 from idu_api.urban_api.logic.territories import TerritoriesService
-from idu_api.urban_api.schemas import Service, ServicesCountCapacity, ServiceType, ServiceWithGeometry
+from idu_api.urban_api.schemas import (
+    Service,
+    ServiceProvision,
+    ServicesCountCapacity,
+    ServiceType,
+    ServiceWithGeometry,
+)
 from idu_api.urban_api.schemas.enums import OrderByField, Ordering
 from idu_api.urban_api.schemas.geometries import GeoJSONResponse
 from idu_api.urban_api.schemas.pages import Page
+from idu_api.urban_api.utils.bbox import BBox, get_bbox
 from idu_api.urban_api.utils.pagination import paginate
+from idu_api.urban_api.utils.responses import TrustedJSONResponse
 
 from .routers import territories_router
 
@@ -79,7 +87,7 @@ async def get_services_by_territory_id(
     ordering: Ordering = Query(
         Ordering.ASC, description="order type (ascending or descending) if ordering field is set"
     ),
-) -> Page[Service]:
+) -> TrustedJSONResponse:
     """
     ## Get services for a given territory.
 
@@ -136,10 +144,12 @@ async def get_services_by_territory_id(
         paginate=True,
     )
 
-    return paginate(
-        services.items,
-        services.total,
-        transformer=lambda x: [Service.from_dto(item) for item in x],
+    return TrustedJSONResponse(
+        paginate(
+            services.items,
+            services.total,
+            transformer=lambda x: [Service.from_dto(item) for item in x],
+        )
     )
 
 
@@ -164,7 +174,8 @@ async def get_services_with_geometry_by_territory_id(
     ordering: Ordering = Query(
         Ordering.ASC, description="Order type (ascending or descending) if ordering field is set"
     ),
-) -> Page[ServiceWithGeometry]:
+    bbox: BBox | None = Depends(get_bbox),
+) -> TrustedJSONResponse:
     """
     ## Get services with geometry for a given territory.
 
@@ -184,12 +195,13 @@ async def get_services_with_geometry_by_territory_id(
     - **ordering** (Ordering, Query): Specifies sorting order - ascending (default) or descending.
     - **page** (int, Query): Specifies the page number for retrieving services (default: 1).
     - **page_size** (int, Query): Defines the number of services per page (default: 10).
+    - **bbox** (str | None, Query): Returns only objects intersecting the bounding box `min_lon,min_lat,max_lon,max_lat` (EPSG:4326).
 
     ### Returns:
     - **Page[ServiceWithGeometry]**: A paginated list of services with geometry.
 
     ### Errors:
-    - **400 Bad Request**: If `cities_only` is set to True and `include_child_territories` is set to False or
+    - **400 Bad Request**: If `bbox` is invalid or if `cities_only` is set to True and `include_child_territories` is set to False or
     set both `service_type_id` and `urban_function_id`.
     - **404 Not Found**: If the territory does not exist.
     """
@@ -219,12 +231,15 @@ async def get_services_with_geometry_by_territory_id(
         order_by_value,
         ordering.value,
         paginate=True,
+        bbox=bbox,
     )
 
-    return paginate(
-        services.items,
-        services.total,
-        transformer=lambda x: [ServiceWithGeometry.from_dto(item) for item in x],
+    return TrustedJSONResponse(
+        paginate(
+            services.items,
+            services.total,
+            transformer=lambda x: [ServiceWithGeometry.from_dto(item) for item in x],
+        )
     )
 
 
@@ -244,6 +259,9 @@ async def get_services_geojson_by_territory_id(
     ),
     cities_only: bool = Query(False, description="to get only for cities"),
     centers_only: bool = Query(False, description="to get only center points of geometries"),
+    with_geometry: bool = Query(True, description="set to false to get features without geometry"),
+    bbox: BBox | None = Depends(get_bbox),
+    limit: int | None = Query(None, description="maximum number of objects to return", gt=0),
 ) -> GeoJSONResponse[Feature[Geometry, Service]]:
     """
     ## Get services in GeoJSON format for a given territory.
@@ -261,12 +279,15 @@ async def get_services_geojson_by_territory_id(
       Note: This can be unsafe for high-level territories due to potential performance issues.
     - **cities_only** (bool, Query): If True, retrieves data only for cities (default: false).
     - **centers_only** (bool, Query): If True, returns only center points of geometries (default: false).
+    - **with_geometry** (bool, Query): If False, returns features only with properties and null geometry (default: true).
+    - **bbox** (str | None, Query): Returns only objects intersecting the bounding box `min_lon,min_lat,max_lon,max_lat` (EPSG:4326).
+    - **limit** (int | None, Query): Returns no more than the given number of objects.
 
     ### Returns:
     - **GeoJSONResponse[Feature[Geometry, Service]]**: A GeoJSON response containing services and their geometries.
 
     ### Errors:
-    - **400 Bad Request**: If `cities_only` is set to True and `include_child_territories` is set to False or
+    - **400 Bad Request**: If `bbox` is invalid or if `cities_only` is set to True and `include_child_territories` is set to False or
     set both `service_type_id` and `urban_function_id`.
     - **404 Not Found**: If the territory does not exist.
     """
@@ -294,6 +315,10 @@ async def get_services_geojson_by_territory_id(
         None,
         "asc",
         paginate=False,
+        centers_only=centers_only,
+        with_geometry=with_geometry,
+        bbox=bbox,
+        limit=limit,
     )
 
     return await GeoJSONResponse.from_list([service.to_geojson_dict() for service in services], centers_only)
@@ -329,3 +354,45 @@ async def get_total_services_capacity_by_territory_id(
     services = await territories_service.get_services_capacity_by_territory_id(territory_id, level, service_type_id)
 
     return [ServicesCountCapacity.from_dto(s) for s in services]
+
+
+@territories_router.get(
+    "/territory/{territory_id}/services_provision",
+    response_model=list[ServiceProvision],
+    status_code=status.HTTP_200_OK,
+)
+async def get_services_provision_by_territory_id(
+    request: Request,
+    territory_id: int = Path(..., description="territory identifier", gt=0),
+    level: int = Query(..., description="territory level", gt=0),
+    year: int | None = Query(None, description="year of normatives and population (current year by default)", gt=0),
+    service_type_id: int | None = Query(None, description="service type identifier", gt=0),
+) -> list[ServiceProvision]:
+    """
+    ## Get services provision for territories at the given level.
+
+    Required number and capacity of services are calculated from the territory population and
+    `services_per_1000_normative` / `services_capacity_per_1000_normative` normatives. Normative of the territory itself
+    or of its closest ancestor (with the latest year not later than the given one) is used.
+    Actual number and capacity include services of all descendant territories.
+
+    ### Parameters:
+    - **territory_id** (int, Path): Unique identifier of the territory.
+    - **level** (int, Query): Level of the territory hierarchy to retrieve data for.
+    - **year** (int | None, Query): Year of normatives and population. Current year by default.
+    - **service_type_id** (int | None, Query): Filters results by service type. If not provided, returns data for all service types with normatives.
+
+    ### Returns:
+    - **list[ServiceProvision]**: A list of required and actual services count and capacity
+      for each pair of territory and service type.
+
+    ### Errors:
+    - **404 Not Found**: If the territory does not exist.
+    """
+    territories_service: TerritoriesService = request.state.territories_service
+
+    provision = await territories_service.get_services_provision_by_territory_id(
+        territory_id, level, year, service_type_id
+    )
+
+    return [ServiceProvision.from_dto(p) for p in provision]
@@ -8,6 +8,7 @@ from starlette import status
 
 from idu_api.urban_api.logic.territories import TerritoriesService
 from idu_api.urban_api.schemas import (
+    PointsBatch,
     Territory,
     TerritoryPatch,
     TerritoryPost,
@@ -18,7 +19,9 @@ from idu_api.urban_api.schemas import (
 from idu_api.urban_api.schemas.enums import OrderByField, Ordering
 from idu_api.urban_api.schemas.geometries import AllPossibleGeometry, Feature, GeoJSONResponse
 from idu_api.urban_api.schemas.pages import Page
+from idu_api.urban_api.schemas.short_models import ShortTerritory
 from idu_api.urban_api.utils.pagination import paginate
+from idu_api.urban_api.utils.responses import TrustedJSONResponse
 
 from .routers import territories_router
 
@@ -166,7 +169,11 @@ async def get_territories_by_parent_id(
     ordering: Ordering = Query(
         Ordering.ASC, description="order type (ascending or descending) if ordering field is set"
     ),
-) -> Page[Territory]:
+    simplify_tolerance: float | None = Query(
+        None, description="geometry simplification tolerance in degrees (0.0001, 0.001 and 0.01 are precomputed)", gt=0
+    ),
+    precision: int | None = Query(None, description="number of decimal digits in coordinates", ge=0, le=15),
+) -> TrustedJSONResponse:
     """
     ## Get a paginated list of territories by parent identifier.
 
@@ -182,6 +189,9 @@ async def get_territories_by_parent_id(
     - **created_at** (date | None, Query): Returns territories created at the specified date.
     - **order_by** (OrderByField, Query): Defines the sorting attribute - territory_id (default), created_at or updated_at.
     - **ordering** (Ordering, Query): Specifies sorting order - ascending (default) or descending.
+    - **simplify_tolerance** (float | None, Query): Simplifies geometries preserving topology with the given tolerance
+      in degrees. Geometries for 0.0001, 0.001 and 0.01 are precomputed, so these values are the fastest.
+    - **precision** (int | None, Query): Rounds coordinates to the given number of decimal digits.
     - **page** (int, Query): Specifies the page number for retrieving territories (default: 1).
     - **page_size** (int, Query): Defines the number of territories per page (default: 10).
 
@@ -212,12 +222,16 @@ async def get_territories_by_parent_id(
         order_by_value,
         ordering.value,
         paginate=True,
+        simplify_tolerance=simplify_tolerance,
+        precision=precision,
     )
 
-    return paginate(
-        territories.items,
-        territories.total,
-        transformer=lambda x: [Territory.from_dto(item) for item in x],
+    return TrustedJSONResponse(
+        paginate(
+            territories.items,
+            territories.total,
+            transformer=lambda x: [Territory.from_dto(item) for item in x],
+        )
     )
 
 
@@ -239,6 +253,11 @@ async def get_all_territories_by_parent_id(
     cities_only: bool = Query(False, description="to get only for cities"),
     created_at: date | None = Query(None, description="to filter by created date"),
     centers_only: bool = Query(False, description="display only centers"),
+    with_geometry: bool = Query(True, description="set to false to get features without geometry"),
+    simplify_tolerance: float | None = Query(
+        None, description="geometry simplification tolerance in degrees (0.0001, 0.001 and 0.01 are precomputed)", gt=0
+    ),
+    precision: int | None = Query(None, description="number of decimal digits in coordinates", ge=0, le=15),
 ) -> GeoJSONResponse[Feature[FeatureGeometry, TerritoryWithoutGeometry]]:
     """
     ## Get all territories as a GeoJSON collection by parent identifier.
@@ -254,6 +273,10 @@ async def get_all_territories_by_parent_id(
     - **cities_only** (bool, Query): If True, retrieves data only for cities (default: false).
     - **created_at** (date | None, Query): Returns territories created at the specified date.
     - **centers_only** (bool, Query): If True, retrieves only center points of territories (default: false).
+    - **with_geometry** (bool, Query): If False, returns features only with properties and null geometry (default: true).
+    - **simplify_tolerance** (float | None, Query): Simplifies geometries preserving topology with the given tolerance
+      in degrees. Geometries for 0.0001, 0.001 and 0.01 are precomputed, so these values are the fastest.
+    - **precision** (int | None, Query): Rounds coordinates to the given number of decimal digits.
 
     ### Returns:
     - **GeoJSONResponse[Feature[FeatureGeometry, TerritoryWithoutGeometry]]**: A GeoJSON response containing territories.
@@ -280,6 +303,10 @@ async def get_all_territories_by_parent_id(
         None,
         "asc",
         paginate=False,
+        centers_only=centers_only,
+        with_geometry=with_geometry,
+        simplify_tolerance=simplify_tolerance,
+        precision=precision,
     )
 
     return await GeoJSONResponse.from_list([territory.to_geojson_dict() for territory in territories], centers_only)
@@ -308,7 +335,7 @@ async def get_territories_without_geometry_by_parent_id(
     ordering: Ordering = Query(
         Ordering.ASC, description="order type (ascending or descending) if ordering field is set"
     ),
-) -> Page[TerritoryWithoutGeometry]:
+) -> TrustedJSONResponse:
     """
     ## Get a paginated list of territories without geometry by parent identifier.
 
@@ -356,10 +383,12 @@ async def get_territories_without_geometry_by_parent_id(
         paginate=True,
     )
 
-    return paginate(
-        territories.items,
-        territories.total,
-        transformer=lambda x: [TerritoryWithoutGeometry.from_dto(item) for item in x],
+    return TrustedJSONResponse(
+        paginate(
+            territories.items,
+            territories.total,
+            transformer=lambda x: [TerritoryWithoutGeometry.from_dto(item) for item in x],
+        )
     )
 
 
@@ -386,7 +415,7 @@ async def get_all_territories_without_geometry_by_parent_id(
     ordering: Ordering = Query(
         Ordering.ASC, description="order type (ascending or descending) if ordering field is set"
     ),
-) -> list[TerritoryWithoutGeometry]:
+) -> TrustedJSONResponse:
     """
     ## Get a list of all territories without geometry by parent identifier.
 
@@ -432,7 +461,7 @@ async def get_all_territories_without_geometry_by_parent_id(
         paginate=False,
     )
 
-    return [TerritoryWithoutGeometry.from_dto(territory) for territory in territories]
+    return TrustedJSONResponse([TerritoryWithoutGeometry.from_dto(territory) for territory in territories])
 
 
 @territories_router.get(
@@ -553,6 +582,35 @@ async def intersecting_territories(
     return [Territory.from_dto(territory) for territory in territories]
 
 
+@territories_router.post(
+    "/reverse_geocoding",
+    response_model=list[list[ShortTerritory]],
+    status_code=status.HTTP_200_OK,
+)
+async def get_territories_for_points(request: Request, points: PointsBatch) -> TrustedJSONResponse:
+    """
+    ## Get chains of territories covering each of the given points.
+
+    **NOTE:** Points are resolved by in-memory spatial index of territories, so thousands of points can be
+    processed in one request.
+
+    ### Parameters:
+    - **points** (PointsBatch, Body): List of (longitude, latitude) pairs (up to 25000).
+      NOTE: The coordinates must be in **SRID=4326**.
+
+    ### Returns:
+    - **list[list[ShortTerritory]]**: Territories covering each point (in the order of the given points),
+      from the top-level one to the deepest one. Empty list if the point is outside all territories.
+    """
+    territories_service: TerritoriesService = request.state.territories_service
+
+    chains = await territories_service.get_territories_for_points(points.points)
+
+    return TrustedJSONResponse(
+        [[ShortTerritory(id=t.territory_id, name=t.name) for t in territories] for territories in chains]
+    )
+
+
 @territories_router.get(
     "/territories/{territories_ids}",
     response_model=GeoJSONResponse[Feature[FeatureGeometry, TerritoryWithoutGeometry]],
@@ -562,12 +620,20 @@ async def get_territories_by_ids(
     request: Request,
     territories_ids: str = Path(..., description="list of identifiers separated by comma"),
     centers_only: bool = Query(False, description="display only centers"),
+    simplify_tolerance: float | None = Query(
+        None, description="geometry simplification tolerance in degrees (0.0001, 0.001 and 0.01 are precomputed)", gt=0
+    ),
+    precision: int | None = Query(None, description="number of decimal digits in coordinates", ge=0, le=15),
 ) -> GeoJSONResponse[Feature[FeatureGeometry, TerritoryWithoutGeometry]]:
     """
     ## Get list of territories by given identifiers in GeoJSON format.
 
     ### Parameters:
     - **territories_ids** (int, Path): List of unique identifiers separated by comma.
+    - **centers_only** (bool, Query): If True, retrieves only center points of territories (default: false).
+    - **simplify_tolerance** (float | None, Query): Simplifies geometries preserving topology with the given tolerance
+      in degrees. Geometries for 0.0001, 0.001 and 0.01 are precomputed, so these values are the fastest.
+    - **precision** (int | None, Query): Rounds coordinates to the given number of decimal digits.
 
     ### Returns:
     - **GeoJSONResponse[Feature[FeatureGeometry, TerritoryWithoutGeometry]]**: A list of requested territories in GeoJSON format.
@@ -583,6 +649,6 @@ async def get_territories_by_ids(
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
 
-    territories = await territories_service.get_territories_by_ids(ids)
+    territories = await territories_service.get_territories_by_ids(ids, centers_only, simplify_tolerance, precision)
 
     return await GeoJSONResponse.from_list([t.to_geojson_dict() for t in territories], centers_only=centers_only)
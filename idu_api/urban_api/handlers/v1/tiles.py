@@ -0,0 +1,109 @@
+"""Vector tiles handlers are defined here."""
+
+from fastapi import Depends, HTTPException, Path, Request
+from fastapi.responses import Response
+from starlette import status
+
+from idu_api.urban_api.dto.users import UserDTO
+from idu_api.urban_api.logic.tiles import TilesService
+from idu_api.urban_api.schemas.enums import ScenarioTileLayer, TileLayer
+from idu_api.urban_api.utils.auth_client import get_user
+
+from .routers import tiles_router
+
+MVT_MEDIA_TYPE = "application/vnd.mapbox-vector-tile"
+
+
+def _check_tile_coordinates(z: int, x: int, y: int) -> None:
+    if x >= 2**z or y >= 2**z:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Tile coordinates must be less than {2 ** z} at zoom level {z}",
+        )
+
+
+@tiles_router.get(
+    "/{layer}/tiles/{z}/{x}/{y}.mvt",
+    response_class=Response,
+    responses={200: {"content": {MVT_MEDIA_TYPE: {}}}},
+    status_code=status.HTTP_200_OK,
+)
+async def get_tile(
+    request: Request,
+    layer: TileLayer = Path(..., description="map layer"),
+    z: int = Path(..., description="zoom level", ge=0, le=22),
+    x: int = Path(..., description="tile column", ge=0),
+    y: int = Path(..., description="tile row", ge=0),
+) -> Response:
+    """
+    ## Get Mapbox Vector Tile of the public data layer.
+
+    **NOTE:** Physical objects and services are put to tiles starting from zoom level 12, functional zones -
+    from zoom level 10, tiles of lower zoom levels are empty. Territories geometries are simplified at low
+    zoom levels. Tiles are cached and rebuilt only after objects in their bounds are changed.
+
+    ### Parameters:
+    - **layer** (TileLayer, Path): Map layer - territories, physical_objects, services or functional_zones.
+    - **z** (int, Path): Zoom level (0-22).
+    - **x** (int, Path): Tile column.
+    - **y** (int, Path): Tile row.
+
+    ### Returns:
+    - **bytes**: Tile in Mapbox Vector Tile format with a single layer named as the requested one.
+
+    ### Errors:
+    - **400 Bad Request**: If tile coordinates are out of range for the given zoom level.
+    """
+    tiles_service: TilesService = request.state.tiles_service
+
+    _check_tile_coordinates(z, x, y)
+
+    tile = await tiles_service.get_tile(layer.value, z, x, y)
+
+    return Response(content=tile, media_type=MVT_MEDIA_TYPE)
+
+
+@tiles_router.get(
+    "/scenarios/{scenario_id}/{layer}/tiles/{z}/{x}/{y}.mvt",
+    response_class=Response,
+    responses={200: {"content": {MVT_MEDIA_TYPE: {}}}},
+    status_code=status.HTTP_200_OK,
+)
+async def get_scenario_tile(
+    request: Request,
+    scenario_id: int = Path(..., description="scenario identifier", gt=0),
+    layer: ScenarioTileLayer = Path(..., description="scenario map layer"),
+    z: int = Path(..., description="zoom level", ge=0, le=22),
+    x: int = Path(..., description="tile column", ge=0),
+    y: int = Path(..., description="tile row", ge=0),
+    user: UserDTO = Depends(get_user),
+) -> Response:
+    """
+    ## Get Mapbox Vector Tile of the scenario data layer.
+
+    ### Parameters:
+    - **scenario_id** (int, Path): Unique identifier of the scenario.
+    - **layer** (ScenarioTileLayer, Path): Scenario map layer - geometries (of the scenario urban objects)
+      or functional_zones.
+    - **z** (int, Path): Zoom level (0-22).
+    - **x** (int, Path): Tile column.
+    - **y** (int, Path): Tile row.
+
+    ### Returns:
+    - **bytes**: Tile in Mapbox Vector Tile format with a single layer named as the requested one.
+
+    ### Errors:
+    - **400 Bad Request**: If tile coordinates are out of range for the given zoom level.
+    - **403 Forbidden**: If the user does not have access rights.
+    - **404 Not Found**: If the scenario does not exist.
+
+    ### Constraints:
+    - The user must be the relevant project owner or the project must be publicly accessible.
+    """
+    tiles_service: TilesService = request.state.tiles_service
+
+    _check_tile_coordinates(z, x, y)
+
+    tile = await tiles_service.get_scenario_tile(scenario_id, layer.value, z, x, y, user)
+
+    return Response(content=tile, media_type=MVT_MEDIA_TYPE)
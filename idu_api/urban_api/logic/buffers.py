@@ -7,6 +7,7 @@ from shapely.geometry import LineString, MultiPolygon, Point, Polygon
 
 from idu_api.urban_api.dto import (
     BufferDTO,
+    BuffersQueueStatsDTO,
     BufferTypeDTO,
     DefaultBufferValueDTO,
 )
@@ -50,3 +51,11 @@ class BufferService(Protocol):
     @abc.abstractmethod
     async def delete_buffer(self, buffer_type_id: int, urban_object_id: int) -> dict:
         """Delete buffer by identifier."""
+
+    @abc.abstractmethod
+    async def get_buffers_queue_stats(self) -> BuffersQueueStatsDTO:
+        """Get statistics of urban objects waiting for buffers recalculation."""
+
+    @abc.abstractmethod
+    async def process_buffers_queue(self, batch_size: int) -> int:
+        """Recalculate default buffers for the next batch of queued urban objects."""
@@ -89,5 +89,6 @@ class FunctionalZonesService(Protocol):
         year: int,
         source: str,
         functional_zone_type_id: int | None,
+        buffer_meters: int,
     ) -> list[FunctionalZoneDTO]:
         """Get functional zones which are in buffer area of the given geometry."""
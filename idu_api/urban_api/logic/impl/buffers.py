@@ -5,6 +5,7 @@ from shapely.geometry import MultiPolygon, Polygon
 from idu_api.common.db.connection import PostgresConnectionManager
 from idu_api.urban_api.dto import (
     BufferDTO,
+    BuffersQueueStatsDTO,
     BufferTypeDTO,
     DefaultBufferValueDTO,
 )
@@ -15,6 +16,8 @@ from idu_api.urban_api.logic.impl.helpers.buffers import (
     delete_buffer_from_db,
     get_all_default_buffer_values_from_db,
     get_buffer_types_from_db,
+    get_buffers_queue_stats_from_db,
+    process_buffers_queue_in_db,
     put_buffer_to_db,
     put_default_buffer_value_to_db,
 )
@@ -64,3 +67,11 @@ class BufferServiceImpl(BufferService):
     async def delete_buffer(self, buffer_type_id: int, urban_object_id: int) -> dict:
         async with self._connection_manager.get_connection() as conn:
             return await delete_buffer_from_db(conn, buffer_type_id, urban_object_id)
+
+    async def get_buffers_queue_stats(self) -> BuffersQueueStatsDTO:
+        async with self._connection_manager.get_ro_connection() as conn:
+            return await get_buffers_queue_stats_from_db(conn)
+
+    async def process_buffers_queue(self, batch_size: int) -> int:
+        async with self._connection_manager.get_connection() as conn:
+            return await process_buffers_queue_in_db(conn, batch_size)
@@ -107,6 +107,9 @@ class FunctionalZonesServiceImpl(FunctionalZonesService):
         year: int,
         source: str,
         functional_zone_type_id: int | None,
+        buffer_meters: int,
     ) -> list[FunctionalZoneDTO]:
         async with self._connection_manager.get_ro_connection() as conn:
-            return await get_functional_zones_around_from_db(conn, geometry, year, source, functional_zone_type_id)
+            return await get_functional_zones_around_from_db(
+                conn, geometry, year, source, functional_zone_type_id, buffer_meters
+            )
@@ -4,16 +4,18 @@ from collections.abc import Callable
 
 from geoalchemy2.functions import ST_AsEWKB
 from shapely.geometry import LineString, MultiPolygon, Point, Polygon
-from sqlalchemy import delete, insert, select, update
+from sqlalchemy import delete, func, insert, select, true, update
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from idu_api.common.db.entities import (
     buffer_types_dict,
     buffers_data,
+    buffers_queue_data,
     default_buffer_values_dict,
     object_geometries_data,
     physical_object_types_dict,
     physical_objects_data,
+    projects_buffers_queue_data,
     service_types_dict,
     services_data,
     territories_data,
@@ -21,6 +23,7 @@ from idu_api.common.db.entities import (
 )
 from idu_api.urban_api.dto import (
     BufferDTO,
+    BuffersQueueStatsDTO,
     BufferTypeDTO,
     DefaultBufferValueDTO,
 )
@@ -353,3 +356,41 @@ async def delete_buffer_from_db(conn: AsyncConnection, buffer_type_id: int, urba
     await conn.commit()
 
     return {"status": "ok"}
+
+
+async def get_buffers_queue_stats_from_db(conn: AsyncConnection) -> BuffersQueueStatsDTO:
+    """Get the number of urban objects waiting for buffers recalculation and the oldest enqueue time."""
+
+    public_queue = select(
+        func.count().label("pending"),
+        func.min(buffers_queue_data.c.queued_at).label("oldest_queued_at"),
+    ).subquery("public_queue")
+    projects_queue = select(
+        func.count().label("pending"),
+        func.min(projects_buffers_queue_data.c.queued_at).label("oldest_queued_at"),
+    ).subquery("projects_queue")
+
+    statement = select(
+        public_queue.c.pending,
+        public_queue.c.oldest_queued_at,
+        projects_queue.c.pending.label("projects_pending"),
+        projects_queue.c.oldest_queued_at.label("projects_oldest_queued_at"),
+    ).select_from(public_queue.join(projects_queue, true()))
+
+    result = (await conn.execute(statement)).mappings().one()
+
+    return BuffersQueueStatsDTO(**result)
+
+
+async def process_buffers_queue_in_db(conn: AsyncConnection, batch_size: int) -> int:
+    """Recalculate default buffers for the next batch of queued urban objects in both public and user projects schemas.
+
+    Returns the number of processed urban objects.
+    """
+
+    processed = (await conn.execute(select(func.public.process_buffers_queue(batch_size)))).scalar_one()
+    processed += (await conn.execute(select(func.user_projects.process_buffers_queue(batch_size)))).scalar_one()
+
+    await conn.commit()
+
+    return processed
@@ -4,8 +4,9 @@ from collections.abc import Callable
 
 from geoalchemy2.functions import ST_AsEWKB, ST_GeomFromWKB
 from shapely.geometry import LineString, MultiPolygon, Point, Polygon
-from sqlalchemy import case, delete, func, insert, select, text, update
+from sqlalchemy import case, delete, insert, select, text, update
 from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.sql.selectable import Select
 
 from idu_api.common.db.entities import (
     functional_zone_types_dict,
@@ -31,6 +32,7 @@ from idu_api.urban_api.logic.impl.helpers.utils import (
     SRID,
     check_existence,
     extract_values_from_model,
+    within_distance,
 )
 from idu_api.urban_api.schemas import (
     FunctionalZonePatch,
@@ -332,40 +334,42 @@ async def delete_profiles_reclamation_data_from_db(
     return {"status": "ok"}
 
 
+def _build_functional_zones_query() -> Select:
+    """Build a query for functional zones with their territories and types data."""
+
+    return select(
+        functional_zones_data.c.functional_zone_id,
+        functional_zones_data.c.territory_id,
+        territories_data.c.name.label("territory_name"),
+        functional_zones_data.c.functional_zone_type_id,
+        functional_zone_types_dict.c.name.label("functional_zone_type_name"),
+        functional_zone_types_dict.c.zone_nickname.label("functional_zone_type_nickname"),
+        functional_zone_types_dict.c.description.label("functional_zone_type_description"),
+        functional_zones_data.c.name,
+        ST_AsEWKB(functional_zones_data.c.geometry).label("geometry"),
+        functional_zones_data.c.year,
+        functional_zones_data.c.source,
+        functional_zones_data.c.properties,
+        functional_zones_data.c.created_at,
+        functional_zones_data.c.updated_at,
+    ).select_from(
+        functional_zones_data.join(
+            territories_data,
+            territories_data.c.territory_id == functional_zones_data.c.territory_id,
+        ).join(
+            functional_zone_types_dict,
+            functional_zone_types_dict.c.functional_zone_type_id == functional_zones_data.c.functional_zone_type_id,
+        )
+    )
+
+
 async def get_functional_zone_by_ids(conn: AsyncConnection, ids: list[int]) -> list[FunctionalZoneDTO]:
     """Get list of functional zones by identifiers."""
 
     if len(ids) > OBJECTS_NUMBER_LIMIT:
         raise TooManyObjectsError(len(ids), OBJECTS_NUMBER_LIMIT)
 
-    statement = (
-        select(
-            functional_zones_data.c.functional_zone_id,
-            functional_zones_data.c.territory_id,
-            territories_data.c.name.label("territory_name"),
-            functional_zones_data.c.functional_zone_type_id,
-            functional_zone_types_dict.c.name.label("functional_zone_type_name"),
-            functional_zone_types_dict.c.zone_nickname.label("functional_zone_type_nickname"),
-            functional_zone_types_dict.c.description.label("functional_zone_type_description"),
-            functional_zones_data.c.name,
-            ST_AsEWKB(functional_zones_data.c.geometry).label("geometry"),
-            functional_zones_data.c.year,
-            functional_zones_data.c.source,
-            functional_zones_data.c.properties,
-            functional_zones_data.c.created_at,
-            functional_zones_data.c.updated_at,
-        )
-        .select_from(
-            functional_zones_data.join(
-                territories_data,
-                territories_data.c.territory_id == functional_zones_data.c.territory_id,
-            ).join(
-                functional_zone_types_dict,
-                functional_zone_types_dict.c.functional_zone_type_id == functional_zones_data.c.functional_zone_type_id,
-            )
-        )
-        .where(functional_zones_data.c.functional_zone_id.in_(ids))
-    )
+    statement = _build_functional_zones_query().where(functional_zones_data.c.functional_zone_id.in_(ids))
 
     result = (await conn.execute(statement)).mappings().all()
     if len(ids) == 1 and not result:
@@ -486,25 +490,19 @@ async def get_functional_zones_around_from_db(
     year: int,
     source: str,
     functional_zone_type_id: int | None,
+    buffer_meters: int = 0,
 ) -> list[FunctionalZoneDTO]:
-    """Get functional zones which are in the given geometry."""
+    """Get functional zones which are in buffer area of the given geometry."""
 
     given_geometry = select(ST_GeomFromWKB(geometry.wkb, text(str(SRID)))).scalar_subquery()
-    statement = (
-        select(functional_zones_data.c.functional_zone_id)
-        .where(
-            functional_zones_data.c.year == year,
-            functional_zones_data.c.source == source,
-            func.ST_Intersects(functional_zones_data.c.geometry, given_geometry),
-        )
-        .distinct()
+    statement = _build_functional_zones_query().where(
+        functional_zones_data.c.year == year,
+        functional_zones_data.c.source == source,
+        within_distance(functional_zones_data.c.geometry, given_geometry, buffer_meters),
     )
     if functional_zone_type_id is not None:
         statement = statement.where(functional_zones_data.c.functional_zone_type_id == functional_zone_type_id)
 
-    ids = (await conn.execute(statement)).scalars().all()
-
-    if len(ids) == 0:
-        return []
+    result = (await conn.execute(statement)).mappings().all()
 
-    return await get_functional_zone_by_ids(conn, ids)
+    return [FunctionalZoneDTO(**zone) for zone in result]
@@ -17,7 +17,13 @@ from idu_api.urban_api.dto import (
     ServiceTypeDTO,
 )
 from idu_api.urban_api.exceptions.logic.common import EntitiesNotFoundByIds, EntityAlreadyExists, EntityNotFoundById
-from idu_api.urban_api.logic.impl.helpers.utils import build_recursive_query, check_existence
+from idu_api.urban_api.logic.impl.helpers.utils import (
+    CachedTypesHierarchy,
+    build_recursive_query,
+    build_types_hierarchy,
+    check_existence,
+    get_tables_version,
+)
 from idu_api.urban_api.schemas import (
     PhysicalObjectFunctionPatch,
     PhysicalObjectFunctionPost,
@@ -27,6 +33,12 @@ from idu_api.urban_api.schemas import (
 )
 from idu_api.urban_api.utils.query_filters import EqFilter, ILikeFilter, apply_filters
 
+PHYSICAL_OBJECT_TYPES_HIERARCHY_SOURCE_TABLES = ("physical_object_functions_dict", "physical_object_types_dict")
+"""Tables which physical object types hierarchy depends on (tracked in `public.tables_versions_data`)."""
+
+_physical_object_types_hierarchy_cache: CachedTypesHierarchy | None = None
+"""Physical object functions and types with the full hierarchy for the source tables version they were loaded for."""
+
 
 async def get_physical_object_types_from_db(
     conn: AsyncConnection,
@@ -370,14 +382,16 @@ async def delete_physical_object_function_from_db(conn: AsyncConnection, physica
     return {"status": "ok"}
 
 
-async def get_physical_object_types_hierarchy_from_db(
-    conn: AsyncConnection, ids: set[int] | None
-) -> list[PhysicalObjectTypesHierarchyDTO]:
-    """Get physical object types hierarchy (from top-level physical object function to physical object type)
-    based on a list of required physical object type ids.
+async def _get_physical_object_types_hierarchy_source(conn: AsyncConnection) -> CachedTypesHierarchy:
+    """Get physical object functions, physical object types and the full hierarchy,
+    reloading them only if source tables changed."""
 
-    If the list of identifiers was not passed, it returns the full hierarchy.
-    """
+    global _physical_object_types_hierarchy_cache  # pylint: disable=global-statement
+
+    version = await get_tables_version(conn, PHYSICAL_OBJECT_TYPES_HIERARCHY_SOURCE_TABLES)
+    cached = _physical_object_types_hierarchy_cache
+    if cached is not None and cached.version == version:
+        return cached
 
     statement = (
         select(physical_object_types_dict, physical_object_functions_dict.c.name.label("physical_object_function_name"))
@@ -390,42 +404,53 @@ async def get_physical_object_types_hierarchy_from_db(
         )
         .order_by(physical_object_types_dict.c.physical_object_type_id)
     )
+    physical_object_types = [PhysicalObjectTypeDTO(**p) for p in (await conn.execute(statement)).mappings().all()]
 
-    if ids is not None:
-        query = select(physical_object_types_dict.c.physical_object_type_id).where(
-            physical_object_types_dict.c.physical_object_type_id.in_(ids)
-        )
-        physical_object_types = (await conn.execute(query)).scalars().all()
-        if len(physical_object_types) < len(ids):
-            raise EntitiesNotFoundByIds("physical object type")
-        statement = statement.where(physical_object_types_dict.c.physical_object_type_id.in_(ids))
+    statement = select(physical_object_functions_dict).order_by(
+        physical_object_functions_dict.c.level, physical_object_functions_dict.c.physical_object_function_id
+    )
+    physical_object_functions = list((await conn.execute(statement)).mappings().all())
+
+    cached = CachedTypesHierarchy(
+        version=version,
+        functions=physical_object_functions,
+        types=physical_object_types,
+        type_ids=frozenset(p.physical_object_type_id for p in physical_object_types),
+        full=build_types_hierarchy(
+            physical_object_functions,
+            physical_object_types,
+            "physical_object_function_id",
+            PhysicalObjectTypesHierarchyDTO,
+        ),
+    )
+    _physical_object_types_hierarchy_cache = cached
 
-    physical_object_types = (await conn.execute(statement)).mappings().all()
+    return cached
 
-    statement = select(physical_object_functions_dict).order_by(physical_object_functions_dict.c.level)
-    physical_object_functions = (await conn.execute(statement)).mappings().all()
 
-    def build_filtered_hierarchy(parent_id: int | None = None) -> list[PhysicalObjectTypesHierarchyDTO]:
-        children = []
-        for pof in [pof for pof in physical_object_functions if pof.parent_id == parent_id]:
-            filtered_children = build_filtered_hierarchy(pof.physical_object_function_id)
+async def get_physical_object_types_hierarchy_from_db(
+    conn: AsyncConnection, ids: set[int] | None
+) -> list[PhysicalObjectTypesHierarchyDTO]:
+    """Get physical object types hierarchy (from top-level physical object function to physical object type)
+    based on a list of required physical object type ids.
+
+    If the list of identifiers was not passed, it returns the full hierarchy.
+    """
 
-            relevant_physical_object_types = [
-                PhysicalObjectTypeDTO(**p)
-                for p in physical_object_types
-                if p.physical_object_function_id == pof.physical_object_function_id
-            ]
+    cached = await _get_physical_object_types_hierarchy_source(conn)
 
-            if filtered_children or relevant_physical_object_types:
-                children.append(
-                    PhysicalObjectTypesHierarchyDTO(
-                        **pof, children=filtered_children if filtered_children else relevant_physical_object_types
-                    )
-                )
+    if ids is None:
+        return cached.full
 
-        return children
+    if not ids <= cached.type_ids:
+        raise EntitiesNotFoundByIds("physical object type")
 
-    return build_filtered_hierarchy()
+    return build_types_hierarchy(
+        cached.functions,
+        [p for p in cached.types if p.physical_object_type_id in ids],
+        "physical_object_function_id",
+        PhysicalObjectTypesHierarchyDTO,
+    )
 
 
 async def get_service_types_by_physical_object_type_id_from_db(
@@ -3,11 +3,11 @@
 from collections import defaultdict
 from typing import Callable
 
-from geoalchemy2 import Geography, Geometry
 from geoalchemy2.functions import ST_AsEWKB, ST_GeomFromWKB
 from shapely.geometry import LineString, MultiPolygon, Point, Polygon
-from sqlalchemy import cast, delete, func, insert, select, text, update
+from sqlalchemy import FromClause, delete, insert, select, text, update
 from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.sql.selectable import Select
 
 from idu_api.common.db.entities import (
     buildings_data,
@@ -42,7 +42,9 @@ from idu_api.urban_api.logic.impl.helpers.utils import (
     OBJECTS_NUMBER_LIMIT,
     SRID,
     check_existence,
+    distance_order,
     extract_values_from_model,
+    within_distance,
 )
 from idu_api.urban_api.schemas import (
     BuildingPatch,
@@ -59,6 +61,55 @@ func: Callable
 Geom = Point | Polygon | MultiPolygon | LineString
 
 
+def _build_physical_objects_with_geometry_query(urban_objects: FromClause = urban_objects_data) -> Select:
+    """Build a query for physical objects with their geometries, territories and buildings data.
+
+    Physical objects are linked to geometries through `urban_objects` - the table itself or any subquery
+    with `physical_object_id` and `object_geometry_id` columns.
+    """
+
+    building_columns = [col for col in buildings_data.c if col.name not in ("physical_object_id", "properties")]
+
+    return select(
+        physical_objects_data,
+        physical_object_types_dict.c.name.label("physical_object_type_name"),
+        physical_object_types_dict.c.physical_object_function_id,
+        physical_object_functions_dict.c.name.label("physical_object_function_name"),
+        territories_data.c.territory_id,
+        territories_data.c.name.label("territory_name"),
+        object_geometries_data.c.object_geometry_id,
+        object_geometries_data.c.address,
+        object_geometries_data.c.osm_id,
+        ST_AsEWKB(object_geometries_data.c.geometry).label("geometry"),
+        ST_AsEWKB(object_geometries_data.c.centre_point).label("centre_point"),
+        *building_columns,
+        buildings_data.c.properties.label("building_properties"),
+    ).select_from(
+        physical_objects_data.join(
+            urban_objects,
+            urban_objects.c.physical_object_id == physical_objects_data.c.physical_object_id,
+        )
+        .join(
+            object_geometries_data,
+            urban_objects.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
+        )
+        .join(territories_data, territories_data.c.territory_id == object_geometries_data.c.territory_id)
+        .join(
+            physical_object_types_dict,
+            physical_objects_data.c.physical_object_type_id == physical_object_types_dict.c.physical_object_type_id,
+        )
+        .join(
+            physical_object_functions_dict,
+            physical_object_functions_dict.c.physical_object_function_id
+            == physical_object_types_dict.c.physical_object_function_id,
+        )
+        .outerjoin(
+            buildings_data,
+            buildings_data.c.physical_object_id == physical_objects_data.c.physical_object_id,
+        )
+    )
+
+
 async def get_physical_objects_with_geometry_by_ids_from_db(
     conn: AsyncConnection, ids: list[int]
 ) -> list[PhysicalObjectWithGeometryDTO]:
@@ -67,48 +118,8 @@ async def get_physical_objects_with_geometry_by_ids_from_db(
     if len(ids) > OBJECTS_NUMBER_LIMIT:
         raise TooManyObjectsError(len(ids), OBJECTS_NUMBER_LIMIT)
 
-    building_columns = [col for col in buildings_data.c if col.name not in ("physical_object_id", "properties")]
-
     statement = (
-        select(
-            physical_objects_data,
-            physical_object_types_dict.c.name.label("physical_object_type_name"),
-            physical_object_types_dict.c.physical_object_function_id,
-            physical_object_functions_dict.c.name.label("physical_object_function_name"),
-            territories_data.c.territory_id,
-            territories_data.c.name.label("territory_name"),
-            object_geometries_data.c.object_geometry_id,
-            object_geometries_data.c.address,
-            object_geometries_data.c.osm_id,
-            ST_AsEWKB(object_geometries_data.c.geometry).label("geometry"),
-            ST_AsEWKB(object_geometries_data.c.centre_point).label("centre_point"),
-            *building_columns,
-            buildings_data.c.properties.label("building_properties"),
-        )
-        .select_from(
-            physical_objects_data.join(
-                urban_objects_data,
-                urban_objects_data.c.physical_object_id == physical_objects_data.c.physical_object_id,
-            )
-            .join(
-                object_geometries_data,
-                urban_objects_data.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
-            )
-            .join(territories_data, territories_data.c.territory_id == object_geometries_data.c.territory_id)
-            .join(
-                physical_object_types_dict,
-                physical_objects_data.c.physical_object_type_id == physical_object_types_dict.c.physical_object_type_id,
-            )
-            .join(
-                physical_object_functions_dict,
-                physical_object_functions_dict.c.physical_object_function_id
-                == physical_object_types_dict.c.physical_object_function_id,
-            )
-            .outerjoin(
-                buildings_data,
-                buildings_data.c.physical_object_id == physical_objects_data.c.physical_object_id,
-            )
-        )
+        _build_physical_objects_with_geometry_query()
         .where(physical_objects_data.c.physical_object_id.in_(ids))
         .distinct()
     )
@@ -128,40 +139,81 @@ async def get_physical_objects_around_from_db(
 ) -> list[PhysicalObjectWithGeometryDTO]:
     """Get physical objects which are in buffer area of the given geometry."""
 
-    buffered_geometry_cte = select(
-        cast(
-            func.ST_Buffer(cast(ST_GeomFromWKB(geometry.wkb, text(str(SRID))), Geography(srid=SRID)), buffer_meters),
-            Geometry(srid=SRID),
-        ).label("geometry"),
-    ).cte("buffered_geometry_cte")
+    given_geometry = select(ST_GeomFromWKB(geometry.wkb, text(str(SRID)))).scalar_subquery()
 
-    statement = (
-        select(physical_objects_data.c.physical_object_id)
+    objects_around = (
+        select(urban_objects_data.c.physical_object_id)
         .select_from(
-            physical_objects_data.join(
-                urban_objects_data,
-                urban_objects_data.c.physical_object_id == physical_objects_data.c.physical_object_id,
-            ).join(
+            urban_objects_data.join(
                 object_geometries_data,
                 urban_objects_data.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
             )
         )
-        .where(
-            func.ST_Intersects(
-                object_geometries_data.c.geometry, select(buffered_geometry_cte.c.geometry).scalar_subquery()
-            ),
-        )
+        .where(within_distance(object_geometries_data.c.geometry, given_geometry, buffer_meters))
+    )
+
+    statement = (
+        _build_physical_objects_with_geometry_query()
+        .where(physical_objects_data.c.physical_object_id.in_(objects_around))
         .distinct()
     )
     if physical_object_type_id is not None:
         statement = statement.where(physical_objects_data.c.physical_object_type_id == physical_object_type_id)
 
-    ids = (await conn.execute(statement)).scalars().all()
+    results = (await conn.execute(statement)).mappings().all()
+
+    return [PhysicalObjectWithGeometryDTO(**physical_object) for physical_object in results]
 
-    if len(ids) == 0:
-        return []
 
-    return await get_physical_objects_with_geometry_by_ids_from_db(conn, ids)
+async def get_nearest_physical_objects_from_db(
+    conn: AsyncConnection,
+    geometry: Geom,
+    physical_object_type_id: int | None,
+    limit: int,
+    max_distance_meters: int | None,
+) -> list[PhysicalObjectWithGeometryDTO]:
+    """Get the nearest physical objects (by their geometries) to the given geometry, sorted by distance.
+
+    Physical object is linked to the same geometry once for every its service, so the nearest geometry
+    of each physical object is chosen before the limit is applied.
+    """
+
+    given_geometry = select(ST_GeomFromWKB(geometry.wkb, text(str(SRID)))).scalar_subquery()
+    distance = distance_order(object_geometries_data.c.geometry, given_geometry)
+
+    nearest = (
+        select(
+            urban_objects_data.c.physical_object_id,
+            urban_objects_data.c.object_geometry_id,
+            distance.label("distance"),
+        )
+        .select_from(
+            urban_objects_data.join(
+                object_geometries_data,
+                object_geometries_data.c.object_geometry_id == urban_objects_data.c.object_geometry_id,
+            ).join(
+                physical_objects_data,
+                physical_objects_data.c.physical_object_id == urban_objects_data.c.physical_object_id,
+            )
+        )
+        .distinct(urban_objects_data.c.physical_object_id)
+        .order_by(urban_objects_data.c.physical_object_id, distance)
+    )
+    if physical_object_type_id is not None:
+        nearest = nearest.where(physical_objects_data.c.physical_object_type_id == physical_object_type_id)
+    if max_distance_meters is not None:
+        nearest = nearest.where(within_distance(object_geometries_data.c.geometry, given_geometry, max_distance_meters))
+    nearest = nearest.subquery("nearest")
+
+    statement = (
+        _build_physical_objects_with_geometry_query(nearest)
+        .order_by(nearest.c.distance, nearest.c.physical_object_id)
+        .limit(limit)
+    )
+
+    results = (await conn.execute(statement)).mappings().all()
+
+    return [PhysicalObjectWithGeometryDTO(**physical_object) for physical_object in results]
 
 
 async def get_physical_object_by_id_from_db(conn: AsyncConnection, physical_object_id: int) -> PhysicalObjectDTO:
@@ -35,6 +35,7 @@ from idu_api.urban_api.logic.impl.helpers.projects_scenarios import check_scenar
 from idu_api.urban_api.logic.impl.helpers.utils import (
     check_existence,
     extract_values_from_model,
+    get_context_layer_cache,
     get_context_territories_geometry,
 )
 from idu_api.urban_api.schemas import ScenarioBufferDelete, ScenarioBufferPut
@@ -312,7 +313,7 @@ async def get_context_buffers_from_db(
 ) -> list[ScenarioBufferDTO]:
     """Get list of buffer objects for `context` of project territory."""
 
-    parent_id, context_geom, context_ids = await get_context_territories_geometry(conn, scenario_id, user)
+    parent_id, context_geom, _ = await get_context_territories_geometry(conn, scenario_id, user)
 
     # Step 1: Get all the public_urban_object_id for a given scenario_id
     public_urban_object_ids = (
@@ -321,65 +322,56 @@ async def get_context_buffers_from_db(
         .where(projects_urban_objects_data.c.public_urban_object_id.isnot(None))
     ).cte(name="public_urban_object_ids")
 
-    # Step 2: Find all intersecting object geometries from public (except object from previous step)
-    objects_intersecting = (
-        select(object_geometries_data.c.object_geometry_id)
-        .select_from(
-            object_geometries_data.join(
-                urban_objects_data,
-                urban_objects_data.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
-            )
-        )
-        .where(
-            urban_objects_data.c.urban_object_id.not_in(select(public_urban_object_ids)),
-            object_geometries_data.c.territory_id.in_(context_ids)
-            | ST_Intersects(object_geometries_data.c.geometry, context_geom),
-        )
-        .cte(name="objects_intersecting")
-    )
+    # Step 2: Get public buffers of objects in context clipped by context geometry (cached per project)
+    context_buffers = await get_context_layer_cache(conn, scenario_id, "buffers")
 
     # Step 3: Collect all buffers from `public` intersecting context geometry
-    public_buffers_query = select(
-        buffer_types_dict.c.buffer_type_id,
-        buffer_types_dict.c.name.label("buffer_type_name"),
-        urban_objects_data.c.urban_object_id,
-        physical_objects_data.c.physical_object_id,
-        physical_objects_data.c.name.label("physical_object_name"),
-        physical_object_types_dict.c.physical_object_type_id,
-        physical_object_types_dict.c.name.label("physical_object_type_name"),
-        object_geometries_data.c.object_geometry_id,
-        territories_data.c.territory_id,
-        territories_data.c.name.label("territory_name"),
-        services_data.c.service_id,
-        services_data.c.name.label("service_name"),
-        service_types_dict.c.service_type_id,
-        service_types_dict.c.name.label("service_type_name"),
-        ST_AsEWKB(ST_Intersection(buffers_data.c.geometry, context_geom)).label("geometry"),
-        buffers_data.c.is_custom,
-        literal(False).label("is_scenario_object"),
-        literal(True).label("is_locked"),
-    ).select_from(
-        buffers_data.join(buffer_types_dict, buffer_types_dict.c.buffer_type_id == buffers_data.c.buffer_type_id)
-        .join(urban_objects_data, urban_objects_data.c.urban_object_id == buffers_data.c.urban_object_id)
-        .join(
-            physical_objects_data,
-            physical_objects_data.c.physical_object_id == urban_objects_data.c.physical_object_id,
-        )
-        .join(
-            physical_object_types_dict,
-            physical_object_types_dict.c.physical_object_type_id == physical_objects_data.c.physical_object_type_id,
-        )
-        .join(
-            object_geometries_data,
-            object_geometries_data.c.object_geometry_id == urban_objects_data.c.object_geometry_id,
+    public_buffers_query = (
+        select(
+            buffer_types_dict.c.buffer_type_id,
+            buffer_types_dict.c.name.label("buffer_type_name"),
+            urban_objects_data.c.urban_object_id,
+            physical_objects_data.c.physical_object_id,
+            physical_objects_data.c.name.label("physical_object_name"),
+            physical_object_types_dict.c.physical_object_type_id,
+            physical_object_types_dict.c.name.label("physical_object_type_name"),
+            object_geometries_data.c.object_geometry_id,
+            territories_data.c.territory_id,
+            territories_data.c.name.label("territory_name"),
+            services_data.c.service_id,
+            services_data.c.name.label("service_name"),
+            service_types_dict.c.service_type_id,
+            service_types_dict.c.name.label("service_type_name"),
+            ST_AsEWKB(context_buffers.c.geometry).label("geometry"),
+            buffers_data.c.is_custom,
+            literal(False).label("is_scenario_object"),
+            literal(True).label("is_locked"),
         )
-        .join(
-            objects_intersecting,
-            objects_intersecting.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
+        .select_from(
+            buffers_data.join(buffer_types_dict, buffer_types_dict.c.buffer_type_id == buffers_data.c.buffer_type_id)
+            .join(
+                context_buffers,
+                (context_buffers.c.buffer_type_id == buffers_data.c.buffer_type_id)
+                & (context_buffers.c.urban_object_id == buffers_data.c.urban_object_id),
+            )
+            .join(urban_objects_data, urban_objects_data.c.urban_object_id == buffers_data.c.urban_object_id)
+            .join(
+                physical_objects_data,
+                physical_objects_data.c.physical_object_id == urban_objects_data.c.physical_object_id,
+            )
+            .join(
+                physical_object_types_dict,
+                physical_object_types_dict.c.physical_object_type_id == physical_objects_data.c.physical_object_type_id,
+            )
+            .join(
+                object_geometries_data,
+                object_geometries_data.c.object_geometry_id == urban_objects_data.c.object_geometry_id,
+            )
+            .join(territories_data, territories_data.c.territory_id == object_geometries_data.c.territory_id)
+            .outerjoin(services_data, services_data.c.service_id == urban_objects_data.c.service_id)
+            .outerjoin(service_types_dict, service_types_dict.c.service_type_id == services_data.c.service_type_id)
         )
-        .join(territories_data, territories_data.c.territory_id == object_geometries_data.c.territory_id)
-        .outerjoin(services_data, services_data.c.service_id == urban_objects_data.c.service_id)
-        .outerjoin(service_types_dict, service_types_dict.c.service_type_id == services_data.c.service_type_id)
+        .where(urban_objects_data.c.urban_object_id.not_in(select(public_urban_object_ids)))
     )
 
     # Step 4: Collect all buffers from regional scenario intersecting context geometry
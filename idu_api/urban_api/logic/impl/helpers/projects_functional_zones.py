@@ -2,8 +2,8 @@
 
 from collections.abc import Sequence
 
-from geoalchemy2.functions import ST_AsEWKB, ST_Intersection, ST_Intersects, ST_Within
-from sqlalchemy import case, delete, insert, select, update
+from geoalchemy2.functions import ST_AsEWKB
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from idu_api.common.db.entities import (
@@ -20,6 +20,7 @@ from idu_api.urban_api.logic.impl.helpers.utils import (
     OBJECTS_NUMBER_LIMIT,
     check_existence,
     extract_values_from_model,
+    get_context_layer_cache,
     get_context_territories_geometry,
 )
 from idu_api.urban_api.schemas import (
@@ -109,15 +110,18 @@ async def get_context_functional_zones_sources_from_db(
 ) -> list[FunctionalZoneSourceDTO]:
     """Get list of pairs year + source for functional zones for 'context' of the project territory."""
 
-    _, context_geom, context_ids = await get_context_territories_geometry(conn, scenario_id, user)
+    await get_context_territories_geometry(conn, scenario_id, user)
+
+    # Get public functional zones clipped by context geometry (cached per project)
+    context_zones = await get_context_layer_cache(conn, scenario_id, "functional_zones")
 
     statement = (
         select(functional_zones_data.c.year, functional_zones_data.c.source)
-        .where(
-            (
-                (functional_zones_data.c.territory_id.in_(context_ids))
-                | (ST_Intersects(functional_zones_data.c.geometry, context_geom))
-            ),
+        .select_from(
+            functional_zones_data.join(
+                context_zones,
+                context_zones.c.functional_zone_id == functional_zones_data.c.functional_zone_id,
+            )
         )
         .distinct()
     )
@@ -136,7 +140,10 @@ async def get_context_functional_zones_from_db(
 ) -> list[FunctionalZoneDTO]:
     """Get list of functional zone objects for 'context' of the project territory."""
 
-    _, context_geom, context_ids = await get_context_territories_geometry(conn, scenario_id, user)
+    await get_context_territories_geometry(conn, scenario_id, user)
+
+    # Get public functional zones clipped by context geometry (cached per project)
+    context_zones = await get_context_layer_cache(conn, scenario_id, "functional_zones")
 
     statement = (
         select(
@@ -148,15 +155,7 @@ async def get_context_functional_zones_from_db(
             functional_zone_types_dict.c.zone_nickname.label("functional_zone_type_nickname"),
             functional_zone_types_dict.c.description.label("functional_zone_type_description"),
             functional_zones_data.c.name,
-            ST_AsEWKB(
-                case(
-                    (
-                        ~ST_Within(functional_zones_data.c.geometry, context_geom),
-                        ST_Intersection(functional_zones_data.c.geometry, context_geom),
-                    ),
-                    else_=functional_zones_data.c.geometry,
-                )
-            ).label("geometry"),
+            ST_AsEWKB(context_zones.c.geometry).label("geometry"),
             functional_zones_data.c.year,
             functional_zones_data.c.source,
             functional_zones_data.c.properties,
@@ -167,18 +166,19 @@ async def get_context_functional_zones_from_db(
             functional_zones_data.join(
                 territories_data,
                 territories_data.c.territory_id == functional_zones_data.c.territory_id,
-            ).join(
+            )
+            .join(
                 functional_zone_types_dict,
                 functional_zone_types_dict.c.functional_zone_type_id == functional_zones_data.c.functional_zone_type_id,
             )
+            .join(
+                context_zones,
+                context_zones.c.functional_zone_id == functional_zones_data.c.functional_zone_id,
+            )
         )
         .where(
             functional_zones_data.c.year == year,
             functional_zones_data.c.source == source,
-            (
-                functional_zones_data.c.territory_id.in_(context_ids)
-                | ST_Intersects(functional_zones_data.c.geometry, context_geom)
-            ),
         )
     )
 
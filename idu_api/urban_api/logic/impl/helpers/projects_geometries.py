@@ -6,11 +6,11 @@ from geoalchemy2.functions import (
     ST_AsEWKB,
     ST_Centroid,
     ST_Intersection,
-    ST_Intersects,
     ST_IsEmpty,
+    ST_MakeEnvelope,
     ST_Within,
 )
-from sqlalchemy import delete, insert, literal, or_, select, union_all, update
+from sqlalchemy import ColumnElement, delete, insert, literal, or_, select, union_all, update
 from sqlalchemy.ext.asyncio import AsyncConnection
 from sqlalchemy.sql.functions import coalesce
 
@@ -41,13 +41,26 @@ from idu_api.urban_api.dto import (
 from idu_api.urban_api.exceptions.logic.common import EntityAlreadyEdited, EntityNotFoundById
 from idu_api.urban_api.logic.impl.helpers.projects_scenarios import check_scenario
 from idu_api.urban_api.logic.impl.helpers.utils import (
+    SRID,
     check_existence,
     extract_values_from_model,
+    get_context_layer_cache,
     get_context_territories_geometry,
     include_child_territories_cte,
 )
 from idu_api.urban_api.schemas import ObjectGeometryPatch, ObjectGeometryPut
-from idu_api.urban_api.utils.query_filters import EqFilter, RecursiveFilter, apply_filters
+from idu_api.urban_api.utils.bbox import BBox
+from idu_api.urban_api.utils.query_filters import BBoxFilter, EqFilter, RecursiveFilter, apply_filters
+
+
+def _scenario_geometry_in_bbox(bbox: BBox) -> ColumnElement[bool]:
+    """Build condition for scenario urban objects which own or public geometry intersects the bounding box."""
+
+    envelope = ST_MakeEnvelope(*bbox, SRID)
+    return or_(
+        projects_object_geometries_data.c.geometry.intersects(envelope),
+        object_geometries_data.c.geometry.intersects(envelope),
+    )
 
 
 async def get_geometries_by_scenario_id_from_db(
@@ -56,8 +69,9 @@ async def get_geometries_by_scenario_id_from_db(
     user: UserDTO | None,
     physical_object_id: int | None,
     service_id: int | None,
+    bbox: BBox | None = None,
 ) -> list[ScenarioGeometryDTO]:
-    """Get geometries by scenario identifier."""
+    """Get geometries by scenario identifier (optionally only the ones intersecting `bbox`)."""
 
     project = await check_scenario(conn, scenario_id, user, return_value=True)
 
@@ -123,6 +137,9 @@ async def get_geometries_by_scenario_id_from_db(
         )
     if service_id is not None:
         public_urban_objects_query = public_urban_objects_query.where(services_data.c.service_id == service_id)
+    public_urban_objects_query = apply_filters(
+        public_urban_objects_query, BBoxFilter(object_geometries_data, "geometry", bbox, SRID)
+    )
 
     rows = (await conn.execute(public_urban_objects_query)).mappings().all()
 
@@ -206,6 +223,8 @@ async def get_geometries_by_scenario_id_from_db(
         )
     if service_id is not None:
         scenario_urban_objects_query = scenario_urban_objects_query.where(services_data.c.service_id == service_id)
+    if bbox is not None:
+        scenario_urban_objects_query = scenario_urban_objects_query.where(_scenario_geometry_in_bbox(bbox))
 
     rows = (await conn.execute(scenario_urban_objects_query)).mappings().all()
 
@@ -271,8 +290,10 @@ async def get_geometries_with_all_objects_by_scenario_id_from_db(
     service_type_id: int | None,
     physical_object_function_id: int | None,
     urban_function_id: int | None,
+    bbox: BBox | None = None,
 ) -> list[ScenarioGeometryWithAllObjectsDTO]:
-    """Get geometries with list of physical objects and services by scenario identifier."""
+    """Get geometries with list of physical objects and services by scenario identifier
+    (optionally only the ones intersecting `bbox`)."""
 
     project = await check_scenario(conn, scenario_id, user, return_value=True)
 
@@ -485,6 +506,13 @@ async def get_geometries_with_all_objects_by_scenario_id_from_db(
         )
     )
 
+    # bounding box is applied before union, so that spatial indexes can be used
+    public_urban_objects_query = apply_filters(
+        public_urban_objects_query, BBoxFilter(object_geometries_data, "geometry", bbox, SRID)
+    )
+    if bbox is not None:
+        scenario_urban_objects_query = scenario_urban_objects_query.where(_scenario_geometry_in_bbox(bbox))
+
     union_query = union_all(
         public_urban_objects_query,
         scenario_urban_objects_query,
@@ -610,7 +638,7 @@ async def get_context_geometries_from_db(
 ) -> list[ScenarioGeometryDTO]:
     """Get list of geometries for 'context' of the project territory."""
 
-    parent_id, context_geom, context_ids = await get_context_territories_geometry(conn, scenario_id, user)
+    parent_id, context_geom, _ = await get_context_territories_geometry(conn, scenario_id, user)
 
     # Step 1: Get all the public_urban_object_id for a given scenario_id
     public_urban_object_ids = (
@@ -619,25 +647,10 @@ async def get_context_geometries_from_db(
         .where(projects_urban_objects_data.c.public_urban_object_id.isnot(None))
     ).cte(name="public_urban_object_ids")
 
-    # Step 2: Find all intersecting object geometries from public (except object from previous step)
-    objects_intersecting = (
-        select(object_geometries_data.c.object_geometry_id)
-        .select_from(
-            object_geometries_data.join(
-                urban_objects_data,
-                urban_objects_data.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
-            )
-        )
-        .where(
-            urban_objects_data.c.urban_object_id.not_in(select(public_urban_object_ids)),
-            object_geometries_data.c.territory_id.in_(context_ids)
-            | ST_Intersects(object_geometries_data.c.geometry, context_geom),
-        )
-        .cte(name="objects_intersecting")
-    )
+    # Step 2: Get public object geometries clipped by context geometry (cached per project)
+    context_objects = await get_context_layer_cache(conn, scenario_id, "object_geometries")
 
     # Step 3: Collect all geometries from `public` intersecting context geometry
-    intersected_geom = ST_Intersection(object_geometries_data.c.geometry, context_geom)
     public_geoms_query = (
         select(
             object_geometries_data.c.object_geometry_id,
@@ -645,8 +658,8 @@ async def get_context_geometries_from_db(
             object_geometries_data.c.osm_id,
             object_geometries_data.c.created_at,
             object_geometries_data.c.updated_at,
-            ST_AsEWKB(intersected_geom).label("geometry"),
-            ST_AsEWKB(ST_Centroid(intersected_geom)).label("centre_point"),
+            ST_AsEWKB(context_objects.c.geometry).label("geometry"),
+            ST_AsEWKB(context_objects.c.centre_point).label("centre_point"),
             territories_data.c.territory_id,
             territories_data.c.name.label("territory_name"),
             literal(False).label("is_scenario_object"),
@@ -657,15 +670,15 @@ async def get_context_geometries_from_db(
                 object_geometries_data.c.object_geometry_id == urban_objects_data.c.object_geometry_id,
             )
             .join(
-                objects_intersecting,
-                objects_intersecting.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
+                context_objects,
+                context_objects.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
             )
             .join(
                 territories_data,
                 territories_data.c.territory_id == object_geometries_data.c.territory_id,
             )
         )
-        .where(~ST_IsEmpty(intersected_geom))
+        .where(urban_objects_data.c.urban_object_id.not_in(select(public_urban_object_ids)))
         .distinct()
     )
 
@@ -767,7 +780,7 @@ async def get_context_geometries_with_all_objects_from_db(
 ) -> list[ScenarioGeometryWithAllObjectsDTO]:
     """Get geometries with lists of physical objects and services for 'context' of the project territory."""
 
-    parent_id, context_geom, context_ids = await get_context_territories_geometry(conn, scenario_id, user)
+    parent_id, context_geom, _ = await get_context_territories_geometry(conn, scenario_id, user)
 
     # Step 1: Get all the public_urban_object_id for a given scenario_id
     public_urban_object_ids = (
@@ -776,25 +789,10 @@ async def get_context_geometries_with_all_objects_from_db(
         .where(projects_urban_objects_data.c.public_urban_object_id.isnot(None))
     ).cte(name="public_urban_object_ids")
 
-    # Step 2: Find all intersecting object geometries from public (except object from previous step)
-    objects_intersecting = (
-        select(object_geometries_data.c.object_geometry_id)
-        .select_from(
-            object_geometries_data.join(
-                urban_objects_data,
-                urban_objects_data.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
-            )
-        )
-        .where(
-            urban_objects_data.c.urban_object_id.not_in(select(public_urban_object_ids)),
-            object_geometries_data.c.territory_id.in_(context_ids)
-            | ST_Intersects(object_geometries_data.c.geometry, context_geom),
-        )
-        .cte(name="objects_intersecting")
-    )
+    # Step 2: Get public object geometries clipped by context geometry (cached per project)
+    context_objects = await get_context_layer_cache(conn, scenario_id, "object_geometries")
 
     # Step 3: Collect all geometries from `public` intersecting context geometry
-    intersected_geom = ST_Intersection(object_geometries_data.c.geometry, context_geom)
     building_columns = [col for col in buildings_data.c if col.name not in ("physical_object_id", "properties")]
     public_geoms_query = (
         select(
@@ -811,8 +809,8 @@ async def get_context_geometries_with_all_objects_from_db(
             territories_data.c.name.label("territory_name"),
             object_geometries_data.c.address,
             object_geometries_data.c.osm_id,
-            ST_AsEWKB(intersected_geom).label("geometry"),
-            ST_AsEWKB(ST_Centroid(intersected_geom)).label("centre_point"),
+            ST_AsEWKB(context_objects.c.geometry).label("geometry"),
+            ST_AsEWKB(context_objects.c.centre_point).label("centre_point"),
             services_data.c.service_id,
             services_data.c.name.label("service_name"),
             services_data.c.capacity,
@@ -837,8 +835,8 @@ async def get_context_geometries_with_all_objects_from_db(
                 object_geometries_data.c.object_geometry_id == urban_objects_data.c.object_geometry_id,
             )
             .join(
-                objects_intersecting,
-                objects_intersecting.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
+                context_objects,
+                context_objects.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
             )
             .join(
                 territories_data,
@@ -862,7 +860,7 @@ async def get_context_geometries_with_all_objects_from_db(
                 buildings_data.c.physical_object_id == physical_objects_data.c.physical_object_id,
             )
         )
-        .where(~ST_IsEmpty(intersected_geom))
+        .where(urban_objects_data.c.urban_object_id.not_in(select(public_urban_object_ids)))
     )
 
     # Step 4: Collect all geometries from parent regional scenario
@@ -1,14 +1,17 @@
 """Projects indicators values internal logic is defined here."""
 
 import os
+from collections.abc import Callable
 from typing import Any
 
 import aiohttp
+import numpy as np
 import structlog
 from geoalchemy2.functions import ST_AsEWKB
 from otteroad import KafkaProducerClient
 from otteroad.models import RegionalScenarioIndicatorsUpdated, ScenarioIndicatorsUpdated
-from sqlalchemy import delete, insert, select, update
+from sqlalchemy import Subquery, delete, func, insert, select, update
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from idu_api.common.db.entities import (
@@ -22,6 +25,7 @@ from idu_api.common.db.entities import (
 )
 from idu_api.urban_api.config import UrbanAPIConfig
 from idu_api.urban_api.dto import (
+    HexagonsIndicatorsMatrixDTO,
     HexagonWithIndicatorsDTO,
     ScenarioIndicatorValueDTO,
     ShortScenarioIndicatorValueDTO,
@@ -34,6 +38,8 @@ from idu_api.urban_api.logic.impl.helpers.utils import check_existence, extract_
 from idu_api.urban_api.schemas import ScenarioIndicatorValuePatch, ScenarioIndicatorValuePost, ScenarioIndicatorValuePut
 from idu_api.urban_api.utils.query_filters import EqFilter, InFilter, apply_filters
 
+func: Callable
+
 
 async def get_scenario_indicator_value_by_id_from_db(
     conn: AsyncConnection, indicator_value_id: int
@@ -397,70 +403,141 @@ async def get_hexagons_with_indicators_by_scenario_id_from_db(
     indicators_group_id: int | None,
     user: UserDTO | None,
 ) -> list[HexagonWithIndicatorsDTO]:
-    """Get scenario's indicators values for given regional scenario with hexagons."""
+    """Get scenario's indicators values for given regional scenario with hexagons.
+
+    Indicators values are aggregated per hexagon in the database, so each hexagon geometry is transferred once.
+    """
 
     scenario = await check_scenario(conn, scenario_id, user, return_value=True)
     if not scenario.is_regional:
         raise NotAllowedInProjectScenario()
 
+    values_subquery = _get_hexagons_indicators_values_subquery(scenario_id, indicator_ids, indicators_group_id)
     statement = (
         select(
-            projects_indicators_data.c.value,
-            projects_indicators_data.c.comment,
-            indicators_dict.c.indicator_id,
-            indicators_dict.c.name_full,
-            measurement_units_dict.c.name.label("measurement_unit_name"),
             hexagons_data.c.hexagon_id,
             ST_AsEWKB(hexagons_data.c.geometry).label("geometry"),
             ST_AsEWKB(hexagons_data.c.centre_point).label("centre_point"),
+            values_subquery.c.indicator_ids,
+            values_subquery.c.indicator_values,
+            values_subquery.c.indicator_comments,
+        )
+        .select_from(values_subquery.join(hexagons_data, hexagons_data.c.hexagon_id == values_subquery.c.hexagon_id))
+        .order_by(hexagons_data.c.hexagon_id)
+    )
+    hexagons = (await conn.execute(statement)).mappings().all()
+    if not hexagons:
+        return []
+
+    statement = (
+        select(
+            indicators_dict.c.indicator_id,
+            indicators_dict.c.name_full,
+            measurement_units_dict.c.name.label("measurement_unit_name"),
         )
         .select_from(
-            projects_indicators_data.join(
-                hexagons_data,
-                hexagons_data.c.hexagon_id == projects_indicators_data.c.hexagon_id,
-            )
-            .join(indicators_dict, indicators_dict.c.indicator_id == projects_indicators_data.c.indicator_id)
-            .outerjoin(
+            indicators_dict.outerjoin(
                 measurement_units_dict,
                 measurement_units_dict.c.measurement_unit_id == indicators_dict.c.measurement_unit_id,
             )
-            .outerjoin(
-                indicators_groups_data,
-                indicators_groups_data.c.indicator_id == indicators_dict.c.indicator_id,
-            )
         )
-        .where(projects_indicators_data.c.scenario_id == scenario_id)
-        .order_by(projects_indicators_data.c.indicator_id.asc())
+        .where(indicators_dict.c.indicator_id.in_({ind_id for row in hexagons for ind_id in row["indicator_ids"]}))
     )
+    indicators = {row["indicator_id"]: row for row in (await conn.execute(statement)).mappings().all()}
+
+    return [
+        HexagonWithIndicatorsDTO(
+            hexagon_id=row["hexagon_id"],
+            geometry=row["geometry"],
+            centre_point=row["centre_point"],
+            indicators=[
+                ShortScenarioIndicatorValueDTO(
+                    indicator_id=indicator_id,
+                    name_full=indicators[indicator_id]["name_full"],
+                    measurement_unit_name=indicators[indicator_id]["measurement_unit_name"],
+                    value=value,
+                    comment=comment,
+                )
+                for indicator_id, value, comment in zip(
+                    row["indicator_ids"], row["indicator_values"], row["indicator_comments"]
+                )
+            ],
+        )
+        for row in hexagons
+    ]
 
-    statement = apply_filters(
-        statement,
-        EqFilter(indicators_groups_data, "indicators_group_id", indicators_group_id),
-        InFilter(projects_indicators_data, "indicator_id", indicator_ids),
+
+async def get_hexagons_indicators_matrix_by_scenario_id_from_db(
+    conn: AsyncConnection,
+    scenario_id: int,
+    indicator_ids: set[int] | None,
+    indicators_group_id: int | None,
+    user: UserDTO | None,
+) -> HexagonsIndicatorsMatrixDTO:
+    """Get scenario's indicators values for given regional scenario as a (hexagons x indicators) matrix."""
+
+    scenario = await check_scenario(conn, scenario_id, user, return_value=True)
+    if not scenario.is_regional:
+        raise NotAllowedInProjectScenario()
+
+    values_subquery = _get_hexagons_indicators_values_subquery(scenario_id, indicator_ids, indicators_group_id)
+    statement = select(
+        values_subquery.c.hexagon_id, values_subquery.c.indicator_ids, values_subquery.c.indicator_values
+    ).order_by(values_subquery.c.hexagon_id)
+    hexagons = (await conn.execute(statement)).mappings().all()
+
+    hexagon_ids = [row["hexagon_id"] for row in hexagons]
+    matrix_indicator_ids = sorted({indicator_id for row in hexagons for indicator_id in row["indicator_ids"]})
+    column_index = {indicator_id: j for j, indicator_id in enumerate(matrix_indicator_ids)}
+
+    values = np.full((len(hexagon_ids), len(matrix_indicator_ids)), np.nan)
+    for i, row in enumerate(hexagons):
+        values[i, [column_index[indicator_id] for indicator_id in row["indicator_ids"]]] = row["indicator_values"]
+
+    return HexagonsIndicatorsMatrixDTO(
+        hexagon_ids=hexagon_ids,
+        indicator_ids=matrix_indicator_ids,
+        values=np.where(np.isnan(values), None, values).tolist(),
+    )
+
+
+def _get_hexagons_indicators_values_subquery(
+    scenario_id: int, indicator_ids: set[int] | None, indicators_group_id: int | None
+) -> Subquery:
+    """Get subquery with scenario's indicators identifiers, values and comments aggregated (ordered by indicator
+    identifier) per hexagon."""
+
+    statement = (
+        select(
+            projects_indicators_data.c.hexagon_id,
+            func.array_agg(
+                aggregate_order_by(projects_indicators_data.c.indicator_id, projects_indicators_data.c.indicator_id)
+            ).label("indicator_ids"),
+            func.array_agg(
+                aggregate_order_by(projects_indicators_data.c.value, projects_indicators_data.c.indicator_id)
+            ).label("indicator_values"),
+            func.array_agg(
+                aggregate_order_by(projects_indicators_data.c.comment, projects_indicators_data.c.indicator_id)
+            ).label("indicator_comments"),
+        )
+        .where(
+            projects_indicators_data.c.scenario_id == scenario_id,
+            projects_indicators_data.c.hexagon_id.isnot(None),
+        )
+        .group_by(projects_indicators_data.c.hexagon_id)
     )
-    indicators = (await conn.execute(statement)).mappings().all()
-
-    grouped_data = {}
-    for row in indicators:
-        hexagon_id = row["hexagon_id"]
-        if hexagon_id not in grouped_data:
-            grouped_data[hexagon_id] = {
-                "hexagon_id": hexagon_id,
-                "geometry": row["geometry"],
-                "centre_point": row["centre_point"],
-                "indicators": [],
-            }
-        grouped_data[hexagon_id]["indicators"].append(
-            ShortScenarioIndicatorValueDTO(
-                indicator_id=row["indicator_id"],
-                name_full=row["name_full"],
-                measurement_unit_name=row["measurement_unit_name"],
-                value=row["value"],
-                comment=row["comment"],
+
+    if indicators_group_id is not None:
+        statement = statement.where(
+            projects_indicators_data.c.indicator_id.in_(
+                select(indicators_groups_data.c.indicator_id).where(
+                    indicators_groups_data.c.indicators_group_id == indicators_group_id
+                )
             )
         )
+    statement = apply_filters(statement, InFilter(projects_indicators_data, "indicator_id", indicator_ids))
 
-    return [HexagonWithIndicatorsDTO(**result) for result in list(grouped_data.values())]
+    return statement.subquery()
 
 
 async def update_all_indicators_values_by_scenario_id_to_db(
@@ -75,7 +75,12 @@ from idu_api.urban_api.dto import (
 from idu_api.urban_api.exceptions.logic.common import EntityAlreadyExists, EntityNotFoundById, EntityNotFoundByParams
 from idu_api.urban_api.exceptions.logic.projects import NotAllowedInProjectScenario, NotAllowedInRegionalProject
 from idu_api.urban_api.exceptions.logic.users import AccessDeniedError
-from idu_api.urban_api.logic.impl.helpers.utils import SRID, check_existence, extract_values_from_model
+from idu_api.urban_api.logic.impl.helpers.utils import (
+    SRID,
+    check_existence,
+    extract_values_from_model,
+    intersecting_territories_ids,
+)
 from idu_api.urban_api.minio.services import ProjectStorageManager
 from idu_api.urban_api.schemas import (
     ProjectPatch,
@@ -747,7 +752,10 @@ async def add_context_territories(
                 territory_types_dict, territory_types_dict.c.territory_type_id == territories_data.c.territory_type_id
             )
         )
-        .where(territories_data.c.level == region_level, ST_Intersects(territories_data.c.geometry, buffered_geometry))
+        .where(
+            territories_data.c.level == region_level,
+            territories_data.c.territory_id.in_(intersecting_territories_ids(buffered_geometry)),
+        )
     )
 
     regions = (await conn.execute(intersecting_regions_query)).mappings().all()
@@ -799,7 +807,6 @@ async def _extract_regular_regions_context(
             territories_data.c.name,
             territories_data.c.is_city,
             territories_data.c.level,
-            territories_data.c.geometry,
         )
         .where(territories_data.c.parent_id.in_(region_ids))
         .cte(name="territories_cte", recursive=True)
@@ -810,7 +817,6 @@ async def _extract_regular_regions_context(
         territories_data.c.name,
         territories_data.c.is_city,
         territories_data.c.level,
-        territories_data.c.geometry,
     ).where(territories_data.c.parent_id == base_cte.c.territory_id)
     territories_cte = base_cte.union_all(recursive_cte)
 
@@ -833,20 +839,22 @@ async def _extract_regular_regions_context(
         .distinct()
     )
 
-    # Final selections
+    # Final selections (spatial filters use subdivided territories geometries)
+    intersecting_ids = intersecting_territories_ids(geometry)
+    buffer_intersecting_ids = intersecting_territories_ids(buffered_geometry)
     territories_query = select(territories_cte.c.name).where(
         territories_cte.c.territory_id.in_(parent_territory_ids),
-        ST_Intersects(territories_cte.c.geometry, geometry),
+        territories_cte.c.territory_id.in_(intersecting_ids),
         territories_cte.c.is_city.is_(False),
     )
     districts_query = select(territories_cte.c.name).where(
         territories_cte.c.territory_id.in_(district_ids),
-        ST_Intersects(territories_cte.c.geometry, geometry),
+        territories_cte.c.territory_id.in_(intersecting_ids),
         territories_cte.c.is_city.is_(False),
     )
     context_query = select(territories_cte.c.territory_id).where(
         territories_cte.c.territory_id.in_(parent_territory_ids),
-        ST_Intersects(territories_cte.c.geometry, buffered_geometry),
+        territories_cte.c.territory_id.in_(buffer_intersecting_ids),
         territories_cte.c.is_city.is_(False),
     )
 
@@ -884,7 +892,6 @@ async def _extract_federal_cities_context(
             territories_data.c.territory_type_id,
             territories_data.c.parent_id,
             territories_data.c.name,
-            territories_data.c.geometry,
         )
         .where(territories_data.c.parent_id.in_(region_ids))
         .cte(name="territories_cte", recursive=True)
@@ -894,7 +901,6 @@ async def _extract_federal_cities_context(
         territories_data.c.territory_type_id,
         territories_data.c.parent_id,
         territories_data.c.name,
-        territories_data.c.geometry,
     ).where(territories_data.c.parent_id == base_cte.c.territory_id)
     territories_cte = base_cte.union_all(recursive_cte)
 
@@ -905,7 +911,7 @@ async def _extract_federal_cities_context(
                 territory_types_dict, territory_types_dict.c.territory_type_id == territories_cte.c.territory_type_id
             )
         )
-        .where(ST_Intersects(territories_cte.c.geometry, geometry))
+        .where(territories_cte.c.territory_id.in_(intersecting_territories_ids(geometry)))
     )
     territories_query = base_query.where(territory_types_dict.c.name == "Муниципальное образование")
     districts_query = base_query.where(territory_types_dict.c.name == "Район")
@@ -918,7 +924,7 @@ async def _extract_federal_cities_context(
         )
         .where(
             territory_types_dict.c.name == "Муниципальное образование",
-            ST_Intersects(territories_cte.c.geometry, buffered_geometry),
+            territories_cte.c.territory_id.in_(intersecting_territories_ids(buffered_geometry)),
         )
     )
 
@@ -47,6 +47,7 @@ from idu_api.urban_api.logic.impl.helpers.utils import (
     SRID,
     check_existence,
     extract_values_from_model,
+    get_context_layer_cache,
     get_context_territories_geometry,
     include_child_territories_cte,
 )
@@ -586,7 +587,7 @@ async def get_context_physical_objects_from_db(
 ) -> list[ScenarioPhysicalObjectDTO]:
     """Get list of physical objects for 'context' of the project territory."""
 
-    parent_id, context_geom, context_ids = await get_context_territories_geometry(conn, scenario_id, user)
+    parent_id, context_geom, _ = await get_context_territories_geometry(conn, scenario_id, user)
 
     # Step 1: Get all the public_urban_object_id for a given scenario_id
     public_urban_object_ids = (
@@ -595,70 +596,60 @@ async def get_context_physical_objects_from_db(
         .where(projects_urban_objects_data.c.public_urban_object_id.isnot(None))
     ).cte(name="public_urban_object_ids")
 
-    # Step 2: Find all intersecting object geometries from public (except object from previous step)
-    objects_intersecting = (
-        select(object_geometries_data.c.object_geometry_id)
-        .select_from(
-            object_geometries_data.join(
-                urban_objects_data,
-                urban_objects_data.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
-            )
-        )
-        .where(
-            urban_objects_data.c.urban_object_id.not_in(select(public_urban_object_ids)),
-            object_geometries_data.c.territory_id.in_(context_ids)
-            | ST_Intersects(object_geometries_data.c.geometry, context_geom),
-        )
-        .cte(name="objects_intersecting")
-    )
+    # Step 2: Get public object geometries clipped by context geometry (cached per project)
+    context_objects = await get_context_layer_cache(conn, scenario_id, "object_geometries")
 
     # Step 3: Collect all physical objects from `public` intersecting context geometry
     building_columns = [col for col in buildings_data.c if col.name not in ("physical_object_id", "properties")]
-    public_urban_objects_query = select(
-        physical_objects_data.c.physical_object_id,
-        physical_object_types_dict.c.physical_object_type_id,
-        physical_object_types_dict.c.name.label("physical_object_type_name"),
-        physical_object_functions_dict.c.physical_object_function_id,
-        physical_object_functions_dict.c.name.label("physical_object_function_name"),
-        physical_objects_data.c.name,
-        physical_objects_data.c.properties,
-        physical_objects_data.c.created_at,
-        physical_objects_data.c.updated_at,
-        *building_columns,
-        buildings_data.c.properties.label("building_properties"),
-        territories_data.c.territory_id,
-        territories_data.c.name.label("territory_name"),
-        literal(False).label("is_scenario_object"),
-    ).select_from(
-        urban_objects_data.join(
-            physical_objects_data,
-            physical_objects_data.c.physical_object_id == urban_objects_data.c.physical_object_id,
-        )
-        .join(
-            object_geometries_data,
-            object_geometries_data.c.object_geometry_id == urban_objects_data.c.object_geometry_id,
-        )
-        .join(
-            objects_intersecting,
-            objects_intersecting.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
-        )
-        .join(
-            territories_data,
-            territories_data.c.territory_id == object_geometries_data.c.territory_id,
-        )
-        .join(
-            physical_object_types_dict,
-            physical_object_types_dict.c.physical_object_type_id == physical_objects_data.c.physical_object_type_id,
-        )
-        .join(
-            physical_object_functions_dict,
-            physical_object_functions_dict.c.physical_object_function_id
-            == physical_object_types_dict.c.physical_object_function_id,
+    public_urban_objects_query = (
+        select(
+            physical_objects_data.c.physical_object_id,
+            physical_object_types_dict.c.physical_object_type_id,
+            physical_object_types_dict.c.name.label("physical_object_type_name"),
+            physical_object_functions_dict.c.physical_object_function_id,
+            physical_object_functions_dict.c.name.label("physical_object_function_name"),
+            physical_objects_data.c.name,
+            physical_objects_data.c.properties,
+            physical_objects_data.c.created_at,
+            physical_objects_data.c.updated_at,
+            *building_columns,
+            buildings_data.c.properties.label("building_properties"),
+            territories_data.c.territory_id,
+            territories_data.c.name.label("territory_name"),
+            literal(False).label("is_scenario_object"),
         )
-        .outerjoin(
-            buildings_data,
-            buildings_data.c.physical_object_id == physical_objects_data.c.physical_object_id,
+        .select_from(
+            urban_objects_data.join(
+                physical_objects_data,
+                physical_objects_data.c.physical_object_id == urban_objects_data.c.physical_object_id,
+            )
+            .join(
+                object_geometries_data,
+                object_geometries_data.c.object_geometry_id == urban_objects_data.c.object_geometry_id,
+            )
+            .join(
+                context_objects,
+                context_objects.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
+            )
+            .join(
+                territories_data,
+                territories_data.c.territory_id == object_geometries_data.c.territory_id,
+            )
+            .join(
+                physical_object_types_dict,
+                physical_object_types_dict.c.physical_object_type_id == physical_objects_data.c.physical_object_type_id,
+            )
+            .join(
+                physical_object_functions_dict,
+                physical_object_functions_dict.c.physical_object_function_id
+                == physical_object_types_dict.c.physical_object_function_id,
+            )
+            .outerjoin(
+                buildings_data,
+                buildings_data.c.physical_object_id == physical_objects_data.c.physical_object_id,
+            )
         )
+        .where(urban_objects_data.c.urban_object_id.not_in(select(public_urban_object_ids)))
     )
 
     # Step 4: Collect all physical objects from parent regional scenario intersecting context geometry
@@ -827,7 +818,7 @@ async def get_context_physical_objects_with_geometry_from_db(
 ) -> list[ScenarioPhysicalObjectWithGeometryDTO]:
     """Get list of physical objects with geometry for 'context' of the project territory."""
 
-    parent_id, context_geom, context_ids = await get_context_territories_geometry(conn, project_id, user)
+    parent_id, context_geom, _ = await get_context_territories_geometry(conn, project_id, user)
 
     # Step 1: Get all the public_urban_object_id for a given scenario_id
     public_urban_object_ids = (
@@ -836,25 +827,10 @@ async def get_context_physical_objects_with_geometry_from_db(
         .where(projects_urban_objects_data.c.public_urban_object_id.isnot(None))
     ).cte(name="public_urban_object_ids")
 
-    # Step 2: Find all intersecting object geometries from public (except object from previous step)
-    objects_intersecting = (
-        select(object_geometries_data.c.object_geometry_id)
-        .select_from(
-            object_geometries_data.join(
-                urban_objects_data,
-                urban_objects_data.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
-            )
-        )
-        .where(
-            urban_objects_data.c.urban_object_id.not_in(select(public_urban_object_ids)),
-            object_geometries_data.c.territory_id.in_(context_ids)
-            | ST_Intersects(object_geometries_data.c.geometry, context_geom),
-        )
-        .cte(name="objects_intersecting")
-    )
+    # Step 2: Get public object geometries clipped by context geometry (cached per project)
+    context_objects = await get_context_layer_cache(conn, project_id, "object_geometries")
 
     # Step 3: Collect all physical objects from `public` intersecting context geometry
-    intersected_geom = ST_Intersection(object_geometries_data.c.geometry, context_geom)
     building_columns = [col for col in buildings_data.c if col.name not in ("physical_object_id", "properties")]
     public_urban_objects_query = (
         select(
@@ -872,8 +848,8 @@ async def get_context_physical_objects_with_geometry_from_db(
             object_geometries_data.c.object_geometry_id,
             object_geometries_data.c.address,
             object_geometries_data.c.osm_id,
-            ST_AsEWKB(intersected_geom).label("geometry"),
-            ST_AsEWKB(ST_Centroid(intersected_geom)).label("centre_point"),
+            ST_AsEWKB(context_objects.c.geometry).label("geometry"),
+            ST_AsEWKB(context_objects.c.centre_point).label("centre_point"),
             territories_data.c.territory_id,
             territories_data.c.name.label("territory_name"),
             literal(False).label("is_scenario_physical_object"),
@@ -889,8 +865,8 @@ async def get_context_physical_objects_with_geometry_from_db(
                 object_geometries_data.c.object_geometry_id == urban_objects_data.c.object_geometry_id,
             )
             .join(
-                objects_intersecting,
-                objects_intersecting.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
+                context_objects,
+                context_objects.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
             )
             .join(
                 territories_data,
@@ -910,7 +886,7 @@ async def get_context_physical_objects_with_geometry_from_db(
                 buildings_data.c.physical_object_id == physical_objects_data.c.physical_object_id,
             )
         )
-        .where(~ST_IsEmpty(intersected_geom))
+        .where(urban_objects_data.c.urban_object_id.not_in(select(public_urban_object_ids)))
         .distinct()
     )
 
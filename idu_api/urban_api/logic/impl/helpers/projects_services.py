@@ -2,7 +2,7 @@
 
 from collections import defaultdict
 
-from geoalchemy2.functions import ST_AsEWKB, ST_Centroid, ST_Intersection, ST_Intersects, ST_IsEmpty, ST_Within
+from geoalchemy2.functions import ST_AsEWKB, ST_Centroid, ST_Intersection, ST_IsEmpty, ST_Within
 from sqlalchemy import delete, insert, literal, or_, select, union_all, update
 from sqlalchemy.ext.asyncio import AsyncConnection
 from sqlalchemy.sql.functions import coalesce
@@ -36,6 +36,7 @@ from idu_api.urban_api.logic.impl.helpers.projects_urban_objects import get_scen
 from idu_api.urban_api.logic.impl.helpers.utils import (
     check_existence,
     extract_values_from_model,
+    get_context_layer_cache,
     get_context_territories_geometry,
     include_child_territories_cte,
 )
@@ -461,7 +462,7 @@ async def get_context_services_from_db(
 ) -> list[ScenarioServiceDTO]:
     """Get list of services for 'context' of the project territory."""
 
-    parent_id, context_geom, context_ids = await get_context_territories_geometry(conn, scenario_id, user)
+    parent_id, context_geom, _ = await get_context_territories_geometry(conn, scenario_id, user)
 
     # Step 1: Get all the public_urban_object_id for a given scenario_id
     public_urban_object_ids = (
@@ -470,71 +471,61 @@ async def get_context_services_from_db(
         .where(projects_urban_objects_data.c.public_urban_object_id.isnot(None))
     ).cte(name="public_urban_object_ids")
 
-    # Step 2: Find all intersecting object geometries from public (except object from previous step)
-    objects_intersecting = (
-        select(object_geometries_data.c.object_geometry_id)
-        .select_from(
-            object_geometries_data.join(
-                urban_objects_data,
-                urban_objects_data.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
-            )
-        )
-        .where(
-            urban_objects_data.c.urban_object_id.not_in(select(public_urban_object_ids)),
-            object_geometries_data.c.territory_id.in_(context_ids)
-            | ST_Intersects(object_geometries_data.c.geometry, context_geom),
-        )
-        .cte(name="objects_intersecting")
-    )
+    # Step 2: Get public object geometries clipped by context geometry (cached per project)
+    context_objects = await get_context_layer_cache(conn, scenario_id, "object_geometries")
 
     # Step 3: Collect all services from `public` intersecting context geometry
-    public_services_query = select(
-        services_data.c.service_id,
-        services_data.c.name,
-        services_data.c.capacity,
-        services_data.c.is_capacity_real,
-        services_data.c.properties,
-        services_data.c.created_at,
-        services_data.c.updated_at,
-        service_types_dict.c.service_type_id,
-        service_types_dict.c.urban_function_id,
-        urban_functions_dict.c.name.label("urban_function_name"),
-        service_types_dict.c.name.label("service_type_name"),
-        service_types_dict.c.capacity_modeled.label("service_type_capacity_modeled"),
-        service_types_dict.c.code.label("service_type_code"),
-        service_types_dict.c.infrastructure_type,
-        service_types_dict.c.properties.label("service_type_properties"),
-        territory_types_dict.c.territory_type_id,
-        territory_types_dict.c.name.label("territory_type_name"),
-        territories_data.c.territory_id,
-        territories_data.c.name.label("territory_name"),
-        literal(False).label("is_scenario_object"),
-    ).select_from(
-        urban_objects_data.join(services_data, services_data.c.service_id == urban_objects_data.c.service_id)
-        .join(
-            object_geometries_data,
-            object_geometries_data.c.object_geometry_id == urban_objects_data.c.object_geometry_id,
-        )
-        .join(
-            objects_intersecting,
-            objects_intersecting.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
-        )
-        .join(
-            territories_data,
-            territories_data.c.territory_id == object_geometries_data.c.territory_id,
-        )
-        .join(
-            service_types_dict,
-            service_types_dict.c.service_type_id == services_data.c.service_type_id,
-        )
-        .outerjoin(
-            territory_types_dict,
-            territory_types_dict.c.territory_type_id == services_data.c.territory_type_id,
+    public_services_query = (
+        select(
+            services_data.c.service_id,
+            services_data.c.name,
+            services_data.c.capacity,
+            services_data.c.is_capacity_real,
+            services_data.c.properties,
+            services_data.c.created_at,
+            services_data.c.updated_at,
+            service_types_dict.c.service_type_id,
+            service_types_dict.c.urban_function_id,
+            urban_functions_dict.c.name.label("urban_function_name"),
+            service_types_dict.c.name.label("service_type_name"),
+            service_types_dict.c.capacity_modeled.label("service_type_capacity_modeled"),
+            service_types_dict.c.code.label("service_type_code"),
+            service_types_dict.c.infrastructure_type,
+            service_types_dict.c.properties.label("service_type_properties"),
+            territory_types_dict.c.territory_type_id,
+            territory_types_dict.c.name.label("territory_type_name"),
+            territories_data.c.territory_id,
+            territories_data.c.name.label("territory_name"),
+            literal(False).label("is_scenario_object"),
         )
-        .join(
-            urban_functions_dict,
-            urban_functions_dict.c.urban_function_id == service_types_dict.c.urban_function_id,
+        .select_from(
+            urban_objects_data.join(services_data, services_data.c.service_id == urban_objects_data.c.service_id)
+            .join(
+                object_geometries_data,
+                object_geometries_data.c.object_geometry_id == urban_objects_data.c.object_geometry_id,
+            )
+            .join(
+                context_objects,
+                context_objects.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
+            )
+            .join(
+                territories_data,
+                territories_data.c.territory_id == object_geometries_data.c.territory_id,
+            )
+            .join(
+                service_types_dict,
+                service_types_dict.c.service_type_id == services_data.c.service_type_id,
+            )
+            .outerjoin(
+                territory_types_dict,
+                territory_types_dict.c.territory_type_id == services_data.c.territory_type_id,
+            )
+            .join(
+                urban_functions_dict,
+                urban_functions_dict.c.urban_function_id == service_types_dict.c.urban_function_id,
+            )
         )
+        .where(urban_objects_data.c.urban_object_id.not_in(select(public_urban_object_ids)))
     )
 
     # Step 4: Collect all services from parent regional scenario intersecting context geometry
@@ -649,7 +640,7 @@ async def get_context_services_with_geometry_from_db(
 ) -> list[ScenarioServiceWithGeometryDTO]:
     """Get list of services with geometry for 'context' of the project territory."""
 
-    parent_id, context_geom, context_ids = await get_context_territories_geometry(conn, scenario_id, user)
+    parent_id, context_geom, _ = await get_context_territories_geometry(conn, scenario_id, user)
 
     # Step 1: Get all the public_urban_object_id for a given scenario_id
     public_urban_object_ids = (
@@ -658,25 +649,10 @@ async def get_context_services_with_geometry_from_db(
         .where(projects_urban_objects_data.c.public_urban_object_id.isnot(None))
     ).cte(name="public_urban_object_ids")
 
-    # Step 2: Find all intersecting object geometries from public (except object from previous step)
-    objects_intersecting = (
-        select(object_geometries_data.c.object_geometry_id)
-        .select_from(
-            object_geometries_data.join(
-                urban_objects_data,
-                urban_objects_data.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
-            )
-        )
-        .where(
-            urban_objects_data.c.urban_object_id.not_in(select(public_urban_object_ids)),
-            object_geometries_data.c.territory_id.in_(context_ids)
-            | ST_Intersects(object_geometries_data.c.geometry, context_geom),
-        )
-        .cte(name="objects_intersecting")
-    )
+    # Step 2: Get public object geometries clipped by context geometry (cached per project)
+    context_objects = await get_context_layer_cache(conn, scenario_id, "object_geometries")
 
     # Step 3: Collect all services from `public` intersecting context geometry
-    intersected_geom = ST_Intersection(object_geometries_data.c.geometry, context_geom)
     public_services_query = (
         select(
             services_data.c.service_id,
@@ -699,8 +675,8 @@ async def get_context_services_with_geometry_from_db(
             object_geometries_data.c.object_geometry_id,
             object_geometries_data.c.address,
             object_geometries_data.c.osm_id,
-            ST_AsEWKB(intersected_geom).label("geometry"),
-            ST_AsEWKB(ST_Centroid(intersected_geom)).label("centre_point"),
+            ST_AsEWKB(context_objects.c.geometry).label("geometry"),
+            ST_AsEWKB(context_objects.c.centre_point).label("centre_point"),
             territories_data.c.territory_id,
             territories_data.c.name.label("territory_name"),
             literal(False).label("is_scenario_service"),
@@ -713,8 +689,8 @@ async def get_context_services_with_geometry_from_db(
                 object_geometries_data.c.object_geometry_id == urban_objects_data.c.object_geometry_id,
             )
             .join(
-                objects_intersecting,
-                objects_intersecting.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
+                context_objects,
+                context_objects.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
             )
             .join(
                 territories_data,
@@ -733,7 +709,7 @@ async def get_context_services_with_geometry_from_db(
                 urban_functions_dict.c.urban_function_id == service_types_dict.c.urban_function_id,
             )
         )
-        .where(~ST_IsEmpty(intersected_geom))
+        .where(urban_objects_data.c.urban_object_id.not_in(select(public_urban_object_ids)))
         .distinct()
     )
 
@@ -0,0 +1,90 @@
+"""Search by name internal logic is defined here."""
+
+from typing import Callable, Literal
+
+from sqlalchemy import ColumnElement, Float, func, select
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from idu_api.common.db.entities import physical_objects_data, projects_data, services_data, territories_data
+from idu_api.urban_api.dto import SearchResultDTO, UserDTO
+
+func: Callable
+
+SearchEntity = Literal["territories", "physical_objects", "services", "projects"]
+SearchMode = Literal["substring", "prefix", "fuzzy"]
+
+
+def escape_like(value: str) -> str:
+    """Escape LIKE pattern special characters, so the value is matched literally."""
+
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def name_condition(column: ColumnElement, query: str, mode: SearchMode) -> ColumnElement:
+    """Build name matching condition, all of the modes are resolved with trigram GIN index (for the query
+    of 3 symbols or longer).
+
+    Args:
+        column (ColumnElement): Text column to match.
+        query (str): Query string.
+        mode (SearchMode): `substring` - case-insensitive substring, `prefix` - case-insensitive prefix,
+            `fuzzy` - trigram similarity is greater than `pg_trgm.similarity_threshold` (0.3 by default).
+    """
+
+    if mode == "fuzzy":
+        return column.op("%")(query)
+    if mode == "prefix":
+        return column.ilike(f"{escape_like(query)}%")
+    return column.ilike(f"%{escape_like(query)}%")
+
+
+async def search_by_name_from_db(
+    conn: AsyncConnection,
+    query: str,
+    entity_type: SearchEntity | None,
+    mode: SearchMode,
+    limit: int,
+    user: UserDTO | None,
+) -> list[SearchResultDTO]:
+    """Search territories, physical objects, services and projects by name.
+
+    Results are ranked by trigram similarity of the name to the query (the most similar first).
+    Only public projects and projects of the user are searched.
+    """
+
+    if user is None:
+        projects_visibility = projects_data.c.public.is_(True)
+    elif user.is_superuser:
+        projects_visibility = True
+    else:
+        projects_visibility = (projects_data.c.user_id == user.id) | projects_data.c.public.is_(True)
+
+    sources: dict[str, tuple[ColumnElement, ColumnElement, list]] = {
+        "territories": (territories_data.c.territory_id, territories_data.c.name, []),
+        "physical_objects": (physical_objects_data.c.physical_object_id, physical_objects_data.c.name, []),
+        "services": (services_data.c.service_id, services_data.c.name, []),
+        "projects": (
+            projects_data.c.project_id,
+            projects_data.c.name,
+            [projects_data.c.is_regional.is_(False), projects_visibility],
+        ),
+    }
+
+    results: list[SearchResultDTO] = []
+    for entity, (id_column, name_column, conditions) in sources.items():
+        if entity_type is not None and entity != entity_type:
+            continue
+
+        rank = func.similarity(name_column, query, type_=Float)
+        statement = (
+            select(id_column.label("id"), name_column.label("name"), rank.label("rank"))
+            .where(name_condition(name_column, query, mode), *conditions)
+            .order_by(rank.desc(), id_column)
+            .limit(limit)
+        )
+        rows = (await conn.execute(statement)).mappings().all()
+        results.extend(SearchResultDTO(entity_type=entity, **row) for row in rows)
+
+    results.sort(key=lambda result: result.rank, reverse=True)
+
+    return results[:limit]
@@ -25,7 +25,14 @@ from idu_api.urban_api.dto import (
     UrbanFunctionDTO,
 )
 from idu_api.urban_api.exceptions.logic.common import EntitiesNotFoundByIds, EntityAlreadyExists, EntityNotFoundById
-from idu_api.urban_api.logic.impl.helpers.utils import build_recursive_query, check_existence, extract_values_from_model
+from idu_api.urban_api.logic.impl.helpers.utils import (
+    CachedTypesHierarchy,
+    build_recursive_query,
+    build_types_hierarchy,
+    check_existence,
+    extract_values_from_model,
+    get_tables_version,
+)
 from idu_api.urban_api.schemas import (
     ServiceTypePatch,
     ServiceTypePost,
@@ -38,6 +45,12 @@ from idu_api.urban_api.utils.query_filters import EqFilter, ILikeFilter, apply_f
 
 func: Callable
 
+SERVICE_TYPES_HIERARCHY_SOURCE_TABLES = ("urban_functions_dict", "service_types_dict")
+"""Tables which service types hierarchy depends on (tracked in `public.tables_versions_data`)."""
+
+_service_types_hierarchy_cache: CachedTypesHierarchy | None = None
+"""Urban functions and service types with the full hierarchy for the source tables version they were loaded for."""
+
 
 async def get_service_types_from_db(
     conn: AsyncConnection,
@@ -373,14 +386,15 @@ async def delete_urban_function_from_db(conn: AsyncConnection, urban_function_id
     return {"status": "ok"}
 
 
-async def get_service_types_hierarchy_from_db(
-    conn: AsyncConnection, ids: set[int] | None
-) -> list[ServiceTypesHierarchyDTO]:
-    """Get service types hierarchy (from top-level urban function to service type)
-    based on a list of required service type ids.
+async def _get_service_types_hierarchy_source(conn: AsyncConnection) -> CachedTypesHierarchy:
+    """Get urban functions, service types and the full hierarchy, reloading them only if source tables changed."""
 
-    If the list of identifiers was not passed, it returns the full hierarchy.
-    """
+    global _service_types_hierarchy_cache  # pylint: disable=global-statement
+
+    version = await get_tables_version(conn, SERVICE_TYPES_HIERARCHY_SOURCE_TABLES)
+    cached = _service_types_hierarchy_cache
+    if cached is not None and cached.version == version:
+        return cached
 
     statement = (
         select(service_types_dict, urban_functions_dict.c.name.label("urban_function_name"))
@@ -392,38 +406,48 @@ async def get_service_types_hierarchy_from_db(
         )
         .order_by(service_types_dict.c.service_type_id)
     )
+    service_types = [ServiceTypeDTO(**s) for s in (await conn.execute(statement)).mappings().all()]
 
-    if ids is not None:
-        query = select(service_types_dict.c.service_type_id).where(service_types_dict.c.service_type_id.in_(ids))
-        service_types = (await conn.execute(query)).scalars().all()
-        if len(list(service_types)) < len(ids):
-            raise EntitiesNotFoundByIds("service_type")
-        statement = statement.where(service_types_dict.c.service_type_id.in_(ids))
+    statement = select(urban_functions_dict).order_by(
+        urban_functions_dict.c.level, urban_functions_dict.c.urban_function_id
+    )
+    urban_functions = list((await conn.execute(statement)).mappings().all())
+
+    cached = CachedTypesHierarchy(
+        version=version,
+        functions=urban_functions,
+        types=service_types,
+        type_ids=frozenset(s.service_type_id for s in service_types),
+        full=build_types_hierarchy(urban_functions, service_types, "urban_function_id", ServiceTypesHierarchyDTO),
+    )
+    _service_types_hierarchy_cache = cached
 
-    service_types = (await conn.execute(statement)).mappings().all()
+    return cached
 
-    statement = select(urban_functions_dict).order_by(urban_functions_dict.c.level)
-    urban_functions = (await conn.execute(statement)).mappings().all()
 
-    def build_filtered_hierarchy(parent_id: int = None) -> list[ServiceTypesHierarchyDTO]:
-        children = []
-        for uf in [uf for uf in urban_functions if uf.parent_id == parent_id]:
-            filtered_children = build_filtered_hierarchy(uf.urban_function_id)
+async def get_service_types_hierarchy_from_db(
+    conn: AsyncConnection, ids: set[int] | None
+) -> list[ServiceTypesHierarchyDTO]:
+    """Get service types hierarchy (from top-level urban function to service type)
+    based on a list of required service type ids.
 
-            relevant_service_types = [
-                ServiceTypeDTO(**s) for s in service_types if s.urban_function_id == uf.urban_function_id
-            ]
+    If the list of identifiers was not passed, it returns the full hierarchy.
+    """
 
-            if filtered_children or relevant_service_types:
-                children.append(
-                    ServiceTypesHierarchyDTO(
-                        **uf, children=filtered_children if filtered_children else relevant_service_types
-                    )
-                )
+    cached = await _get_service_types_hierarchy_source(conn)
 
-        return children
+    if ids is None:
+        return cached.full
 
-    return build_filtered_hierarchy()
+    if not ids <= cached.type_ids:
+        raise EntitiesNotFoundByIds("service_type")
+
+    return build_types_hierarchy(
+        cached.functions,
+        [s for s in cached.types if s.service_type_id in ids],
+        "urban_function_id",
+        ServiceTypesHierarchyDTO,
+    )
 
 
 async def get_physical_object_types_by_service_type_id_from_db(
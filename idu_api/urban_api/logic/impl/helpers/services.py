@@ -2,7 +2,9 @@
 
 from typing import Callable
 
-from sqlalchemy import delete, insert, select, update
+from geoalchemy2.functions import ST_AsEWKB, ST_GeomFromWKB
+from shapely.geometry import LineString, MultiPolygon, Point, Polygon
+from sqlalchemy import delete, insert, select, text, update
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from idu_api.common.db.entities import (
@@ -14,13 +16,20 @@ from idu_api.common.db.entities import (
     urban_functions_dict,
     urban_objects_data,
 )
-from idu_api.urban_api.dto import ServiceDTO, UrbanObjectDTO
+from idu_api.urban_api.dto import ServiceDTO, ServiceWithGeometryDTO, UrbanObjectDTO
 from idu_api.urban_api.exceptions.logic.common import EntityAlreadyExists, EntityNotFoundById, EntityNotFoundByParams
 from idu_api.urban_api.logic.impl.helpers.urban_objects import get_urban_objects_by_ids_from_db
-from idu_api.urban_api.logic.impl.helpers.utils import check_existence, extract_values_from_model
+from idu_api.urban_api.logic.impl.helpers.utils import (
+    SRID,
+    check_existence,
+    distance_order,
+    extract_values_from_model,
+    within_distance,
+)
 from idu_api.urban_api.schemas import ServicePatch, ServicePost, ServicePut
 
 func: Callable
+Geom = Point | Polygon | MultiPolygon | LineString
 
 
 async def get_service_by_id_from_db(conn: AsyncConnection, service_id: int) -> ServiceDTO:
@@ -72,6 +81,87 @@ async def get_service_by_id_from_db(conn: AsyncConnection, service_id: int) -> S
     return ServiceDTO(**service, territories=territories)
 
 
+async def get_nearest_services_from_db(
+    conn: AsyncConnection,
+    geometry: Geom,
+    service_type_id: int | None,
+    limit: int,
+    max_distance_meters: int | None,
+) -> list[ServiceWithGeometryDTO]:
+    """Get the nearest services (by their objects geometries) to the given geometry, sorted by distance.
+
+    Service could be linked to several geometries, so the nearest geometry of each service is chosen
+    before the limit is applied.
+    """
+
+    given_geometry = select(ST_GeomFromWKB(geometry.wkb, text(str(SRID)))).scalar_subquery()
+    distance = distance_order(object_geometries_data.c.geometry, given_geometry)
+
+    nearest = (
+        select(
+            urban_objects_data.c.service_id,
+            urban_objects_data.c.object_geometry_id,
+            distance.label("distance"),
+        )
+        .select_from(
+            urban_objects_data.join(services_data, services_data.c.service_id == urban_objects_data.c.service_id).join(
+                object_geometries_data,
+                object_geometries_data.c.object_geometry_id == urban_objects_data.c.object_geometry_id,
+            )
+        )
+        .distinct(urban_objects_data.c.service_id)
+        .order_by(urban_objects_data.c.service_id, distance)
+    )
+    if service_type_id is not None:
+        nearest = nearest.where(services_data.c.service_type_id == service_type_id)
+    if max_distance_meters is not None:
+        nearest = nearest.where(within_distance(object_geometries_data.c.geometry, given_geometry, max_distance_meters))
+    nearest = nearest.subquery("nearest")
+
+    statement = (
+        select(
+            services_data,
+            service_types_dict.c.urban_function_id,
+            urban_functions_dict.c.name.label("urban_function_name"),
+            service_types_dict.c.name.label("service_type_name"),
+            service_types_dict.c.capacity_modeled.label("service_type_capacity_modeled"),
+            service_types_dict.c.code.label("service_type_code"),
+            service_types_dict.c.infrastructure_type,
+            service_types_dict.c.properties.label("service_type_properties"),
+            territory_types_dict.c.name.label("territory_type_name"),
+            object_geometries_data.c.object_geometry_id,
+            object_geometries_data.c.address,
+            object_geometries_data.c.osm_id,
+            ST_AsEWKB(object_geometries_data.c.geometry).label("geometry"),
+            ST_AsEWKB(object_geometries_data.c.centre_point).label("centre_point"),
+            territories_data.c.territory_id,
+            territories_data.c.name.label("territory_name"),
+        )
+        .select_from(
+            nearest.join(services_data, services_data.c.service_id == nearest.c.service_id)
+            .join(
+                object_geometries_data,
+                nearest.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
+            )
+            .join(territories_data, territories_data.c.territory_id == object_geometries_data.c.territory_id)
+            .join(service_types_dict, service_types_dict.c.service_type_id == services_data.c.service_type_id)
+            .join(
+                urban_functions_dict,
+                service_types_dict.c.urban_function_id == urban_functions_dict.c.urban_function_id,
+            )
+            .outerjoin(
+                territory_types_dict, territory_types_dict.c.territory_type_id == services_data.c.territory_type_id
+            )
+        )
+        .order_by(nearest.c.distance, nearest.c.service_id)
+        .limit(limit)
+    )
+
+    result = (await conn.execute(statement)).mappings().all()
+
+    return [ServiceWithGeometryDTO(**service) for service in result]
+
+
 async def add_service_to_db(conn: AsyncConnection, service: ServicePost) -> ServiceDTO:
     """Create service object."""
 
@@ -1,25 +1,39 @@
 """Territories buffers internal logic is defined here."""
 
-from geoalchemy2.functions import ST_AsEWKB
-from sqlalchemy import select
+from collections.abc import Callable
+
+from geoalchemy2 import Geography, Geometry
+from geoalchemy2.functions import ST_Area, ST_AsEWKB, ST_GeomFromWKB, ST_Intersection, ST_Intersects
+from shapely.geometry import MultiPolygon, Polygon
+from sqlalchemy import Boolean, Float, cast, column, exists, func, null, select, text
 from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.sql.selectable import CTE
 
 from idu_api.common.db.entities import (
     buffer_types_dict,
     buffers_data,
+    hexagons_data,
     object_geometries_data,
     physical_object_types_dict,
     physical_objects_data,
+    service_coverage_data,
+    service_coverage_versions_data,
     service_types_dict,
     services_data,
     territories_data,
     urban_objects_data,
 )
-from idu_api.urban_api.dto import BufferDTO
+from idu_api.urban_api.dto import BufferDTO, HexagonServiceCoverageDTO, ServiceCoverageDTO
 from idu_api.urban_api.exceptions.logic.common import EntityNotFoundById
-from idu_api.urban_api.logic.impl.helpers.utils import check_existence, include_child_territories_cte
+from idu_api.urban_api.logic.impl.helpers.utils import SRID, check_existence, include_child_territories_cte
 from idu_api.urban_api.utils.query_filters import CustomFilter, EqFilter, apply_filters
 
+func: Callable
+
+# Services coverages (territory_id, service_type_id, buffer_type_id) found out of date on read, they are rebuilt
+# in background.
+_service_coverage_refresh_requests: set[tuple[int, int, int]] = set()
+
 
 async def get_buffers_by_territory_id_from_db(
     conn: AsyncConnection,
@@ -95,3 +109,162 @@ async def get_buffers_by_territory_id_from_db(
     result = (await conn.execute(statement)).mappings().all()
 
     return [BufferDTO(**buffer) for buffer in result]
+
+
+async def get_service_coverage_by_territory_id_from_db(
+    conn: AsyncConnection,
+    territory_id: int,
+    service_type_id: int,
+    buffer_type_id: int,
+    include_hexagons: bool,
+) -> ServiceCoverageDTO:
+    """Get union of buffers of the given service type for a territory (and its child territories).
+
+    Coverage is taken from `service_coverage_data` if it is up to date. Otherwise it is calculated on the fly and
+    requested to be rebuilt in background (see `refresh_service_coverages`), so this function does not write anything.
+    Coverages are invalidated by triggers only for the territories which intersect changed objects.
+    """
+
+    if not await check_existence(conn, territories_data, conditions={"territory_id": territory_id}):
+        raise EntityNotFoundById(territory_id, "territory")
+
+    if not await check_existence(conn, service_types_dict, conditions={"service_type_id": service_type_id}):
+        raise EntityNotFoundById(service_type_id, "service type")
+
+    if not await check_existence(conn, buffer_types_dict, conditions={"buffer_type_id": buffer_type_id}):
+        raise EntityNotFoundById(buffer_type_id, "buffer type")
+
+    coverage = await _get_service_coverage_cte(conn, territory_id, service_type_id, buffer_type_id)
+
+    statement = select(
+        territories_data.c.territory_id,
+        territories_data.c.name.label("territory_name"),
+        service_types_dict.c.service_type_id,
+        service_types_dict.c.name.label("service_type_name"),
+        buffer_types_dict.c.buffer_type_id,
+        buffer_types_dict.c.name.label("buffer_type_name"),
+        ST_AsEWKB(coverage.c.geometry).label("geometry"),
+        coverage.c.territory_area,
+        coverage.c.covered_area,
+        coverage.c.services_count,
+        coverage.c.built_at,
+    ).where(
+        territories_data.c.territory_id == territory_id,
+        service_types_dict.c.service_type_id == service_type_id,
+        buffer_types_dict.c.buffer_type_id == buffer_type_id,
+    )
+
+    result = ServiceCoverageDTO(**(await conn.execute(statement)).mappings().one())
+
+    if include_hexagons:
+        # geometry is passed back instead of the CTE, so that coverage calculated on the fly is not calculated again
+        result.hexagons = await _get_hexagons_service_coverage_from_db(conn, territory_id, result.geometry)
+
+    return result
+
+
+async def refresh_service_coverages(conn: AsyncConnection) -> int:
+    """Persist services coverages which `_get_service_coverage_cte` had to calculate on the fly,
+    return the number of written coverages.
+
+    `public.refresh_service_coverage` compares the territory version with the persisted one again under an advisory
+    lock, so coverages written by another worker since the request are not calculated twice. Every coverage is
+    committed on its own to keep the lock short.
+    """
+
+    requests = sorted(_service_coverage_refresh_requests)
+    _service_coverage_refresh_requests.clear()
+
+    rebuilt = 0
+    for territory_id, service_type_id, buffer_type_id in requests:
+        statement = select(
+            func.public.refresh_service_coverage(territory_id, service_type_id, buffer_type_id, type_=Boolean)
+        )
+        rebuilt += int((await conn.execute(statement)).scalar_one())
+        await conn.commit()
+
+    return rebuilt
+
+
+####################################################################################
+#                            Helper functions                                      #
+####################################################################################
+
+
+async def _get_service_coverage_cte(
+    conn: AsyncConnection,
+    territory_id: int,
+    service_type_id: int,
+    buffer_type_id: int,
+) -> CTE:
+    """Get CTE with the single row of persisted service coverage if it is up to date, or with the coverage
+    calculated on the fly (and requested to be rebuilt) otherwise."""
+
+    key = (
+        (service_coverage_data.c.territory_id == territory_id)
+        & (service_coverage_data.c.service_type_id == service_type_id)
+        & (service_coverage_data.c.buffer_type_id == buffer_type_id)
+    )
+    statement = select(
+        exists()
+        .where(
+            key,
+            service_coverage_versions_data.c.territory_id == service_coverage_data.c.territory_id,
+            service_coverage_versions_data.c.version == service_coverage_data.c.built_version,
+        )
+        .label("is_actual")
+    )
+    if (await conn.execute(statement)).scalar_one():
+        return (
+            select(
+                service_coverage_data.c.geometry,
+                service_coverage_data.c.territory_area,
+                service_coverage_data.c.covered_area,
+                service_coverage_data.c.services_count,
+                service_coverage_data.c.built_at,
+            )
+            .where(key)
+            .cte(name="coverage")
+        )
+
+    _service_coverage_refresh_requests.add((territory_id, service_type_id, buffer_type_id))
+    calculated = func.public.calculate_service_coverage(territory_id, service_type_id, buffer_type_id).table_valued(
+        *[
+            column(name, service_coverage_data.c[name].type)
+            for name in ("geometry", "territory_area", "covered_area", "services_count")
+        ]
+    )
+    return select(*calculated.c, func.now().label("built_at")).cte(name="coverage")
+
+
+async def _get_hexagons_service_coverage_from_db(
+    conn: AsyncConnection,
+    territory_id: int,
+    geometry: Polygon | MultiPolygon | None,
+) -> list[HexagonServiceCoverageDTO]:
+    """Get covered area of every hexagon of the territory based on the (already unioned) coverage geometry."""
+
+    coverage_geometry = (
+        ST_GeomFromWKB(geometry.wkb, text(str(SRID))) if geometry is not None else cast(null(), Geometry(srid=SRID))
+    )
+    coverage = select(coverage_geometry.label("geometry")).cte(name="coverage")
+    statement = (
+        select(
+            hexagons_data.c.hexagon_id,
+            ST_Area(cast(hexagons_data.c.geometry, Geography(srid=SRID)), type_=Float).label("hexagon_area"),
+            func.coalesce(
+                ST_Area(
+                    cast(ST_Intersection(hexagons_data.c.geometry, coverage.c.geometry), Geography(srid=SRID)),
+                    type_=Float,
+                ),
+                0,
+            ).label("covered_area"),
+        )
+        .select_from(hexagons_data.outerjoin(coverage, ST_Intersects(hexagons_data.c.geometry, coverage.c.geometry)))
+        .where(hexagons_data.c.territory_id == territory_id)
+        .order_by(hexagons_data.c.hexagon_id)
+    )
+
+    result = (await conn.execute(statement)).mappings().all()
+
+    return [HexagonServiceCoverageDTO(**hexagon) for hexagon in result]
@@ -7,7 +7,9 @@ from sqlalchemy.ext.asyncio import AsyncConnection
 from idu_api.common.db.entities import functional_zone_types_dict, functional_zones_data, territories_data
 from idu_api.urban_api.dto import FunctionalZoneDTO, FunctionalZoneSourceDTO
 from idu_api.urban_api.exceptions.logic.common import EntityNotFoundById
-from idu_api.urban_api.logic.impl.helpers.utils import check_existence, include_child_territories_cte
+from idu_api.urban_api.logic.impl.helpers.utils import check_existence, include_child_territories_cte, lod_geometry
+from idu_api.urban_api.utils.bbox import BBox
+from idu_api.urban_api.utils.query_filters import BBoxFilter, apply_filters
 
 
 async def get_functional_zones_sources_by_territory_id_from_db(
@@ -39,8 +41,16 @@ async def get_functional_zones_by_territory_id_from_db(
     functional_zone_type_id: int | None,
     include_child_territories: bool,
     cities_only: bool,
+    simplify_tolerance: float | None = None,
+    precision: int | None = None,
+    bbox: BBox | None = None,
+    limit: int | None = None,
 ) -> list[FunctionalZoneDTO]:
-    """Get functional zones with geometry by territory id."""
+    """Get functional zones with geometry by territory id.
+
+    Geometries can be simplified with `simplify_tolerance` and rounded to `precision` decimal digits.
+    Zones can be limited to the ones intersecting `bbox` and to the first `limit` ones (by identifier).
+    """
 
     if not await check_existence(conn, territories_data, conditions={"territory_id": territory_id}):
         raise EntityNotFoundById(territory_id, "territory")
@@ -55,7 +65,7 @@ async def get_functional_zones_by_territory_id_from_db(
             functional_zone_types_dict.c.zone_nickname.label("functional_zone_type_nickname"),
             functional_zone_types_dict.c.description.label("functional_zone_type_description"),
             functional_zones_data.c.name,
-            ST_AsEWKB(functional_zones_data.c.geometry).label("geometry"),
+            ST_AsEWKB(lod_geometry(functional_zones_data.c.geometry, simplify_tolerance, precision)).label("geometry"),
             functional_zones_data.c.year,
             functional_zones_data.c.source,
             functional_zones_data.c.properties,
@@ -83,6 +93,11 @@ async def get_functional_zones_by_territory_id_from_db(
     if functional_zone_type_id is not None:
         statement = statement.where(functional_zones_data.c.functional_zone_type_id == functional_zone_type_id)
 
+    statement = apply_filters(statement, BBoxFilter(functional_zones_data, "geometry", bbox))
+
+    if limit is not None:
+        statement = statement.order_by(functional_zones_data.c.functional_zone_id).limit(limit)
+
     result = (await conn.execute(statement)).mappings().all()
 
     return [FunctionalZoneDTO(**zone) for zone in result]
@@ -5,7 +5,8 @@ from datetime import date
 from typing import Callable
 
 from geoalchemy2.functions import ST_AsEWKB
-from sqlalchemy import func, select
+from sqlalchemy import CTE, Float, Integer, Select, case, cast, exists, func, literal, literal_column, select, true
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from idu_api.common.db.entities import (
@@ -15,9 +16,15 @@ from idu_api.common.db.entities import (
     physical_object_types_dict,
     service_types_dict,
     territories_data,
+    territory_indicators_aggregates_data,
     territory_indicators_data,
 )
-from idu_api.urban_api.dto import IndicatorDTO, IndicatorValueDTO, TerritoryWithIndicatorsDTO
+from idu_api.urban_api.dto import (
+    AggregatedIndicatorValueDTO,
+    IndicatorDTO,
+    IndicatorValueDTO,
+    TerritoryWithIndicatorsDTO,
+)
 from idu_api.urban_api.exceptions.logic.common import EntityNotFoundById
 from idu_api.urban_api.logic.impl.helpers.utils import (
     check_existence,
@@ -313,3 +320,255 @@ async def get_indicator_values_by_parent_id_from_db(
         )
         for territory_id, rows in territories.items()
     ]
+
+
+async def get_aggregated_indicator_values_by_territory_id_from_db(  # pylint: disable=too-many-arguments
+    conn: AsyncConnection,
+    territory_id: int,
+    indicator_ids: set[int],
+    level: int | None,
+    value_type: str,
+    aggregation_type: str,
+    weight_indicator_id: int | None,
+    date_value: date | None,
+    persistent: bool,
+) -> list[AggregatedIndicatorValueDTO]:
+    """Get indicator values of the territory (or of its sub-territories at the given level)
+    aggregated up the territories hierarchy.
+
+    Own value of the territory is used if it is present, otherwise values of the closest descendants which have
+    values are aggregated. Last values (or last values not later than `date_value`) are taken.
+
+    If `persistent` is set, aggregates of the last values are taken from (and saved to) the aggregates table.
+    """
+
+    if not await check_existence(conn, territories_data, conditions={"territory_id": territory_id}):
+        raise EntityNotFoundById(territory_id, "territory")
+
+    targets_cte = _get_target_territories_cte(territory_id, level)
+
+    if persistent and date_value is None:
+        aggregates = territory_indicators_aggregates_data
+        aggregated = _aggregate_indicator_values_query(
+            targets_cte, indicator_ids, value_type, aggregation_type, weight_indicator_id, None, skip_persisted=True
+        )
+        statement = insert(aggregates).from_select(
+            [
+                "territory_id",
+                "indicator_id",
+                "value_type",
+                "aggregation_type",
+                "weight_indicator_id",
+                "value",
+                "territories_count",
+                "date_value",
+            ],
+            aggregated,
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[
+                aggregates.c.territory_id,
+                aggregates.c.indicator_id,
+                aggregates.c.value_type,
+                aggregates.c.aggregation_type,
+                func.coalesce(aggregates.c.weight_indicator_id, literal_column("0")),
+            ],
+            set_={
+                "value": statement.excluded.value,
+                "territories_count": statement.excluded.territories_count,
+                "date_value": statement.excluded.date_value,
+                "built_at": func.now(),
+            },
+        )
+        await conn.execute(statement)
+        await conn.commit()
+
+        source = (
+            select(
+                aggregates.c.territory_id,
+                aggregates.c.indicator_id,
+                aggregates.c.value_type,
+                aggregates.c.aggregation_type,
+                aggregates.c.weight_indicator_id,
+                aggregates.c.value,
+                aggregates.c.territories_count,
+                aggregates.c.date_value,
+            )
+            .where(
+                aggregates.c.territory_id.in_(select(targets_cte.c.territory_id)),
+                aggregates.c.indicator_id.in_(indicator_ids),
+                aggregates.c.value_type == value_type,
+                aggregates.c.aggregation_type == aggregation_type,
+                aggregates.c.weight_indicator_id.is_not_distinct_from(weight_indicator_id),
+            )
+            .subquery("aggregates")
+        )
+    else:
+        source = _aggregate_indicator_values_query(
+            targets_cte, indicator_ids, value_type, aggregation_type, weight_indicator_id, date_value
+        ).subquery("aggregates")
+
+    statement = (
+        select(
+            source.c.territory_id,
+            territories_data.c.name.label("territory_name"),
+            source.c.indicator_id,
+            indicators_dict.c.parent_id,
+            indicators_dict.c.name_full,
+            measurement_units_dict.c.measurement_unit_id,
+            measurement_units_dict.c.name.label("measurement_unit_name"),
+            indicators_dict.c.level,
+            indicators_dict.c.list_label,
+            source.c.value_type,
+            source.c.aggregation_type,
+            source.c.weight_indicator_id,
+            source.c.value,
+            source.c.territories_count,
+            source.c.date_value,
+        )
+        .select_from(
+            source.join(territories_data, territories_data.c.territory_id == source.c.territory_id)
+            .join(indicators_dict, indicators_dict.c.indicator_id == source.c.indicator_id)
+            .outerjoin(
+                measurement_units_dict,
+                measurement_units_dict.c.measurement_unit_id == indicators_dict.c.measurement_unit_id,
+            )
+        )
+        .order_by(source.c.territory_id, source.c.indicator_id)
+    )
+
+    result = (await conn.execute(statement)).mappings().all()
+
+    return [AggregatedIndicatorValueDTO(**value) for value in result]
+
+
+def _get_target_territories_cte(territory_id: int, level: int | None) -> CTE:
+    """Get CTE with the given territory or its sub-territories at the given level."""
+
+    if level is None:
+        return select(territories_data.c.territory_id).where(territories_data.c.territory_id == territory_id).cte()
+
+    territories_cte = (
+        select(territories_data.c.territory_id, territories_data.c.level)
+        .where(territories_data.c.territory_id == territory_id)
+        .cte(recursive=True)
+    )
+    territories_cte = territories_cte.union_all(
+        select(territories_data.c.territory_id, territories_data.c.level).where(
+            territories_data.c.parent_id == territories_cte.c.territory_id,
+            territories_cte.c.level < level,
+        )
+    )
+
+    return select(territories_cte.c.territory_id).where(territories_cte.c.level == level).cte("target_territories")
+
+
+def _aggregate_indicator_values_query(  # pylint: disable=too-many-arguments
+    targets_cte: CTE,
+    indicator_ids: set[int],
+    value_type: str,
+    aggregation_type: str,
+    weight_indicator_id: int | None,
+    date_value: date | None,
+    skip_persisted: bool = False,
+) -> Select:
+    """Build query aggregating last indicator values for each pair of target territory and indicator.
+
+    Descendants are walked top-down in one recursive pass, which stops at territories having own value,
+    so values of nested territories are never counted twice.
+    """
+
+    values_indicator_ids = set(indicator_ids)
+    if weight_indicator_id is not None:
+        values_indicator_ids.add(weight_indicator_id)
+
+    last_values = (
+        select(
+            territory_indicators_data.c.territory_id,
+            territory_indicators_data.c.indicator_id,
+            territory_indicators_data.c.value,
+            territory_indicators_data.c.date_value,
+        )
+        .where(
+            territory_indicators_data.c.indicator_id.in_(values_indicator_ids),
+            territory_indicators_data.c.value_type == value_type,
+        )
+        .distinct(territory_indicators_data.c.territory_id, territory_indicators_data.c.indicator_id)
+        .order_by(
+            territory_indicators_data.c.territory_id,
+            territory_indicators_data.c.indicator_id,
+            territory_indicators_data.c.date_value.desc(),
+        )
+    )
+    if date_value is not None:
+        last_values = last_values.where(territory_indicators_data.c.date_value <= date_value)
+    last_values = last_values.cte("last_values")
+
+    anchor = (
+        select(
+            targets_cte.c.territory_id.label("root_id"),
+            indicators_dict.c.indicator_id,
+            targets_cte.c.territory_id,
+        )
+        .select_from(targets_cte.join(indicators_dict, true()))
+        .where(indicators_dict.c.indicator_id.in_(indicator_ids))
+    )
+    if skip_persisted:
+        aggregates = territory_indicators_aggregates_data
+        anchor = anchor.where(
+            ~exists().where(
+                aggregates.c.territory_id == targets_cte.c.territory_id,
+                aggregates.c.indicator_id == indicators_dict.c.indicator_id,
+                aggregates.c.value_type == value_type,
+                aggregates.c.aggregation_type == aggregation_type,
+                aggregates.c.weight_indicator_id.is_not_distinct_from(weight_indicator_id),
+            )
+        )
+    frontier_cte = anchor.cte("frontier", recursive=True)
+    frontier_cte = frontier_cte.union_all(
+        select(frontier_cte.c.root_id, frontier_cte.c.indicator_id, territories_data.c.territory_id)
+        .select_from(
+            frontier_cte.join(territories_data, territories_data.c.parent_id == frontier_cte.c.territory_id).outerjoin(
+                last_values,
+                (last_values.c.territory_id == frontier_cte.c.territory_id)
+                & (last_values.c.indicator_id == frontier_cte.c.indicator_id),
+            )
+        )
+        .where(last_values.c.territory_id.is_(None))
+    )
+
+    values = last_values.alias("frontier_values")
+    select_from = frontier_cte.outerjoin(
+        values,
+        (values.c.territory_id == frontier_cte.c.territory_id) & (values.c.indicator_id == frontier_cte.c.indicator_id),
+    )
+    if aggregation_type == "sum":
+        aggregated_value = func.sum(values.c.value)
+    elif aggregation_type == "avg":
+        aggregated_value = func.avg(values.c.value)
+    else:
+        weights = last_values.alias("weights")
+        select_from = select_from.outerjoin(
+            weights,
+            (weights.c.territory_id == frontier_cte.c.territory_id) & (weights.c.indicator_id == weight_indicator_id),
+        )
+        aggregated_value = func.sum(values.c.value * weights.c.value) / func.nullif(
+            func.sum(case((values.c.value.is_not(None), weights.c.value))), 0, type_=Float
+        )
+
+    return (
+        select(
+            frontier_cte.c.root_id.label("territory_id"),
+            frontier_cte.c.indicator_id,
+            cast(value_type, territory_indicators_aggregates_data.c.value_type.type).label("value_type"),
+            cast(aggregation_type, territory_indicators_aggregates_data.c.aggregation_type.type).label(
+                "aggregation_type"
+            ),
+            literal(weight_indicator_id, Integer).label("weight_indicator_id"),
+            aggregated_value.label("value"),
+            func.count(values.c.value).label("territories_count"),
+            func.max(values.c.date_value).label("date_value"),
+        )
+        .select_from(select_from)
+        .group_by(frontier_cte.c.root_id, frontier_cte.c.indicator_id)
+    )
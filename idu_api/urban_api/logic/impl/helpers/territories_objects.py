@@ -1,22 +1,30 @@
 """Territories objects internal logic is defined here."""
 
-from datetime import date
+from datetime import date, datetime, timedelta
+from operator import attrgetter
 from typing import Callable, Literal
 
+import numpy as np
+import shapely
 import shapely.geometry as geom
-from geoalchemy2.functions import ST_AsEWKB, ST_GeomFromWKB
-from sqlalchemy import func, insert, select, text, update
+from geoalchemy2.functions import ST_GeomFromWKB
+from sqlalchemy import TIMESTAMP, Date, cast, func, insert, literal, select, text, update
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from idu_api.common.db.entities import target_city_types_dict, territories_data, territory_types_dict
 from idu_api.urban_api.dto import PageDTO, TerritoryDTO, TerritoryWithoutGeometryDTO
 from idu_api.urban_api.exceptions.logic.common import EntitiesNotFoundByIds, EntityNotFoundById, TooManyObjectsError
+from idu_api.urban_api.logic.impl.helpers.territories_spatial_index import get_territories_spatial_index
+from idu_api.urban_api.logic.impl.helpers.territories_tree import get_territories_tree
 from idu_api.urban_api.logic.impl.helpers.utils import (
     OBJECTS_NUMBER_LIMIT,
     SRID,
     build_recursive_query,
     check_existence,
     extract_values_from_model,
+    geometry_columns,
+    intersecting_territories_ids,
+    simplified_territory_geometry,
 )
 from idu_api.urban_api.schemas import TerritoryPatch, TerritoryPost, TerritoryPut
 from idu_api.urban_api.utils.pagination import paginate_dto
@@ -26,14 +34,30 @@ func: Callable
 Geom = geom.Polygon | geom.MultiPolygon | geom.Point | geom.LineString | geom.MultiLineString
 
 
-async def get_territories_by_ids(conn: AsyncConnection, ids: list[int]) -> list[TerritoryDTO]:
-    """Get territory objects by ids list."""
+async def get_territories_by_ids(
+    conn: AsyncConnection,
+    ids: list[int],
+    centers_only: bool = False,
+    simplify_tolerance: float | None = None,
+    precision: int | None = None,
+) -> list[TerritoryDTO]:
+    """Get territory objects by ids list (only with centre points if `centers_only` is set).
+
+    Geometries can be simplified with `simplify_tolerance` and rounded to `precision` decimal digits.
+    """
 
     if len(ids) > OBJECTS_NUMBER_LIMIT:
         raise TooManyObjectsError(len(ids), OBJECTS_NUMBER_LIMIT)
 
     territories_data_parents = territories_data.alias("territories_data_parents")
     admin_centers = territories_data.alias("admin_centers")
+    geometry, centre_point = geometry_columns(
+        territories_data,
+        centers_only,
+        simplify_tolerance=simplify_tolerance,
+        precision=precision,
+        simplified_geometry=simplified_territory_geometry(territories_data, simplify_tolerance),
+    )
     statement = (
         select(
             territories_data.c.territory_id,
@@ -42,10 +66,10 @@ async def get_territories_by_ids(conn: AsyncConnection, ids: list[int]) -> list[
             territories_data.c.parent_id,
             territories_data_parents.c.name.label("parent_name"),
             territories_data.c.name,
-            ST_AsEWKB(territories_data.c.geometry).label("geometry"),
+            geometry,
             territories_data.c.level,
             territories_data.c.properties,
-            ST_AsEWKB(territories_data.c.centre_point).label("centre_point"),
+            centre_point,
             territories_data.c.admin_center_id,
             admin_centers.c.name.label("admin_center_name"),
             territories_data.c.target_city_type_id,
@@ -206,9 +230,17 @@ async def get_territories_by_parent_id_from_db(
     order_by: Literal["created_at", "updated_at"] | None,
     ordering: Literal["asc", "desc"] | None,
     paginate: bool,
+    centers_only: bool = False,
+    with_geometry: bool = True,
+    simplify_tolerance: float | None = None,
+    precision: int | None = None,
 ) -> list[TerritoryDTO] | PageDTO[TerritoryDTO]:
     """Get a territory or list of territories by parent,
-    ordering and filters can be specified in parameters."""
+    ordering and filters can be specified in parameters.
+
+    Geometries which are not needed (`centers_only` or not `with_geometry`) are not selected at all,
+    the others can be simplified with `simplify_tolerance` and rounded to `precision` decimal digits.
+    """
 
     if parent_id is not None:
         if not await check_existence(conn, territories_data, conditions={"territory_id": parent_id}):
@@ -229,6 +261,14 @@ async def get_territories_by_parent_id_from_db(
     requested_territories = statement.cte("requested_territories")
     territories_data_parents = territories_data.alias("territories_data_parents")
     admin_centers = territories_data.alias("admin_centers")
+    geometry, centre_point = geometry_columns(
+        requested_territories,
+        centers_only,
+        with_geometry,
+        simplify_tolerance=simplify_tolerance,
+        precision=precision,
+        simplified_geometry=simplified_territory_geometry(requested_territories, simplify_tolerance),
+    )
     statement = select(
         requested_territories.c.territory_id,
         requested_territories.c.territory_type_id,
@@ -236,10 +276,10 @@ async def get_territories_by_parent_id_from_db(
         requested_territories.c.parent_id,
         territories_data_parents.c.name.label("parent_name"),
         requested_territories.c.name,
-        ST_AsEWKB(requested_territories.c.geometry).label("geometry"),
+        geometry,
         requested_territories.c.level,
         requested_territories.c.properties,
-        ST_AsEWKB(requested_territories.c.centre_point).label("centre_point"),
+        centre_point,
         requested_territories.c.admin_center_id,
         admin_centers.c.name.label("admin_center_name"),
         requested_territories.c.target_city_type_id,
@@ -293,6 +333,19 @@ async def get_territories_by_parent_id_from_db(
     return [TerritoryDTO(**territory) for territory in result]
 
 
+async def _get_day_bounds(conn: AsyncConnection, day: date) -> tuple[datetime, datetime]:
+    """Get start of the given day and of the next one in the session time zone,
+    so that `date(timestamp) = day` is the same as `start <= timestamp < end`."""
+
+    statement = select(
+        cast(literal(day, Date), TIMESTAMP(timezone=True)).label("day_start"),
+        cast(literal(day + timedelta(days=1), Date), TIMESTAMP(timezone=True)).label("day_end"),
+    )
+    day_start, day_end = (await conn.execute(statement)).one()
+
+    return day_start, day_end
+
+
 async def get_territories_without_geometry_by_parent_id_from_db(
     conn: AsyncConnection,
     parent_id: int | None,
@@ -307,8 +360,29 @@ async def get_territories_without_geometry_by_parent_id_from_db(
 ) -> list[TerritoryWithoutGeometryDTO] | PageDTO[TerritoryWithoutGeometryDTO]:
     """Get a territory or list of territories without geometry by parent,
     ordering and filters can be specified in parameters.
+
+    Not paginated lists are taken from the in-memory territories tree.
     """
 
+    if not paginate:
+        tree = await get_territories_tree(conn)
+        if parent_id is not None and parent_id not in tree:
+            raise EntityNotFoundById(parent_id, "territory")
+
+        territories = tree.descendants(parent_id) if get_all_levels else tree.children(parent_id)
+        territories = [
+            t
+            for t in territories
+            if (not cities_only or t.is_city)
+            and (name is None or name.lower() in t.name.lower())
+            and (territory_type_id is None or t.territory_type_id == territory_type_id)
+        ]
+        if created_at is not None:
+            day_start, day_end = await _get_day_bounds(conn, created_at)
+            territories = [t for t in territories if day_start <= t.created_at < day_end]
+
+        return sorted(territories, key=attrgetter(order_by or "territory_id"), reverse=ordering == "desc")
+
     if parent_id is not None:
         if not await check_existence(conn, territories_data, conditions={"territory_id": parent_id}):
             raise EntityNotFoundById(parent_id, "territory")
@@ -382,22 +456,32 @@ async def get_territories_without_geometry_by_parent_id_from_db(
 
     statement = statement.order_by(order_column)
 
-    if paginate:
-        return await paginate_dto(
-            conn, statement, transformer=lambda x: [TerritoryWithoutGeometryDTO(**item) for item in x]
-        )
-
-    result = (await conn.execute(statement)).mappings().all()
-
-    return [TerritoryWithoutGeometryDTO(**territory) for territory in result]
+    return await paginate_dto(
+        conn, statement, transformer=lambda x: [TerritoryWithoutGeometryDTO(**item) for item in x]
+    )
 
 
 async def get_common_territory_for_geometry(conn: AsyncConnection, geometry: Geom) -> TerritoryDTO | None:
     """Get the deepest territory which covers given geometry. None if there is no such territory."""
 
+    if isinstance(geometry, geom.Point):
+        # point is covered by a territory if it is covered by any of its pieces, so in-memory index is exact here
+        territories = (await get_territories_for_points_from_db(conn, [(geometry.x, geometry.y)]))[0]
+        return await get_territory_by_id(conn, territories[-1].territory_id) if territories else None
+
+    given_geometry = select(ST_GeomFromWKB(geometry.wkb, text(str(SRID))).label("geometry")).cte("given_geometry")
+
+    # only territories with intersecting subdivided pieces and with bounding box containing the bounding box
+    # of the given geometry (`~` operator, resolved by GiST index) are checked with the full geometry
     statement = (
         select(territories_data.c.territory_id)
-        .where(func.ST_Covers(territories_data.c.geometry, ST_GeomFromWKB(geometry.wkb, text(str(SRID)))))
+        .where(
+            territories_data.c.territory_id.in_(
+                intersecting_territories_ids(select(given_geometry.c.geometry).scalar_subquery())
+            ),
+            territories_data.c.geometry.op("~")(select(given_geometry.c.geometry).scalar_subquery()),
+            func.ST_Covers(territories_data.c.geometry, select(given_geometry.c.geometry).scalar_subquery()),
+        )
         .order_by(territories_data.c.level.desc())
         .limit(1)
     )
@@ -426,17 +510,36 @@ async def get_intersecting_territories_for_geometry(
         .scalar_subquery()
     )
 
-    given_geometry = select(ST_GeomFromWKB(geometry.wkb, text(str(SRID)))).cte("given_geometry")
+    given_geometry = select(ST_GeomFromWKB(geometry.wkb, text(str(SRID))).label("geometry")).cte("given_geometry")
 
+    # intersection with subdivided pieces also covers the cases when one geometry contains another
     statement = select(territories_data.c.territory_id).where(
         territories_data.c.level == level_subquery,
-        (
-            func.ST_Intersects(territories_data.c.geometry, select(given_geometry).scalar_subquery())
-            | func.ST_Covers(select(given_geometry).scalar_subquery(), territories_data.c.geometry)
-            | func.ST_Covers(territories_data.c.geometry, select(given_geometry).scalar_subquery())
+        territories_data.c.territory_id.in_(
+            intersecting_territories_ids(select(given_geometry.c.geometry).scalar_subquery())
         ),
     )
 
     territory_ids = (await conn.execute(statement)).scalars().all()
 
     return await get_territories_by_ids(conn, territory_ids)
+
+
+async def get_territories_for_points_from_db(
+    conn: AsyncConnection, points: list[tuple[float, float]]
+) -> list[list[TerritoryWithoutGeometryDTO]]:
+    """Get chains of territories (from the top-level one to the deepest one) covering each of the given points
+    (longitude and latitude in EPSG:4326), empty chain if point is outside all territories.
+
+    Points are resolved by in-memory spatial index of subdivided territories geometries.
+    """
+
+    index = await get_territories_spatial_index(conn)
+    tree = await get_territories_tree(conn)
+
+    territories_ids = index.covering_territories_ids(shapely.points(np.array(points, dtype=float).reshape(-1, 2)))
+
+    return [
+        sorted((tree.get(territory_id) for territory_id in ids if territory_id in tree), key=attrgetter("level"))
+        for ids in territories_ids
+    ]
@@ -3,7 +3,6 @@
 from collections import defaultdict
 from typing import Literal, Sequence
 
-from geoalchemy2.functions import ST_AsEWKB
 from sqlalchemy import RowMapping, select
 from sqlalchemy.ext.asyncio import AsyncConnection
 
@@ -18,9 +17,21 @@ from idu_api.common.db.entities import (
 )
 from idu_api.urban_api.dto import PageDTO, PhysicalObjectDTO, PhysicalObjectTypeDTO, PhysicalObjectWithGeometryDTO
 from idu_api.urban_api.exceptions.logic.common import EntityNotFoundById
-from idu_api.urban_api.logic.impl.helpers.utils import check_existence, include_child_territories_cte
+from idu_api.urban_api.logic.impl.helpers.utils import (
+    check_existence,
+    geometry_columns,
+    include_child_territories_cte,
+)
+from idu_api.urban_api.utils.bbox import BBox
 from idu_api.urban_api.utils.pagination import paginate_dto
-from idu_api.urban_api.utils.query_filters import CustomFilter, EqFilter, ILikeFilter, RecursiveFilter, apply_filters
+from idu_api.urban_api.utils.query_filters import (
+    BBoxFilter,
+    CustomFilter,
+    EqFilter,
+    ILikeFilter,
+    RecursiveFilter,
+    apply_filters,
+)
 
 
 async def get_physical_object_types_by_territory_id_from_db(
@@ -197,15 +208,24 @@ async def get_physical_objects_with_geometry_by_territory_id_from_db(
     order_by: Literal["created_at", "updated_at"] | None,
     ordering: Literal["asc", "desc"] | None = "asc",
     paginate: bool = False,
+    centers_only: bool = False,
+    with_geometry: bool = True,
+    bbox: BBox | None = None,
+    limit: int | None = None,
 ) -> list[PhysicalObjectWithGeometryDTO] | PageDTO[PhysicalObjectWithGeometryDTO]:
     """Get physical objects with geometry by territory id,
-    optional physical object type and physical_object_function_id."""
+    optional physical object type and physical_object_function_id.
+
+    Geometries which are not needed (`centers_only` or not `with_geometry`) are not selected at all.
+    Objects can be limited to the ones intersecting `bbox` and (if not paginated) to the first `limit` ones.
+    """
 
     if not await check_existence(conn, territories_data, conditions={"territory_id": territory_id}):
         raise EntityNotFoundById(territory_id, "territory")
 
     building_columns = [col for col in buildings_data.c if col.name not in ("physical_object_id", "properties")]
 
+    geometry, centre_point = geometry_columns(object_geometries_data, centers_only, with_geometry)
     statement = (
         select(
             physical_objects_data,
@@ -215,8 +235,8 @@ async def get_physical_objects_with_geometry_by_territory_id_from_db(
             object_geometries_data.c.object_geometry_id,
             object_geometries_data.c.address,
             object_geometries_data.c.osm_id,
-            ST_AsEWKB(object_geometries_data.c.geometry).label("geometry"),
-            ST_AsEWKB(object_geometries_data.c.centre_point).label("centre_point"),
+            geometry,
+            centre_point,
             *building_columns,
             buildings_data.c.properties.label("building_properties"),
             territories_data.c.territory_id,
@@ -268,6 +288,7 @@ async def get_physical_objects_with_geometry_by_territory_id_from_db(
             physical_object_functions_dict,
         ),
         ILikeFilter(physical_objects_data, "name", name),
+        BBoxFilter(object_geometries_data, "geometry", bbox),
     )
 
     order_column = {
@@ -285,6 +306,9 @@ async def get_physical_objects_with_geometry_by_territory_id_from_db(
             conn, statement, transformer=lambda x: [PhysicalObjectWithGeometryDTO(**item) for item in x]
         )
 
+    if limit is not None:
+        statement = statement.limit(limit)
+
     result = (await conn.execute(statement)).mappings().all()
 
     return [PhysicalObjectWithGeometryDTO(**phys_obj) for phys_obj in result]
@@ -0,0 +1,314 @@
+"""Territories services provision internal logic is defined here."""
+
+from collections.abc import Callable, Sequence
+from datetime import date
+
+import numpy as np
+from cachetools import LRUCache
+from sqlalchemy import RowMapping, extract, select
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from idu_api.common.db.entities import (
+    service_types_dict,
+    service_types_normatives_data,
+    territories_data,
+    territory_indicators_data,
+    territory_services_rollup_data,
+)
+from idu_api.urban_api.dto import ServiceProvisionDTO
+from idu_api.urban_api.exceptions.logic.common import EntityNotFoundById
+from idu_api.urban_api.logic.impl.helpers.utils import check_existence, get_tables_version
+
+func: Callable
+
+POPULATION_INDICATOR_ID = 1
+"""Identifier of the population indicator in `indicators_dict`."""
+
+PROVISION_SOURCE_TABLES = (
+    "territories_data",
+    "territory_services_rollup_data",
+    "territory_indicators_data",
+    "service_types_normatives_data",
+)
+"""Tables which services provision depends on (tracked in `public.tables_versions_data`)."""
+
+_provision_cache: LRUCache = LRUCache(maxsize=1024)
+"""Calculated provision by (territory_id, level, year, service_type_id) with the source version it was built for."""
+
+
+async def get_services_provision_by_territory_id_from_db(
+    conn: AsyncConnection,
+    territory_id: int,
+    level: int,
+    year: int | None,
+    service_type_id: int | None,
+) -> list[ServiceProvisionDTO]:
+    """Get required (by normatives and population) and actual number and capacity of services
+    for sub-territories of given territory at the given level.
+
+    Results are cached in memory until any of the source tables is changed.
+    """
+
+    if not await check_existence(conn, territories_data, conditions={"territory_id": territory_id}):
+        raise EntityNotFoundById(territory_id, "territory")
+
+    if year is None:
+        year = date.today().year
+
+    source_version = await get_tables_version(conn, PROVISION_SOURCE_TABLES)
+
+    key = (territory_id, level, year, service_type_id)
+    cached = _provision_cache.get(key)
+    if cached is not None and cached[0] == source_version:
+        return cached[1]
+
+    result = await _calculate_services_provision(conn, territory_id, level, year, service_type_id)
+    _provision_cache[key] = (source_version, result)
+
+    return result
+
+
+####################################################################################
+#                            Helper functions                                      #
+####################################################################################
+
+
+async def _calculate_services_provision(  # pylint: disable=too-many-locals
+    conn: AsyncConnection,
+    territory_id: int,
+    level: int,
+    year: int,
+    service_type_id: int | None,
+) -> list[ServiceProvisionDTO]:
+    """Calculate provision for all pairs of territories at the given level and service types with normatives
+    over aligned (territories x service types) arrays."""
+
+    territories = await _get_territories_with_ancestors(conn, territory_id, level)
+    target_territories = [territory for territory in territories if territory["level"] == level]
+    if not target_territories:
+        return []
+    parents = {territory["territory_id"]: territory["parent_id"] for territory in territories}
+    target_ids = [territory["territory_id"] for territory in target_territories]
+
+    normatives = await _get_last_normatives(conn, list(parents), year)
+    service_types = await _get_service_types_with_normatives(conn, normatives, service_type_id)
+    if not service_types:
+        return []
+
+    territory_index = {tid: i for i, tid in enumerate(target_ids)}
+    service_type_index = {service_type["service_type_id"]: j for j, service_type in enumerate(service_types)}
+    shape = (len(target_ids), len(service_types))
+
+    # normatives defined for the territory itself: service type normative overrides urban function one
+    own_normatives: dict[int, tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+    urban_functions = np.array([service_type["urban_function_id"] or 0 for service_type in service_types])
+    for normative in sorted(normatives, key=lambda n: n["service_type_id"] is not None):
+        found, per_1000, capacity_per_1000 = own_normatives.setdefault(
+            normative["territory_id"],
+            (np.zeros(shape[1], dtype=bool), np.full(shape[1], np.nan), np.full(shape[1], np.nan)),
+        )
+        if normative["service_type_id"] is not None:
+            mask = np.zeros(shape[1], dtype=bool)
+            if normative["service_type_id"] in service_type_index:
+                mask[service_type_index[normative["service_type_id"]]] = True
+        else:
+            mask = urban_functions == normative["urban_function_id"]
+        found[mask] = True
+        per_1000[mask] = (
+            np.nan if normative["services_per_1000_normative"] is None else normative["services_per_1000_normative"]
+        )
+        capacity_per_1000[mask] = (
+            np.nan
+            if normative["services_capacity_per_1000_normative"] is None
+            else normative["services_capacity_per_1000_normative"]
+        )
+
+    # effective normative is the one of the territory itself or of its closest ancestor
+    has_normative = np.zeros(shape, dtype=bool)
+    normative_territory = np.zeros(shape, dtype=np.int64)
+    per_1000 = np.full(shape, np.nan)
+    capacity_per_1000 = np.full(shape, np.nan)
+    for tid, i in territory_index.items():
+        current = tid
+        while current is not None and not has_normative[i].all():
+            if current in own_normatives:
+                found, own_per_1000, own_capacity_per_1000 = own_normatives[current]
+                take = found & ~has_normative[i]
+                has_normative[i, take] = True
+                normative_territory[i, take] = current
+                per_1000[i, take] = own_per_1000[take]
+                capacity_per_1000[i, take] = own_capacity_per_1000[take]
+            current = parents.get(current)
+
+    population = np.full(shape[0], np.nan)
+    for row in await _get_population(conn, target_ids, year):
+        population[territory_index[row["territory_id"]]] = row["value"]
+
+    count = np.zeros(shape, dtype=np.int64)
+    capacity = np.zeros(shape, dtype=np.int64)
+    statement = select(
+        territory_services_rollup_data.c.territory_id,
+        territory_services_rollup_data.c.service_type_id,
+        territory_services_rollup_data.c.count,
+        territory_services_rollup_data.c.capacity,
+    ).where(
+        territory_services_rollup_data.c.territory_id.in_(target_ids),
+        territory_services_rollup_data.c.service_type_id.in_(list(service_type_index)),
+    )
+    for row in (await conn.execute(statement)).mappings().all():
+        i, j = territory_index[row["territory_id"]], service_type_index[row["service_type_id"]]
+        count[i, j], capacity[i, j] = row["count"], row["capacity"]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        required_count = population[:, None] * per_1000 / 1000
+        required_capacity = population[:, None] * capacity_per_1000 / 1000
+        provision = np.where(
+            required_capacity > 0,
+            capacity / required_capacity,
+            np.where(required_count > 0, count / required_count, np.nan),
+        )
+
+    def to_optional(value: float) -> float | None:
+        return None if np.isnan(value) else float(value)
+
+    return [
+        ServiceProvisionDTO(
+            territory_id=target_territories[i]["territory_id"],
+            territory_name=target_territories[i]["name"],
+            service_type_id=service_types[j]["service_type_id"],
+            service_type_name=service_types[j]["name"],
+            year=year,
+            population=to_optional(population[i]),
+            normative_territory_id=int(normative_territory[i, j]),
+            services_per_1000_normative=to_optional(per_1000[i, j]),
+            services_capacity_per_1000_normative=to_optional(capacity_per_1000[i, j]),
+            count=int(count[i, j]),
+            capacity=int(capacity[i, j]),
+            required_count=to_optional(required_count[i, j]),
+            required_capacity=to_optional(required_capacity[i, j]),
+            provision=to_optional(provision[i, j]),
+        )
+        for i, j in np.argwhere(has_normative)
+    ]
+
+
+async def _get_territories_with_ancestors(conn: AsyncConnection, territory_id: int, level: int) -> list[RowMapping]:
+    """Get sub-territories of the given territory down to the given level and all ancestors of the territory."""
+
+    descendants_cte = (
+        select(
+            territories_data.c.territory_id,
+            territories_data.c.name,
+            territories_data.c.parent_id,
+            territories_data.c.level,
+        )
+        .where(territories_data.c.territory_id == territory_id)
+        .cte(recursive=True)
+    )
+    descendants_cte = descendants_cte.union_all(
+        select(
+            territories_data.c.territory_id,
+            territories_data.c.name,
+            territories_data.c.parent_id,
+            territories_data.c.level,
+        ).where(
+            territories_data.c.parent_id == descendants_cte.c.territory_id,
+            descendants_cte.c.level < level,
+        )
+    )
+
+    ancestors_cte = (
+        select(
+            territories_data.c.territory_id,
+            territories_data.c.name,
+            territories_data.c.parent_id,
+            territories_data.c.level,
+        )
+        .where(territories_data.c.territory_id == territory_id)
+        .cte(name="ancestors", recursive=True)
+    )
+    ancestors_cte = ancestors_cte.union_all(
+        select(
+            territories_data.c.territory_id,
+            territories_data.c.name,
+            territories_data.c.parent_id,
+            territories_data.c.level,
+        ).where(territories_data.c.territory_id == ancestors_cte.c.parent_id)
+    )
+
+    statement = select(descendants_cte).union(select(ancestors_cte).where(ancestors_cte.c.territory_id != territory_id))
+
+    return list((await conn.execute(statement)).mappings().all())
+
+
+async def _get_last_normatives(conn: AsyncConnection, territory_ids: list[int], year: int) -> Sequence[RowMapping]:
+    """Get the latest (but not later than the given year) normatives defined for the given territories."""
+
+    statement = (
+        select(
+            service_types_normatives_data.c.territory_id,
+            service_types_normatives_data.c.service_type_id,
+            service_types_normatives_data.c.urban_function_id,
+            service_types_normatives_data.c.services_per_1000_normative,
+            service_types_normatives_data.c.services_capacity_per_1000_normative,
+        )
+        .where(
+            service_types_normatives_data.c.territory_id.in_(territory_ids),
+            service_types_normatives_data.c.year <= year,
+        )
+        .distinct(
+            service_types_normatives_data.c.territory_id,
+            service_types_normatives_data.c.service_type_id,
+            service_types_normatives_data.c.urban_function_id,
+        )
+        .order_by(
+            service_types_normatives_data.c.territory_id,
+            service_types_normatives_data.c.service_type_id,
+            service_types_normatives_data.c.urban_function_id,
+            service_types_normatives_data.c.year.desc(),
+        )
+    )
+
+    return (await conn.execute(statement)).mappings().all()
+
+
+async def _get_service_types_with_normatives(
+    conn: AsyncConnection, normatives: Sequence[RowMapping], service_type_id: int | None
+) -> list[RowMapping]:
+    """Get service types which have normatives defined directly or for their urban function."""
+
+    service_type_ids = {n["service_type_id"] for n in normatives if n["service_type_id"] is not None}
+    urban_function_ids = {n["urban_function_id"] for n in normatives if n["urban_function_id"] is not None}
+    if not service_type_ids and not urban_function_ids:
+        return []
+
+    statement = (
+        select(service_types_dict.c.service_type_id, service_types_dict.c.name, service_types_dict.c.urban_function_id)
+        .where(
+            service_types_dict.c.service_type_id.in_(service_type_ids)
+            | service_types_dict.c.urban_function_id.in_(urban_function_ids)
+        )
+        .order_by(service_types_dict.c.service_type_id)
+    )
+    if service_type_id is not None:
+        statement = statement.where(service_types_dict.c.service_type_id == service_type_id)
+
+    return list((await conn.execute(statement)).mappings().all())
+
+
+async def _get_population(conn: AsyncConnection, territory_ids: list[int], year: int) -> Sequence[RowMapping]:
+    """Get the latest (but not later than the given year) real population of the given territories."""
+
+    statement = (
+        select(territory_indicators_data.c.territory_id, territory_indicators_data.c.value)
+        .where(
+            territory_indicators_data.c.territory_id.in_(territory_ids),
+            territory_indicators_data.c.indicator_id == POPULATION_INDICATOR_ID,
+            territory_indicators_data.c.value_type == "real",
+            extract("year", territory_indicators_data.c.date_value) <= year,
+        )
+        .distinct(territory_indicators_data.c.territory_id)
+        .order_by(territory_indicators_data.c.territory_id, territory_indicators_data.c.date_value.desc())
+    )
+
+    return (await conn.execute(statement)).mappings().all()
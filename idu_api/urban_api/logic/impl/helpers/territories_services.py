@@ -2,9 +2,8 @@
 
 from collections import defaultdict
 from collections.abc import Callable, Sequence
-from typing import Any, Literal
+from typing import Literal
 
-from geoalchemy2.functions import ST_AsEWKB
 from sqlalchemy import RowMapping, func, select
 from sqlalchemy.ext.asyncio import AsyncConnection
 
@@ -13,15 +12,28 @@ from idu_api.common.db.entities import (
     service_types_dict,
     services_data,
     territories_data,
+    territory_services_rollup_data,
     territory_types_dict,
     urban_functions_dict,
     urban_objects_data,
 )
 from idu_api.urban_api.dto import PageDTO, ServiceDTO, ServicesCountCapacityDTO, ServiceTypeDTO, ServiceWithGeometryDTO
 from idu_api.urban_api.exceptions.logic.common import EntityNotFoundById
-from idu_api.urban_api.logic.impl.helpers.utils import check_existence, include_child_territories_cte
+from idu_api.urban_api.logic.impl.helpers.utils import (
+    check_existence,
+    geometry_columns,
+    include_child_territories_cte,
+)
+from idu_api.urban_api.utils.bbox import BBox
 from idu_api.urban_api.utils.pagination import paginate_dto
-from idu_api.urban_api.utils.query_filters import CustomFilter, EqFilter, ILikeFilter, RecursiveFilter, apply_filters
+from idu_api.urban_api.utils.query_filters import (
+    BBoxFilter,
+    CustomFilter,
+    EqFilter,
+    ILikeFilter,
+    RecursiveFilter,
+    apply_filters,
+)
 
 func: Callable
 
@@ -178,12 +190,21 @@ async def get_services_with_geometry_by_territory_id_from_db(
     order_by: Literal["created_at", "updated_at"] | None,
     ordering: Literal["asc", "desc"] | None = "asc",
     paginate: bool = False,
+    centers_only: bool = False,
+    with_geometry: bool = True,
+    bbox: BBox | None = None,
+    limit: int | None = None,
 ) -> list[ServiceWithGeometryDTO] | PageDTO[ServiceWithGeometryDTO]:
-    """Get list of services with objects geometries by territory id."""
+    """Get list of services with objects geometries by territory id.
+
+    Geometries which are not needed (`centers_only` or not `with_geometry`) are not selected at all.
+    Services can be limited to the ones intersecting `bbox` and (if not paginated) to the first `limit` ones.
+    """
 
     if not await check_existence(conn, territories_data, conditions={"territory_id": territory_id}):
         raise EntityNotFoundById(territory_id, "territory")
 
+    geometry, centre_point = geometry_columns(object_geometries_data, centers_only, with_geometry)
     statement = (
         select(
             services_data,
@@ -198,8 +219,8 @@ async def get_services_with_geometry_by_territory_id_from_db(
             object_geometries_data.c.object_geometry_id,
             object_geometries_data.c.address,
             object_geometries_data.c.osm_id,
-            ST_AsEWKB(object_geometries_data.c.geometry).label("geometry"),
-            ST_AsEWKB(object_geometries_data.c.centre_point).label("centre_point"),
+            geometry,
+            centre_point,
             territories_data.c.territory_id,
             territories_data.c.name.label("territory_name"),
         )
@@ -236,6 +257,7 @@ async def get_services_with_geometry_by_territory_id_from_db(
         EqFilter(services_data, "service_type_id", service_type_id),
         RecursiveFilter(service_types_dict, "urban_function_id", urban_function_id, urban_functions_dict),
         ILikeFilter(services_data, "name", name),
+        BBoxFilter(object_geometries_data, "geometry", bbox),
     )
 
     order_column = {
@@ -251,6 +273,9 @@ async def get_services_with_geometry_by_territory_id_from_db(
     if paginate:
         return await paginate_dto(conn, statement, transformer=lambda x: [ServiceWithGeometryDTO(**item) for item in x])
 
+    if limit is not None:
+        statement = statement.limit(limit)
+
     result = (await conn.execute(statement)).mappings().all()
 
     return [ServiceWithGeometryDTO(**service) for service in result]
@@ -268,69 +293,33 @@ async def get_services_capacity_by_territory_id_from_db(
         raise EntityNotFoundById(territory_id, "territory")
 
     territories_cte = (
-        select(territories_data.c.territory_id, territories_data.c.parent_id, territories_data.c.level)
+        select(territories_data.c.territory_id, territories_data.c.level)
         .where(territories_data.c.territory_id == territory_id)
         .cte(recursive=True)
     )
     territories_cte = territories_cte.union_all(
-        select(territories_data.c.territory_id, territories_data.c.parent_id, territories_data.c.level).where(
-            territories_data.c.parent_id == territories_cte.c.territory_id
+        select(territories_data.c.territory_id, territories_data.c.level).where(
+            territories_data.c.parent_id == territories_cte.c.territory_id,
+            territories_cte.c.level < level,
         )
     )
 
-    level_territories = select(territories_cte).where(territories_cte.c.level >= level).alias("level_territories")
-    territories_list = (await conn.execute(select(level_territories))).mappings().all()
-
-    territory_ids = [territory.territory_id for territory in territories_list]
+    # rollup table already contains services of all descendants, so only territories at the given level are needed
+    join_condition = territories_cte.c.territory_id == territory_services_rollup_data.c.territory_id
+    if service_type_id is not None:
+        join_condition &= territory_services_rollup_data.c.service_type_id == service_type_id
 
     statement = (
         select(
-            level_territories.c.territory_id,
-            func.count(services_data.c.service_id).label("count"),
-            func.coalesce(func.sum(services_data.c.capacity), 0).label("capacity"),
-        )
-        .select_from(
-            level_territories.outerjoin(
-                object_geometries_data, level_territories.c.territory_id == object_geometries_data.c.territory_id
-            )
-            .outerjoin(
-                urban_objects_data,
-                urban_objects_data.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
-            )
-            .outerjoin(services_data, services_data.c.service_id == urban_objects_data.c.service_id)
+            territories_cte.c.territory_id,
+            func.coalesce(func.sum(territory_services_rollup_data.c.count), 0).label("count"),
+            func.coalesce(func.sum(territory_services_rollup_data.c.capacity), 0).label("capacity"),
         )
-        .group_by(level_territories.c.territory_id)
+        .select_from(territories_cte.outerjoin(territory_services_rollup_data, join_condition))
+        .where(territories_cte.c.level == level)
+        .group_by(territories_cte.c.territory_id)
     )
 
-    if service_type_id is not None:
-        statement = statement.where(services_data.c.service_type_id == service_type_id)
-
-    services_data_results = (await conn.execute(statement)).mappings().all()
-
-    services_data_dict = {result["territory_id"]: result for result in services_data_results}
-
-    for t_id in territory_ids:
-        if t_id not in services_data_dict:
-            services_data_dict[t_id] = {"territory_id": t_id, "count": 0, "capacity": 0}
-
-    hierarchy = defaultdict(list)
-    for territory in territories_list:
-        hierarchy[territory.parent_id].append(territory.territory_id)
-
-    def build_hierarchy(tid: int) -> dict[str, Any]:
-        total_count = services_data_dict[tid]["count"]
-        total_capacity = services_data_dict[tid]["capacity"]
-
-        for child_id in hierarchy.get(tid, []):
-            child_data = build_hierarchy(child_id)
-            total_count += child_data["count"]
-            total_capacity += child_data["capacity"]
-
-        return {"territory_id": tid, "count": total_count, "capacity": total_capacity}
-
-    result = []
-    for territory in territories_list:
-        if territory.level == level:
-            result.append(build_hierarchy(territory.territory_id))
+    result = (await conn.execute(statement)).mappings().all()
 
     return [ServicesCountCapacityDTO(**territory) for territory in result]
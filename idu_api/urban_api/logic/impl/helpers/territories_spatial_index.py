@@ -0,0 +1,96 @@
+"""In-memory spatial index of territories geometries is defined here."""
+
+import asyncio
+from typing import Callable, Sequence
+
+import numpy as np
+import shapely
+from sqlalchemy import RowMapping, func, select
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from idu_api.common.db.entities import territories_subdivided_data
+from idu_api.urban_api.logic.impl.helpers.utils import get_tables_version
+
+func: Callable
+
+TERRITORIES_SPATIAL_INDEX_SOURCE_TABLES = ("territories_data",)
+"""Tables which territories spatial index depends on (tracked in `public.tables_versions_data`)."""
+
+_territories_spatial_index: "TerritoriesSpatialIndex | None" = None
+"""Territories spatial index for the source tables version it was loaded for."""
+
+_territories_spatial_index_lock = asyncio.Lock()
+"""Lock to build the index once when several requests find it outdated at the same time."""
+
+
+class TerritoriesSpatialIndex:
+    """STRtree over prepared subdivided territories geometries (from `territories_subdivided_data`).
+
+    Pieces have limited number of vertices, so candidates found by bounding boxes are checked cheaply.
+    """
+
+    def __init__(self, version: int, territory_ids: np.ndarray, geometries: np.ndarray):
+        self.version = version
+        self._territory_ids = territory_ids
+        self._geometries = geometries
+        shapely.prepare(self._geometries)
+        self._tree = shapely.STRtree(self._geometries)
+
+    def __len__(self) -> int:
+        return len(self._geometries)
+
+    def covering_territories_ids(self, geometries: np.ndarray) -> list[list[int]]:
+        """Get sorted identifiers of territories covering each of the given geometries.
+
+        Geometry is covered by a territory if it is covered by any of the territory pieces, which is exact
+        for points (for other geometries it may cross pieces borders, so it is a subset of the covering ones).
+        """
+
+        input_indexes, piece_indexes = self._tree.query(geometries)
+        covered = shapely.covers(self._geometries[piece_indexes], geometries[input_indexes])
+
+        result: list[set[int]] = [set() for _ in range(len(geometries))]
+        for input_index, territory_id in zip(
+            input_indexes[covered].tolist(), self._territory_ids[piece_indexes[covered]].tolist()
+        ):
+            result[input_index].add(territory_id)
+
+        return [sorted(territories_ids) for territories_ids in result]
+
+
+async def get_territories_spatial_index(conn: AsyncConnection) -> TerritoriesSpatialIndex:
+    """Get territories spatial index, reloading it only if territories were changed.
+
+    Index is built in a separate thread, so the event loop is not blocked while geometries are parsed.
+    """
+
+    global _territories_spatial_index  # pylint: disable=global-statement
+
+    version = await get_tables_version(conn, TERRITORIES_SPATIAL_INDEX_SOURCE_TABLES)
+    index = _territories_spatial_index
+    if index is not None and index.version == version:
+        return index
+
+    async with _territories_spatial_index_lock:
+        index = _territories_spatial_index
+        if index is not None and index.version == version:
+            return index
+
+        statement = select(
+            territories_subdivided_data.c.territory_id,
+            func.ST_AsBinary(territories_subdivided_data.c.geometry).label("geometry"),
+        )
+        pieces = (await conn.execute(statement)).mappings().all()
+
+        index = await asyncio.to_thread(_build_territories_spatial_index, version, pieces)
+        _territories_spatial_index = index
+
+    return index
+
+
+def _build_territories_spatial_index(version: int, pieces: Sequence[RowMapping]) -> TerritoriesSpatialIndex:
+    return TerritoriesSpatialIndex(
+        version,
+        np.array([piece["territory_id"] for piece in pieces], dtype=np.int64),
+        shapely.from_wkb(np.array([piece["geometry"] for piece in pieces], dtype=object)),
+    )
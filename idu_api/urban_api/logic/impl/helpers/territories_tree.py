@@ -0,0 +1,117 @@
+"""In-memory territories tree index is defined here."""
+
+from collections import defaultdict
+from collections.abc import Iterable
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from idu_api.common.db.entities import target_city_types_dict, territories_data, territory_types_dict
+from idu_api.urban_api.dto import TerritoryTreeWithoutGeometryDTO, TerritoryWithoutGeometryDTO
+from idu_api.urban_api.logic.impl.helpers.utils import get_tables_version
+
+TERRITORIES_TREE_SOURCE_TABLES = ("territories_data", "territory_types_dict", "target_city_types_dict")
+"""Tables which territories tree depends on (tracked in `public.tables_versions_data`)."""
+
+_territories_tree: "TerritoriesTree | None" = None
+"""Territories tree for the source tables version it was loaded for."""
+
+
+class TerritoriesTree:
+    """Index of all territories (without geometry) by identifier and by parent.
+
+    Children of every territory are kept in the order of territories identifiers.
+    """
+
+    def __init__(self, version: int, territories: Iterable[TerritoryWithoutGeometryDTO]):
+        self.version = version
+        self._territories: dict[int, TerritoryWithoutGeometryDTO] = {}
+        self._children: dict[int | None, list[TerritoryWithoutGeometryDTO]] = defaultdict(list)
+        for territory in sorted(territories, key=lambda t: t.territory_id):
+            self._territories[territory.territory_id] = territory
+            self._children[territory.parent_id].append(territory)
+
+    def __contains__(self, territory_id: int) -> bool:
+        return territory_id in self._territories
+
+    def __len__(self) -> int:
+        return len(self._territories)
+
+    def get(self, territory_id: int) -> TerritoryWithoutGeometryDTO | None:
+        """Get territory by identifier, None if there is no such territory."""
+        return self._territories.get(territory_id)
+
+    def children(self, parent_id: int | None) -> list[TerritoryWithoutGeometryDTO]:
+        """Get direct children of the territory (top-level territories if parent is None)."""
+        return list(self._children.get(parent_id, []))
+
+    def descendants(self, parent_id: int | None) -> list[TerritoryWithoutGeometryDTO]:
+        """Get all territories of the subtree (parent is not included), parents go before their children."""
+        result = []
+        stack = list(reversed(self._children.get(parent_id, [])))
+        while stack:
+            territory = stack.pop()
+            result.append(territory)
+            stack.extend(reversed(self._children.get(territory.territory_id, [])))
+        return result
+
+    def hierarchy(self, parent_id: int | None) -> list[TerritoryTreeWithoutGeometryDTO]:
+        """Get subtrees of the territory children (parent is not included)."""
+
+        def build(territory: TerritoryWithoutGeometryDTO) -> TerritoryTreeWithoutGeometryDTO:
+            return TerritoryTreeWithoutGeometryDTO(
+                **territory.__dict__,
+                children=[build(child) for child in self._children.get(territory.territory_id, [])],
+            )
+
+        return [build(territory) for territory in self._children.get(parent_id, [])]
+
+
+async def get_territories_tree(conn: AsyncConnection) -> TerritoriesTree:
+    """Get territories tree, reloading it only if any of the source tables was changed."""
+
+    global _territories_tree  # pylint: disable=global-statement
+
+    version = await get_tables_version(conn, TERRITORIES_TREE_SOURCE_TABLES)
+    tree = _territories_tree
+    if tree is not None and tree.version == version:
+        return tree
+
+    territories_data_parents = territories_data.alias("territories_data_parents")
+    admin_centers = territories_data.alias("admin_centers")
+    statement = select(
+        territories_data.c.territory_id,
+        territories_data.c.territory_type_id,
+        territory_types_dict.c.name.label("territory_type_name"),
+        territories_data.c.parent_id,
+        territories_data_parents.c.name.label("parent_name"),
+        territories_data.c.name,
+        territories_data.c.level,
+        territories_data.c.properties,
+        territories_data.c.admin_center_id,
+        admin_centers.c.name.label("admin_center_name"),
+        territories_data.c.target_city_type_id,
+        target_city_types_dict.c.name.label("target_city_type_name"),
+        target_city_types_dict.c.description.label("target_city_type_description"),
+        territories_data.c.okato_code,
+        territories_data.c.oktmo_code,
+        territories_data.c.is_city,
+        territories_data.c.created_at,
+        territories_data.c.updated_at,
+    ).select_from(
+        territories_data.join(
+            territory_types_dict, territory_types_dict.c.territory_type_id == territories_data.c.territory_type_id
+        )
+        .outerjoin(
+            target_city_types_dict,
+            target_city_types_dict.c.target_city_type_id == territories_data.c.target_city_type_id,
+        )
+        .outerjoin(territories_data_parents, territories_data_parents.c.territory_id == territories_data.c.parent_id)
+        .outerjoin(admin_centers, admin_centers.c.territory_id == territories_data.c.admin_center_id)
+    )
+
+    result = (await conn.execute(statement)).mappings().all()
+    tree = TerritoriesTree(version, (TerritoryWithoutGeometryDTO(**territory) for territory in result))
+    _territories_tree = tree
+
+    return tree
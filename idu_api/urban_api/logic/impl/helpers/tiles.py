@@ -0,0 +1,320 @@
+"""Vector tiles internal logic is defined here."""
+
+from datetime import timedelta
+from typing import Callable, Literal
+
+from sqlalchemy import BigInteger, ColumnElement, String, cast, delete, exists, func, select
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.sql.selectable import Select
+
+from idu_api.common.db.entities import (
+    functional_zones_data,
+    object_geometries_data,
+    physical_object_types_dict,
+    physical_objects_data,
+    projects_functional_zones,
+    projects_object_geometries_data,
+    projects_urban_objects_data,
+    service_types_dict,
+    services_data,
+    territories_data,
+    tiles_invalidations_data,
+    urban_objects_data,
+)
+from idu_api.urban_api.logic.impl.helpers.utils import (
+    SIMPLIFIED_TERRITORIES_TOLERANCES,
+    SRID,
+    simplified_territory_geometry,
+)
+
+func: Callable
+
+# Layers of public and scenario data available as vector tiles.
+TileLayer = Literal["territories", "physical_objects", "services", "functional_zones"]
+ScenarioTileLayer = Literal["geometries", "functional_zones"]
+
+# Tables (schema-qualified) which changes invalidate tiles of the layer.
+TILE_LAYERS_SOURCES: dict[str, tuple[str, ...]] = {
+    "territories": ("public.territories_data",),
+    "physical_objects": (
+        "public.object_geometries_data",
+        "public.urban_objects_data",
+        "public.physical_objects_data",
+        "public.physical_object_types_dict",
+    ),
+    "services": (
+        "public.object_geometries_data",
+        "public.urban_objects_data",
+        "public.services_data",
+        "public.service_types_dict",
+    ),
+    "functional_zones": ("public.functional_zones_data",),
+}
+SCENARIO_TILE_LAYERS_SOURCES: dict[str, tuple[str, ...]] = {
+    "geometries": ("user_projects.object_geometries_data", "user_projects.urban_objects_data"),
+    "functional_zones": ("user_projects.functional_zones_data",),
+}
+
+# Minimal zoom level at which layer objects are put to tiles (tiles of lower zoom levels are empty).
+TILE_LAYERS_MIN_ZOOM: dict[str, int] = {
+    "territories": 0,
+    "physical_objects": 12,
+    "services": 12,
+    "functional_zones": 10,
+}
+
+# Tile extent (size of the tile in integer coordinates) and buffer around it.
+TILE_EXTENT = 4096
+TILE_BUFFER = 64
+
+# Web Mercator SRID in which tiles geometries are encoded.
+TILES_SRID = 3857
+
+# Time for which tiles invalidations are kept (cached tiles older than that are never used).
+TILES_INVALIDATIONS_TTL = timedelta(days=1)
+
+
+def tile_bounds(z: int, x: int, y: int) -> ColumnElement:
+    """Build tile envelope expression in the database SRID."""
+
+    return func.ST_Transform(func.ST_TileEnvelope(z, x, y), SRID)
+
+
+def tile_simplify_tolerance(z: int) -> float | None:
+    """Get the largest precomputed territories simplification tolerance which is less than a tile grid cell
+    (in degrees at the equator) of the given zoom level, as any finer details are lost in tile encoding anyway."""
+
+    cell_size = 360 / (TILE_EXTENT * 2**z)
+    return max((tolerance for tolerance in SIMPLIFIED_TERRITORIES_TOLERANCES if tolerance <= cell_size), default=None)
+
+
+def build_mvt_statement(features: Select, layer: str, id_column: str, z: int, x: int, y: int) -> Select:
+    """
+    Wrap features query into `ST_AsMVT` aggregation.
+
+    Args:
+        features (Select): Query with `geometry` column (in the database SRID), the other columns are encoded as
+            feature properties. It should be already filtered by tile bounds.
+        layer (str): Name of the layer in the tile.
+        id_column (str): Name of the integer column to be used as feature identifier.
+        z (int): Zoom level of the tile.
+        x (int): Column of the tile.
+        y (int): Row of the tile.
+
+    Returns:
+        Select: A SQLAlchemy query returning a single tile (`bytea`).
+    """
+
+    envelope = func.ST_TileEnvelope(z, x, y)
+    source = features.subquery("source")
+    mvt = (
+        select(
+            func.ST_AsMVTGeom(
+                func.ST_Transform(source.c.geometry, TILES_SRID), envelope, TILE_EXTENT, TILE_BUFFER, True
+            ).label("geom"),
+            *[column for column in source.c if column.name != "geometry"],
+        )
+        .select_from(source)
+        .subquery("mvt")
+    )
+
+    return select(func.ST_AsMVT(mvt.table_valued(), layer, TILE_EXTENT, "geom", id_column)).where(
+        mvt.c.geom.isnot(None)
+    )
+
+
+async def get_tile_from_db(conn: AsyncConnection, layer: TileLayer, z: int, x: int, y: int) -> bytes:
+    """Build Mapbox Vector Tile of the public data layer."""
+
+    if z < TILE_LAYERS_MIN_ZOOM[layer]:
+        return b""
+
+    bounds = tile_bounds(z, x, y)
+    if layer == "territories":
+        geometry = simplified_territory_geometry(territories_data, tile_simplify_tolerance(z))
+        features = select(
+            (geometry if geometry is not None else territories_data.c.geometry).label("geometry"),
+            territories_data.c.territory_id,
+            territories_data.c.name,
+            territories_data.c.territory_type_id,
+            territories_data.c.parent_id,
+            territories_data.c.level,
+            territories_data.c.is_city,
+        ).where(territories_data.c.geometry.intersects(bounds))
+        id_column = "territory_id"
+    elif layer == "physical_objects":
+        features = (
+            select(
+                object_geometries_data.c.geometry,
+                physical_objects_data.c.physical_object_id,
+                object_geometries_data.c.object_geometry_id,
+                physical_objects_data.c.physical_object_type_id,
+                physical_object_types_dict.c.name.label("physical_object_type_name"),
+                physical_objects_data.c.name,
+            )
+            .select_from(
+                object_geometries_data.join(
+                    urban_objects_data,
+                    urban_objects_data.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
+                )
+                .join(
+                    physical_objects_data,
+                    physical_objects_data.c.physical_object_id == urban_objects_data.c.physical_object_id,
+                )
+                .join(
+                    physical_object_types_dict,
+                    physical_object_types_dict.c.physical_object_type_id
+                    == physical_objects_data.c.physical_object_type_id,
+                )
+            )
+            .where(object_geometries_data.c.geometry.intersects(bounds))
+            .distinct(physical_objects_data.c.physical_object_id, object_geometries_data.c.object_geometry_id)
+        )
+        id_column = "physical_object_id"
+    elif layer == "services":
+        features = (
+            select(
+                object_geometries_data.c.geometry,
+                services_data.c.service_id,
+                object_geometries_data.c.object_geometry_id,
+                services_data.c.service_type_id,
+                service_types_dict.c.name.label("service_type_name"),
+                services_data.c.name,
+                services_data.c.capacity,
+            )
+            .select_from(
+                object_geometries_data.join(
+                    urban_objects_data,
+                    urban_objects_data.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
+                )
+                .join(services_data, services_data.c.service_id == urban_objects_data.c.service_id)
+                .join(service_types_dict, service_types_dict.c.service_type_id == services_data.c.service_type_id)
+            )
+            .where(object_geometries_data.c.geometry.intersects(bounds))
+            .distinct(services_data.c.service_id, object_geometries_data.c.object_geometry_id)
+        )
+        id_column = "service_id"
+    else:
+        features = select(
+            functional_zones_data.c.geometry,
+            functional_zones_data.c.functional_zone_id,
+            functional_zones_data.c.functional_zone_type_id,
+            functional_zones_data.c.territory_id,
+            functional_zones_data.c.name,
+            functional_zones_data.c.year,
+            functional_zones_data.c.source,
+        ).where(functional_zones_data.c.geometry.intersects(bounds))
+        id_column = "functional_zone_id"
+
+    statement = build_mvt_statement(features, layer, id_column, z, x, y)
+
+    return (await conn.execute(statement)).scalar_one_or_none() or b""
+
+
+async def get_scenario_tile_from_db(
+    conn: AsyncConnection, scenario_id: int, layer: ScenarioTileLayer, z: int, x: int, y: int
+) -> bytes:
+    """Build Mapbox Vector Tile of the scenario data layer (access must be checked beforehand)."""
+
+    bounds = tile_bounds(z, x, y)
+    if layer == "geometries":
+        features = (
+            select(
+                projects_object_geometries_data.c.geometry,
+                projects_urban_objects_data.c.urban_object_id,
+                projects_object_geometries_data.c.object_geometry_id,
+                func.coalesce(
+                    projects_urban_objects_data.c.physical_object_id,
+                    projects_urban_objects_data.c.public_physical_object_id,
+                ).label("physical_object_id"),
+                func.coalesce(
+                    projects_urban_objects_data.c.service_id,
+                    projects_urban_objects_data.c.public_service_id,
+                ).label("service_id"),
+            )
+            .select_from(
+                projects_object_geometries_data.join(
+                    projects_urban_objects_data,
+                    projects_urban_objects_data.c.object_geometry_id
+                    == projects_object_geometries_data.c.object_geometry_id,
+                )
+            )
+            .where(
+                projects_urban_objects_data.c.scenario_id == scenario_id,
+                projects_object_geometries_data.c.geometry.intersects(bounds),
+            )
+        )
+        id_column = "urban_object_id"
+    else:
+        features = select(
+            projects_functional_zones.c.geometry,
+            projects_functional_zones.c.functional_zone_id,
+            projects_functional_zones.c.functional_zone_type_id,
+            projects_functional_zones.c.name,
+            projects_functional_zones.c.year,
+            projects_functional_zones.c.source,
+        ).where(
+            projects_functional_zones.c.scenario_id == scenario_id,
+            projects_functional_zones.c.geometry.intersects(bounds),
+        )
+        id_column = "functional_zone_id"
+
+    statement = build_mvt_statement(features, layer, id_column, z, x, y)
+
+    return (await conn.execute(statement)).scalar_one_or_none() or b""
+
+
+async def get_tiles_invalidation_state_from_db(
+    conn: AsyncConnection, tables: tuple[str, ...], z: int, x: int, y: int, watermark: int | None
+) -> tuple[int, bool]:
+    """
+    Get the current tiles watermark and check if the tile built at the given watermark is stale.
+
+    Watermark is xmin of the current snapshot: every transaction with lesser identifier is already finished,
+    so changes which are not visible yet are always registered with greater or equal transaction identifier
+    (unlike sequence values, which are taken in a different order than transactions are committed).
+
+    Args:
+        conn (AsyncConnection): Database connection object.
+        tables (tuple[str, ...]): Schema-qualified names of tables used to build the tile.
+        z (int): Zoom level of the tile.
+        x (int): Column of the tile.
+        y (int): Row of the tile.
+        watermark (int | None): The watermark taken before the cached tile was built, None if there is
+            no cached tile.
+
+    Returns:
+        A tuple of the current watermark and flag whether rows in the tile bounds could be changed after
+        the given watermark (always True if it is None).
+    """
+
+    current_watermark = cast(cast(func.pg_snapshot_xmin(func.pg_current_snapshot()), String), BigInteger).label(
+        "watermark"
+    )
+    if watermark is None:
+        return (await conn.execute(select(current_watermark))).scalar_one(), True
+
+    is_stale = (
+        exists()
+        .where(
+            tiles_invalidations_data.c.transaction_id >= watermark,
+            tiles_invalidations_data.c.table_name.in_(tables),
+            tiles_invalidations_data.c.bbox.intersects(tile_bounds(z, x, y)),
+        )
+        .label("is_stale")
+    )
+    result = (await conn.execute(select(current_watermark, is_stale))).one()
+
+    return result[0], result[1]
+
+
+async def delete_outdated_tiles_invalidations_from_db(conn: AsyncConnection) -> int:
+    """Remove tiles invalidations older than `TILES_INVALIDATIONS_TTL` and return the number of removed ones."""
+
+    statement = delete(tiles_invalidations_data).where(
+        tiles_invalidations_data.c.created_at < func.now() - TILES_INVALIDATIONS_TTL
+    )
+    result = await conn.execute(statement)
+    await conn.commit()
+
+    return result.rowcount
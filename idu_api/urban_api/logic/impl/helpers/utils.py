@@ -1,13 +1,30 @@
+from collections import defaultdict
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Type, TypeVar
+from typing import Any, Literal, Type, TypeVar
 
-from geoalchemy2.functions import ST_GeomFromWKB, ST_Union
+from geoalchemy2 import Geography, Geometry
+from geoalchemy2.functions import ST_AsEWKB, ST_GeomFromWKB, ST_SimplifyPreserveTopology
 from pydantic import BaseModel
-from sqlalchemy import ScalarSelect, Table, select, text
+from sqlalchemy import Boolean, ColumnElement, Float, ScalarSelect, Table, cast, column, func, null, select, text
 from sqlalchemy.ext.asyncio import AsyncConnection
 from sqlalchemy.sql.selectable import CTE, Select
 
-from idu_api.common.db.entities import projects_data, scenarios_data, territories_data
+from idu_api.common.db.entities import (
+    projects_context_buffers_data,
+    projects_context_cache_data,
+    projects_context_data,
+    projects_context_functional_zones_data,
+    projects_context_object_geometries_data,
+    projects_context_subdivided_data,
+    projects_data,
+    scenarios_data,
+    tables_versions_data,
+    territories_data,
+    territories_simplified_data,
+    territories_subdivided_data,
+)
 from idu_api.urban_api.dto import UserDTO
 from idu_api.urban_api.exceptions.logic.common import EntityNotFoundById
 from idu_api.urban_api.exceptions.logic.projects import NotAllowedInRegionalScenario
@@ -22,6 +39,21 @@ OBJECTS_NUMBER_TO_INSERT_LIMIT = 7_000
 # Spatial Reference System Identifier (SRID) for geometry fields.
 SRID = 4326
 
+# Tolerances (in degrees) with which simplified territories geometries are precomputed in `territories_simplified_data`,
+# must be the same as in `trigger_refresh_territory_simplified_geometry` database function.
+SIMPLIFIED_TERRITORIES_TOLERANCES = (0.0001, 0.001, 0.01)
+
+# Cached layers of the project context and tables storing them.
+ContextLayer = Literal["object_geometries", "buffers", "functional_zones"]
+CONTEXT_LAYERS_TABLES: dict[str, Table] = {
+    "object_geometries": projects_context_object_geometries_data,
+    "buffers": projects_context_buffers_data,
+    "functional_zones": projects_context_functional_zones_data,
+}
+
+# Layers of the projects contexts found out of date on read, they are rebuilt in background.
+_context_layers_refresh_requests: set[tuple[int, ContextLayer]] = set()
+
 UrbanAPIModel = TypeVar("UrbanAPIModel", bound=BaseModel)
 InputDTOType = TypeVar("InputDTOType")
 OutputDTOType = TypeVar("OutputDTOType")
@@ -110,6 +142,106 @@ def build_recursive_query(
     return final_query
 
 
+def lod_geometry(
+    geometry: ColumnElement, simplify_tolerance: float | None = None, precision: int | None = None
+) -> ColumnElement:
+    """
+    Applies level of detail reduction to the geometry expression.
+
+    Geometry is simplified with `ST_SimplifyPreserveTopology` (so polygons stay valid) and then its coordinates
+    are snapped to the grid of `10 ** -precision` with `ST_ReducePrecision`, which shortens both EWKB transferred
+    from the database and GeoJSON coordinates (duplicated vertices are removed as well).
+
+    Args:
+        geometry (ColumnElement): Geometry column (or expression).
+        simplify_tolerance (float | None): Simplification tolerance in units of the SRID (degrees), None to skip.
+        precision (int | None): Number of decimal digits to keep in coordinates, None to skip.
+
+    Returns:
+        ColumnElement: Geometry expression (the same one if no reduction is requested).
+    """
+
+    if simplify_tolerance:
+        geometry = ST_SimplifyPreserveTopology(geometry, simplify_tolerance)
+    if precision is not None:
+        geometry = func.ST_ReducePrecision(geometry, 10**-precision, type_=Geometry)
+
+    return geometry
+
+
+def simplified_territory_geometry(territories: Table | CTE, simplify_tolerance: float | None) -> ColumnElement | None:
+    """
+    Builds simplified geometry expression for the territories table (or CTE with `territory_id` and `geometry`).
+
+    If the tolerance is one of `SIMPLIFIED_TERRITORIES_TOLERANCES`, geometry precomputed by the database trigger
+    is taken from `territories_simplified_data`, otherwise (or if it is missing) it is simplified on the fly.
+
+    Args:
+        territories (Table | CTE): SQLAlchemy Table (or its alias) with `territory_id` and `geometry` columns.
+        simplify_tolerance (float | None): Simplification tolerance in degrees.
+
+    Returns:
+        ColumnElement | None: Simplified geometry expression or None if simplification is not requested.
+    """
+
+    if not simplify_tolerance:
+        return None
+
+    simplified = ST_SimplifyPreserveTopology(territories.c.geometry, simplify_tolerance)
+    if simplify_tolerance not in SIMPLIFIED_TERRITORIES_TOLERANCES:
+        return simplified
+
+    precomputed = (
+        select(territories_simplified_data.c.geometry)
+        .where(
+            territories_simplified_data.c.territory_id == territories.c.territory_id,
+            territories_simplified_data.c.tolerance == simplify_tolerance,
+        )
+        .scalar_subquery()
+    )
+    return func.coalesce(precomputed, simplified, type_=Geometry)
+
+
+def geometry_columns(
+    table: Table | CTE,
+    centers_only: bool = False,
+    with_geometry: bool = True,
+    simplify_tolerance: float | None = None,
+    precision: int | None = None,
+    simplified_geometry: ColumnElement | None = None,
+) -> tuple[ColumnElement, ColumnElement]:
+    """
+    Builds `geometry` and `centre_point` columns (as EWKB) of the given table for a select statement.
+
+    Columns which are not going to be used are replaced with NULL, so heavy geometries are not read from disk,
+    detoasted and transferred to the application at all.
+
+    Args:
+        table (Table | CTE): SQLAlchemy Table (or its alias) with `geometry` and `centre_point` columns.
+        centers_only (bool): Select only centre point (geometry falls back to it in DTOs).
+        with_geometry (bool): Select neither geometry nor centre point if set to False.
+        simplify_tolerance (float | None): Geometry simplification tolerance (see `lod_geometry`).
+        precision (int | None): Number of decimal digits to keep in coordinates of both columns.
+        simplified_geometry (ColumnElement | None): Already simplified geometry expression to be used instead of
+            simplifying `geometry` column (i.e. `simplified_territory_geometry`).
+
+    Returns:
+        A tuple of `geometry` and `centre_point` labeled columns.
+    """
+
+    geometry = centre_point = null()
+    if with_geometry:
+        centre_point = ST_AsEWKB(lod_geometry(table.c.centre_point, precision=precision))
+        if not centers_only:
+            if simplified_geometry is not None:
+                geometry = lod_geometry(simplified_geometry, precision=precision)
+            else:
+                geometry = lod_geometry(table.c.geometry, simplify_tolerance, precision)
+            geometry = ST_AsEWKB(geometry)
+
+    return geometry.label("geometry"), centre_point.label("centre_point")
+
+
 def include_child_territories_cte(territory_id: int, cities_only: bool = False) -> CTE:
     """
     Recursively constructs a Common Table Expression (CTE) to include all child territories
@@ -149,6 +281,70 @@ def include_child_territories_cte(territory_id: int, cities_only: bool = False)
     return recursive_cte
 
 
+def intersecting_territories_ids(geometry: Any) -> Select:
+    """
+    Build a query for identifiers of all territories which intersect with the given geometry.
+
+    Spatial predicate is evaluated against subdivided pieces of territories geometries
+    (`territories_subdivided_data`), so GiST index is used and each check touches only a small polygon
+    instead of the whole (possibly huge) territory geometry. Pieces cover the territory exactly,
+    so the result is the same as for `ST_Intersects` on `territories_data.geometry`.
+
+    Args:
+        geometry (Any): SQL expression for the geometry to check (i.e. `ST_GeomFromWKB(...)` or scalar subquery).
+
+    Returns:
+        Select: A SQLAlchemy query with distinct `territory_id` column to be used in `.in_(...)` filters.
+    """
+
+    return (
+        select(territories_subdivided_data.c.territory_id)
+        .where(func.ST_Intersects(territories_subdivided_data.c.geometry, geometry))
+        .distinct()
+    )
+
+
+def within_distance(column: Any, geometry: Any, distance_meters: int | float) -> ColumnElement[bool]:
+    """
+    Build an index-friendly predicate to check that geometry column is within given distance of the geometry.
+
+    Distance is calculated on geography (in meters) with `ST_DWithin`, which is supported by GiST expression
+    indexes `((geometry::geography(Geometry, 4326)))`, instead of buffering the given geometry.
+    Zero distance falls back to plain `ST_Intersects` on geometries.
+
+    Args:
+        column (Any): Geometry column (or expression) of the searched table.
+        geometry (Any): SQL expression for the geometry to search around (i.e. `ST_GeomFromWKB(...)`).
+        distance_meters (int | float): Search distance in meters.
+
+    Returns:
+        ColumnElement[bool]: A SQLAlchemy boolean expression to be used in `.where(...)`.
+    """
+
+    if not distance_meters:
+        return func.ST_Intersects(column, geometry)
+
+    return func.ST_DWithin(cast(column, Geography(srid=SRID)), cast(geometry, Geography(srid=SRID)), distance_meters)
+
+
+def distance_order(column: Any, geometry: Any) -> ColumnElement[float]:
+    """
+    Build a KNN (`<->`) distance expression between geometry column and the geometry on geography (in meters).
+
+    Being used in `.order_by(...)` with `.limit(...)`, it is resolved by GiST index scan, so only
+    the nearest rows are read.
+
+    Args:
+        column (Any): Geometry column (or expression) of the searched table.
+        geometry (Any): SQL expression for the geometry to search nearest objects to.
+
+    Returns:
+        ColumnElement[float]: A SQLAlchemy expression to be used in `.order_by(...)`.
+    """
+
+    return cast(column, Geography(srid=SRID)).op("<->", return_type=Float)(cast(geometry, Geography(srid=SRID)))
+
+
 def extract_values_from_model(
     model: UrbanAPIModel,
     exclude_unset: bool = False,
@@ -219,10 +415,14 @@ def extract_values_from_model(
 
 async def get_context_territories_geometry(
     conn, scenario_id: int, user: UserDTO | None
-) -> tuple[int, ScalarSelect[Any], list[int]]:
+) -> tuple[int, ScalarSelect[Any], CTE]:
     """
-    Retrieve project territory relations including context territories, unified geometry,
-    and all related territories (descendants and ancestors).
+    Retrieve project context geometry: the union of all context territories and its subdivided pieces.
+
+    Both geometries are precomputed and stored in `projects_context_data` and `projects_context_subdivided_data`
+    by database triggers (on change of `properties.context` of the project or geometry of context territories).
+    The union geometry should be used to clip objects, while subdivided pieces should be used in spatial filters,
+    so that GiST indexes of the joined tables can be used.
 
     Args:
         conn (AsyncConnection): Database connection object.
@@ -232,8 +432,8 @@ async def get_context_territories_geometry(
     Returns:
         Tuple containing:
         - parent_id: Parent regional scenario identifier for given scenario.
-        - unified_geometry: CTE for unified geometry of context territories.
-        - context identifiers: List of context territory identifiers.
+        - unified_geometry: Scalar subquery for unified geometry of context territories.
+        - context_pieces: CTE with subdivided pieces (`geometry` column) of the context geometry.
 
     Raises:
         EntityNotFoundById: If project ID does not exist.
@@ -257,14 +457,92 @@ async def get_context_territories_geometry(
     elif scenario.is_regional:
         raise NotAllowedInRegionalScenario()
 
-    # Get union geometry of all context territories
+    # Get precomputed union geometry of all context territories
     unified_geometry = (
-        select(ST_Union(territories_data.c.geometry).label("geometry"))
-        .where(territories_data.c.territory_id.in_(scenario.properties["context"]))
+        select(projects_context_data.c.geometry)
+        .where(projects_context_data.c.project_id == scenario.project_id)
         .scalar_subquery()
     )
 
-    return scenario.parent_id, unified_geometry, scenario.properties["context"]
+    # Get subdivided pieces of context geometry for index-friendly spatial filters
+    context_pieces = (
+        select(projects_context_subdivided_data.c.geometry)
+        .where(projects_context_subdivided_data.c.project_id == scenario.project_id)
+        .cte(name="context_pieces")
+    )
+
+    return scenario.parent_id, unified_geometry, context_pieces
+
+
+async def get_context_layer_cache(conn: AsyncConnection, scenario_id: int, layer: ContextLayer) -> CTE:
+    """
+    Retrieve layer of public objects clipped by the project context geometry.
+
+    Layer is taken from `user_projects.projects_context_*_data` tables if it is up to date. Otherwise it is calculated
+    on the fly and the project layer is requested to be rebuilt in background (see `refresh_context_layers_caches`),
+    so this function does not write anything. Cached layers are invalidated by triggers only for the projects
+    which context intersects changed public objects.
+    Access to the scenario must be checked beforehand (i.e. with `get_context_territories_geometry`).
+
+    Args:
+        conn (AsyncConnection): Database connection object.
+        scenario_id (int): Unique identifier of the project scenario.
+        layer (ContextLayer): Name of the cached layer.
+
+    Returns:
+        CTE with the layer rows of the project (clipped `geometry` column and layer identifiers).
+    """
+    cache = projects_context_cache_data
+    statement = (
+        select(
+            scenarios_data.c.project_id,
+            func.coalesce(
+                (cache.c.built_version == cache.c.version)
+                & cache.c.context_updated_at.is_not_distinct_from(projects_context_data.c.updated_at),
+                False,
+                type_=Boolean,
+            ).label("is_actual"),
+        )
+        .select_from(
+            scenarios_data.outerjoin(
+                projects_context_data, projects_context_data.c.project_id == scenarios_data.c.project_id
+            ).outerjoin(cache, (cache.c.project_id == scenarios_data.c.project_id) & (cache.c.layer == layer))
+        )
+        .where(scenarios_data.c.scenario_id == scenario_id)
+    )
+    scenario = (await conn.execute(statement)).mappings().one()
+
+    table = CONTEXT_LAYERS_TABLES[layer]
+    columns = [table_column for table_column in table.c if table_column.name != "project_id"]
+    if scenario.is_actual:
+        return select(*columns).where(table.c.project_id == scenario.project_id).cte(name=f"context_{layer}")
+
+    _context_layers_refresh_requests.add((scenario.project_id, layer))
+    calculated_layer = getattr(func.user_projects, f"calculate_project_context_{layer}")(
+        scenario.project_id
+    ).table_valued(*[column(table_column.name, table_column.type) for table_column in columns])
+    return select(*calculated_layer.c).cte(name=f"context_{layer}")
+
+
+async def refresh_context_layers_caches(conn: AsyncConnection) -> int:
+    """
+    Rebuild projects context layers which `get_context_layer_cache` found out of date and requested to refresh,
+    return the number of actually rebuilt layers.
+
+    Every layer is rebuilt by `user_projects.refresh_project_context_cache` database function, which skips
+    layers already rebuilt (or removed) since the request. Each layer is committed separately, so that its lock
+    is released before the next one is rebuilt.
+    """
+    requests = sorted(_context_layers_refresh_requests)
+    _context_layers_refresh_requests.clear()
+
+    rebuilt = 0
+    for project_id, layer in requests:
+        statement = select(func.user_projects.refresh_project_context_cache(project_id, layer, type_=Boolean))
+        rebuilt += int((await conn.execute(statement)).scalar_one())
+        await conn.commit()
+
+    return rebuilt
 
 
 def build_hierarchy(
@@ -315,3 +593,68 @@ def build_hierarchy(
             root_nodes.append(node)
 
     return root_nodes
+
+
+@dataclass(frozen=True)
+class CachedTypesHierarchy:
+    """Functions and types loaded for the given source tables version with the full hierarchy built from them."""
+
+    version: int
+    functions: list[Mapping[str, Any]]
+    types: list[Any]
+    type_ids: frozenset[int]
+    full: list[Any]
+
+
+def build_types_hierarchy(
+    functions: Sequence[Mapping[str, Any]],
+    types: Sequence[InputDTOType],
+    function_id_attr: str,
+    output_model: Type[OutputDTOType],
+) -> list[OutputDTOType]:
+    """
+    Creates trees hierarchy of functions (urban functions or physical object functions) with types in leaves.
+
+    Function node children are its child functions, or (if it has none left) types of the function itself.
+    Functions without any types in their subtree are skipped. Each function and type is visited only once.
+
+    Parameters:
+    - functions: Function rows with the identifier and parent_id attributes (order of siblings is preserved).
+    - types: Type DTOs with the function identifier attribute.
+    - function_id_attr: The name of the attribute of the function identifier (in both functions and types).
+    - output_model: The class used to create function nodes (must contain the children attribute).
+
+    Retrieves the list of root nodes of the trees.
+    """
+
+    types_by_function: dict[int, list[InputDTOType]] = defaultdict(list)
+    for type_dto in types:
+        types_by_function[getattr(type_dto, function_id_attr)].append(type_dto)
+
+    functions_by_parent: dict[int | None, list[Mapping[str, Any]]] = defaultdict(list)
+    for function in functions:
+        functions_by_parent[function["parent_id"]].append(function)
+
+    def build_children(parent_id: int | None) -> list[OutputDTOType]:
+        children = []
+        for function in functions_by_parent.get(parent_id, []):
+            function_children = build_children(function[function_id_attr]) or types_by_function.get(
+                function[function_id_attr]
+            )
+            if function_children:
+                children.append(output_model(**function, children=function_children))
+
+        return children
+
+    return build_children(None)
+
+
+async def get_tables_version(conn: AsyncConnection, tables: Sequence[str]) -> int:
+    """Get summary version of the given tables (tracked in `public.tables_versions_data`),
+    which is changed on every write to any of them."""
+
+    statement = select(func.coalesce(func.sum(tables_versions_data.c.version), 0)).where(
+        tables_versions_data.c.table_name.in_(tables)
+    )
+
+    return (await conn.execute(statement)).scalar_one()
@@ -19,6 +19,7 @@ from idu_api.urban_api.logic.impl.helpers.physical_objects import (
     delete_building_from_db,
     delete_physical_object_from_db,
     get_buildings_by_physical_object_id_from_db,
+    get_nearest_physical_objects_from_db,
     get_physical_object_by_id_from_db,
     get_physical_object_geometries_from_db,
     get_physical_objects_around_from_db,
@@ -67,6 +68,14 @@ class PhysicalObjectsServiceImpl(PhysicalObjectsService):
         async with self._connection_manager.get_ro_connection() as conn:
             return await get_physical_objects_around_from_db(conn, geometry, physical_object_type_id, buffer_meters)
 
+    async def get_nearest_physical_objects(
+        self, geometry: Geom, physical_object_type_id: int | None, limit: int, max_distance_meters: int | None
+    ) -> list[PhysicalObjectWithGeometryDTO]:
+        async with self._connection_manager.get_ro_connection() as conn:
+            return await get_nearest_physical_objects_from_db(
+                conn, geometry, physical_object_type_id, limit, max_distance_meters
+            )
+
     async def add_physical_object_with_geometry(
         self, physical_object: PhysicalObjectWithGeometryPost
     ) -> UrbanObjectDTO:
@@ -10,6 +10,7 @@ from idu_api.common.db.connection.manager import PostgresConnectionManager
 from idu_api.urban_api.dto import (
     FunctionalZoneDTO,
     FunctionalZoneSourceDTO,
+    HexagonsIndicatorsMatrixDTO,
     HexagonWithIndicatorsDTO,
     PageDTO,
     ProjectDTO,
@@ -58,6 +59,7 @@ from idu_api.urban_api.logic.impl.helpers.projects_indicators import (
     add_scenario_indicator_value_to_db,
     delete_scenario_indicator_value_by_id_from_db,
     delete_scenario_indicators_values_by_scenario_id_from_db,
+    get_hexagons_indicators_matrix_by_scenario_id_from_db,
     get_hexagons_with_indicators_by_scenario_id_from_db,
     get_scenario_indicators_values_by_scenario_id_from_db,
     patch_scenario_indicator_value_to_db,
@@ -143,6 +145,7 @@ from idu_api.urban_api.schemas import (
     ServicePatch,
     ServicePut,
 )
+from idu_api.urban_api.utils.bbox import BBox
 
 
 class UserProjectServiceImpl(UserProjectService):  # pylint: disable=too-many-public-methods
@@ -541,6 +544,7 @@ class UserProjectServiceImpl(UserProjectService):  # pylint: disable=too-many-pu
         user: UserDTO | None,
         physical_object_id: int | None,
         service_id: int | None,
+        bbox: BBox | None = None,
     ) -> list[ScenarioGeometryDTO]:
         async with self._connection_manager.get_ro_connection() as conn:
             return await get_geometries_by_scenario_id_from_db(
@@ -549,6 +553,7 @@ class UserProjectServiceImpl(UserProjectService):  # pylint: disable=too-many-pu
                 user,
                 physical_object_id,
                 service_id,
+                bbox,
             )
 
     async def get_geometries_with_all_objects_by_scenario_id(
@@ -559,6 +564,7 @@ class UserProjectServiceImpl(UserProjectService):  # pylint: disable=too-many-pu
         service_type_id: int | None,
         physical_object_function_id: int | None,
         urban_function_id: int | None,
+        bbox: BBox | None = None,
     ) -> list[ScenarioGeometryWithAllObjectsDTO]:
         async with self._connection_manager.get_ro_connection() as conn:
             return await get_geometries_with_all_objects_by_scenario_id_from_db(
@@ -569,6 +575,7 @@ class UserProjectServiceImpl(UserProjectService):  # pylint: disable=too-many-pu
                 service_type_id,
                 physical_object_function_id,
                 urban_function_id,
+                bbox,
             )
 
     async def get_context_geometries(
@@ -712,6 +719,18 @@ class UserProjectServiceImpl(UserProjectService):  # pylint: disable=too-many-pu
                 conn, scenario_id, indicator_ids, indicators_group_id, user
             )
 
+    async def get_hexagons_indicators_matrix_by_scenario_id(
+        self,
+        scenario_id: int,
+        indicator_ids: set[int] | None,
+        indicators_group_id: int | None,
+        user: UserDTO | None,
+    ) -> HexagonsIndicatorsMatrixDTO:
+        async with self._connection_manager.get_ro_connection() as conn:
+            return await get_hexagons_indicators_matrix_by_scenario_id_from_db(
+                conn, scenario_id, indicator_ids, indicators_group_id, user
+            )
+
     async def update_all_indicators_values_by_scenario_id(self, scenario_id: int, user: UserDTO) -> dict[str, Any]:
         async with self._connection_manager.get_connection() as conn:
             return await update_all_indicators_values_by_scenario_id_to_db(conn, scenario_id, user, logger=self._logger)
@@ -0,0 +1,27 @@
+"""Search handlers logic of getting entities from the database is defined here."""
+
+from idu_api.common.db.connection.manager import PostgresConnectionManager
+from idu_api.urban_api.dto import SearchResultDTO, UserDTO
+from idu_api.urban_api.logic.impl.helpers.search import search_by_name_from_db
+from idu_api.urban_api.logic.search import SearchService
+
+
+class SearchServiceImpl(SearchService):
+    """Service to search entities by name.
+
+    Based on async SQLAlchemy connection.
+    """
+
+    def __init__(self, connection_manager: PostgresConnectionManager):
+        self._connection_manager = connection_manager
+
+    async def search_by_name(
+        self,
+        query: str,
+        entity_type: str | None,
+        mode: str,
+        limit: int,
+        user: UserDTO | None,
+    ) -> list[SearchResultDTO]:
+        async with self._connection_manager.get_ro_connection() as conn:
+            return await search_by_name_from_db(conn, query, entity_type, mode, limit, user)
@@ -1,11 +1,14 @@
 """Service handlers logic of getting entities from the database is defined here."""
 
+from shapely.geometry import LineString, MultiPolygon, Point, Polygon
+
 from idu_api.common.db.connection.manager import PostgresConnectionManager
-from idu_api.urban_api.dto import ServiceDTO, UrbanObjectDTO
+from idu_api.urban_api.dto import ServiceDTO, ServiceWithGeometryDTO, UrbanObjectDTO
 from idu_api.urban_api.logic.impl.helpers.services import (
     add_service_to_db,
     add_service_to_object_in_db,
     delete_service_from_db,
+    get_nearest_services_from_db,
     get_service_by_id_from_db,
     patch_service_to_db,
     put_service_to_db,
@@ -13,6 +16,8 @@ from idu_api.urban_api.logic.impl.helpers.services import (
 from idu_api.urban_api.logic.services import ServicesDataService
 from idu_api.urban_api.schemas import ServicePatch, ServicePost, ServicePut
 
+Geom = Point | Polygon | MultiPolygon | LineString
+
 
 class ServicesDataServiceImpl(ServicesDataService):
     """Service to manipulate service objects.
@@ -27,6 +32,12 @@ class ServicesDataServiceImpl(ServicesDataService):
         async with self._connection_manager.get_ro_connection() as conn:
             return await get_service_by_id_from_db(conn, service_id)
 
+    async def get_nearest_services(
+        self, geometry: Geom, service_type_id: int | None, limit: int, max_distance_meters: int | None
+    ) -> list[ServiceWithGeometryDTO]:
+        async with self._connection_manager.get_ro_connection() as conn:
+            return await get_nearest_services_from_db(conn, geometry, service_type_id, limit, max_distance_meters)
+
     async def add_service(self, service: ServicePost) -> ServiceDTO:
         async with self._connection_manager.get_connection() as conn:
             return await add_service_to_db(conn, service)
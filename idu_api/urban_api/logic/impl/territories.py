@@ -7,6 +7,7 @@ from shapely.geometry import LineString, MultiLineString, MultiPolygon, Point, P
 
 from idu_api.common.db.connection.manager import PostgresConnectionManager
 from idu_api.urban_api.dto import (
+    AggregatedIndicatorValueDTO,
     BufferDTO,
     BuildingWithGeometryDTO,
     FunctionalZoneDTO,
@@ -19,7 +20,9 @@ from idu_api.urban_api.dto import (
     PhysicalObjectDTO,
     PhysicalObjectTypeDTO,
     PhysicalObjectWithGeometryDTO,
+    ServiceCoverageDTO,
     ServiceDTO,
+    ServiceProvisionDTO,
     ServicesCountCapacityDTO,
     ServiceTypeDTO,
     ServiceWithGeometryDTO,
@@ -31,7 +34,10 @@ from idu_api.urban_api.dto import (
     TerritoryWithNormativesDTO,
     TerritoryWithoutGeometryDTO,
 )
-from idu_api.urban_api.logic.impl.helpers.territories_buffers import get_buffers_by_territory_id_from_db
+from idu_api.urban_api.logic.impl.helpers.territories_buffers import (
+    get_buffers_by_territory_id_from_db,
+    get_service_coverage_by_territory_id_from_db,
+)
 from idu_api.urban_api.logic.impl.helpers.territories_buildings import (
     get_buildings_with_geometry_by_territory_id_from_db,
 )
@@ -46,6 +52,7 @@ from idu_api.urban_api.logic.impl.helpers.territories_hexagons import (
     get_hexagons_by_territory_id_from_db,
 )
 from idu_api.urban_api.logic.impl.helpers.territories_indicators import (
+    get_aggregated_indicator_values_by_territory_id_from_db,
     get_indicator_values_by_parent_id_from_db,
     get_indicator_values_by_territory_id_from_db,
     get_indicators_by_territory_id_from_db,
@@ -64,6 +71,7 @@ from idu_api.urban_api.logic.impl.helpers.territories_objects import (
     get_intersecting_territories_for_geometry,
     get_territories_by_ids,
     get_territories_by_parent_id_from_db,
+    get_territories_for_points_from_db,
     get_territories_without_geometry_by_parent_id_from_db,
     get_territory_by_id,
     patch_territory_to_db,
@@ -74,6 +82,9 @@ from idu_api.urban_api.logic.impl.helpers.territories_physical_objects import (
     get_physical_objects_by_territory_id_from_db,
     get_physical_objects_with_geometry_by_territory_id_from_db,
 )
+from idu_api.urban_api.logic.impl.helpers.territories_provision import (
+    get_services_provision_by_territory_id_from_db,
+)
 from idu_api.urban_api.logic.impl.helpers.territories_services import (
     get_service_types_by_territory_id_from_db,
     get_services_by_territory_id_from_db,
@@ -99,6 +110,7 @@ from idu_api.urban_api.schemas import (
     TerritoryPut,
     TerritoryTypePost,
 )
+from idu_api.urban_api.utils.bbox import BBox
 
 Geom = Point | Polygon | MultiPolygon | LineString | MultiLineString
 
@@ -129,9 +141,15 @@ class TerritoriesServiceImpl(TerritoriesService):  # pylint: disable=too-many-pu
         async with self._connection_manager.get_connection() as conn:
             return await add_target_city_type_to_db(conn, target_city_type)
 
-    async def get_territories_by_ids(self, territory_ids: list[int]) -> list[TerritoryDTO]:
+    async def get_territories_by_ids(
+        self,
+        territory_ids: list[int],
+        centers_only: bool = False,
+        simplify_tolerance: float | None = None,
+        precision: int | None = None,
+    ) -> list[TerritoryDTO]:
         async with self._connection_manager.get_ro_connection() as conn:
-            return await get_territories_by_ids(conn, territory_ids)
+            return await get_territories_by_ids(conn, territory_ids, centers_only, simplify_tolerance, precision)
 
     async def get_territory_by_id(self, territory_id: int) -> TerritoryDTO:
         async with self._connection_manager.get_ro_connection() as conn:
@@ -194,6 +212,10 @@ class TerritoriesServiceImpl(TerritoriesService):  # pylint: disable=too-many-pu
         order_by: Literal["created_at", "updated_at"] | None,
         ordering: Literal["asc", "desc"],
         paginate: bool = False,
+        centers_only: bool = False,
+        with_geometry: bool = True,
+        bbox: BBox | None = None,
+        limit: int | None = None,
     ) -> list[ServiceWithGeometryDTO] | PageDTO[ServiceWithGeometryDTO]:
         async with self._connection_manager.get_ro_connection() as conn:
             return await get_services_with_geometry_by_territory_id_from_db(
@@ -207,6 +229,10 @@ class TerritoriesServiceImpl(TerritoriesService):  # pylint: disable=too-many-pu
                 order_by,
                 ordering,
                 paginate,
+                centers_only,
+                with_geometry,
+                bbox,
+                limit,
             )
 
     async def get_services_capacity_by_territory_id(
@@ -215,6 +241,14 @@ class TerritoriesServiceImpl(TerritoriesService):  # pylint: disable=too-many-pu
         async with self._connection_manager.get_ro_connection() as conn:
             return await get_services_capacity_by_territory_id_from_db(conn, territory_id, level, service_type_id)
 
+    async def get_services_provision_by_territory_id(
+        self, territory_id: int, level: int, year: int | None, service_type_id: int | None
+    ) -> list[ServiceProvisionDTO]:
+        async with self._connection_manager.get_ro_connection() as conn:
+            return await get_services_provision_by_territory_id_from_db(
+                conn, territory_id, level, year, service_type_id
+            )
+
     async def get_indicators_by_territory_id(self, territory_id: int) -> list[IndicatorDTO]:
         async with self._connection_manager.get_ro_connection() as conn:
             return await get_indicators_by_territory_id_from_db(conn, territory_id)
@@ -271,6 +305,32 @@ class TerritoriesServiceImpl(TerritoriesService):  # pylint: disable=too-many-pu
                 last_only,
             )
 
+    async def get_aggregated_indicator_values_by_territory_id(
+        self,
+        territory_id: int,
+        indicator_ids: set[int],
+        level: int | None,
+        value_type: Literal["real", "target", "forecast"],
+        aggregation_type: Literal["sum", "avg", "weighted_avg"],
+        weight_indicator_id: int | None,
+        date_value: date | None,
+        persistent: bool,
+    ) -> list[AggregatedIndicatorValueDTO]:
+        async with (
+            self._connection_manager.get_connection() if persistent else self._connection_manager.get_ro_connection()
+        ) as conn:
+            return await get_aggregated_indicator_values_by_territory_id_from_db(
+                conn,
+                territory_id,
+                indicator_ids,
+                level,
+                value_type,
+                aggregation_type,
+                weight_indicator_id,
+                date_value,
+                persistent,
+            )
+
     async def get_normatives_by_territory_id(
         self,
         territory_id: int,
@@ -357,6 +417,10 @@ class TerritoriesServiceImpl(TerritoriesService):  # pylint: disable=too-many-pu
         order_by: Literal["created_at", "updated_at"] | None,
         ordering: Literal["asc", "desc"],
         paginate: bool = False,
+        centers_only: bool = False,
+        with_geometry: bool = True,
+        bbox: BBox | None = None,
+        limit: int | None = None,
     ) -> list[PhysicalObjectWithGeometryDTO] | PageDTO[PhysicalObjectWithGeometryDTO]:
         async with self._connection_manager.get_ro_connection() as conn:
             return await get_physical_objects_with_geometry_by_territory_id_from_db(
@@ -370,6 +434,10 @@ class TerritoriesServiceImpl(TerritoriesService):  # pylint: disable=too-many-pu
                 order_by,
                 ordering,
                 paginate,
+                centers_only,
+                with_geometry,
+                bbox,
+                limit,
             )
 
     async def get_buildings_with_geometry_by_territory_id(
@@ -399,6 +467,10 @@ class TerritoriesServiceImpl(TerritoriesService):  # pylint: disable=too-many-pu
         functional_zone_type_id: int | None,
         include_child_territories: bool,
         cities_only: bool,
+        simplify_tolerance: float | None = None,
+        precision: int | None = None,
+        bbox: BBox | None = None,
+        limit: int | None = None,
     ) -> list[FunctionalZoneDTO]:
         async with self._connection_manager.get_ro_connection() as conn:
             return await get_functional_zones_by_territory_id_from_db(
@@ -409,6 +481,10 @@ class TerritoriesServiceImpl(TerritoriesService):  # pylint: disable=too-many-pu
                 functional_zone_type_id,
                 include_child_territories,
                 cities_only,
+                simplify_tolerance,
+                precision,
+                bbox,
+                limit,
             )
 
     async def delete_all_functional_zones_for_territory(
@@ -430,6 +506,10 @@ class TerritoriesServiceImpl(TerritoriesService):  # pylint: disable=too-many-pu
         order_by: Literal["created_at", "updated_at"] | None,
         ordering: Literal["asc", "desc"] | None,
         paginate: bool,
+        centers_only: bool = False,
+        with_geometry: bool = True,
+        simplify_tolerance: float | None = None,
+        precision: int | None = None,
     ) -> list[TerritoryDTO] | PageDTO[TerritoryDTO]:
         async with self._connection_manager.get_ro_connection() as conn:
             return await get_territories_by_parent_id_from_db(
@@ -443,6 +523,10 @@ class TerritoriesServiceImpl(TerritoriesService):  # pylint: disable=too-many-pu
                 order_by,
                 ordering,
                 paginate,
+                centers_only,
+                with_geometry,
+                simplify_tolerance,
+                precision,
             )
 
     async def get_territories_without_geometry_by_parent_id(
@@ -498,6 +582,12 @@ class TerritoriesServiceImpl(TerritoriesService):  # pylint: disable=too-many-pu
         async with self._connection_manager.get_ro_connection() as conn:
             return await get_common_territory_for_geometry(conn, geometry)
 
+    async def get_territories_for_points(
+        self, points: list[tuple[float, float]]
+    ) -> list[list[TerritoryWithoutGeometryDTO]]:
+        async with self._connection_manager.get_ro_connection() as conn:
+            return await get_territories_for_points_from_db(conn, points)
+
     async def get_intersecting_territories_for_geometry(
         self,
         parent_territory: int,
@@ -537,3 +627,15 @@ class TerritoriesServiceImpl(TerritoriesService):  # pylint: disable=too-many-pu
                 physical_object_type_id,
                 service_type_id,
             )
+
+    async def get_service_coverage_by_territory_id(
+        self,
+        territory_id: int,
+        service_type_id: int,
+        buffer_type_id: int,
+        include_hexagons: bool,
+    ) -> ServiceCoverageDTO:
+        async with self._connection_manager.get_ro_connection() as conn:
+            return await get_service_coverage_by_territory_id_from_db(
+                conn, territory_id, service_type_id, buffer_type_id, include_hexagons
+            )
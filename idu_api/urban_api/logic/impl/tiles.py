@@ -0,0 +1,88 @@
+"""Vector tiles handlers logic of getting entities from the database is defined here."""
+
+import time
+from collections.abc import Awaitable, Callable
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from idu_api.common.db.connection.manager import PostgresConnectionManager
+from idu_api.urban_api.dto import UserDTO
+from idu_api.urban_api.logic.impl.helpers.projects_scenarios import check_scenario
+from idu_api.urban_api.logic.impl.helpers.tiles import (
+    SCENARIO_TILE_LAYERS_SOURCES,
+    TILE_LAYERS_SOURCES,
+    get_scenario_tile_from_db,
+    get_tile_from_db,
+    get_tiles_invalidation_state_from_db,
+)
+from idu_api.urban_api.logic.tiles import TilesService
+from idu_api.urban_api.utils.tiles_cache import CachedTile, TilesCache
+
+
+class TilesServiceImpl(TilesService):
+    """Service to build and cache vector tiles of the map layers.
+
+    Based on async `PostgresConnectionManager` and shared `TilesCache`. Cached tile is returned only if
+    no rows in its bounds were changed in the layer source tables since the tile was built.
+    """
+
+    def __init__(
+        self,
+        connection_manager: PostgresConnectionManager,
+        tiles_cache: TilesCache,
+        logger: structlog.stdlib.BoundLogger,
+    ):
+        self._connection_manager = connection_manager
+        self._tiles_cache = tiles_cache
+        self._logger = logger
+
+    async def get_tile(self, layer: str, z: int, x: int, y: int) -> bytes:
+        async with self._connection_manager.get_ro_connection() as conn:
+            return await self._get_cached_tile(
+                conn,
+                f"{layer}/{z}/{x}/{y}",
+                TILE_LAYERS_SOURCES[layer],
+                z,
+                x,
+                y,
+                lambda: get_tile_from_db(conn, layer, z, x, y),
+            )
+
+    async def get_scenario_tile(
+        self, scenario_id: int, layer: str, z: int, x: int, y: int, user: UserDTO | None
+    ) -> bytes:
+        async with self._connection_manager.get_ro_connection() as conn:
+            await check_scenario(conn, scenario_id, user)
+            return await self._get_cached_tile(
+                conn,
+                f"scenarios/{scenario_id}/{layer}/{z}/{x}/{y}",
+                SCENARIO_TILE_LAYERS_SOURCES[layer],
+                z,
+                x,
+                y,
+                lambda: get_scenario_tile_from_db(conn, scenario_id, layer, z, x, y),
+            )
+
+    async def _get_cached_tile(  # pylint: disable=too-many-arguments
+        self,
+        conn: AsyncConnection,
+        key: str,
+        tables: tuple[str, ...],
+        z: int,
+        x: int,
+        y: int,
+        build: Callable[[], Awaitable[bytes]],
+    ) -> bytes:
+        cached = await self._tiles_cache.get(key, self._logger)
+        watermark, is_stale = await get_tiles_invalidation_state_from_db(
+            conn, tables, z, x, y, cached.watermark if cached is not None else None
+        )
+        if cached is not None and not is_stale:
+            return cached.data
+
+        # watermark is taken before building, so changes committed meanwhile invalidate the tile on the next request
+        data = await build()
+        await self._tiles_cache.put(key, CachedTile(data, watermark, time.time()), self._logger)
+
+        return data
@@ -44,6 +44,12 @@ class PhysicalObjectsService(Protocol):
     ) -> list[PhysicalObjectWithGeometryDTO]:
         """Get physical objects which are in buffer area of the given geometry."""
 
+    @abc.abstractmethod
+    async def get_nearest_physical_objects(
+        self, geometry: Geom, physical_object_type_id: int | None, limit: int, max_distance_meters: int | None
+    ) -> list[PhysicalObjectWithGeometryDTO]:
+        """Get the nearest physical objects to the given geometry, sorted by distance."""
+
     @abc.abstractmethod
     async def add_physical_object_with_geometry(
         self, physical_object: PhysicalObjectWithGeometryPost
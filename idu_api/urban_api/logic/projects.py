@@ -7,6 +7,7 @@ from otteroad import KafkaProducerClient
 from idu_api.urban_api.dto import (
     FunctionalZoneDTO,
     FunctionalZoneSourceDTO,
+    HexagonsIndicatorsMatrixDTO,
     HexagonWithIndicatorsDTO,
     PageDTO,
     ProjectDTO,
@@ -55,6 +56,7 @@ from idu_api.urban_api.schemas import (
     ServicePatch,
     ServicePut,
 )
+from idu_api.urban_api.utils.bbox import BBox
 
 
 class UserProjectService(Protocol):  # pylint: disable=too-many-public-methods
@@ -389,8 +391,9 @@ class UserProjectService(Protocol):  # pylint: disable=too-many-public-methods
         user: UserDTO | None,
         physical_object_id: int | None,
         service_id: int | None,
+        bbox: BBox | None = None,
     ) -> list[ScenarioGeometryDTO]:
-        """Get all geometries for given scenario."""
+        """Get all geometries for given scenario (optionally only the ones intersecting bounding box)."""
 
     @abc.abstractmethod
     async def get_geometries_with_all_objects_by_scenario_id(
@@ -401,8 +404,10 @@ class UserProjectService(Protocol):  # pylint: disable=too-many-public-methods
         service_type_id: int | None,
         physical_object_function_id: int | None,
         urban_function_id: int | None,
+        bbox: BBox | None = None,
     ) -> list[ScenarioGeometryWithAllObjectsDTO]:
-        """Get geometries with lists of physical objects and services by scenario identifier."""
+        """Get geometries with lists of physical objects and services by scenario identifier
+        (optionally only the ones intersecting bounding box)."""
 
     @abc.abstractmethod
     async def get_context_geometries(
@@ -522,6 +527,16 @@ class UserProjectService(Protocol):  # pylint: disable=too-many-public-methods
     ) -> list[HexagonWithIndicatorsDTO]:
         """Get project's indicators values for given regional scenario with hexagons."""
 
+    @abc.abstractmethod
+    async def get_hexagons_indicators_matrix_by_scenario_id(
+        self,
+        scenario_id: int,
+        indicator_ids: set[int] | None,
+        indicators_group_id: int | None,
+        user: UserDTO | None,
+    ) -> HexagonsIndicatorsMatrixDTO:
+        """Get project's indicators values for given regional scenario as a (hexagons x indicators) matrix."""
+
     @abc.abstractmethod
     async def update_all_indicators_values_by_scenario_id(self, scenario_id: int, user: UserDTO) -> dict[str, Any]:
         """Update all indicators values for given scenario."""
@@ -0,0 +1,21 @@
+"""Search handlers logic of getting entities from the database is defined here."""
+
+import abc
+from typing import Protocol
+
+from idu_api.urban_api.dto import SearchResultDTO, UserDTO
+
+
+class SearchService(Protocol):
+    """Service to search entities by name."""
+
+    @abc.abstractmethod
+    async def search_by_name(
+        self,
+        query: str,
+        entity_type: str | None,
+        mode: str,
+        limit: int,
+        user: UserDTO | None,
+    ) -> list[SearchResultDTO]:
+        """Search territories, physical objects, services and projects by name (the most similar first)."""
@@ -3,9 +3,13 @@
 import abc
 from typing import Protocol
 
-from idu_api.urban_api.dto import ServiceDTO, UrbanObjectDTO
+from shapely.geometry import LineString, MultiPolygon, Point, Polygon
+
+from idu_api.urban_api.dto import ServiceDTO, ServiceWithGeometryDTO, UrbanObjectDTO
 from idu_api.urban_api.schemas import ServicePatch, ServicePost, ServicePut
 
+Geom = Point | Polygon | MultiPolygon | LineString
+
 
 class ServicesDataService(Protocol):
     """Service to manipulate service objects."""
@@ -14,6 +18,12 @@ class ServicesDataService(Protocol):
     async def get_service_by_id(self, service_id: int) -> ServiceDTO:
         """Get service object by id with territories."""
 
+    @abc.abstractmethod
+    async def get_nearest_services(
+        self, geometry: Geom, service_type_id: int | None, limit: int, max_distance_meters: int | None
+    ) -> list[ServiceWithGeometryDTO]:
+        """Get the nearest services to the given geometry, sorted by distance."""
+
     @abc.abstractmethod
     async def add_service(self, service: ServicePost) -> ServiceDTO:
         """Create service object."""
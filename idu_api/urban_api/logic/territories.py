@@ -7,6 +7,7 @@ from typing import Literal, Protocol
 from shapely.geometry import LineString, MultiLineString, MultiPolygon, Point, Polygon
 
 from idu_api.urban_api.dto import (
+    AggregatedIndicatorValueDTO,
     BufferDTO,
     BuildingWithGeometryDTO,
     FunctionalZoneDTO,
@@ -19,7 +20,9 @@ from idu_api.urban_api.dto import (
     PhysicalObjectDTO,
     PhysicalObjectTypeDTO,
     PhysicalObjectWithGeometryDTO,
+    ServiceCoverageDTO,
     ServiceDTO,
+    ServiceProvisionDTO,
     ServicesCountCapacityDTO,
     ServiceTypeDTO,
     ServiceWithGeometryDTO,
@@ -42,6 +45,7 @@ from idu_api.urban_api.schemas import (
     TerritoryPut,
     TerritoryTypePost,
 )
+from idu_api.urban_api.utils.bbox import BBox
 
 Geom = Point | Polygon | MultiPolygon | LineString | MultiLineString
 
@@ -67,8 +71,15 @@ class TerritoriesService(Protocol):  # pylint: disable=too-many-public-methods,
         """Create target city type object."""
 
     @abc.abstractmethod
-    async def get_territories_by_ids(self, territory_ids: list[int]) -> list[TerritoryDTO]:
-        """Get territory objects by ids list."""
+    async def get_territories_by_ids(
+        self,
+        territory_ids: list[int],
+        centers_only: bool = False,
+        simplify_tolerance: float | None = None,
+        precision: int | None = None,
+    ) -> list[TerritoryDTO]:
+        """Get territory objects by ids list (only with centre points if `centers_only` is set),
+        geometries can be simplified with `simplify_tolerance` and rounded to `precision` decimal digits."""
 
     @abc.abstractmethod
     async def get_territory_by_id(self, territory_id: int) -> TerritoryDTO:
@@ -119,8 +130,12 @@ class TerritoriesService(Protocol):  # pylint: disable=too-many-public-methods,
         order_by: Literal["created_at", "updated_at"] | None,
         ordering: Literal["asc", "desc"],
         paginate: bool = False,
+        centers_only: bool = False,
+        with_geometry: bool = True,
+        bbox: BBox | None = None,
+        limit: int | None = None,
     ) -> list[ServiceWithGeometryDTO] | PageDTO[ServiceWithGeometryDTO]:
-        """Get service objects with geometry by territory id."""
+        """Get service objects with geometry by territory id (optionally only the ones intersecting bounding box)."""
 
     @abc.abstractmethod
     async def get_services_capacity_by_territory_id(
@@ -128,6 +143,13 @@ class TerritoriesService(Protocol):  # pylint: disable=too-many-public-methods,
     ) -> list[ServicesCountCapacityDTO]:
         """Get summary capacity and count of services for sub-territories of given territory at the given level."""
 
+    @abc.abstractmethod
+    async def get_services_provision_by_territory_id(
+        self, territory_id: int, level: int, year: int | None, service_type_id: int | None
+    ) -> list[ServiceProvisionDTO]:
+        """Get required (by normatives and population) and actual number and capacity of services
+        for sub-territories of given territory at the given level."""
+
     @abc.abstractmethod
     async def get_indicators_by_territory_id(self, territory_id: int) -> list[IndicatorDTO]:
         """Get indicators for a given territory."""
@@ -170,6 +192,24 @@ class TerritoriesService(Protocol):  # pylint: disable=too-many-public-methods,
         Could be specified by last_only flag to get only current indicator values.
         """
 
+    @abc.abstractmethod
+    async def get_aggregated_indicator_values_by_territory_id(
+        self,
+        territory_id: int,
+        indicator_ids: set[int],
+        level: int | None,
+        value_type: Literal["real", "target", "forecast"],
+        aggregation_type: Literal["sum", "avg", "weighted_avg"],
+        weight_indicator_id: int | None,
+        date_value: date | None,
+        persistent: bool,
+    ) -> list[AggregatedIndicatorValueDTO]:
+        """Get indicator values of the territory (or of its sub-territories at the given level)
+        aggregated up the territories hierarchy.
+
+        Could be specified by persistent flag to use (and save) persisted aggregates of the last values.
+        """
+
     @abc.abstractmethod
     async def get_normatives_by_territory_id(
         self,
@@ -242,9 +282,13 @@ class TerritoriesService(Protocol):  # pylint: disable=too-many-public-methods,
         order_by: Literal["created_at", "updated_at"] | None,
         ordering: Literal["asc", "desc"],
         paginate: bool = False,
+        centers_only: bool = False,
+        with_geometry: bool = True,
+        bbox: BBox | None = None,
+        limit: int | None = None,
     ) -> list[PhysicalObjectWithGeometryDTO] | PageDTO[PhysicalObjectWithGeometryDTO]:
-        """Get physical objects with geometry by territory id,
-        optional physical object type and physical object function and for cities only."""
+        """Get physical objects with geometry by territory id, optional physical object type
+        and physical object function, for cities only and intersecting bounding box."""
 
     @abc.abstractmethod
     async def get_buildings_with_geometry_by_territory_id(
@@ -270,8 +314,12 @@ class TerritoriesService(Protocol):  # pylint: disable=too-many-public-methods,
         functional_zone_type_id: int | None,
         include_child_territories: bool,
         cities_only: bool,
+        simplify_tolerance: float | None = None,
+        precision: int | None = None,
+        bbox: BBox | None = None,
+        limit: int | None = None,
     ) -> list[FunctionalZoneDTO]:
-        """Get functional zones with geometry by territory id."""
+        """Get functional zones with geometry (optionally simplified and rounded) by territory id."""
 
     @abc.abstractmethod
     async def delete_all_functional_zones_for_territory(
@@ -291,6 +339,10 @@ class TerritoriesService(Protocol):  # pylint: disable=too-many-public-methods,
         order_by: Literal["created_at", "updated_at"] | None,
         ordering: Literal["asc", "desc"],
         paginate: bool,
+        centers_only: bool = False,
+        with_geometry: bool = True,
+        simplify_tolerance: float | None = None,
+        precision: int | None = None,
     ) -> list[TerritoryDTO] | PageDTO[TerritoryDTO]:
         """Get a territory or list of territories by parent, territory type could be specified in parameters."""
 
@@ -324,6 +376,13 @@ class TerritoriesService(Protocol):  # pylint: disable=too-many-public-methods,
     async def get_common_territory_for_geometry(self, geometry: Geom) -> TerritoryDTO | None:
         """Get the deepest territory which covers given geometry. None if there is no such territory."""
 
+    @abc.abstractmethod
+    async def get_territories_for_points(
+        self, points: list[tuple[float, float]]
+    ) -> list[list[TerritoryWithoutGeometryDTO]]:
+        """Get chains of territories (from the top-level one to the deepest one) covering each of the given points,
+        empty chain if point is outside all territories."""
+
     @abc.abstractmethod
     async def get_intersecting_territories_for_geometry(
         self,
@@ -355,3 +414,13 @@ class TerritoriesService(Protocol):  # pylint: disable=too-many-public-methods,
         service_type_id: int | None,
     ) -> list[BufferDTO]:
         """Get buffers by territory identifier."""
+
+    @abc.abstractmethod
+    async def get_service_coverage_by_territory_id(
+        self,
+        territory_id: int,
+        service_type_id: int,
+        buffer_type_id: int,
+        include_hexagons: bool,
+    ) -> ServiceCoverageDTO:
+        """Get union of buffers of the given service type for a territory."""
@@ -0,0 +1,20 @@
+"""Vector tiles handlers logic of getting entities from the database is defined here."""
+
+import abc
+from typing import Protocol
+
+from idu_api.urban_api.dto import UserDTO
+
+
+class TilesService(Protocol):
+    """Service to build and cache vector tiles of the map layers."""
+
+    @abc.abstractmethod
+    async def get_tile(self, layer: str, z: int, x: int, y: int) -> bytes:
+        """Get Mapbox Vector Tile of the public data layer."""
+
+    @abc.abstractmethod
+    async def get_scenario_tile(
+        self, scenario_id: int, layer: str, z: int, x: int, y: int, user: UserDTO | None
+    ) -> bytes:
+        """Get Mapbox Vector Tile of the scenario data layer."""
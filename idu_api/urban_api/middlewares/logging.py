@@ -6,10 +6,12 @@ import structlog
 from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from idu_api.common.db.connection import start_queries_statistics
 from idu_api.urban_api.dto.users.users import UserDTO
 from idu_api.urban_api.exceptions.base import IduApiError
 from idu_api.urban_api.prometheus import metrics
 from idu_api.urban_api.utils.logging import get_handler_from_path
+from idu_api.urban_api.utils.profiler import requests_profiler
 
 
 class LoggingMiddleware(BaseHTTPMiddleware):  # pylint: disable=too-few-public-methods
@@ -25,7 +27,7 @@ class LoggingMiddleware(BaseHTTPMiddleware):  # pylint: disable=too-few-public-m
         request.state.logger = logger
         user: UserDTO | None = request.state.user
 
-        await logger.ainfo(
+        logger.info(
             "handling request",
             client=request.client.host,
             path_params=request.path_params,
@@ -35,6 +37,8 @@ class LoggingMiddleware(BaseHTTPMiddleware):  # pylint: disable=too-few-public-m
         )
 
         path_for_metric = get_handler_from_path(request.url.path)
+        queries_statistics = start_queries_statistics()
+        sampler = requests_profiler.try_start(request.method, request.url.path) if requests_profiler.armed else None
 
         time_begin = time.monotonic_ns()
         try:
@@ -42,7 +46,14 @@ class LoggingMiddleware(BaseHTTPMiddleware):  # pylint: disable=too-few-public-m
 
             time_finish = time.monotonic_ns()
             duration_seconds = (time_finish - time_begin) / 1e9
-            await logger.ainfo("request handled successfully", time_consumed=round(duration_seconds, 3))
+            logger.info(
+                "request handled successfully",
+                time_consumed=round(duration_seconds, 3),
+                db_queries=queries_statistics.queries,
+                db_time=round(queries_statistics.db_time, 3),
+                db_rows=queries_statistics.rows,
+                db_pool_wait=round(queries_statistics.pool_wait_time, 3),
+            )
             metrics.SUCCESS_COUNTER.labels(
                 method=request.method, path=path_for_metric, status_code=result.status_code
             ).inc(1)
@@ -52,15 +63,31 @@ class LoggingMiddleware(BaseHTTPMiddleware):  # pylint: disable=too-few-public-m
             duration_seconds = (time_finish - time_begin) / 1e9
 
             if isinstance(exc, (IduApiError, HTTPException)):
-                log_func = logger.aerror
+                log_func = logger.error
             else:
-                log_func = logger.aexception
-            await log_func(
-                "failed to handle request", time_consumed=round(duration_seconds, 3), error_type=type(exc).__name__
+                log_func = logger.exception
+            log_func(
+                "failed to handle request",
+                time_consumed=round(duration_seconds, 3),
+                error_type=type(exc).__name__,
+                db_queries=queries_statistics.queries,
+                db_time=round(queries_statistics.db_time, 3),
             )
             raise
         finally:
+            if sampler is not None:
+                requests_profiler.finish(sampler)
             metrics.REQUESTS_COUNTER.labels(
                 method=request.method, path=path_for_metric, is_user_set=user is not None
             ).inc(1)
             metrics.REQUEST_TIME.labels(method=request.method, path=path_for_metric).observe(duration_seconds)
+            metrics.REQUEST_DB_TIME.labels(method=request.method, path=path_for_metric).observe(
+                queries_statistics.db_time
+            )
+            metrics.REQUEST_DB_QUERIES.labels(method=request.method, path=path_for_metric).observe(
+                queries_statistics.queries
+            )
+            metrics.REQUEST_DB_ROWS.labels(method=request.method, path=path_for_metric).observe(queries_statistics.rows)
+            metrics.REQUEST_DB_POOL_WAIT_TIME.labels(method=request.method, path=path_for_metric).observe(
+                queries_statistics.pool_wait_time
+            )
@@ -2,15 +2,19 @@
 
 import asyncio
 import io
+from collections.abc import Iterable
 from contextlib import asynccontextmanager
 
 import aioboto3
 import structlog
 from botocore.config import Config
-from botocore.exceptions import EndpointConnectionError
+from botocore.exceptions import ClientError, EndpointConnectionError
 
 from idu_api.urban_api.config import UrbanAPIConfig
-from idu_api.urban_api.exceptions.utils.external import ExternalServiceUnavailable
+from idu_api.urban_api.exceptions.utils.external import ExternalServiceResponseError, ExternalServiceUnavailable
+
+DELETE_OBJECTS_BATCH_SIZE = 1000
+"""Maximum number of keys accepted by a single S3 `DeleteObjects` request."""
 
 
 class AsyncMinioClient:
@@ -62,11 +66,13 @@ class AsyncMinioClient:
         file_data: bytes,
         object_name: str,
         logger: structlog.stdlib.BoundLogger,
+        metadata: dict[str, str] | None = None,
     ) -> str:
-        """Upload a file from bytes data to the specified bucket asynchronously."""
+        """Upload a file from bytes data (with optional user-defined metadata) to the specified bucket asynchronously."""
         try:
             file_stream = io.BytesIO(file_data)
-            await session.upload_fileobj(file_stream, self._bucket_name, object_name)
+            extra_args = {"Metadata": metadata} if metadata else None
+            await session.upload_fileobj(file_stream, self._bucket_name, object_name, ExtraArgs=extra_args)
             return object_name
         except EndpointConnectionError as exc:
             await logger.aerror("could not connect to MinIO fileserver")
@@ -81,10 +87,13 @@ class AsyncMinioClient:
         logger: structlog.stdlib.BoundLogger,
         prefix: str = "",
     ) -> list[str]:
+        """List all object keys with the given prefix, following `list_objects_v2` pagination."""
         try:
-            response = await session.list_objects_v2(Bucket=self._bucket_name, Prefix=prefix)
-            existing_objects = {obj["Key"] for obj in response.get("Contents", [])}
-            return list(existing_objects)
+            existing_objects = []
+            paginator = session.get_paginator("list_objects_v2")
+            async for page in paginator.paginate(Bucket=self._bucket_name, Prefix=prefix):
+                existing_objects.extend(obj["Key"] for obj in page.get("Contents", []))
+            return list(dict.fromkeys(existing_objects))
         except EndpointConnectionError as exc:
             await logger.aerror("could not connect to MinIO fileserver")
             raise ExternalServiceUnavailable("fileserver") from exc
@@ -114,6 +123,26 @@ class AsyncMinioClient:
             await logger.aexception("unexpected error in AsyncMinioClient")
             raise exc
 
+    async def get_file_with_metadata(
+        self, session, object_name: str, logger: structlog.stdlib.BoundLogger
+    ) -> tuple[bytes, dict[str, str]] | None:
+        """Retrieve a file content with its user-defined metadata or None if the file does not exist."""
+        try:
+            response = await session.get_object(Bucket=self._bucket_name, Key=object_name)
+            async with response["Body"] as stream:
+                return await stream.read(), response.get("Metadata", {})
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") in ("NoSuchKey", "404"):
+                return None
+            await logger.aexception("unexpected error in AsyncMinioClient")
+            raise exc
+        except EndpointConnectionError as exc:
+            await logger.aerror("could not connect to MinIO fileserver")
+            raise ExternalServiceUnavailable("fileserver") from exc
+        except Exception as exc:
+            await logger.aexception("unexpected error in AsyncMinioClient")
+            raise exc
+
     async def generate_presigned_urls(
         self,
         session,
@@ -169,6 +198,59 @@ class AsyncMinioClient:
             await logger.aexception("unexpected error in AsyncMinioClient")
             raise exc
 
+    async def delete_files(
+        self,
+        session,
+        object_names: Iterable[str],
+        logger: structlog.stdlib.BoundLogger,
+        batch_size: int = DELETE_OBJECTS_BATCH_SIZE,
+        max_concurrency: int = 4,
+    ) -> int:
+        """Delete given files from the bucket with batched `DeleteObjects` requests.
+
+        Keys are split into batches of at most `batch_size` (S3 limit is 1000 keys per request),
+        and no more than `max_concurrency` requests are executed at the same time.
+
+        Returns the number of deleted objects.
+        """
+        object_names = list(dict.fromkeys(object_names))
+        if not object_names:
+            return 0
+
+        batch_size = min(batch_size, DELETE_OBJECTS_BATCH_SIZE)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def delete_batch(keys: list[str]) -> list[dict]:
+            async with semaphore:
+                response = await session.delete_objects(
+                    Bucket=self._bucket_name,
+                    Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+                )
+                return response.get("Errors", [])
+
+        try:
+            batches = [object_names[i : i + batch_size] for i in range(0, len(object_names), batch_size)]
+            results = await asyncio.gather(*[delete_batch(batch) for batch in batches])
+        except EndpointConnectionError as exc:
+            await logger.aerror("could not connect to MinIO fileserver")
+            raise ExternalServiceUnavailable("fileserver") from exc
+        except Exception as exc:
+            await logger.aexception("unexpected error in AsyncMinioClient")
+            raise exc
+
+        errors = [error for batch_errors in results for error in batch_errors]
+        if errors:
+            await logger.aerror(
+                "could not delete some objects from MinIO fileserver",
+                errors_count=len(errors),
+                first_error=errors[0],
+            )
+            raise ExternalServiceResponseError(
+                "fileserver", f"failed to delete {len(errors)} of {len(object_names)} objects", 502
+            )
+
+        return len(object_names)
+
 
 def get_minio_client_from_config(app_config: UrbanAPIConfig) -> AsyncMinioClient:
     minio_client = AsyncMinioClient(
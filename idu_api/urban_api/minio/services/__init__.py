@@ -1,8 +1,11 @@
 """Services using Minio are defined here."""
 
 from .projects_storage import ProjectStorageManager, get_project_storage_manager
+from .tiles_storage import TilesStorageManager, get_tiles_storage_manager_from_config
 
 __all__ = [
     "get_project_storage_manager",
     "ProjectStorageManager",
+    "get_tiles_storage_manager_from_config",
+    "TilesStorageManager",
 ]
@@ -167,9 +167,8 @@ class ProjectStorageManager:
             logger: Structlog logger.
         """
         async with self._client.get_session() as session:
-            existing_objects = await self._client.list_objects(session, logger, prefix=f"{project_id}/")
-            tasks = [self._client.delete_file(session, name, logger) for name in existing_objects]
-            await asyncio.gather(*tasks)
+            existing_objects = await self._client.list_objects(session, logger, prefix=self._project_prefix(project_id))
+            await self._client.delete_files(session, existing_objects, logger)
 
     # ========== Gallery Management ==========
 
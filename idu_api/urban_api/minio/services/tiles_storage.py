@@ -0,0 +1,84 @@
+"""Vector tiles storage in MinIO is defined here."""
+
+from structlog.stdlib import BoundLogger
+
+from idu_api.urban_api.config import UrbanAPIConfig
+from idu_api.urban_api.minio.client import AsyncMinioClient
+
+WATERMARK_METADATA_KEY = "watermark"
+CREATED_AT_METADATA_KEY = "created-at"
+
+
+class TilesStorageManager:
+    """
+    Manages the second level of vector tiles cache in MinIO, shared between all application workers.
+
+    Each tile is stored with the tiles watermark (snapshot xmin) taken before its building and building time
+    (as unix timestamp) in the object metadata. Storage errors are only logged, as tiles can always
+    be built again from the database.
+    """
+
+    def __init__(self, app_config: UrbanAPIConfig):
+        """
+        Initialize storage manager with application configuration.
+
+        Args:
+            app_config: Instance of UrbanAPIConfig containing MinIO settings.
+        """
+        self._client = AsyncMinioClient(
+            url=app_config.fileserver.url,
+            access_key=app_config.fileserver.access_key,
+            secret_key=app_config.fileserver.secret_key,
+            bucket_name=app_config.tiles.bucket,
+            region_name=app_config.fileserver.region_name,
+            connect_timeout=app_config.fileserver.connect_timeout,
+            read_timeout=app_config.fileserver.read_timeout,
+        )
+
+    @staticmethod
+    def _tile_path(key: str) -> str:
+        return f"{key}.mvt"
+
+    async def load_tile(self, key: str, logger: BoundLogger) -> tuple[bytes, int, float] | None:
+        """
+        Load tile with its watermark and building time.
+
+        Args:
+            key: Tile cache key (`{layer}/{z}/{x}/{y}` or `scenarios/{scenario_id}/{layer}/{z}/{x}/{y}`).
+            logger: Structlog logger.
+
+        Returns:
+            A tuple of tile content, watermark and building time or None if the tile is not stored.
+        """
+        try:
+            async with self._client.get_session() as session:
+                result = await self._client.get_file_with_metadata(session, self._tile_path(key), logger)
+            if result is None:
+                return None
+            data, metadata = result
+            return data, int(metadata[WATERMARK_METADATA_KEY]), float(metadata[CREATED_AT_METADATA_KEY])
+        except Exception:  # pylint: disable=broad-except
+            await logger.awarning("could not load tile from fileserver", key=key)
+            return None
+
+    async def save_tile(self, key: str, data: bytes, watermark: int, created_at: float, logger: BoundLogger) -> None:
+        """
+        Save tile with its watermark and building time.
+
+        Args:
+            key: Tile cache key.
+            data: Tile content (Mapbox Vector Tile).
+            watermark: The tiles watermark (snapshot xmin) taken before the tile building.
+            created_at: Tile building time (unix timestamp).
+            logger: Structlog logger.
+        """
+        metadata = {WATERMARK_METADATA_KEY: str(watermark), CREATED_AT_METADATA_KEY: str(created_at)}
+        try:
+            async with self._client.get_session() as session:
+                await self._client.upload_file(session, data, self._tile_path(key), logger, metadata=metadata)
+        except Exception:  # pylint: disable=broad-except
+            await logger.awarning("could not save tile to fileserver", key=key)
+
+
+def get_tiles_storage_manager_from_config(app_config: UrbanAPIConfig) -> TilesStorageManager:
+    return TilesStorageManager(app_config)
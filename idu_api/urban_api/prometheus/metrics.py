@@ -1,4 +1,4 @@
-from prometheus_client import Counter, Histogram
+from prometheus_client import Counter, Gauge, Histogram
 
 REQUEST_TIME = Histogram(
     "urban_api_request_processing_seconds",
@@ -22,3 +22,63 @@ ERRORS_COUNTER = Counter(
     "urban_api_errors_total", "Total number of errors in requests", ["method", "path", "error_type", "status_code"]
 )
 """Total errors (caused by exceptions) counter"""
+
+REQUEST_DB_TIME = Histogram(
+    "urban_api_request_db_seconds",
+    "Time spent on database queries per request histogram",
+    ["method", "path"],
+    buckets=[0.005, 0.01, 0.05, 0.1, 0.3, 0.7, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0],
+)
+"""Database queries time per request histogram in seconds"""
+
+REQUEST_DB_QUERIES = Histogram(
+    "urban_api_request_db_queries",
+    "Number of database queries per request histogram",
+    ["method", "path"],
+    buckets=[0, 1, 2, 3, 5, 10, 20, 50, 100, 500],
+)
+"""Database queries count per request histogram"""
+
+REQUEST_DB_ROWS = Histogram(
+    "urban_api_request_db_rows",
+    "Number of rows returned or affected by database queries per request histogram",
+    ["method", "path"],
+    buckets=[0, 1, 10, 100, 1000, 10000, 100000, 1000000],
+)
+"""Database rows per request histogram"""
+
+REQUEST_DB_POOL_WAIT_TIME = Histogram(
+    "urban_api_request_db_pool_wait_seconds",
+    "Time spent on waiting for database connections per request histogram",
+    ["method", "path"],
+    buckets=[0.001, 0.005, 0.01, 0.05, 0.1, 0.3, 1.0, 2.5, 5.0, 10.0],
+)
+"""Database connections acquiring time per request histogram in seconds"""
+
+DB_POOL_CONNECTIONS = Gauge(
+    "urban_api_db_pool_connections",
+    "Number of database connections in the pool by state (checked_out, idle, overflow) and pool size",
+    ["engine", "state"],
+    multiprocess_mode="livesum",
+)
+"""Database connection pool state gauge"""
+
+DB_POOL_CHECKOUT_WAIT_TIME = Histogram(
+    "urban_api_db_pool_checkout_wait_seconds",
+    "Time spent on acquiring a database connection from the pool histogram",
+    ["engine"],
+    buckets=[0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.3, 1.0, 2.5, 5.0, 10.0, 30.0],
+)
+"""Database connection checkout wait histogram in seconds"""
+
+EVENT_LOOP_LAG = Histogram(
+    "urban_api_event_loop_lag_seconds",
+    "Delay of scheduled callbacks in the event loop histogram",
+    buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0],
+)
+"""Event loop scheduling delay histogram in seconds"""
+
+EVENT_LOOP_LAG_LAST = Gauge(
+    "urban_api_event_loop_lag_last_seconds", "Last measured event loop scheduling delay", multiprocess_mode="livemax"
+)
+"""Last measured event loop scheduling delay in seconds"""
@@ -1,13 +1,30 @@
-from prometheus_client import start_http_server
+import os
+
+from prometheus_client import REGISTRY, CollectorRegistry, multiprocess, start_http_server
 
 _server, _thread = None, None
 
 
+def is_multiprocess_mode() -> bool:
+    """Check if metrics are collected from several worker processes (`PROMETHEUS_MULTIPROC_DIR` is set)."""
+    return bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+
 def start_server(port: int = 8000):
     global _server, _thread  # pylint: disable=global-statement
-    _server, _thread = start_http_server(port)
+    registry = REGISTRY
+    if is_multiprocess_mode():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    _server, _thread = start_http_server(port, registry=registry)
 
 
 def stop_server():
     if _server is not None:
         _server.shutdown()
+
+
+def mark_process_dead(pid: int):
+    """Remove live gauges values of the finished worker process in multiprocess mode."""
+    if is_multiprocess_mode():
+        multiprocess.mark_process_dead(pid)
@@ -5,15 +5,18 @@ from .buffers import (
     Buffer,
     BufferAttributes,
     BufferPut,
+    BuffersQueueStats,
     BufferType,
     BufferTypePost,
     DefaultBufferValue,
     DefaultBufferValuePost,
     DefaultBufferValuePut,
+    HexagonServiceCoverage,
     ScenarioBuffer,
     ScenarioBufferAttributes,
     ScenarioBufferDelete,
     ScenarioBufferPut,
+    ServiceCoverage,
 )
 from .buildings import (
     Building,
@@ -41,8 +44,9 @@ from .functional_zones import (
     ScenarioFunctionalZoneWithoutGeometry,
 )
 from .health_check import PingResponse
-from .hexagons import Hexagon, HexagonAttributes, HexagonPost, HexagonWithIndicators
+from .hexagons import Hexagon, HexagonAttributes, HexagonPost, HexagonsIndicatorsMatrix, HexagonWithIndicators
 from .indicators import (
+    AggregatedIndicatorValue,
     Indicator,
     IndicatorPost,
     IndicatorPut,
@@ -111,6 +115,7 @@ from .projects import (
     ProjectTerritoryPost,
 )
 from .scenarios import Scenario, ScenarioPatch, ScenarioPost, ScenarioPut
+from .search import SearchResult
 from .service_types import (
     ServiceType,
     ServiceTypePatch,
@@ -129,6 +134,7 @@ from .services import (
     Service,
     ServicePatch,
     ServicePost,
+    ServiceProvision,
     ServicePut,
     ServicesCountCapacity,
     ServiceWithGeometry,
@@ -146,6 +152,7 @@ from .soc_groups import (
     SocValueWithServiceTypes,
 )
 from .territories import (
+    PointsBatch,
     TargetCityType,
     TargetCityTypePost,
     Territory,
@@ -164,6 +171,7 @@ from .urban_objects import ScenarioUrbanObject, UrbanObject, UrbanObjectPatch
 
 __all__ = [
     "PingResponse",
+    "PointsBatch",
     "TerritoryType",
     "TerritoryTypePost",
     "Territory",
@@ -174,10 +182,12 @@ __all__ = [
     "TerritoryWithIndicators",
     "TerritoryWithNormatives",
     "TerritoryWithoutGeometry",
+    "SearchResult",
     "Scenario",
     "ScenarioPatch",
     "ScenarioPost",
     "ScenarioPut",
+    "ServiceProvision",
     "ServicesCountCapacity",
     "Service",
     "ServicePatch",
@@ -196,6 +206,7 @@ __all__ = [
     "IndicatorPost",
     "IndicatorPut",
     "IndicatorValue",
+    "AggregatedIndicatorValue",
     "IndicatorValuePost",
     "IndicatorValuePut",
     "MeasurementUnit",
@@ -269,6 +280,7 @@ __all__ = [
     "HexagonPost",
     "HexagonAttributes",
     "HexagonWithIndicators",
+    "HexagonsIndicatorsMatrix",
     "ScenarioFunctionalZone",
     "ScenarioFunctionalZonePatch",
     "ScenarioFunctionalZonePost",
@@ -300,6 +312,7 @@ __all__ = [
     "Buffer",
     "BufferAttributes",
     "BufferPut",
+    "BuffersQueueStats",
     "BufferType",
     "DefaultBufferValue",
     "DefaultBufferValuePost",
@@ -309,4 +322,6 @@ __all__ = [
     "ScenarioBufferPut",
     "ScenarioBufferDelete",
     "ScenarioBufferAttributes",
+    "ServiceCoverage",
+    "HexagonServiceCoverage",
 ]
@@ -1,8 +1,18 @@
 """Buffers schemas are defined here."""
 
+from datetime import datetime
+
 from pydantic import BaseModel, Field, model_validator
 
-from idu_api.urban_api.dto import BufferDTO, BufferTypeDTO, DefaultBufferValueDTO, ScenarioBufferDTO
+from idu_api.urban_api.dto import (
+    BufferDTO,
+    BuffersQueueStatsDTO,
+    BufferTypeDTO,
+    DefaultBufferValueDTO,
+    HexagonServiceCoverageDTO,
+    ScenarioBufferDTO,
+    ServiceCoverageDTO,
+)
 from idu_api.urban_api.schemas.geometries import Geometry, NotPointGeometryValidationModel
 from idu_api.urban_api.schemas.short_models import (
     BufferTypeBasic,
@@ -160,6 +170,80 @@ class BufferPut(NotPointGeometryValidationModel):
     geometry: Geometry | None
 
 
+class BuffersQueueStats(BaseModel):
+    """Pending buffers recalculation statistics schema."""
+
+    pending: int = Field(..., description="number of queued public urban objects", examples=[0])
+    oldest_queued_at: datetime | None = Field(..., description="time of the oldest queued public urban object")
+    projects_pending: int = Field(..., description="number of queued user projects urban objects", examples=[0])
+    projects_oldest_queued_at: datetime | None = Field(
+        ..., description="time of the oldest queued user projects urban object"
+    )
+
+    @classmethod
+    def from_dto(cls, dto: BuffersQueueStatsDTO) -> "BuffersQueueStats":
+        return cls(
+            pending=dto.pending,
+            oldest_queued_at=dto.oldest_queued_at,
+            projects_pending=dto.projects_pending,
+            projects_oldest_queued_at=dto.projects_oldest_queued_at,
+        )
+
+
+class HexagonServiceCoverage(BaseModel):
+    """Service coverage of a single hexagon."""
+
+    hexagon_id: int = Field(..., description="hexagon identifier", examples=[1])
+    hexagon_area: float = Field(..., description="hexagon area in square meters", examples=[1000000])
+    covered_area: float = Field(..., description="covered area of the hexagon in square meters", examples=[250000])
+    coverage_ratio: float = Field(..., description="share of the covered hexagon area", examples=[0.25])
+
+    @classmethod
+    def from_dto(cls, dto: HexagonServiceCoverageDTO) -> "HexagonServiceCoverage":
+        return cls(
+            hexagon_id=dto.hexagon_id,
+            hexagon_area=dto.hexagon_area,
+            covered_area=dto.covered_area,
+            coverage_ratio=dto.coverage_ratio,
+        )
+
+
+class ServiceCoverage(BaseModel):
+    """Service coverage (union of buffers) of the territory."""
+
+    territory: ShortTerritory
+    service_type: ServiceTypeBasic
+    buffer_type: BufferTypeBasic
+    geometry: Geometry | None = Field(..., description="union of buffers clipped by the territory geometry")
+    territory_area: float = Field(..., description="territory area in square meters", examples=[1000000])
+    covered_area: float = Field(..., description="covered area in square meters", examples=[250000])
+    coverage_ratio: float = Field(..., description="share of the covered territory area", examples=[0.25])
+    services_count: int = Field(..., description="number of services with buffers of the given type", examples=[10])
+    built_at: datetime = Field(..., description="the time when the coverage was calculated")
+    hexagons: list[HexagonServiceCoverage] | None = Field(
+        None, description="coverage of the territory hexagons (if requested)"
+    )
+
+    @classmethod
+    def from_dto(cls, dto: ServiceCoverageDTO) -> "ServiceCoverage":
+        return cls(
+            territory=ShortTerritory(id=dto.territory_id, name=dto.territory_name),
+            service_type=ServiceTypeBasic(id=dto.service_type_id, name=dto.service_type_name),
+            buffer_type=BufferTypeBasic(id=dto.buffer_type_id, name=dto.buffer_type_name),
+            geometry=Geometry.from_shapely_geometry(dto.geometry),
+            territory_area=dto.territory_area,
+            covered_area=dto.covered_area,
+            coverage_ratio=dto.coverage_ratio,
+            services_count=dto.services_count,
+            built_at=dto.built_at,
+            hexagons=(
+                [HexagonServiceCoverage.from_dto(hexagon) for hexagon in dto.hexagons]
+                if dto.hexagons is not None
+                else None
+            ),
+        )
+
+
 class ScenarioBuffer(BaseModel):
     """Scenario buffer schema with all its attributes."""
 
@@ -15,6 +15,17 @@ class ValueType(str, Enum):
     FORECAST = "forecast"
 
 
+class AggregationType(str, Enum):
+    SUM = "sum"
+    AVG = "avg"
+    WEIGHTED_AVG = "weighted_avg"
+
+
+class ProfileFormat(str, Enum):
+    SPEEDSCOPE = "speedscope"
+    COLLAPSED = "collapsed"
+
+
 class Ordering(str, Enum):
     ASC = "asc"
     DESC = "desc"
@@ -49,3 +60,28 @@ class ProjectPhase(str, Enum):
     CONSTRUCTION = "construction"
     OPERATION = "operation"
     DECOMMISSION = "decommission"
+
+
+class TileLayer(str, Enum):
+    TERRITORIES = "territories"
+    PHYSICAL_OBJECTS = "physical_objects"
+    SERVICES = "services"
+    FUNCTIONAL_ZONES = "functional_zones"
+
+
+class ScenarioTileLayer(str, Enum):
+    GEOMETRIES = "geometries"
+    FUNCTIONAL_ZONES = "functional_zones"
+
+
+class SearchEntity(str, Enum):
+    TERRITORIES = "territories"
+    PHYSICAL_OBJECTS = "physical_objects"
+    SERVICES = "services"
+    PROJECTS = "projects"
+
+
+class SearchMode(str, Enum):
+    SUBSTRING = "substring"
+    PREFIX = "prefix"
+    FUZZY = "fuzzy"
@@ -4,7 +4,7 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 
-from idu_api.urban_api.dto import HexagonDTO
+from idu_api.urban_api.dto import HexagonDTO, HexagonsIndicatorsMatrixDTO
 from idu_api.urban_api.schemas.geometries import Geometry, GeometryValidationModel
 from idu_api.urban_api.schemas.short_models import ShortProjectIndicatorValue, ShortTerritory
 
@@ -66,3 +66,21 @@ class HexagonWithIndicators(BaseModel):
 
     hexagon_id: int = Field(..., examples=[1])
     indicators: list[ShortProjectIndicatorValue]
+
+
+class HexagonsIndicatorsMatrix(BaseModel):
+    """Indicators values matrix (hexagons x indicators) for heatmaps."""
+
+    hexagon_ids: list[int] = Field(..., description="hexagons identifiers (rows of the matrix)", examples=[[1, 2]])
+    indicator_ids: list[int] = Field(
+        ..., description="indicators identifiers (columns of the matrix)", examples=[[1, 2]]
+    )
+    values: list[list[float | None]] = Field(
+        ..., description="indicators values (null if there is no value)", examples=[[[23.5, None], [1.0, 2.0]]]
+    )
+
+    @classmethod
+    def from_dto(cls, dto: HexagonsIndicatorsMatrixDTO) -> "HexagonsIndicatorsMatrix":
+        """Construct from DTO"""
+
+        return cls(hexagon_ids=dto.hexagon_ids, indicator_ids=dto.indicator_ids, values=dto.values)
@@ -7,6 +7,7 @@ from typing import Any, Literal
 from pydantic import BaseModel, Field, field_validator, model_validator
 
 from idu_api.urban_api.dto import (
+    AggregatedIndicatorValueDTO,
     IndicatorDTO,
     IndicatorsGroupDTO,
     IndicatorValueDTO,
@@ -281,6 +282,62 @@ class IndicatorValue(BaseModel):
         )
 
 
+class AggregatedIndicatorValue(BaseModel):
+    """Indicator value aggregated up the territories hierarchy."""
+
+    indicator: ShortIndicatorInfo
+    territory: ShortTerritory
+    value_type: Literal["real", "forecast", "target"] = Field(
+        ..., description="indicator value type", examples=["real"]
+    )
+    aggregation_type: Literal["sum", "avg", "weighted_avg"] = Field(
+        ..., description="aggregation type", examples=["sum"]
+    )
+    weight_indicator_id: int | None = Field(
+        ..., description="identifier of indicator which values are used as weights", examples=[1]
+    )
+    value: float | None = Field(..., description="aggregated value (null if there are no values)", examples=[23.5])
+    territories_count: int = Field(..., description="number of territories which values were aggregated", examples=[5])
+    date_value: date | None = Field(..., description="the latest date of aggregated values", examples=["2024-01-01"])
+
+    @field_validator("value_type", "aggregation_type", mode="before")
+    @staticmethod
+    def enum_to_string(value: Any) -> str:
+        if isinstance(value, Enum):
+            return value.value
+        return value
+
+    @classmethod
+    def from_dto(cls, dto: AggregatedIndicatorValueDTO) -> "AggregatedIndicatorValue":
+        """
+        Construct from DTO.
+        """
+        return cls(
+            indicator=ShortIndicatorInfo(
+                indicator_id=dto.indicator_id,
+                parent_id=dto.parent_id,
+                name_full=dto.name_full,
+                level=dto.level,
+                list_label=dto.list_label,
+                measurement_unit=(
+                    MeasurementUnitBasic(
+                        id=dto.measurement_unit_id,
+                        name=dto.measurement_unit_name,
+                    )
+                    if dto.measurement_unit_id is not None
+                    else None
+                ),
+            ),
+            territory=ShortTerritory(id=dto.territory_id, name=dto.territory_name),
+            value_type=dto.value_type,
+            aggregation_type=dto.aggregation_type,
+            weight_indicator_id=dto.weight_indicator_id,
+            value=dto.value,
+            territories_count=dto.territories_count,
+            date_value=dto.date_value,
+        )
+
+
 class IndicatorValuePost(BaseModel):
     """Indicator value schema for POST request."""
 
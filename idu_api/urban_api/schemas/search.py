@@ -0,0 +1,21 @@
+"""Search schemas are defined here."""
+
+from pydantic import BaseModel, Field
+
+from idu_api.urban_api.dto import SearchResultDTO
+from idu_api.urban_api.schemas.enums import SearchEntity
+
+
+class SearchResult(BaseModel):
+    """Entity found by name."""
+
+    entity_type: SearchEntity = Field(..., description="type of the found entity", examples=["territories"])
+    id: int = Field(..., description="entity identifier", examples=[1])
+    name: str = Field(..., description="entity name", examples=["--"])
+    rank: float = Field(..., description="trigram similarity of the name to the query (from 0 to 1)", examples=[0.5])
+
+    @classmethod
+    def from_dto(cls, dto: SearchResultDTO) -> "SearchResult":
+        """Construct from DTO"""
+
+        return cls(entity_type=dto.entity_type, id=dto.id, name=dto.name, rank=dto.rank)
@@ -8,11 +8,13 @@ from pydantic import BaseModel, Field, model_validator
 from idu_api.urban_api.dto import (
     ScenarioServiceDTO,
     ServiceDTO,
+    ServiceProvisionDTO,
     ServicesCountCapacityDTO,
     ServiceWithGeometryDTO,
 )
 from idu_api.urban_api.schemas.geometries import Geometry
 from idu_api.urban_api.schemas.service_types import ServiceType, UrbanFunctionBasic
+from idu_api.urban_api.schemas.short_models import ServiceTypeBasic
 from idu_api.urban_api.schemas.territories import ShortTerritory, TerritoryType
 
 
@@ -213,6 +215,48 @@ class ServicesCountCapacity(BaseModel):
         return cls(territory_id=dto.territory_id, count=dto.count, capacity=dto.capacity)
 
 
+class ServiceProvision(BaseModel):
+    """Required and actual number and capacity of services of the given type in the territory."""
+
+    territory: ShortTerritory
+    service_type: ServiceTypeBasic
+    year: int = Field(..., description="year of normatives and population", examples=[2025])
+    population: float | None = Field(..., description="territory population", examples=[10000])
+    normative_territory_id: int = Field(
+        ..., description="identifier of the territory which normative is applied (itself or ancestor)", examples=[1]
+    )
+    services_per_1000_normative: float | None = Field(..., examples=[1.0])
+    services_capacity_per_1000_normative: float | None = Field(..., examples=[120.0])
+    count: int = Field(..., description="number of services located in the territory", examples=[8])
+    capacity: int = Field(..., description="summary capacity of services located in the territory", examples=[1000])
+    required_count: float | None = Field(..., description="number of services required by normative", examples=[10])
+    required_capacity: float | None = Field(
+        ..., description="summary capacity of services required by normative", examples=[1200]
+    )
+    provision: float | None = Field(
+        ...,
+        description="ratio of actual capacity to required (or count if there is no capacity normative)",
+        examples=[0.83],
+    )
+
+    @classmethod
+    def from_dto(cls, dto: ServiceProvisionDTO) -> "ServiceProvision":
+        return cls(
+            territory=ShortTerritory(id=dto.territory_id, name=dto.territory_name),
+            service_type=ServiceTypeBasic(id=dto.service_type_id, name=dto.service_type_name),
+            year=dto.year,
+            population=dto.population,
+            normative_territory_id=dto.normative_territory_id,
+            services_per_1000_normative=dto.services_per_1000_normative,
+            services_capacity_per_1000_normative=dto.services_capacity_per_1000_normative,
+            count=dto.count,
+            capacity=dto.capacity,
+            required_count=dto.required_count,
+            required_capacity=dto.required_capacity,
+            provision=dto.provision,
+        )
+
+
 class ScenarioService(Service):
     """Service with all its attributes."""
 
@@ -1,7 +1,7 @@
 """Territory schemas are defined here."""
 
 from datetime import datetime, timezone
-from typing import Any
+from typing import Annotated, Any
 
 from pydantic import BaseModel, Field, model_validator
 
@@ -331,3 +331,15 @@ class TerritoryWithNormatives(BaseModel):
     territory_id: int = Field(..., examples=[1])
     name: str = Field(..., description="territory name", examples=["--"])
     normatives: list[ShortNormativeInfo]
+
+
+class PointsBatch(BaseModel):
+    """Points to find covering territories for."""
+
+    points: list[tuple[Annotated[float, Field(ge=-180, le=180)], Annotated[float, Field(ge=-90, le=90)]]] = Field(
+        ...,
+        min_length=1,
+        max_length=25_000,
+        description="list of (longitude, latitude) pairs in EPSG:4326",
+        examples=[[[30.31, 59.94]]],
+    )
@@ -0,0 +1,45 @@
+"""
+Bounding box query parameter dependency for FastAPI handlers.
+
+Clients showing data on a map pass the current viewport as `bbox=min_lon,min_lat,max_lon,max_lat`
+(in EPSG:4326), so that only objects intersecting it are selected.
+
+Example usage:
+
+    from fastapi import Depends
+
+    @router.get("/objects")
+    async def get_objects(bbox: BBox | None = Depends(get_bbox)):
+        ...
+"""
+
+from fastapi import HTTPException, Query
+from starlette import status
+
+BBox = tuple[float, float, float, float]
+
+
+def get_bbox(
+    bbox: str | None = Query(
+        None, description="bounding box to filter by: min_lon,min_lat,max_lon,max_lat (EPSG:4326)"
+    ),
+) -> BBox | None:
+    """Parse comma-separated bounding box coordinates, raise 400 Bad Request if they are invalid."""
+    if bbox is None:
+        return None
+
+    try:
+        min_lon, min_lat, max_lon, max_lat = (float(coordinate.strip()) for coordinate in bbox.split(","))
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="bbox must be given as four comma-separated numbers: min_lon,min_lat,max_lon,max_lat",
+        ) from exc
+
+    if not (-180 <= min_lon <= max_lon <= 180 and -90 <= min_lat <= max_lat <= 90):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="bbox minimal coordinates must not exceed maximal ones and must be within EPSG:4326 bounds",
+        )
+
+    return min_lon, min_lat, max_lon, max_lat
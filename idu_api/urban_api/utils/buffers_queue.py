@@ -0,0 +1,35 @@
+"""Background worker which drains the default buffers recalculation queue is defined here."""
+
+import structlog
+
+from idu_api.common.db.connection.manager import PostgresConnectionManager
+from idu_api.urban_api.logic.impl.buffers import BufferServiceImpl
+from idu_api.urban_api.utils.periodic_worker import PeriodicWorker
+
+
+class BuffersQueueWorker(PeriodicWorker):
+    """Periodically recalculates default buffers of queued urban objects in batches.
+
+    Queue is filled by database triggers, so that writing transactions do not compute buffers themselves.
+    When a full batch was processed the next one is taken immediately, otherwise worker sleeps for `interval` seconds.
+    """
+
+    task_name = "buffers_queue_worker"
+    error_message = "could not process buffers queue"
+
+    def __init__(
+        self,
+        connection_manager: PostgresConnectionManager,
+        batch_size: int,
+        interval: float,
+        logger: structlog.stdlib.BoundLogger,
+    ):
+        super().__init__(interval, logger)
+        self._buffers_service = BufferServiceImpl(connection_manager)
+        self._batch_size = batch_size
+
+    async def _iterate(self) -> bool:
+        processed = await self._buffers_service.process_buffers_queue(self._batch_size)
+        if processed > 0:
+            await self._logger.adebug("processed buffers queue batch", urban_objects=processed)
+        return processed >= self._batch_size
@@ -0,0 +1,37 @@
+"""Background worker which rebuilds persisted caches found out of date on read is defined here."""
+
+import structlog
+
+from idu_api.common.db.connection.manager import PostgresConnectionManager
+from idu_api.urban_api.logic.impl.helpers.territories_buffers import refresh_service_coverages
+from idu_api.urban_api.logic.impl.helpers.utils import refresh_context_layers_caches
+from idu_api.urban_api.utils.periodic_worker import PeriodicWorker
+
+
+class CachesRefreshWorker(PeriodicWorker):
+    """Periodically rebuilds cached layers of the projects contexts and services coverages which were requested
+    while out of date.
+
+    Reading requests calculate out of date caches on the fly and only register them for the rebuild, so that
+    they do not write anything and can be served by replicas.
+    """
+
+    task_name = "caches_refresh_worker"
+    error_message = "could not rebuild out of date caches"
+
+    def __init__(
+        self,
+        connection_manager: PostgresConnectionManager,
+        interval: float,
+        logger: structlog.stdlib.BoundLogger,
+    ):
+        super().__init__(interval, logger)
+        self._connection_manager = connection_manager
+
+    async def _iterate(self) -> bool:
+        async with self._connection_manager.get_connection() as conn:
+            layers = await refresh_context_layers_caches(conn)
+            coverages = await refresh_service_coverages(conn)
+        if layers > 0 or coverages > 0:
+            await self._logger.adebug("rebuilt out of date caches", layers=layers, coverages=coverages)
+        return False
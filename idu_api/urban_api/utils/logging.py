@@ -1,15 +1,39 @@
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from typing import Literal
 
 import structlog
 
 LoggingLevel = Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
 
+_queue_listener: QueueListener | None = None
+
+
+class _StructlogQueueHandler(QueueHandler):
+    """Queue handler which passes records as is, so that structlog event dicts are rendered by the listener handlers.
+
+    Default `QueueHandler.prepare` formats the message in the calling thread, which is what the queue avoids.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
 
 def configure_logging(
-    log_level: LoggingLevel, files: dict[str, LoggingLevel] | None = None, root_logger_level: LoggingLevel = "INFO"
+    log_level: LoggingLevel,
+    files: dict[str, LoggingLevel] | None = None,
+    root_logger_level: LoggingLevel = "INFO",
+    json_console: bool = False,
 ) -> structlog.stdlib.BoundLogger:
+    """Configure structlog and standard logging.
+
+    Log records are put to a queue and rendered and written by a single background thread (`QueueListener`),
+    so logging calls do not block the event loop on I/O. Console output is colored unless `json_console` is set.
+    """
+    global _queue_listener  # pylint: disable=global-statement
+
     level_name_mapping = {
         "DEBUG": logging.DEBUG,
         "INFO": logging.INFO,
@@ -39,23 +63,49 @@ def configure_logging(
 
     console_handler = logging.StreamHandler(sys.stderr)
     console_handler.setFormatter(
-        structlog.stdlib.ProcessorFormatter(processor=structlog.dev.ConsoleRenderer(colors=True))
+        structlog.stdlib.ProcessorFormatter(
+            processor=(
+                structlog.processors.JSONRenderer() if json_console else structlog.dev.ConsoleRenderer(colors=True)
+            )
+        )
     )
-
-    root_logger = logging.getLogger()
-    root_logger.addHandler(console_handler)
+    handlers: list[logging.Handler] = [console_handler]
 
     for filename, level in files.items():
         file_handler = logging.FileHandler(filename=filename, encoding="utf-8")
         file_handler.setFormatter(structlog.stdlib.ProcessorFormatter(processor=structlog.processors.JSONRenderer()))
         file_handler.setLevel(level_name_mapping[level])
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    stop_logging()
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
 
+    root_logger = logging.getLogger()
+    root_logger.addHandler(_StructlogQueueHandler(log_queue))
     root_logger.setLevel(root_logger_level)
 
     return logger
 
 
+def stop_logging() -> None:
+    """Write all queued log records, stop the background writer thread and close its handlers."""
+    global _queue_listener  # pylint: disable=global-statement
+
+    if _queue_listener is None:
+        return
+
+    _queue_listener.stop()
+    for handler in _queue_listener.handlers:
+        handler.close()
+    root_logger = logging.getLogger()
+    for handler in root_logger.handlers[:]:
+        if isinstance(handler, _StructlogQueueHandler):
+            root_logger.removeHandler(handler)
+    _queue_listener = None
+
+
 def get_handler_from_path(path: str) -> str:
     parts = path.split("/")
     return "/".join(part if not part.rstrip(".0").isdigit() else "*" for part in parts)
@@ -0,0 +1,53 @@
+"""Base class of background workers running in the application event loop is defined here."""
+
+import abc
+import asyncio
+
+import structlog
+
+
+class PeriodicWorker(abc.ABC):
+    """Runs `_iterate` in a background task, sleeping for `interval` seconds between iterations.
+
+    Errors of an iteration are logged with `error_message` and do not stop the worker.
+    """
+
+    task_name: str
+    error_message: str
+
+    def __init__(self, interval: float, logger: structlog.stdlib.BoundLogger):
+        self._interval = interval
+        self._logger = logger
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start worker task in the current event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name=self.task_name)
+
+    async def stop(self) -> None:
+        """Cancel worker task and wait for it to finish."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    @abc.abstractmethod
+    async def _iterate(self) -> bool:
+        """Do the work once, return True if the next iteration should start without sleeping."""
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                repeat = await self._iterate()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # pylint: disable=broad-except
+                await self._logger.aexception(self.error_message, error=repr(exc))
+                repeat = False
+            if not repeat:
+                await asyncio.sleep(self._interval)
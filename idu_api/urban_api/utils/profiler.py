@@ -0,0 +1,166 @@
+"""Statistical (sampling) profiler used by profiler endpoints is defined here.
+
+Sampler thread periodically takes a stack of the event loop thread, so profiling has no effect on the code being
+profiled except for GIL contention on each sample. Nothing is running while profiler is not active.
+"""
+
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from types import FrameType
+from typing import Any
+
+Frame = tuple[str, str, int]
+"""Function qualified name, file name and line number of the function definition."""
+
+
+@dataclass
+class SampledProfile:
+    name: str
+    interval: float
+    duration: float = 0.0
+    stacks: Counter[tuple[Frame, ...]] = field(default_factory=Counter)
+
+
+class StackSampler:
+    """Samples stacks of the given thread with the given interval in a background daemon thread."""
+
+    def __init__(self, name: str, interval: float, thread_id: int | None = None):
+        self._profile = SampledProfile(name=name, interval=interval)
+        self._thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._started_at = 0.0
+
+    def start(self) -> None:
+        """Start sampling in a background thread."""
+        self._started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="stack_sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> SampledProfile:
+        """Stop sampling and return collected profile."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._profile.duration = time.perf_counter() - self._started_at
+        return self._profile
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self._profile.interval):
+            frame = sys._current_frames().get(self._thread_id)  # pylint: disable=protected-access
+            if frame is not None:
+                self._profile.stacks[_extract_stack(frame)] += 1
+
+
+class RequestsProfiler:
+    """Profiles the next requests which path matches the given pattern.
+
+    Only one request is profiled at a time, as the sampler takes stacks of the whole event loop thread.
+    """
+
+    def __init__(self):
+        self._pattern: re.Pattern | None = None
+        self._count = 0
+        self._interval = 0.005
+        self._in_progress = False
+        self._lock = threading.Lock()
+        self.profiles: list[SampledProfile] = []
+
+    @property
+    def armed(self) -> bool:
+        """Check if there are requests left to profile."""
+        return self._pattern is not None
+
+    def arm(self, path_pattern: str, count: int, interval: float) -> None:
+        """Profile the next `count` requests which path matches `path_pattern` (regular expression)."""
+        with self._lock:
+            self._pattern = re.compile(path_pattern)
+            self._count = count
+            self._interval = interval
+            self.profiles = []
+
+    def disarm(self) -> None:
+        """Stop waiting for requests to profile and forget collected profiles."""
+        with self._lock:
+            self._pattern = None
+            self._count = 0
+            self.profiles = []
+
+    def try_start(self, method: str, path: str) -> StackSampler | None:
+        """Get started sampler if the request should be profiled."""
+        with self._lock:
+            if self._pattern is None or self._in_progress or self._pattern.search(path) is None:
+                return None
+            self._in_progress = True
+            self._count -= 1
+            if self._count <= 0:
+                self._pattern = None
+        sampler = StackSampler(f"{method} {path}", self._interval)
+        sampler.start()
+        return sampler
+
+    def finish(self, sampler: StackSampler) -> None:
+        """Stop sampler and save the request profile."""
+        profile = sampler.stop()
+        profile.name = f"{profile.name} ({profile.duration:.3f}s)"
+        with self._lock:
+            self.profiles.append(profile)
+            self._in_progress = False
+
+
+requests_profiler = RequestsProfiler()
+
+
+def to_speedscope(profiles: list[SampledProfile], name: str = "urban_api") -> dict[str, Any]:
+    """Build report in speedscope file format (https://www.speedscope.app/file-format-schema.json)."""
+    frames: dict[Frame, int] = {}
+    speedscope_profiles = []
+    for profile in profiles:
+        samples, weights = [], []
+        # sampler thread is not woken up exactly on time, so real duration is split between samples
+        sample_weight = profile.duration / max(profile.stacks.total(), 1)
+        for stack, count in profile.stacks.items():
+            samples.append([frames.setdefault(frame, len(frames)) for frame in stack])
+            weights.append(count * sample_weight)
+        speedscope_profiles.append(
+            {
+                "type": "sampled",
+                "name": profile.name,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": samples,
+                "weights": weights,
+            }
+        )
+
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "name": name,
+        "exporter": "urban_api",
+        "shared": {"frames": [{"name": func, "file": file, "line": line} for func, file, line in frames]},
+        "profiles": speedscope_profiles,
+    }
+
+
+def to_collapsed(profiles: list[SampledProfile]) -> str:
+    """Build report in collapsed stacks format (used by flamegraph.pl, inferno and speedscope)."""
+    lines = []
+    for profile in profiles:
+        for stack, count in profile.stacks.items():
+            frames = ";".join(f"{func} ({file}:{line})" for func, file, line in stack)
+            lines.append(f"{profile.name};{frames} {count}")
+    return "\n".join(lines) + "\n"
+
+
+def _extract_stack(frame: FrameType | None) -> tuple[Frame, ...]:
+    stack = []
+    while frame is not None:
+        code = frame.f_code
+        stack.append((getattr(code, "co_qualname", code.co_name), code.co_filename, code.co_firstlineno))
+        frame = frame.f_back
+    return tuple(reversed(stack))
@@ -19,10 +19,13 @@ import abc
 from collections.abc import Callable
 from typing import Any
 
+from geoalchemy2.functions import ST_MakeEnvelope
 from sqlalchemy import CTE, select
 from sqlalchemy.sql import Select
 from sqlalchemy.sql.schema import Table
 
+from idu_api.urban_api.utils.bbox import BBox
+
 
 class BaseFilter(abc.ABC):
     """
@@ -98,6 +101,33 @@ class ILikeFilter(BaseFilter):
         return query
 
 
+class BBoxFilter(BaseFilter):
+    """
+    A spatial filter by bounding box: `table.field && ST_MakeEnvelope(min_x, min_y, max_x, max_y, srid)`.
+
+    The `&&` operator is resolved with the GiST index of the geometry column. It compares bounding boxes only,
+    so it is enough to cut the data to the map viewport. If value is None, this filter has no effect.
+    """
+
+    def __init__(self, table: Table | CTE, field_name: str, value: BBox | None, srid: int = 4326):
+        """
+        Args:
+            table: The SQLAlchemy Table object that contains the target geometry column.
+            field_name: The geometry column name to apply the filter to.
+            value: Bounding box (min_x, min_y, max_x, max_y). If None, the filter will be skipped.
+            srid: SRID of the bounding box coordinates (must be the same as the column one).
+        """
+        super().__init__(table, field_name, value)
+        self.srid = srid
+
+    def apply(self, query: Select) -> Select:
+        if self.value is not None:
+            return query.where(
+                getattr(self.table.c, self.field_name).intersects(ST_MakeEnvelope(*self.value, self.srid))
+            )
+        return query
+
+
 class RecursiveFilter(BaseFilter):
     """
     A recursive filter using a common table expression (CTE).
@@ -0,0 +1,26 @@
+"""JSON responses rendered by pydantic-core serializer are defined here."""
+
+from typing import Any
+
+from pydantic_core import to_json
+from starlette.responses import JSONResponse
+
+
+class FastJSONResponse(JSONResponse):
+    """Default application response class which renders content with pydantic-core (Rust) serializer
+    instead of the standard library `json` module.
+
+    Non-finite floats are rendered as null, as JSON has no representation for them.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content, inf_nan_mode="null")
+
+
+class TrustedJSONResponse(FastJSONResponse):
+    """Response for schemas which are built by the application itself (from DTOs), i.e. they are already valid.
+
+    Returning a response object from a handler makes FastAPI skip `response_model` validation and
+    `jsonable_encoder` pass, so pydantic models are serialized to bytes only once. `response_model` should still be
+    set in the route decorator to keep OpenAPI schema.
+    """
@@ -0,0 +1,51 @@
+"""Background monitor of database connection pools and event loop health is defined here."""
+
+import asyncio
+
+import structlog
+
+from idu_api.common.db.connection.manager import PostgresConnectionManager
+from idu_api.urban_api.prometheus import metrics
+from idu_api.urban_api.utils.periodic_worker import PeriodicWorker
+
+
+class RuntimeMetricsMonitor(PeriodicWorker):
+    """Periodically exports connection pools state and event loop lag to Prometheus.
+
+    Event loop lag is the delay between the moment a sleeping task was scheduled to wake up and the moment it
+    actually did, so any blocking code (image processing, heavy geometry operations) running on the loop shows up here.
+    """
+
+    task_name = "runtime_metrics_monitor"
+    error_message = "could not collect connection pools statistics"
+
+    def __init__(
+        self,
+        connection_manager: PostgresConnectionManager,
+        interval: float,
+        logger: structlog.stdlib.BoundLogger,
+    ):
+        super().__init__(interval, logger)
+        self._connection_manager = connection_manager
+        self._expected_wakeup: float | None = None
+
+    async def _iterate(self) -> bool:
+        loop = asyncio.get_running_loop()
+        if self._expected_wakeup is not None:
+            lag = max(loop.time() - self._expected_wakeup, 0.0)
+            metrics.EVENT_LOOP_LAG.observe(lag)
+            metrics.EVENT_LOOP_LAG_LAST.set(lag)
+        # worker falls asleep for the interval right after the iteration
+        self._expected_wakeup = loop.time() + self._interval
+
+        for pool in self._connection_manager.get_pools_statistics():
+            metrics.DB_POOL_CONNECTIONS.labels(engine=pool.engine, state="size").set(pool.size)
+            metrics.DB_POOL_CONNECTIONS.labels(engine=pool.engine, state="checked_out").set(pool.checked_out)
+            metrics.DB_POOL_CONNECTIONS.labels(engine=pool.engine, state="idle").set(pool.idle)
+            metrics.DB_POOL_CONNECTIONS.labels(engine=pool.engine, state="overflow").set(pool.overflow)
+        return False
+
+
+def observe_pool_wait_time(engine: str, wait_time: float) -> None:
+    """Export time spent on acquiring a connection from the given engine pool."""
+    metrics.DB_POOL_CHECKOUT_WAIT_TIME.labels(engine=engine).observe(wait_time)
@@ -0,0 +1,66 @@
+"""Two-level (memory + MinIO) vector tiles cache is defined here."""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from structlog.stdlib import BoundLogger
+
+from idu_api.urban_api.minio.services import TilesStorageManager
+
+
+@dataclass(frozen=True)
+class CachedTile:
+    """Built tile with the tiles watermark (snapshot xmin) taken before its building."""
+
+    data: bytes
+    watermark: int
+    created_at: float
+
+
+class TilesCache:
+    """Vector tiles cache with LRU in-memory level (per worker process) and optional shared MinIO level.
+
+    Cache itself does not know anything about data changes: a tile returned by `get` must be checked against
+    invalidations registered after its watermark. Tiles older than `ttl` seconds are never returned, so that
+    invalidations can be removed from the database after some time.
+    """
+
+    def __init__(self, size: int, ttl: float, storage: TilesStorageManager | None = None):
+        self._size = size
+        self._ttl = ttl
+        self._storage = storage
+        self._memory: OrderedDict[str, CachedTile] = OrderedDict()
+
+    async def get(self, key: str, logger: BoundLogger) -> CachedTile | None:
+        """Get tile from memory or (on miss) from MinIO storage."""
+        tile = self._memory.get(key)
+        if tile is not None:
+            self._memory.move_to_end(key)
+        elif self._storage is not None:
+            loaded = await self._storage.load_tile(key, logger)
+            if loaded is not None:
+                tile = CachedTile(*loaded)
+                self._remember(key, tile)
+
+        if tile is not None and time.time() - tile.created_at > self._ttl:
+            self.discard(key)
+            return None
+
+        return tile
+
+    async def put(self, key: str, tile: CachedTile, logger: BoundLogger) -> None:
+        """Save tile to memory and MinIO storage."""
+        self._remember(key, tile)
+        if self._storage is not None:
+            await self._storage.save_tile(key, tile.data, tile.watermark, tile.created_at, logger)
+
+    def discard(self, key: str) -> None:
+        """Remove tile from memory (stored one is going to be overwritten with a newly built tile)."""
+        self._memory.pop(key, None)
+
+    def _remember(self, key: str, tile: CachedTile) -> None:
+        self._memory[key] = tile
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._size:
+            self._memory.popitem(last=False)
@@ -0,0 +1,34 @@
+"""Background worker which removes outdated tiles invalidations is defined here."""
+
+import structlog
+
+from idu_api.common.db.connection.manager import PostgresConnectionManager
+from idu_api.urban_api.logic.impl.helpers.tiles import delete_outdated_tiles_invalidations_from_db
+from idu_api.urban_api.utils.periodic_worker import PeriodicWorker
+
+
+class TilesInvalidationsCleaner(PeriodicWorker):
+    """Periodically removes tiles invalidations which are older than any tile allowed to be taken from cache.
+
+    Invalidations are registered by database triggers, and cleaning them up there would make every writing
+    transaction delete rows of the shared table.
+    """
+
+    task_name = "tiles_invalidations_cleaner"
+    error_message = "could not remove outdated tiles invalidations"
+
+    def __init__(
+        self,
+        connection_manager: PostgresConnectionManager,
+        interval: float,
+        logger: structlog.stdlib.BoundLogger,
+    ):
+        super().__init__(interval, logger)
+        self._connection_manager = connection_manager
+
+    async def _iterate(self) -> bool:
+        async with self._connection_manager.get_connection() as conn:
+            removed = await delete_outdated_tiles_invalidations_from_db(conn)
+        if removed > 0:
+            await self._logger.adebug("removed outdated tiles invalidations", invalidations=removed)
+        return False
@@ -59,6 +59,13 @@ class MockResult:
         self.rows = rows
         self.paging = self.Paging(paging_data) if paging_data else None
 
+    @property
+    def rowcount(self):
+        """
+        Simulate the `rowcount` attribute to return the number of rows.
+        """
+        return len(self.rows)
+
     def scalar(self):
         """
         Simulate the `scalar_one()` method to return the first value of the first row.
@@ -23,6 +23,7 @@ class MockAsyncMinioClient:
         self.copy_object_mock = AsyncMock()
         self.generate_presigned_urls_mock = AsyncMock()
         self.delete_file_mock = AsyncMock()
+        self.delete_files_mock = AsyncMock()
 
     @asynccontextmanager
     async def get_session_client(self):
@@ -67,6 +68,13 @@ class MockAsyncMinioClient:
         else:
             raise FileNotFoundError(f"Object '{object_name}' not found in mock store")
 
+    async def delete_files(self, session, object_names: list[str], logger: structlog.stdlib.BoundLogger) -> int:
+        """Mock the delete_files method."""
+        await self.delete_files_mock(object_names)
+        for object_name in object_names:
+            self._store.pop(object_name, None)
+        return len(object_names)
+
 
 @pytest.fixture
 def mock_minio_client():
@@ -5,15 +5,17 @@ from unittest.mock import AsyncMock, patch
 import pytest
 from geoalchemy2.functions import ST_AsEWKB
 from shapely.geometry import LineString, MultiLineString, MultiPoint, MultiPolygon, Point, Polygon
-from sqlalchemy import delete, insert, select, update
+from sqlalchemy import delete, func, insert, select, true, update
 
 from idu_api.common.db.entities import (
     buffer_types_dict,
     buffers_data,
+    buffers_queue_data,
     default_buffer_values_dict,
     object_geometries_data,
     physical_object_types_dict,
     physical_objects_data,
+    projects_buffers_queue_data,
     service_types_dict,
     services_data,
     territories_data,
@@ -21,6 +23,7 @@ from idu_api.common.db.entities import (
 )
 from idu_api.urban_api.dto import (
     BufferDTO,
+    BuffersQueueStatsDTO,
     BufferTypeDTO,
     DefaultBufferValueDTO,
 )
@@ -36,7 +39,9 @@ from idu_api.urban_api.logic.impl.helpers.buffers import (
     get_all_default_buffer_values_from_db,
     get_buffer_from_db,
     get_buffer_types_from_db,
+    get_buffers_queue_stats_from_db,
     get_default_buffer_value_from_db,
+    process_buffers_queue_in_db,
     put_buffer_to_db,
     put_default_buffer_value_to_db,
 )
@@ -462,3 +467,49 @@ async def test_delete_buffer_from_db(mock_conn: MockConnection):
     assert result == {"status": "ok"}, "Result should be {'status': 'ok'}."
     mock_conn.execute_mock.assert_called_once_with(str(statement))
     mock_conn.commit_mock.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_buffers_queue_stats_from_db(mock_conn: MockConnection):
+    """Test the get_buffers_queue_stats_from_db function."""
+
+    # Arrange
+    public_queue = select(
+        func.count().label("pending"),
+        func.min(buffers_queue_data.c.queued_at).label("oldest_queued_at"),
+    ).subquery("public_queue")
+    projects_queue = select(
+        func.count().label("pending"),
+        func.min(projects_buffers_queue_data.c.queued_at).label("oldest_queued_at"),
+    ).subquery("projects_queue")
+    statement = select(
+        public_queue.c.pending,
+        public_queue.c.oldest_queued_at,
+        projects_queue.c.pending.label("projects_pending"),
+        projects_queue.c.oldest_queued_at.label("projects_oldest_queued_at"),
+    ).select_from(public_queue.join(projects_queue, true()))
+
+    # Act
+    result = await get_buffers_queue_stats_from_db(mock_conn)
+
+    # Assert
+    assert isinstance(result, BuffersQueueStatsDTO), "Result should be a BuffersQueueStatsDTO."
+    mock_conn.execute_mock.assert_called_once_with(str(statement))
+
+
+@pytest.mark.asyncio
+async def test_process_buffers_queue_in_db(mock_conn: MockConnection):
+    """Test the process_buffers_queue_in_db function."""
+
+    # Arrange
+    batch_size = 100
+    public_statement = select(func.public.process_buffers_queue(batch_size))
+    projects_statement = select(func.user_projects.process_buffers_queue(batch_size))
+
+    # Act
+    await process_buffers_queue_in_db(mock_conn, batch_size)
+
+    # Assert
+    mock_conn.execute_mock.assert_any_call(str(public_statement))
+    mock_conn.execute_mock.assert_any_call(str(projects_statement))
+    mock_conn.commit_mock.assert_called_once()
@@ -6,7 +6,7 @@ from unittest.mock import AsyncMock, patch
 import pytest
 from geoalchemy2.functions import ST_AsEWKB, ST_GeomFromWKB
 from shapely.geometry import LineString, MultiLineString, MultiPoint, MultiPolygon, Point, Polygon
-from sqlalchemy import case, delete, func, insert, or_, select, text, update
+from sqlalchemy import case, delete, insert, or_, select, text, update
 
 from idu_api.common.db.entities import (
     functional_zone_types_dict,
@@ -43,7 +43,7 @@ from idu_api.urban_api.logic.impl.helpers.functional_zones import (
     put_functional_zone_to_db,
     put_profiles_reclamation_data_to_db,
 )
-from idu_api.urban_api.logic.impl.helpers.utils import OBJECTS_NUMBER_LIMIT, SRID
+from idu_api.urban_api.logic.impl.helpers.utils import OBJECTS_NUMBER_LIMIT, SRID, within_distance
 from idu_api.urban_api.schemas import (
     FunctionalZone,
     FunctionalZonePatch,
@@ -594,21 +594,46 @@ async def test_get_functional_zones_around_from_db(mock_conn: MockConnection, sh
 
     # Arrange
     year, source = 1, "mock_string"
-    functional_zone_type_id = None
+    functional_zone_type_id = 1
+    buffer_meters = 100
     given_geometry = select(ST_GeomFromWKB(shapely_geometry.wkb, text(str(SRID)))).scalar_subquery()
     statement = (
-        select(functional_zones_data.c.functional_zone_id)
+        select(
+            functional_zones_data.c.functional_zone_id,
+            functional_zones_data.c.territory_id,
+            territories_data.c.name.label("territory_name"),
+            functional_zones_data.c.functional_zone_type_id,
+            functional_zone_types_dict.c.name.label("functional_zone_type_name"),
+            functional_zone_types_dict.c.zone_nickname.label("functional_zone_type_nickname"),
+            functional_zone_types_dict.c.description.label("functional_zone_type_description"),
+            functional_zones_data.c.name,
+            ST_AsEWKB(functional_zones_data.c.geometry).label("geometry"),
+            functional_zones_data.c.year,
+            functional_zones_data.c.source,
+            functional_zones_data.c.properties,
+            functional_zones_data.c.created_at,
+            functional_zones_data.c.updated_at,
+        )
+        .select_from(
+            functional_zones_data.join(
+                territories_data,
+                territories_data.c.territory_id == functional_zones_data.c.territory_id,
+            ).join(
+                functional_zone_types_dict,
+                functional_zone_types_dict.c.functional_zone_type_id == functional_zones_data.c.functional_zone_type_id,
+            )
+        )
         .where(
             functional_zones_data.c.year == year,
             functional_zones_data.c.source == source,
-            func.ST_Intersects(functional_zones_data.c.geometry, given_geometry),
+            within_distance(functional_zones_data.c.geometry, given_geometry, buffer_meters),
+            functional_zones_data.c.functional_zone_type_id == functional_zone_type_id,
         )
-        .distinct()
     )
 
     # Act
     result = await get_functional_zones_around_from_db(
-        mock_conn, shapely_geometry, year, source, functional_zone_type_id
+        mock_conn, shapely_geometry, year, source, functional_zone_type_id, buffer_meters
     )
 
     # Assert
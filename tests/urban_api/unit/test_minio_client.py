@@ -0,0 +1,71 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from structlog.stdlib import BoundLogger
+
+from idu_api.urban_api.exceptions.utils.external import ExternalServiceResponseError
+from idu_api.urban_api.minio.client import AsyncMinioClient
+
+
+@pytest.fixture
+def minio_client():
+    return AsyncMinioClient(
+        url="http://localhost:9000",
+        access_key="",
+        secret_key="",
+        bucket_name="projects",
+        region_name="us-west-rack-2",
+        connect_timeout=5,
+        read_timeout=20,
+    )
+
+
+@pytest.fixture
+def fake_logger():
+    return AsyncMock(spec=BoundLogger)
+
+
+@pytest.mark.asyncio
+async def test_list_objects_follows_pagination(minio_client, fake_logger):
+    pages = [
+        {"Contents": [{"Key": f"1/{i}.jpg"} for i in range(1000)]},
+        {"Contents": [{"Key": "1/1000.jpg"}]},
+        {},
+    ]
+
+    async def paginate(**_kwargs):
+        for page in pages:
+            yield page
+
+    session = MagicMock()
+    session.get_paginator.return_value.paginate = paginate
+
+    result = await minio_client.list_objects(session, fake_logger, prefix="1/")
+
+    session.get_paginator.assert_called_once_with("list_objects_v2")
+    assert len(result) == 1001
+    assert result[-1] == "1/1000.jpg"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("objects_count, expected_calls", [(0, 0), (1, 1), (1000, 1), (2500, 3)])
+async def test_delete_files_batches(minio_client, fake_logger, objects_count, expected_calls):
+    session = MagicMock()
+    session.delete_objects = AsyncMock(return_value={})
+    object_names = [f"1/{i}.jpg" for i in range(objects_count)]
+
+    result = await minio_client.delete_files(session, object_names, fake_logger)
+
+    assert result == objects_count
+    assert session.delete_objects.await_count == expected_calls
+    for call in session.delete_objects.await_args_list:
+        assert len(call.kwargs["Delete"]["Objects"]) <= 1000
+
+
+@pytest.mark.asyncio
+async def test_delete_files_reports_errors(minio_client, fake_logger):
+    session = MagicMock()
+    session.delete_objects = AsyncMock(return_value={"Errors": [{"Key": "1/a.jpg", "Code": "AccessDenied"}]})
+
+    with pytest.raises(ExternalServiceResponseError):
+        await minio_client.delete_files(session, ["1/a.jpg", "1/b.jpg"], fake_logger)
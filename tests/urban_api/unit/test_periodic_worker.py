@@ -0,0 +1,52 @@
+"""Unit tests for periodic background worker are defined here."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from idu_api.urban_api.utils.periodic_worker import PeriodicWorker
+
+####################################################################################
+#                           Default use-case tests                                 #
+####################################################################################
+
+
+class _Worker(PeriodicWorker):
+    task_name = "test_worker"
+    error_message = "could not do test work"
+
+    def __init__(self, results: list, logger):
+        super().__init__(0.01, logger)
+        self.results = results
+        self.iterations = 0
+        self.done = asyncio.Event()
+
+    async def _iterate(self) -> bool:
+        self.iterations += 1
+        if not self.results:
+            self.done.set()
+            return False
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+@pytest.mark.asyncio
+async def test_periodic_worker():
+    """Test the PeriodicWorker class."""
+
+    # Arrange
+    logger = AsyncMock()
+    worker = _Worker([True, RuntimeError("error"), False], logger)
+
+    # Act
+    worker.start()
+    await asyncio.wait_for(worker.done.wait(), timeout=1)
+    await worker.stop()
+
+    # Assert
+    assert worker.iterations == 4, "Worker should continue after repeated, failed and regular iterations."
+    logger.aexception.assert_awaited_once_with("could not do test work", error=repr(RuntimeError("error")))
+    assert worker._task is None, "Worker task should be removed on stop."  # pylint: disable=protected-access
@@ -4,15 +4,9 @@ from datetime import datetime, timezone
 from unittest.mock import AsyncMock, call, patch
 
 import pytest
-from geoalchemy2.functions import (
-    ST_AsEWKB,
-    ST_Buffer,
-    ST_GeomFromWKB,
-    ST_Intersects,
-)
-from geoalchemy2.types import Geography, Geometry
+from geoalchemy2.functions import ST_AsEWKB, ST_GeomFromWKB
 from shapely.geometry import LineString, MultiLineString, MultiPoint, MultiPolygon, Point, Polygon
-from sqlalchemy import cast, delete, insert, select, text, update
+from sqlalchemy import delete, insert, select, text, update
 
 from idu_api.common.db.entities import (
     buildings_data,
@@ -44,6 +38,7 @@ from idu_api.urban_api.logic.impl.helpers.physical_objects import (
     delete_building_from_db,
     delete_physical_object_from_db,
     get_buildings_by_physical_object_id_from_db,
+    get_nearest_physical_objects_from_db,
     get_physical_object_by_id_from_db,
     get_physical_object_geometries_from_db,
     get_physical_objects_around_from_db,
@@ -55,7 +50,12 @@ from idu_api.urban_api.logic.impl.helpers.physical_objects import (
     put_building_to_db,
     put_physical_object_to_db,
 )
-from idu_api.urban_api.logic.impl.helpers.utils import OBJECTS_NUMBER_LIMIT, SRID
+from idu_api.urban_api.logic.impl.helpers.utils import (
+    OBJECTS_NUMBER_LIMIT,
+    SRID,
+    distance_order,
+    within_distance,
+)
 from idu_api.urban_api.schemas import (
     Building,
     BuildingPatch,
@@ -154,29 +154,63 @@ async def test_get_physical_objects_around_from_db(mock_conn: MockConnection, sh
     """Test the get_physical_objects_around_from_db function."""
 
     # Arrange
-    physical_object_type_id = None
+    physical_object_type_id = 1
     buffer_meters = 500
-    buffered_geometry_cte = select(
-        cast(
-            ST_Buffer(cast(ST_GeomFromWKB(shapely_geometry.wkb, text(str(SRID))), Geography(srid=SRID)), buffer_meters),
-            Geometry(srid=SRID),
-        ).label("geometry"),
-    ).cte("buffered_geometry_cte")
+    given_geometry = select(ST_GeomFromWKB(shapely_geometry.wkb, text(str(SRID)))).scalar_subquery()
+    objects_around = (
+        select(urban_objects_data.c.physical_object_id)
+        .select_from(
+            urban_objects_data.join(
+                object_geometries_data,
+                urban_objects_data.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
+            )
+        )
+        .where(within_distance(object_geometries_data.c.geometry, given_geometry, buffer_meters))
+    )
+    building_columns = [col for col in buildings_data.c if col.name not in ("physical_object_id", "properties")]
     statement = (
-        select(physical_objects_data.c.physical_object_id)
+        select(
+            physical_objects_data,
+            physical_object_types_dict.c.name.label("physical_object_type_name"),
+            physical_object_types_dict.c.physical_object_function_id,
+            physical_object_functions_dict.c.name.label("physical_object_function_name"),
+            territories_data.c.territory_id,
+            territories_data.c.name.label("territory_name"),
+            object_geometries_data.c.object_geometry_id,
+            object_geometries_data.c.address,
+            object_geometries_data.c.osm_id,
+            ST_AsEWKB(object_geometries_data.c.geometry).label("geometry"),
+            ST_AsEWKB(object_geometries_data.c.centre_point).label("centre_point"),
+            *building_columns,
+            buildings_data.c.properties.label("building_properties"),
+        )
         .select_from(
             physical_objects_data.join(
                 urban_objects_data,
                 urban_objects_data.c.physical_object_id == physical_objects_data.c.physical_object_id,
-            ).join(
+            )
+            .join(
                 object_geometries_data,
                 urban_objects_data.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
             )
+            .join(territories_data, territories_data.c.territory_id == object_geometries_data.c.territory_id)
+            .join(
+                physical_object_types_dict,
+                physical_objects_data.c.physical_object_type_id == physical_object_types_dict.c.physical_object_type_id,
+            )
+            .join(
+                physical_object_functions_dict,
+                physical_object_functions_dict.c.physical_object_function_id
+                == physical_object_types_dict.c.physical_object_function_id,
+            )
+            .outerjoin(
+                buildings_data,
+                buildings_data.c.physical_object_id == physical_objects_data.c.physical_object_id,
+            )
         )
         .where(
-            ST_Intersects(
-                object_geometries_data.c.geometry, select(buffered_geometry_cte.c.geometry).scalar_subquery()
-            ),
+            physical_objects_data.c.physical_object_id.in_(objects_around),
+            physical_objects_data.c.physical_object_type_id == physical_object_type_id,
         )
         .distinct()
     )
@@ -194,7 +228,101 @@ async def test_get_physical_objects_around_from_db(mock_conn: MockConnection, sh
     assert isinstance(
         PhysicalObjectWithGeometry.from_dto(result[0]), PhysicalObjectWithGeometry
     ), "Couldn't create pydantic model from DTO."
-    mock_conn.execute_mock.assert_any_call(str(statement))
+    mock_conn.execute_mock.assert_called_once_with(str(statement))
+
+
+@pytest.mark.asyncio
+async def test_get_nearest_physical_objects_from_db(mock_conn: MockConnection, shapely_geometry: Geom):
+    """Test the get_nearest_physical_objects_from_db function."""
+
+    # Arrange
+    physical_object_type_id = 1
+    limit = 10
+    max_distance_meters = 1000
+    given_geometry = select(ST_GeomFromWKB(shapely_geometry.wkb, text(str(SRID)))).scalar_subquery()
+    distance = distance_order(object_geometries_data.c.geometry, given_geometry)
+    nearest = (
+        select(
+            urban_objects_data.c.physical_object_id,
+            urban_objects_data.c.object_geometry_id,
+            distance.label("distance"),
+        )
+        .select_from(
+            urban_objects_data.join(
+                object_geometries_data,
+                object_geometries_data.c.object_geometry_id == urban_objects_data.c.object_geometry_id,
+            ).join(
+                physical_objects_data,
+                physical_objects_data.c.physical_object_id == urban_objects_data.c.physical_object_id,
+            )
+        )
+        .distinct(urban_objects_data.c.physical_object_id)
+        .where(
+            physical_objects_data.c.physical_object_type_id == physical_object_type_id,
+            within_distance(object_geometries_data.c.geometry, given_geometry, max_distance_meters),
+        )
+        .order_by(urban_objects_data.c.physical_object_id, distance)
+        .subquery("nearest")
+    )
+    building_columns = [col for col in buildings_data.c if col.name not in ("physical_object_id", "properties")]
+    statement = (
+        select(
+            physical_objects_data,
+            physical_object_types_dict.c.name.label("physical_object_type_name"),
+            physical_object_types_dict.c.physical_object_function_id,
+            physical_object_functions_dict.c.name.label("physical_object_function_name"),
+            territories_data.c.territory_id,
+            territories_data.c.name.label("territory_name"),
+            object_geometries_data.c.object_geometry_id,
+            object_geometries_data.c.address,
+            object_geometries_data.c.osm_id,
+            ST_AsEWKB(object_geometries_data.c.geometry).label("geometry"),
+            ST_AsEWKB(object_geometries_data.c.centre_point).label("centre_point"),
+            *building_columns,
+            buildings_data.c.properties.label("building_properties"),
+        )
+        .select_from(
+            physical_objects_data.join(
+                nearest,
+                nearest.c.physical_object_id == physical_objects_data.c.physical_object_id,
+            )
+            .join(
+                object_geometries_data,
+                nearest.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
+            )
+            .join(territories_data, territories_data.c.territory_id == object_geometries_data.c.territory_id)
+            .join(
+                physical_object_types_dict,
+                physical_objects_data.c.physical_object_type_id == physical_object_types_dict.c.physical_object_type_id,
+            )
+            .join(
+                physical_object_functions_dict,
+                physical_object_functions_dict.c.physical_object_function_id
+                == physical_object_types_dict.c.physical_object_function_id,
+            )
+            .outerjoin(
+                buildings_data,
+                buildings_data.c.physical_object_id == physical_objects_data.c.physical_object_id,
+            )
+        )
+        .order_by(nearest.c.distance, nearest.c.physical_object_id)
+        .limit(limit)
+    )
+
+    # Act
+    result = await get_nearest_physical_objects_from_db(
+        mock_conn, shapely_geometry, physical_object_type_id, limit, max_distance_meters
+    )
+
+    # Assert
+    assert isinstance(result, list), "Result should be a list."
+    assert all(
+        isinstance(obj, PhysicalObjectWithGeometryDTO) for obj in result
+    ), "Each item should be a PhysicalObjectWithGeometryDTO."
+    assert isinstance(
+        PhysicalObjectWithGeometry.from_dto(result[0]), PhysicalObjectWithGeometry
+    ), "Couldn't create pydantic model from DTO."
+    mock_conn.execute_mock.assert_called_once_with(str(statement))
 
 
 @pytest.mark.asyncio
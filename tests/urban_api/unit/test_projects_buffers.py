@@ -17,6 +17,8 @@ from idu_api.common.db.entities import (
     physical_object_types_dict,
     physical_objects_data,
     projects_buffers_data,
+    projects_context_buffers_data,
+    projects_context_subdivided_data,
     projects_object_geometries_data,
     projects_physical_objects_data,
     projects_services_data,
@@ -333,6 +335,11 @@ async def test_get_context_buffers_from_db(mock_conn: MockConnection):
     buffer_type_id = 1
     physical_object_type_id, service_type_id = 1, 1
     mock_geom = str(MagicMock(spec=ScalarSelect))
+    context_pieces = (
+        select(projects_context_subdivided_data.c.geometry)
+        .where(projects_context_subdivided_data.c.project_id == 1)
+        .cte(name="context_pieces")
+    )
     user = UserDTO(id="mock_string", is_superuser=False)
 
     public_urban_object_ids = (
@@ -340,20 +347,14 @@ async def test_get_context_buffers_from_db(mock_conn: MockConnection):
         .where(projects_urban_objects_data.c.scenario_id == 1)
         .where(projects_urban_objects_data.c.public_urban_object_id.isnot(None))
     ).cte(name="public_urban_object_ids")
-    objects_intersecting = (
-        select(object_geometries_data.c.object_geometry_id)
-        .select_from(
-            object_geometries_data.join(
-                urban_objects_data,
-                urban_objects_data.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
-            )
-        )
-        .where(
-            urban_objects_data.c.urban_object_id.not_in(select(public_urban_object_ids)),
-            object_geometries_data.c.territory_id.in_([1])
-            | ST_Intersects(object_geometries_data.c.geometry, mock_geom),
+    context_buffers = (
+        select(
+            projects_context_buffers_data.c.buffer_type_id,
+            projects_context_buffers_data.c.urban_object_id,
+            projects_context_buffers_data.c.geometry,
         )
-        .cte(name="objects_intersecting")
+        .where(projects_context_buffers_data.c.project_id == 1)
+        .cte(name="context_buffers")
     )
     public_buffers_query = (
         select(
@@ -371,13 +372,18 @@ async def test_get_context_buffers_from_db(mock_conn: MockConnection):
             services_data.c.name.label("service_name"),
             service_types_dict.c.service_type_id,
             service_types_dict.c.name.label("service_type_name"),
-            ST_AsEWKB(ST_Intersection(buffers_data.c.geometry, mock_geom)).label("geometry"),
+            ST_AsEWKB(context_buffers.c.geometry).label("geometry"),
             buffers_data.c.is_custom,
             literal(False).label("is_scenario_object"),
             literal(True).label("is_locked"),
         )
         .select_from(
             buffers_data.join(buffer_types_dict, buffer_types_dict.c.buffer_type_id == buffers_data.c.buffer_type_id)
+            .join(
+                context_buffers,
+                (context_buffers.c.buffer_type_id == buffers_data.c.buffer_type_id)
+                & (context_buffers.c.urban_object_id == buffers_data.c.urban_object_id),
+            )
             .join(urban_objects_data, urban_objects_data.c.urban_object_id == buffers_data.c.urban_object_id)
             .join(
                 physical_objects_data,
@@ -391,14 +397,11 @@ async def test_get_context_buffers_from_db(mock_conn: MockConnection):
                 object_geometries_data,
                 object_geometries_data.c.object_geometry_id == urban_objects_data.c.object_geometry_id,
             )
-            .join(
-                objects_intersecting,
-                objects_intersecting.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
-            )
             .join(territories_data, territories_data.c.territory_id == object_geometries_data.c.territory_id)
             .outerjoin(services_data, services_data.c.service_id == urban_objects_data.c.service_id)
             .outerjoin(service_types_dict, service_types_dict.c.service_type_id == services_data.c.service_type_id)
         )
+        .where(urban_objects_data.c.urban_object_id.not_in(select(public_urban_object_ids)))
         .where(
             buffer_types_dict.c.buffer_type_id == buffer_type_id,
             physical_object_types_dict.c.physical_object_type_id == physical_object_type_id,
@@ -498,11 +501,18 @@ async def test_get_context_buffers_from_db(mock_conn: MockConnection):
     # Act
     with pytest.raises(NotAllowedInRegionalScenario):
         await get_context_buffers_from_db(mock_conn, project_id, year, source, buffer_type_id, user)
-    with patch(
-        "idu_api.urban_api.logic.impl.helpers.projects_buffers.get_context_territories_geometry",
-        new_callable=AsyncMock,
-    ) as mock_get_context:
-        mock_get_context.return_value = 1, mock_geom, [1]
+    with (
+        patch(
+            "idu_api.urban_api.logic.impl.helpers.projects_buffers.get_context_territories_geometry",
+            new_callable=AsyncMock,
+        ) as mock_get_context,
+        patch(
+            "idu_api.urban_api.logic.impl.helpers.projects_buffers.get_context_layer_cache",
+            new_callable=AsyncMock,
+        ) as mock_get_context_layer,
+    ):
+        mock_get_context.return_value = 1, mock_geom, context_pieces
+        mock_get_context_layer.return_value = context_buffers
         result = await get_context_buffers_from_db(mock_conn, project_id, year, source, buffer_type_id, user)
 
     # Assert
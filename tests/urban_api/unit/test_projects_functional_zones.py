@@ -4,12 +4,14 @@ from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from geoalchemy2.functions import ST_AsEWKB, ST_GeomFromWKB, ST_Intersection, ST_Intersects, ST_Within
-from sqlalchemy import ScalarSelect, case, delete, insert, select, text, update
+from geoalchemy2.functions import ST_AsEWKB, ST_GeomFromWKB
+from sqlalchemy import ScalarSelect, delete, insert, select, text, update
 
 from idu_api.common.db.entities import (
     functional_zone_types_dict,
     functional_zones_data,
+    projects_context_functional_zones_data,
+    projects_context_subdivided_data,
     projects_functional_zones,
     scenarios_data,
     territories_data,
@@ -157,12 +159,27 @@ async def test_get_context_functional_zones_sources_from_db(mock_conn: MockConne
     # Arrange
     project_id = 1
     mock_geom = str(MagicMock(spec=ScalarSelect))
+    context_pieces = (
+        select(projects_context_subdivided_data.c.geometry)
+        .where(projects_context_subdivided_data.c.project_id == 1)
+        .cte(name="context_pieces")
+    )
+    context_zones = (
+        select(
+            projects_context_functional_zones_data.c.functional_zone_id,
+            projects_context_functional_zones_data.c.geometry,
+        )
+        .where(projects_context_functional_zones_data.c.project_id == 1)
+        .cte(name="context_functional_zones")
+    )
     user = UserDTO(id="mock_string", is_superuser=False)
     statement = (
         select(functional_zones_data.c.year, functional_zones_data.c.source)
-        .where(
-            (functional_zones_data.c.territory_id.in_([1]))
-            | (ST_Intersects(functional_zones_data.c.geometry, mock_geom))
+        .select_from(
+            functional_zones_data.join(
+                context_zones,
+                context_zones.c.functional_zone_id == functional_zones_data.c.functional_zone_id,
+            )
         )
         .distinct()
     )
@@ -170,11 +187,18 @@ async def test_get_context_functional_zones_sources_from_db(mock_conn: MockConne
     # Act
     with pytest.raises(NotAllowedInRegionalScenario):
         await get_context_functional_zones_sources_from_db(mock_conn, project_id, user)
-    with patch(
-        "idu_api.urban_api.logic.impl.helpers.projects_functional_zones.get_context_territories_geometry",
-        new_callable=AsyncMock,
-    ) as mock_get_context:
-        mock_get_context.return_value = 1, mock_geom, [1]
+    with (
+        patch(
+            "idu_api.urban_api.logic.impl.helpers.projects_functional_zones.get_context_territories_geometry",
+            new_callable=AsyncMock,
+        ) as mock_get_context,
+        patch(
+            "idu_api.urban_api.logic.impl.helpers.projects_functional_zones.get_context_layer_cache",
+            new_callable=AsyncMock,
+        ) as mock_get_context_layer,
+    ):
+        mock_get_context.return_value = 1, mock_geom, context_pieces
+        mock_get_context_layer.return_value = context_zones
         result = await get_context_functional_zones_sources_from_db(mock_conn, project_id, user)
 
     # Assert
@@ -185,6 +209,7 @@ async def test_get_context_functional_zones_sources_from_db(mock_conn: MockConne
     assert isinstance(
         FunctionalZoneSource.from_dto(result[0]), FunctionalZoneSource
     ), "Couldn't create pydantic model from DTO."
+    mock_get_context_layer.assert_called_once_with(mock_conn, project_id, "functional_zones")
     mock_conn.execute_mock.assert_any_call(str(statement))
 
 
@@ -198,6 +223,19 @@ async def test_get_context_functional_zones_from_db(mock_conn: MockConnection):
     source = "mock_string"
     functional_zone_type_id = 1
     mock_geom = str(MagicMock(spec=ScalarSelect))
+    context_pieces = (
+        select(projects_context_subdivided_data.c.geometry)
+        .where(projects_context_subdivided_data.c.project_id == 1)
+        .cte(name="context_pieces")
+    )
+    context_zones = (
+        select(
+            projects_context_functional_zones_data.c.functional_zone_id,
+            projects_context_functional_zones_data.c.geometry,
+        )
+        .where(projects_context_functional_zones_data.c.project_id == 1)
+        .cte(name="context_functional_zones")
+    )
     user = UserDTO(id="mock_string", is_superuser=False)
     statement = (
         select(
@@ -209,15 +247,7 @@ async def test_get_context_functional_zones_from_db(mock_conn: MockConnection):
             functional_zone_types_dict.c.zone_nickname.label("functional_zone_type_nickname"),
             functional_zone_types_dict.c.description.label("functional_zone_type_description"),
             functional_zones_data.c.name,
-            ST_AsEWKB(
-                case(
-                    (
-                        ~ST_Within(functional_zones_data.c.geometry, mock_geom),
-                        ST_Intersection(functional_zones_data.c.geometry, mock_geom),
-                    ),
-                    else_=functional_zones_data.c.geometry,
-                )
-            ).label("geometry"),
+            ST_AsEWKB(context_zones.c.geometry).label("geometry"),
             functional_zones_data.c.year,
             functional_zones_data.c.source,
             functional_zones_data.c.properties,
@@ -228,30 +258,38 @@ async def test_get_context_functional_zones_from_db(mock_conn: MockConnection):
             functional_zones_data.join(
                 territories_data,
                 territories_data.c.territory_id == functional_zones_data.c.territory_id,
-            ).join(
+            )
+            .join(
                 functional_zone_types_dict,
                 functional_zone_types_dict.c.functional_zone_type_id == functional_zones_data.c.functional_zone_type_id,
             )
+            .join(
+                context_zones,
+                context_zones.c.functional_zone_id == functional_zones_data.c.functional_zone_id,
+            )
         )
         .where(
             functional_zones_data.c.year == year,
             functional_zones_data.c.source == source,
-            (
-                functional_zones_data.c.territory_id.in_([1])
-                | ST_Intersects(functional_zones_data.c.geometry, mock_geom)
-            ),
-            functional_zones_data.c.functional_zone_type_id == functional_zone_type_id,
         )
+        .where(functional_zones_data.c.functional_zone_type_id == functional_zone_type_id)
     )
 
     # Act
     with pytest.raises(NotAllowedInRegionalScenario):
         await get_context_functional_zones_from_db(mock_conn, project_id, year, source, functional_zone_type_id, user)
-    with patch(
-        "idu_api.urban_api.logic.impl.helpers.projects_functional_zones.get_context_territories_geometry",
-        new_callable=AsyncMock,
-    ) as mock_get_context:
-        mock_get_context.return_value = 1, mock_geom, [1]
+    with (
+        patch(
+            "idu_api.urban_api.logic.impl.helpers.projects_functional_zones.get_context_territories_geometry",
+            new_callable=AsyncMock,
+        ) as mock_get_context,
+        patch(
+            "idu_api.urban_api.logic.impl.helpers.projects_functional_zones.get_context_layer_cache",
+            new_callable=AsyncMock,
+        ) as mock_get_context_layer,
+    ):
+        mock_get_context.return_value = 1, mock_geom, context_pieces
+        mock_get_context_layer.return_value = context_zones
         result = await get_context_functional_zones_from_db(
             mock_conn, project_id, year, source, functional_zone_type_id, user
         )
@@ -260,6 +298,7 @@ async def test_get_context_functional_zones_from_db(mock_conn: MockConnection):
     assert isinstance(result, list), "Result should be a list."
     assert all(isinstance(item, FunctionalZoneDTO) for item in result), "Each item should be a FunctionalZoneDTO."
     assert isinstance(FunctionalZone.from_dto(result[0]), FunctionalZone), "Couldn't create pydantic model from DTO."
+    mock_get_context_layer.assert_called_once_with(mock_conn, project_id, "functional_zones")
     mock_conn.execute_mock.assert_any_call(str(statement))
 
 
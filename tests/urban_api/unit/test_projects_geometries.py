@@ -4,8 +4,8 @@ from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from geoalchemy2.functions import ST_AsEWKB, ST_Centroid, ST_GeomFromWKB, ST_Intersection, ST_Intersects, ST_Within
-from sqlalchemy import ScalarSelect, case, delete, insert, literal, or_, select, text, union_all, update
+from geoalchemy2.functions import ST_AsEWKB, ST_Centroid, ST_GeomFromWKB, ST_Intersection, ST_Within
+from sqlalchemy import ScalarSelect, delete, insert, literal, or_, select, text, union_all, update
 from sqlalchemy.sql.functions import coalesce
 
 from idu_api.common.db.entities import (
@@ -14,6 +14,8 @@ from idu_api.common.db.entities import (
     physical_object_types_dict,
     physical_objects_data,
     projects_buildings_data,
+    projects_context_object_geometries_data,
+    projects_context_subdivided_data,
     projects_object_geometries_data,
     projects_physical_objects_data,
     projects_services_data,
@@ -414,25 +416,24 @@ async def test_get_context_geometries_from_db(mock_conn: MockConnection):
     project_id = 1
     user = UserDTO(id="mock_string", is_superuser=False)
     mock_geom = str(MagicMock(spec=ScalarSelect))
+    context_pieces = (
+        select(projects_context_subdivided_data.c.geometry)
+        .where(projects_context_subdivided_data.c.project_id == 1)
+        .cte(name="context_pieces")
+    )
     public_urban_object_ids = (
         select(projects_urban_objects_data.c.public_urban_object_id)
         .where(projects_urban_objects_data.c.scenario_id == 1)
         .where(projects_urban_objects_data.c.public_urban_object_id.isnot(None))
     ).cte(name="public_urban_object_ids")
-    objects_intersecting = (
-        select(object_geometries_data.c.object_geometry_id)
-        .select_from(
-            object_geometries_data.join(
-                urban_objects_data,
-                urban_objects_data.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
-            )
-        )
-        .where(
-            urban_objects_data.c.urban_object_id.not_in(select(public_urban_object_ids)),
-            object_geometries_data.c.territory_id.in_([1])
-            | ST_Intersects(object_geometries_data.c.geometry, mock_geom),
+    context_objects = (
+        select(
+            projects_context_object_geometries_data.c.object_geometry_id,
+            projects_context_object_geometries_data.c.geometry,
+            projects_context_object_geometries_data.c.centre_point,
         )
-        .cte(name="objects_intersecting")
+        .where(projects_context_object_geometries_data.c.project_id == 1)
+        .cte(name="context_object_geometries")
     )
     public_geoms_query = (
         select(
@@ -441,24 +442,8 @@ async def test_get_context_geometries_from_db(mock_conn: MockConnection):
             object_geometries_data.c.osm_id,
             object_geometries_data.c.created_at,
             object_geometries_data.c.updated_at,
-            ST_AsEWKB(
-                case(
-                    (
-                        ~ST_Within(object_geometries_data.c.geometry, mock_geom),
-                        ST_Intersection(object_geometries_data.c.geometry, mock_geom),
-                    ),
-                    else_=object_geometries_data.c.geometry,
-                )
-            ).label("geometry"),
-            ST_AsEWKB(
-                case(
-                    (
-                        ~ST_Within(object_geometries_data.c.geometry, mock_geom),
-                        ST_Centroid(ST_Intersection(object_geometries_data.c.geometry, mock_geom)),
-                    ),
-                    else_=object_geometries_data.c.centre_point,
-                )
-            ).label("centre_point"),
+            ST_AsEWKB(context_objects.c.geometry).label("geometry"),
+            ST_AsEWKB(context_objects.c.centre_point).label("centre_point"),
             territories_data.c.territory_id,
             territories_data.c.name.label("territory_name"),
             literal(False).label("is_scenario_object"),
@@ -469,14 +454,15 @@ async def test_get_context_geometries_from_db(mock_conn: MockConnection):
                 object_geometries_data.c.object_geometry_id == urban_objects_data.c.object_geometry_id,
             )
             .join(
-                objects_intersecting,
-                objects_intersecting.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
+                context_objects,
+                context_objects.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
             )
             .join(
                 territories_data,
                 territories_data.c.territory_id == object_geometries_data.c.territory_id,
             )
         )
+        .where(urban_objects_data.c.urban_object_id.not_in(select(public_urban_object_ids)))
         .distinct()
     )
     regional_scenario_geoms_query = (
@@ -566,11 +552,18 @@ async def test_get_context_geometries_from_db(mock_conn: MockConnection):
     )
 
     # Act
-    with patch(
-        "idu_api.urban_api.logic.impl.helpers.projects_geometries.get_context_territories_geometry",
-        new_callable=AsyncMock,
-    ) as mock_get_context:
-        mock_get_context.return_value = 1, mock_geom, [1]
+    with (
+        patch(
+            "idu_api.urban_api.logic.impl.helpers.projects_geometries.get_context_territories_geometry",
+            new_callable=AsyncMock,
+        ) as mock_get_context,
+        patch(
+            "idu_api.urban_api.logic.impl.helpers.projects_geometries.get_context_layer_cache",
+            new_callable=AsyncMock,
+        ) as mock_get_context_layer,
+    ):
+        mock_get_context.return_value = 1, mock_geom, context_pieces
+        mock_get_context_layer.return_value = context_objects
         result = await get_context_geometries_from_db(mock_conn, project_id, user, None, None)
 
     # Assert
@@ -589,26 +582,25 @@ async def test_get_context_geometries_with_all_objects_from_db(mock_conn: MockCo
     physical_object_type_id = 1
     service_type_id = 1
     mock_geom = str(MagicMock(spec=ScalarSelect))
+    context_pieces = (
+        select(projects_context_subdivided_data.c.geometry)
+        .where(projects_context_subdivided_data.c.project_id == 1)
+        .cte(name="context_pieces")
+    )
 
     public_urban_object_ids = (
         select(projects_urban_objects_data.c.public_urban_object_id)
         .where(projects_urban_objects_data.c.scenario_id == 1)
         .where(projects_urban_objects_data.c.public_urban_object_id.isnot(None))
     ).cte(name="public_urban_object_ids")
-    objects_intersecting = (
-        select(object_geometries_data.c.object_geometry_id)
-        .select_from(
-            object_geometries_data.join(
-                urban_objects_data,
-                urban_objects_data.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
-            )
-        )
-        .where(
-            urban_objects_data.c.urban_object_id.not_in(select(public_urban_object_ids)),
-            object_geometries_data.c.territory_id.in_([1])
-            | ST_Intersects(object_geometries_data.c.geometry, mock_geom),
+    context_objects = (
+        select(
+            projects_context_object_geometries_data.c.object_geometry_id,
+            projects_context_object_geometries_data.c.geometry,
+            projects_context_object_geometries_data.c.centre_point,
         )
-        .cte(name="objects_intersecting")
+        .where(projects_context_object_geometries_data.c.project_id == 1)
+        .cte(name="context_object_geometries")
     )
     building_columns = [col for col in buildings_data.c if col.name not in ("physical_object_id", "properties")]
     public_geoms_query = (
@@ -625,8 +617,8 @@ async def test_get_context_geometries_with_all_objects_from_db(mock_conn: MockCo
             territories_data.c.name.label("territory_name"),
             object_geometries_data.c.address,
             object_geometries_data.c.osm_id,
-            ST_AsEWKB(ST_Intersection(object_geometries_data.c.geometry, mock_geom)).label("geometry"),
-            ST_AsEWKB(ST_Centroid(ST_Intersection(object_geometries_data.c.geometry, mock_geom))).label("centre_point"),
+            ST_AsEWKB(context_objects.c.geometry).label("geometry"),
+            ST_AsEWKB(context_objects.c.centre_point).label("centre_point"),
             services_data.c.service_id,
             services_data.c.name.label("service_name"),
             services_data.c.capacity,
@@ -650,8 +642,8 @@ async def test_get_context_geometries_with_all_objects_from_db(mock_conn: MockCo
                 object_geometries_data.c.object_geometry_id == urban_objects_data.c.object_geometry_id,
             )
             .join(
-                objects_intersecting,
-                objects_intersecting.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
+                context_objects,
+                context_objects.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
             )
             .join(
                 territories_data,
@@ -675,6 +667,7 @@ async def test_get_context_geometries_with_all_objects_from_db(mock_conn: MockCo
                 buildings_data.c.physical_object_id == physical_objects_data.c.physical_object_id,
             )
         )
+        .where(urban_objects_data.c.urban_object_id.not_in(select(public_urban_object_ids)))
         .where(
             physical_object_types_dict.c.physical_object_type_id == physical_object_type_id,
             service_types_dict.c.service_type_id == service_type_id,
@@ -812,11 +805,18 @@ async def test_get_context_geometries_with_all_objects_from_db(mock_conn: MockCo
     union_query = union_all(public_geoms_query, regional_scenario_geoms_query)
 
     # Act
-    with patch(
-        "idu_api.urban_api.logic.impl.helpers.projects_geometries.get_context_territories_geometry",
-        new_callable=AsyncMock,
-    ) as mock_get_context:
-        mock_get_context.return_value = 1, mock_geom, [1]
+    with (
+        patch(
+            "idu_api.urban_api.logic.impl.helpers.projects_geometries.get_context_territories_geometry",
+            new_callable=AsyncMock,
+        ) as mock_get_context,
+        patch(
+            "idu_api.urban_api.logic.impl.helpers.projects_geometries.get_context_layer_cache",
+            new_callable=AsyncMock,
+        ) as mock_get_context_layer,
+    ):
+        mock_get_context.return_value = 1, mock_geom, context_pieces
+        mock_get_context_layer.return_value = context_objects
         result = await get_context_geometries_with_all_objects_from_db(
             mock_conn, project_id, user, physical_object_type_id, service_type_id, None, None
         )
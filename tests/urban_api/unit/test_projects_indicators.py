@@ -11,7 +11,9 @@ from aioresponses.core import merge_params, normalize_url
 from geoalchemy2.functions import ST_AsEWKB
 from otteroad import KafkaProducerClient
 from otteroad.models import RegionalScenarioIndicatorsUpdated
-from sqlalchemy import delete, insert, select, update
+from shapely.geometry import shape
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 
 from idu_api.common.db.entities import (
     hexagons_data,
@@ -23,12 +25,18 @@ from idu_api.common.db.entities import (
     territories_data,
 )
 from idu_api.urban_api.config import UrbanAPIConfig
-from idu_api.urban_api.dto import HexagonWithIndicatorsDTO, ScenarioIndicatorValueDTO, UserDTO
+from idu_api.urban_api.dto import (
+    HexagonsIndicatorsMatrixDTO,
+    HexagonWithIndicatorsDTO,
+    ScenarioIndicatorValueDTO,
+    UserDTO,
+)
 from idu_api.urban_api.exceptions.logic.common import EntityAlreadyExists, EntityNotFoundById
 from idu_api.urban_api.logic.impl.helpers.projects_indicators import (
     add_scenario_indicator_value_to_db,
     delete_scenario_indicator_value_by_id_from_db,
     delete_scenario_indicators_values_by_scenario_id_from_db,
+    get_hexagons_indicators_matrix_by_scenario_id_from_db,
     get_hexagons_with_indicators_by_scenario_id_from_db,
     get_scenario_indicator_value_by_id_from_db,
     get_scenario_indicators_values_by_scenario_id_from_db,
@@ -37,6 +45,7 @@ from idu_api.urban_api.logic.impl.helpers.projects_indicators import (
     update_all_indicators_values_by_scenario_id_to_db,
 )
 from idu_api.urban_api.schemas import (
+    HexagonsIndicatorsMatrix,
     ScenarioIndicatorValue,
     ScenarioIndicatorValuePatch,
     ScenarioIndicatorValuePost,
@@ -445,53 +454,99 @@ async def test_delete_scenario_indicator_value_by_id_from_db(mock_check: AsyncMo
     mock_check.assert_any_call(mock_conn, scenario_id, user, to_edit=True)
 
 
+def _hexagons_indicators_values_subquery(scenario_id: int, indicator_ids: list[int], indicators_group_id: int):
+    return (
+        select(
+            projects_indicators_data.c.hexagon_id,
+            func.array_agg(
+                aggregate_order_by(projects_indicators_data.c.indicator_id, projects_indicators_data.c.indicator_id)
+            ).label("indicator_ids"),
+            func.array_agg(
+                aggregate_order_by(projects_indicators_data.c.value, projects_indicators_data.c.indicator_id)
+            ).label("indicator_values"),
+            func.array_agg(
+                aggregate_order_by(projects_indicators_data.c.comment, projects_indicators_data.c.indicator_id)
+            ).label("indicator_comments"),
+        )
+        .where(
+            projects_indicators_data.c.scenario_id == scenario_id,
+            projects_indicators_data.c.hexagon_id.isnot(None),
+            projects_indicators_data.c.indicator_id.in_(
+                select(indicators_groups_data.c.indicator_id).where(
+                    indicators_groups_data.c.indicators_group_id == indicators_group_id
+                )
+            ),
+            projects_indicators_data.c.indicator_id.in_(indicator_ids),
+        )
+        .group_by(projects_indicators_data.c.hexagon_id)
+        .subquery()
+    )
+
+
 @pytest.mark.asyncio
 @patch("idu_api.urban_api.logic.impl.helpers.projects_indicators.check_scenario")
-async def test_get_hexagons_with_indicators_by_scenario_id_from_db(mock_check: AsyncMock, mock_conn: MockConnection):
+async def test_get_hexagons_with_indicators_by_scenario_id_from_db(mock_check: AsyncMock):
     """Test the get_hexagons_with_indicators_by_scenario_id_from_db function."""
 
     # Arrange
     scenario_id = 1
-    indicator_ids = [1]
+    indicator_ids = [1, 2]
     indicators_group_id = 1
     user = UserDTO(id="mock_string", is_superuser=False)
-    statement = (
+    geometry = shape({"type": "Point", "coordinates": [1, 2]}).wkb
+    mock_conn = MockConnection(
+        preset_results=[
+            MockResult(
+                rows=[
+                    MockRow(
+                        hexagon_id=1,
+                        geometry=geometry,
+                        centre_point=geometry,
+                        indicator_ids=[1, 2],
+                        indicator_values=[1.0, 2.0],
+                        indicator_comments=[None, "--"],
+                    )
+                ]
+            ),
+            MockResult(
+                rows=[
+                    MockRow(indicator_id=1, name_full="mock_string", measurement_unit_name=None),
+                    MockRow(indicator_id=2, name_full="mock_string", measurement_unit_name="mock_string"),
+                ]
+            ),
+        ]
+    )
+    values_subquery = _hexagons_indicators_values_subquery(scenario_id, indicator_ids, indicators_group_id)
+    hexagons_statement = (
         select(
-            projects_indicators_data.c.value,
-            projects_indicators_data.c.comment,
-            indicators_dict.c.indicator_id,
-            indicators_dict.c.name_full,
-            measurement_units_dict.c.name.label("measurement_unit_name"),
             hexagons_data.c.hexagon_id,
             ST_AsEWKB(hexagons_data.c.geometry).label("geometry"),
             ST_AsEWKB(hexagons_data.c.centre_point).label("centre_point"),
+            values_subquery.c.indicator_ids,
+            values_subquery.c.indicator_values,
+            values_subquery.c.indicator_comments,
+        )
+        .select_from(values_subquery.join(hexagons_data, hexagons_data.c.hexagon_id == values_subquery.c.hexagon_id))
+        .order_by(hexagons_data.c.hexagon_id)
+    )
+    indicators_statement = (
+        select(
+            indicators_dict.c.indicator_id,
+            indicators_dict.c.name_full,
+            measurement_units_dict.c.name.label("measurement_unit_name"),
         )
         .select_from(
-            projects_indicators_data.join(
-                hexagons_data,
-                hexagons_data.c.hexagon_id == projects_indicators_data.c.hexagon_id,
-            )
-            .join(indicators_dict, indicators_dict.c.indicator_id == projects_indicators_data.c.indicator_id)
-            .outerjoin(
+            indicators_dict.outerjoin(
                 measurement_units_dict,
                 measurement_units_dict.c.measurement_unit_id == indicators_dict.c.measurement_unit_id,
             )
-            .outerjoin(
-                indicators_groups_data,
-                indicators_groups_data.c.indicator_id == indicators_dict.c.indicator_id,
-            )
         )
-        .where(
-            projects_indicators_data.c.scenario_id == scenario_id,
-            indicators_groups_data.c.indicators_group_id == indicators_group_id,
-            projects_indicators_data.c.indicator_id.in_(indicator_ids),
-        )
-        .order_by(projects_indicators_data.c.indicator_id.asc())
+        .where(indicators_dict.c.indicator_id.in_({1, 2}))
     )
 
     # Act
     result = await get_hexagons_with_indicators_by_scenario_id_from_db(
-        mock_conn, scenario_id, {1}, indicators_group_id, user
+        mock_conn, scenario_id, set(indicator_ids), indicators_group_id, user
     )
 
     # Assert
@@ -499,6 +554,53 @@ async def test_get_hexagons_with_indicators_by_scenario_id_from_db(mock_check: A
     assert all(
         isinstance(item, HexagonWithIndicatorsDTO) for item in result
     ), "Each item should be a HexagonWithIndicatorsDTO."
+    assert [indicator.indicator_id for indicator in result[0].indicators] == [1, 2], "Indicators should be unpacked."
+    assert result[0].indicators[1].comment == "--", "Indicator values should be aligned with comments."
+    mock_conn.execute_mock.assert_any_call(str(hexagons_statement))
+    mock_conn.execute_mock.assert_any_call(str(indicators_statement))
+    mock_check.assert_called_once_with(mock_conn, scenario_id, user, return_value=True)
+
+
+@pytest.mark.asyncio
+@patch("idu_api.urban_api.logic.impl.helpers.projects_indicators.check_scenario")
+async def test_get_hexagons_indicators_matrix_by_scenario_id_from_db(mock_check: AsyncMock):
+    """Test the get_hexagons_indicators_matrix_by_scenario_id_from_db function."""
+
+    # Arrange
+    scenario_id = 1
+    indicator_ids = [1, 2]
+    indicators_group_id = 1
+    user = UserDTO(id="mock_string", is_superuser=False)
+    mock_conn = MockConnection(
+        preset_results=[
+            MockResult(
+                rows=[
+                    MockRow(
+                        hexagon_id=1, indicator_ids=[1, 2], indicator_values=[1.0, 2.0], indicator_comments=[None, None]
+                    ),
+                    MockRow(hexagon_id=2, indicator_ids=[2], indicator_values=[3.0], indicator_comments=[None]),
+                ]
+            ),
+        ]
+    )
+    values_subquery = _hexagons_indicators_values_subquery(scenario_id, indicator_ids, indicators_group_id)
+    statement = select(
+        values_subquery.c.hexagon_id, values_subquery.c.indicator_ids, values_subquery.c.indicator_values
+    ).order_by(values_subquery.c.hexagon_id)
+
+    # Act
+    result = await get_hexagons_indicators_matrix_by_scenario_id_from_db(
+        mock_conn, scenario_id, set(indicator_ids), indicators_group_id, user
+    )
+
+    # Assert
+    assert isinstance(result, HexagonsIndicatorsMatrixDTO), "Result should be a HexagonsIndicatorsMatrixDTO."
+    assert isinstance(
+        HexagonsIndicatorsMatrix.from_dto(result), HexagonsIndicatorsMatrix
+    ), "Couldn't create pydantic model from DTO."
+    assert result.hexagon_ids == [1, 2], "Hexagons should be matrix rows."
+    assert result.indicator_ids == [1, 2], "Indicators should be matrix columns."
+    assert result.values == [[1.0, 2.0], [None, 3.0]], "Missing values should be filled with None."
     mock_conn.execute_mock.assert_any_call(str(statement))
     mock_check.assert_called_once_with(mock_conn, scenario_id, user, return_value=True)
 
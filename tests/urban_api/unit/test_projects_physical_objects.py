@@ -15,6 +15,8 @@ from idu_api.common.db.entities import (
     physical_object_types_dict,
     physical_objects_data,
     projects_buildings_data,
+    projects_context_object_geometries_data,
+    projects_context_subdivided_data,
     projects_object_geometries_data,
     projects_physical_objects_data,
     projects_territory_data,
@@ -531,26 +533,25 @@ async def test_get_context_physical_objects_from_db(mock_conn: MockConnection):
     physical_object_type_id = 1
     physical_object_function_id = None
     mock_geom = str(MagicMock(spec=ScalarSelect))
+    context_pieces = (
+        select(projects_context_subdivided_data.c.geometry)
+        .where(projects_context_subdivided_data.c.project_id == 1)
+        .cte(name="context_pieces")
+    )
 
     public_urban_object_ids = (
         select(projects_urban_objects_data.c.public_urban_object_id)
         .where(projects_urban_objects_data.c.scenario_id == 1)
         .where(projects_urban_objects_data.c.public_urban_object_id.isnot(None))
     ).cte(name="public_urban_object_ids")
-    objects_intersecting = (
-        select(object_geometries_data.c.object_geometry_id)
-        .select_from(
-            object_geometries_data.join(
-                urban_objects_data,
-                urban_objects_data.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
-            )
-        )
-        .where(
-            urban_objects_data.c.urban_object_id.not_in(select(public_urban_object_ids)),
-            object_geometries_data.c.territory_id.in_([1])
-            | ST_Intersects(object_geometries_data.c.geometry, mock_geom),
+    context_objects = (
+        select(
+            projects_context_object_geometries_data.c.object_geometry_id,
+            projects_context_object_geometries_data.c.geometry,
+            projects_context_object_geometries_data.c.centre_point,
         )
-        .cte(name="objects_intersecting")
+        .where(projects_context_object_geometries_data.c.project_id == 1)
+        .cte(name="context_object_geometries")
     )
     building_columns = [col for col in buildings_data.c if col.name not in ("physical_object_id", "properties")]
     public_urban_objects_query = (
@@ -580,8 +581,8 @@ async def test_get_context_physical_objects_from_db(mock_conn: MockConnection):
                 object_geometries_data.c.object_geometry_id == urban_objects_data.c.object_geometry_id,
             )
             .join(
-                objects_intersecting,
-                objects_intersecting.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
+                context_objects,
+                context_objects.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
             )
             .join(
                 territories_data,
@@ -601,6 +602,7 @@ async def test_get_context_physical_objects_from_db(mock_conn: MockConnection):
                 buildings_data.c.physical_object_id == physical_objects_data.c.physical_object_id,
             )
         )
+        .where(urban_objects_data.c.urban_object_id.not_in(select(public_urban_object_ids)))
         .where(
             physical_object_types_dict.c.physical_object_type_id == physical_object_type_id,
         )
@@ -734,11 +736,18 @@ async def test_get_context_physical_objects_from_db(mock_conn: MockConnection):
     union_query = union_all(public_urban_objects_query, scenario_urban_objects_query)
 
     # Act
-    with patch(
-        "idu_api.urban_api.logic.impl.helpers.projects_physical_objects.get_context_territories_geometry",
-        new_callable=AsyncMock,
-    ) as mock_get_context:
-        mock_get_context.return_value = 1, mock_geom, [1]
+    with (
+        patch(
+            "idu_api.urban_api.logic.impl.helpers.projects_physical_objects.get_context_territories_geometry",
+            new_callable=AsyncMock,
+        ) as mock_get_context,
+        patch(
+            "idu_api.urban_api.logic.impl.helpers.projects_physical_objects.get_context_layer_cache",
+            new_callable=AsyncMock,
+        ) as mock_get_context_layer,
+    ):
+        mock_get_context.return_value = 1, mock_geom, context_pieces
+        mock_get_context_layer.return_value = context_objects
         result = await get_context_physical_objects_from_db(
             mock_conn, project_id, user, physical_object_type_id, physical_object_function_id
         )
@@ -764,26 +773,25 @@ async def test_get_context_physical_objects_with_geometry_from_db(mock_conn: Moc
     physical_object_type_id = 1
     physical_object_function_id = None
     mock_geom = str(MagicMock(spec=ScalarSelect))
+    context_pieces = (
+        select(projects_context_subdivided_data.c.geometry)
+        .where(projects_context_subdivided_data.c.project_id == 1)
+        .cte(name="context_pieces")
+    )
 
     public_urban_object_ids = (
         select(projects_urban_objects_data.c.public_urban_object_id)
         .where(projects_urban_objects_data.c.scenario_id == 1)
         .where(projects_urban_objects_data.c.public_urban_object_id.isnot(None))
     ).cte(name="public_urban_object_ids")
-    objects_intersecting = (
-        select(object_geometries_data.c.object_geometry_id)
-        .select_from(
-            object_geometries_data.join(
-                urban_objects_data,
-                urban_objects_data.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
-            )
-        )
-        .where(
-            urban_objects_data.c.urban_object_id.not_in(select(public_urban_object_ids)),
-            object_geometries_data.c.territory_id.in_([1])
-            | ST_Intersects(object_geometries_data.c.geometry, mock_geom),
+    context_objects = (
+        select(
+            projects_context_object_geometries_data.c.object_geometry_id,
+            projects_context_object_geometries_data.c.geometry,
+            projects_context_object_geometries_data.c.centre_point,
         )
-        .cte(name="objects_intersecting")
+        .where(projects_context_object_geometries_data.c.project_id == 1)
+        .cte(name="context_object_geometries")
     )
     building_columns = [col for col in buildings_data.c if col.name not in ("physical_object_id", "properties")]
     public_urban_objects_query = (
@@ -802,8 +810,8 @@ async def test_get_context_physical_objects_with_geometry_from_db(mock_conn: Moc
             object_geometries_data.c.object_geometry_id,
             object_geometries_data.c.address,
             object_geometries_data.c.osm_id,
-            ST_AsEWKB(ST_Intersection(object_geometries_data.c.geometry, mock_geom)).label("geometry"),
-            ST_AsEWKB(ST_Centroid(ST_Intersection(object_geometries_data.c.geometry, mock_geom))).label("centre_point"),
+            ST_AsEWKB(context_objects.c.geometry).label("geometry"),
+            ST_AsEWKB(context_objects.c.centre_point).label("centre_point"),
             territories_data.c.territory_id,
             territories_data.c.name.label("territory_name"),
             literal(False).label("is_scenario_physical_object"),
@@ -819,8 +827,8 @@ async def test_get_context_physical_objects_with_geometry_from_db(mock_conn: Moc
                 object_geometries_data.c.object_geometry_id == urban_objects_data.c.object_geometry_id,
             )
             .join(
-                objects_intersecting,
-                objects_intersecting.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
+                context_objects,
+                context_objects.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
             )
             .join(
                 territories_data,
@@ -840,6 +848,7 @@ async def test_get_context_physical_objects_with_geometry_from_db(mock_conn: Moc
                 buildings_data.c.physical_object_id == physical_objects_data.c.physical_object_id,
             )
         )
+        .where(urban_objects_data.c.urban_object_id.not_in(select(public_urban_object_ids)))
         .distinct()
     ).where(physical_object_types_dict.c.physical_object_type_id == physical_object_type_id)
     scenario_urban_objects_query = (
@@ -1003,11 +1012,18 @@ async def test_get_context_physical_objects_with_geometry_from_db(mock_conn: Moc
     union_query = union_all(public_urban_objects_query, scenario_urban_objects_query)
 
     # Act
-    with patch(
-        "idu_api.urban_api.logic.impl.helpers.projects_physical_objects.get_context_territories_geometry",
-        new_callable=AsyncMock,
-    ) as mock_get_context:
-        mock_get_context.return_value = 1, mock_geom, [1]
+    with (
+        patch(
+            "idu_api.urban_api.logic.impl.helpers.projects_physical_objects.get_context_territories_geometry",
+            new_callable=AsyncMock,
+        ) as mock_get_context,
+        patch(
+            "idu_api.urban_api.logic.impl.helpers.projects_physical_objects.get_context_layer_cache",
+            new_callable=AsyncMock,
+        ) as mock_get_context_layer,
+    ):
+        mock_get_context.return_value = 1, mock_geom, context_pieces
+        mock_get_context_layer.return_value = context_objects
         result = await get_context_physical_objects_with_geometry_from_db(
             mock_conn, project_id, user, physical_object_type_id, physical_object_function_id
         )
@@ -4,12 +4,14 @@ from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from geoalchemy2.functions import ST_AsEWKB, ST_Intersects, ST_Within
+from geoalchemy2.functions import ST_AsEWKB, ST_Within
 from sqlalchemy import ScalarSelect, delete, insert, literal, or_, select, union_all, update
 from sqlalchemy.sql.functions import coalesce
 
 from idu_api.common.db.entities import (
     object_geometries_data,
+    projects_context_object_geometries_data,
+    projects_context_subdivided_data,
     projects_object_geometries_data,
     projects_services_data,
     projects_territory_data,
@@ -425,26 +427,25 @@ async def test_get_context_services_from_db(mock_conn: MockConnection):
     service_type_id = 1
     urban_function_id = None
     mock_geom = str(MagicMock(spec=ScalarSelect))
+    context_pieces = (
+        select(projects_context_subdivided_data.c.geometry)
+        .where(projects_context_subdivided_data.c.project_id == 1)
+        .cte(name="context_pieces")
+    )
 
     public_urban_object_ids = (
         select(projects_urban_objects_data.c.public_urban_object_id)
         .where(projects_urban_objects_data.c.scenario_id == 1)
         .where(projects_urban_objects_data.c.public_urban_object_id.isnot(None))
     ).cte(name="public_urban_object_ids")
-    objects_intersecting = (
-        select(object_geometries_data.c.object_geometry_id)
-        .select_from(
-            object_geometries_data.join(
-                urban_objects_data,
-                urban_objects_data.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
-            )
-        )
-        .where(
-            urban_objects_data.c.urban_object_id.not_in(select(public_urban_object_ids)),
-            object_geometries_data.c.territory_id.in_([1])
-            | ST_Intersects(object_geometries_data.c.geometry, mock_geom),
+    context_objects = (
+        select(
+            projects_context_object_geometries_data.c.object_geometry_id,
+            projects_context_object_geometries_data.c.geometry,
+            projects_context_object_geometries_data.c.centre_point,
         )
-        .cte(name="objects_intersecting")
+        .where(projects_context_object_geometries_data.c.project_id == 1)
+        .cte(name="context_object_geometries")
     )
     public_services_query = (
         select(
@@ -476,8 +477,8 @@ async def test_get_context_services_from_db(mock_conn: MockConnection):
                 object_geometries_data.c.object_geometry_id == urban_objects_data.c.object_geometry_id,
             )
             .join(
-                objects_intersecting,
-                objects_intersecting.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
+                context_objects,
+                context_objects.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
             )
             .join(
                 territories_data,
@@ -496,6 +497,7 @@ async def test_get_context_services_from_db(mock_conn: MockConnection):
                 urban_functions_dict.c.urban_function_id == service_types_dict.c.urban_function_id,
             )
         )
+        .where(urban_objects_data.c.urban_object_id.not_in(select(public_urban_object_ids)))
         .where(service_types_dict.c.service_type_id == service_type_id)
     )
     scenario_services_query = (
@@ -577,11 +579,18 @@ async def test_get_context_services_from_db(mock_conn: MockConnection):
     union_query = union_all(public_services_query, scenario_services_query)
 
     # Act
-    with patch(
-        "idu_api.urban_api.logic.impl.helpers.projects_services.get_context_territories_geometry",
-        new_callable=AsyncMock,
-    ) as mock_get_context:
-        mock_get_context.return_value = 1, mock_geom, [1]
+    with (
+        patch(
+            "idu_api.urban_api.logic.impl.helpers.projects_services.get_context_territories_geometry",
+            new_callable=AsyncMock,
+        ) as mock_get_context,
+        patch(
+            "idu_api.urban_api.logic.impl.helpers.projects_services.get_context_layer_cache",
+            new_callable=AsyncMock,
+        ) as mock_get_context_layer,
+    ):
+        mock_get_context.return_value = 1, mock_geom, context_pieces
+        mock_get_context_layer.return_value = context_objects
         result = await get_context_services_from_db(mock_conn, project_id, user, service_type_id, urban_function_id)
 
     # Assert
@@ -601,26 +610,25 @@ async def test_get_context_services_with_geometry_from_db(mock_conn: MockConnect
     service_type_id = 1
     urban_function_id = None
     mock_geom = str(MagicMock(spec=ScalarSelect))
+    context_pieces = (
+        select(projects_context_subdivided_data.c.geometry)
+        .where(projects_context_subdivided_data.c.project_id == 1)
+        .cte(name="context_pieces")
+    )
 
     public_urban_object_ids = (
         select(projects_urban_objects_data.c.public_urban_object_id)
         .where(projects_urban_objects_data.c.scenario_id == 1)
         .where(projects_urban_objects_data.c.public_urban_object_id.isnot(None))
     ).cte(name="public_urban_object_ids")
-    objects_intersecting = (
-        select(object_geometries_data.c.object_geometry_id)
-        .select_from(
-            object_geometries_data.join(
-                urban_objects_data,
-                urban_objects_data.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
-            )
-        )
-        .where(
-            urban_objects_data.c.urban_object_id.not_in(select(public_urban_object_ids)),
-            object_geometries_data.c.territory_id.in_([1])
-            | ST_Intersects(object_geometries_data.c.geometry, mock_geom),
+    context_objects = (
+        select(
+            projects_context_object_geometries_data.c.object_geometry_id,
+            projects_context_object_geometries_data.c.geometry,
+            projects_context_object_geometries_data.c.centre_point,
         )
-        .cte(name="objects_intersecting")
+        .where(projects_context_object_geometries_data.c.project_id == 1)
+        .cte(name="context_object_geometries")
     )
     public_services_query = (
         select(
@@ -658,8 +666,8 @@ async def test_get_context_services_with_geometry_from_db(mock_conn: MockConnect
                 object_geometries_data.c.object_geometry_id == urban_objects_data.c.object_geometry_id,
             )
             .join(
-                objects_intersecting,
-                objects_intersecting.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
+                context_objects,
+                context_objects.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
             )
             .join(
                 territories_data,
@@ -678,6 +686,7 @@ async def test_get_context_services_with_geometry_from_db(mock_conn: MockConnect
                 urban_functions_dict.c.urban_function_id == service_types_dict.c.urban_function_id,
             )
         )
+        .where(urban_objects_data.c.urban_object_id.not_in(select(public_urban_object_ids)))
         .where(service_types_dict.c.service_type_id == service_type_id)
     )
     scenario_services_query = (
@@ -784,11 +793,18 @@ async def test_get_context_services_with_geometry_from_db(mock_conn: MockConnect
     union_query = union_all(public_services_query, scenario_services_query)
 
     # Act
-    with patch(
-        "idu_api.urban_api.logic.impl.helpers.projects_services.get_context_territories_geometry",
-        new_callable=AsyncMock,
-    ) as mock_get_context:
-        mock_get_context.return_value = 1, mock_geom, [1]
+    with (
+        patch(
+            "idu_api.urban_api.logic.impl.helpers.projects_services.get_context_territories_geometry",
+            new_callable=AsyncMock,
+        ) as mock_get_context,
+        patch(
+            "idu_api.urban_api.logic.impl.helpers.projects_services.get_context_layer_cache",
+            new_callable=AsyncMock,
+        ) as mock_get_context_layer,
+    ):
+        mock_get_context.return_value = 1, mock_geom, context_pieces
+        mock_get_context_layer.return_value = context_objects
         result = await get_context_services_with_geometry_from_db(
             mock_conn, project_id, user, service_type_id, urban_function_id
         )
@@ -73,7 +73,8 @@ async def test_delete_project(storage_manager, fake_logger):
 
     await storage_manager.delete_project(1, fake_logger)
     storage_manager._client.list_objects.assert_awaited_once_with(session, fake_logger, prefix="1/")
-    storage_manager._client.delete_file.assert_any_call(session, "1/test.jpg", fake_logger)
+    storage_manager._client.delete_files.assert_awaited_once_with(session, ["1/test.jpg"], fake_logger)
+    storage_manager._client.delete_file.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,80 @@
+"""Unit tests for search by name are defined here."""
+
+import pytest
+from sqlalchemy import Float, func, select
+
+from idu_api.common.db.entities import projects_data, territories_data
+from idu_api.urban_api.dto import SearchResultDTO, UserDTO
+from idu_api.urban_api.logic.impl.helpers.search import escape_like, name_condition, search_by_name_from_db
+from tests.urban_api.helpers.connection import MockConnection
+
+####################################################################################
+#                           Default use-case tests                                 #
+####################################################################################
+
+
+def test_name_condition():
+    """Test the name_condition function."""
+
+    # Arrange
+    column = territories_data.c.name
+
+    # Act
+    substring = name_condition(column, "50%_off", "substring")
+    prefix = name_condition(column, "Sain", "prefix")
+    fuzzy = name_condition(column, "Peterburg", "fuzzy")
+
+    # Assert
+    assert escape_like("50%_off") == "50\\%\\_off", "LIKE special characters should be escaped."
+    assert str(substring) == str(column.ilike("%50\\%\\_off%")), "Substring should be matched anywhere."
+    assert str(prefix) == str(column.ilike("Sain%")), "Prefix should be matched at the start."
+    assert str(fuzzy) == str(column.op("%")("Peterburg")), "Trigram similarity operator should be used."
+
+
+@pytest.mark.asyncio
+async def test_search_by_name_from_db(mock_conn: MockConnection):
+    """Test the search_by_name_from_db function."""
+
+    # Arrange
+    query, limit = "Saint", 10
+    user = UserDTO(id="mock_string", is_superuser=False)
+    territories_rank = func.similarity(territories_data.c.name, query, type_=Float)
+    territories_statement = (
+        select(
+            territories_data.c.territory_id.label("id"),
+            territories_data.c.name.label("name"),
+            territories_rank.label("rank"),
+        )
+        .where(territories_data.c.name.ilike(f"%{query}%"))
+        .order_by(territories_rank.desc(), territories_data.c.territory_id)
+        .limit(limit)
+    )
+    projects_rank = func.similarity(projects_data.c.name, query, type_=Float)
+    projects_statement = (
+        select(projects_data.c.project_id.label("id"), projects_data.c.name.label("name"), projects_rank.label("rank"))
+        .where(
+            projects_data.c.name.ilike(f"{query}%"),
+            projects_data.c.is_regional.is_(False),
+            (projects_data.c.user_id == user.id) | projects_data.c.public.is_(True),
+        )
+        .order_by(projects_rank.desc(), projects_data.c.project_id)
+        .limit(limit)
+    )
+
+    # Act
+    result = await search_by_name_from_db(mock_conn, query, None, "substring", limit, None)
+    all_entities_queries = [call.args[0] for call in mock_conn.execute_mock.call_args_list]
+    mock_conn.execute_mock.reset_mock()
+    await search_by_name_from_db(mock_conn, query, "projects", "prefix", limit, user)
+
+    # Assert
+    assert isinstance(result, list), "Result should be a list."
+    assert all(isinstance(item, SearchResultDTO) for item in result), "Each item should be a SearchResultDTO."
+    assert {item.entity_type for item in result} == {
+        "territories",
+        "physical_objects",
+        "services",
+        "projects",
+    }, "All entity types should be searched if entity type is not set."
+    assert str(territories_statement) in all_entities_queries, "Territories should be searched by substring."
+    mock_conn.execute_mock.assert_called_once_with(str(projects_statement))
@@ -4,7 +4,9 @@ from datetime import datetime, timezone
 from unittest.mock import AsyncMock, patch
 
 import pytest
-from sqlalchemy.sql import delete, insert, select, update
+from geoalchemy2.functions import ST_AsEWKB, ST_GeomFromWKB
+from shapely.geometry import LineString, MultiLineString, MultiPoint, MultiPolygon, Point, Polygon
+from sqlalchemy.sql import delete, insert, select, text, update
 
 from idu_api.common.db.entities import (
     object_geometries_data,
@@ -15,19 +17,23 @@ from idu_api.common.db.entities import (
     urban_functions_dict,
     urban_objects_data,
 )
-from idu_api.urban_api.dto import ServiceDTO, UrbanObjectDTO
+from idu_api.urban_api.dto import ServiceDTO, ServiceWithGeometryDTO, UrbanObjectDTO
 from idu_api.urban_api.exceptions.logic.common import EntityAlreadyExists, EntityNotFoundById
 from idu_api.urban_api.logic.impl.helpers.services import (
     add_service_to_db,
     add_service_to_object_in_db,
     delete_service_from_db,
+    get_nearest_services_from_db,
     get_service_by_id_from_db,
     patch_service_to_db,
     put_service_to_db,
 )
-from idu_api.urban_api.schemas import Service, ServicePatch, ServicePost, ServicePut, UrbanObject
+from idu_api.urban_api.logic.impl.helpers.utils import SRID, distance_order, within_distance
+from idu_api.urban_api.schemas import Service, ServicePatch, ServicePost, ServicePut, ServiceWithGeometry, UrbanObject
 from tests.urban_api.helpers.connection import MockConnection
 
+Geom = Point | Polygon | MultiPolygon | LineString | MultiLineString | MultiPoint
+
 ####################################################################################
 #                           Default use-case tests                                 #
 ####################################################################################
@@ -84,6 +90,91 @@ async def test_get_service_by_id_from_db(mock_conn: MockConnection):
     mock_conn.execute_mock.assert_called_once_with(str(statement))
 
 
+@pytest.mark.asyncio
+async def test_get_nearest_services_from_db(mock_conn: MockConnection, shapely_geometry: Geom):
+    """Test the get_nearest_services_from_db function."""
+
+    # Arrange
+    service_type_id = 1
+    limit = 10
+    max_distance_meters = 1000
+    given_geometry = select(ST_GeomFromWKB(shapely_geometry.wkb, text(str(SRID)))).scalar_subquery()
+    distance = distance_order(object_geometries_data.c.geometry, given_geometry)
+    nearest = (
+        select(
+            urban_objects_data.c.service_id,
+            urban_objects_data.c.object_geometry_id,
+            distance.label("distance"),
+        )
+        .select_from(
+            urban_objects_data.join(services_data, services_data.c.service_id == urban_objects_data.c.service_id).join(
+                object_geometries_data,
+                object_geometries_data.c.object_geometry_id == urban_objects_data.c.object_geometry_id,
+            )
+        )
+        .distinct(urban_objects_data.c.service_id)
+        .where(
+            services_data.c.service_type_id == service_type_id,
+            within_distance(object_geometries_data.c.geometry, given_geometry, max_distance_meters),
+        )
+        .order_by(urban_objects_data.c.service_id, distance)
+        .subquery("nearest")
+    )
+    statement = (
+        select(
+            services_data,
+            service_types_dict.c.urban_function_id,
+            urban_functions_dict.c.name.label("urban_function_name"),
+            service_types_dict.c.name.label("service_type_name"),
+            service_types_dict.c.capacity_modeled.label("service_type_capacity_modeled"),
+            service_types_dict.c.code.label("service_type_code"),
+            service_types_dict.c.infrastructure_type,
+            service_types_dict.c.properties.label("service_type_properties"),
+            territory_types_dict.c.name.label("territory_type_name"),
+            object_geometries_data.c.object_geometry_id,
+            object_geometries_data.c.address,
+            object_geometries_data.c.osm_id,
+            ST_AsEWKB(object_geometries_data.c.geometry).label("geometry"),
+            ST_AsEWKB(object_geometries_data.c.centre_point).label("centre_point"),
+            territories_data.c.territory_id,
+            territories_data.c.name.label("territory_name"),
+        )
+        .select_from(
+            nearest.join(services_data, services_data.c.service_id == nearest.c.service_id)
+            .join(
+                object_geometries_data,
+                nearest.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
+            )
+            .join(territories_data, territories_data.c.territory_id == object_geometries_data.c.territory_id)
+            .join(service_types_dict, service_types_dict.c.service_type_id == services_data.c.service_type_id)
+            .join(
+                urban_functions_dict,
+                service_types_dict.c.urban_function_id == urban_functions_dict.c.urban_function_id,
+            )
+            .outerjoin(
+                territory_types_dict, territory_types_dict.c.territory_type_id == services_data.c.territory_type_id
+            )
+        )
+        .order_by(nearest.c.distance, nearest.c.service_id)
+        .limit(limit)
+    )
+
+    # Act
+    result = await get_nearest_services_from_db(
+        mock_conn, shapely_geometry, service_type_id, limit, max_distance_meters
+    )
+
+    # Assert
+    assert isinstance(result, list), "Result should be a list."
+    assert all(
+        isinstance(item, ServiceWithGeometryDTO) for item in result
+    ), "Each item should be a ServiceWithGeometryDTO."
+    assert isinstance(
+        ServiceWithGeometry.from_dto(result[0]), ServiceWithGeometry
+    ), "Couldn't create pydantic model from DTO."
+    mock_conn.execute_mock.assert_called_once_with(str(statement))
+
+
 @pytest.mark.asyncio
 async def test_add_service_to_db(mock_conn: MockConnection, service_post_req: ServicePost):
     """Test the add_service_to_db function."""
@@ -0,0 +1,57 @@
+"""Unit tests for system endpoints are defined here."""
+
+import pytest
+from fastapi import FastAPI, HTTPException
+
+from idu_api.urban_api.dto.users import UserDTO
+from idu_api.urban_api.fastapi_init import bind_routes
+from idu_api.urban_api.handlers import list_of_routers
+from idu_api.urban_api.handlers.system import profile_requests, sample_event_loop
+from idu_api.urban_api.schemas.enums import ProfileFormat
+from idu_api.urban_api.utils.profiler import requests_profiler
+
+####################################################################################
+#                           Default use-case tests                                 #
+####################################################################################
+
+
+def test_profiler_routes_without_debug(monkeypatch: pytest.MonkeyPatch):
+    """Test that profiler routes are registered when the application is not in debug mode."""
+
+    # Arrange
+    for router in list_of_routers:
+        monkeypatch.setattr(router, "routes", list(router.routes))  # routes are removed from routers in place
+    application = FastAPI()
+
+    # Act
+    bind_routes(application, "/api", debug=False)
+    routes = {(route.path, method) for route in application.routes for method in getattr(route, "methods", ())}
+
+    # Assert
+    assert ("/system/profiler/sample", "POST") in routes, "Event loop sampling route should be registered."
+    assert {
+        ("/system/profiler/requests", "POST"),
+        ("/system/profiler/requests", "GET"),
+        ("/system/profiler/requests", "DELETE"),
+    } <= routes, "Requests profiling routes should be registered."
+    assert all("debug" not in path for path, _ in routes), "Debug routes should not be registered."
+
+
+@pytest.mark.asyncio
+async def test_profiler_with_several_workers(monkeypatch: pytest.MonkeyPatch):
+    """Test that profiler endpoints are refused when the application is run with several workers."""
+
+    # Arrange
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", "/tmp/prometheus")
+    user = UserDTO(id="superuser", is_superuser=True)
+
+    # Act
+    with pytest.raises(HTTPException) as sample_exc:
+        await sample_event_loop(duration=1, interval=0.005, output_format=ProfileFormat.SPEEDSCOPE, user=user)
+    with pytest.raises(HTTPException) as requests_exc:
+        await profile_requests(path_pattern="/api/v1/territories", count=1, interval=0.005, user=user)
+
+    # Assert
+    assert sample_exc.value.status_code == 409, "Event loop sampling should be refused."
+    assert requests_exc.value.status_code == 409, "Requests profiling should be refused."
+    assert not requests_profiler.armed, "Requests profiler should not be armed."
@@ -1,27 +1,37 @@
 from unittest.mock import patch
 
 import pytest
-from geoalchemy2.functions import ST_AsEWKB
-from sqlalchemy import select
+import shapely
+from geoalchemy2 import Geography, Geometry
+from geoalchemy2.functions import ST_Area, ST_AsEWKB, ST_GeomFromWKB, ST_Intersection, ST_Intersects
+from sqlalchemy import Boolean, Float, Integer, cast, column, exists, func, select, text
 
 from idu_api.common.db.entities import (
     buffer_types_dict,
     buffers_data,
+    hexagons_data,
     object_geometries_data,
     physical_object_types_dict,
     physical_objects_data,
+    service_coverage_data,
+    service_coverage_versions_data,
     service_types_dict,
     services_data,
     territories_data,
     urban_objects_data,
 )
-from idu_api.urban_api.dto import BufferDTO
+from idu_api.urban_api.dto import BufferDTO, ServiceCoverageDTO
 from idu_api.urban_api.exceptions.logic.common import EntityNotFoundById
-from idu_api.urban_api.logic.impl.helpers.territories_buffers import get_buffers_by_territory_id_from_db
-from idu_api.urban_api.logic.impl.helpers.utils import include_child_territories_cte
-from idu_api.urban_api.schemas import Buffer, BufferAttributes
+from idu_api.urban_api.logic.impl.helpers.territories_buffers import (
+    get_buffers_by_territory_id_from_db,
+    get_service_coverage_by_territory_id_from_db,
+    refresh_service_coverages,
+)
+from idu_api.urban_api.logic.impl.helpers.utils import SRID, include_child_territories_cte
+from idu_api.urban_api.schemas import Buffer, BufferAttributes, ServiceCoverage
 from idu_api.urban_api.schemas.geometries import GeoJSONResponse
 from tests.urban_api.helpers import MockConnection
+from tests.urban_api.helpers.connection import MockResult, MockRow
 
 
 @pytest.mark.asyncio
@@ -134,3 +144,154 @@ async def test_get_buffers_by_territory_id_from_db(mock_conn: MockConnection):
     mock_conn.execute_mock.assert_any_call(str(statement))
     mock_conn.execute_mock.assert_any_call(str(recursive_statement))
     mock_conn.execute_mock.assert_any_call(str(statement_with_filters))
+
+
+@pytest.mark.asyncio
+async def test_get_service_coverage_by_territory_id_from_db(mock_conn: MockConnection):
+    """Test the get_service_coverage_by_territory_id_from_db function."""
+
+    # Arrange
+    territory_id, service_type_id, buffer_type_id = 1, 1, 1
+    key = (
+        (service_coverage_data.c.territory_id == territory_id)
+        & (service_coverage_data.c.service_type_id == service_type_id)
+        & (service_coverage_data.c.buffer_type_id == buffer_type_id)
+    )
+    actual_statement = select(
+        exists()
+        .where(
+            key,
+            service_coverage_versions_data.c.territory_id == service_coverage_data.c.territory_id,
+            service_coverage_versions_data.c.version == service_coverage_data.c.built_version,
+        )
+        .label("is_actual")
+    )
+    coverage = (
+        select(
+            service_coverage_data.c.geometry,
+            service_coverage_data.c.territory_area,
+            service_coverage_data.c.covered_area,
+            service_coverage_data.c.services_count,
+            service_coverage_data.c.built_at,
+        )
+        .where(key)
+        .cte(name="coverage")
+    )
+    calculated = func.public.calculate_service_coverage(territory_id, service_type_id, buffer_type_id).table_valued(
+        column("geometry", Geometry),
+        column("territory_area", Float),
+        column("covered_area", Float),
+        column("services_count", Integer),
+    )
+    calculated_coverage = select(*calculated.c, func.now().label("built_at")).cte(name="coverage")
+
+    def coverage_statement(coverage_cte):
+        return select(
+            territories_data.c.territory_id,
+            territories_data.c.name.label("territory_name"),
+            service_types_dict.c.service_type_id,
+            service_types_dict.c.name.label("service_type_name"),
+            buffer_types_dict.c.buffer_type_id,
+            buffer_types_dict.c.name.label("buffer_type_name"),
+            ST_AsEWKB(coverage_cte.c.geometry).label("geometry"),
+            coverage_cte.c.territory_area,
+            coverage_cte.c.covered_area,
+            coverage_cte.c.services_count,
+            coverage_cte.c.built_at,
+        ).where(
+            territories_data.c.territory_id == territory_id,
+            service_types_dict.c.service_type_id == service_type_id,
+            buffer_types_dict.c.buffer_type_id == buffer_type_id,
+        )
+
+    hexagons_coverage = select(ST_GeomFromWKB(shapely.Point(1, 2).wkb, text(str(SRID))).label("geometry")).cte(
+        name="coverage"
+    )
+    hexagons_statement = (
+        select(
+            hexagons_data.c.hexagon_id,
+            ST_Area(cast(hexagons_data.c.geometry, Geography(srid=SRID)), type_=Float).label("hexagon_area"),
+            func.coalesce(
+                ST_Area(
+                    cast(
+                        ST_Intersection(hexagons_data.c.geometry, hexagons_coverage.c.geometry),
+                        Geography(srid=SRID),
+                    ),
+                    type_=Float,
+                ),
+                0,
+            ).label("covered_area"),
+        )
+        .select_from(
+            hexagons_data.outerjoin(
+                hexagons_coverage, ST_Intersects(hexagons_data.c.geometry, hexagons_coverage.c.geometry)
+            )
+        )
+        .where(hexagons_data.c.territory_id == territory_id)
+        .order_by(hexagons_data.c.hexagon_id)
+    )
+    outdated_conn = MockConnection([MockResult([MockRow(is_actual=False)])])
+
+    # Act
+    with patch("idu_api.urban_api.logic.impl.helpers.territories_buffers.check_existence") as mock_check_existence:
+        mock_check_existence.return_value = False
+        with pytest.raises(EntityNotFoundById):
+            await get_service_coverage_by_territory_id_from_db(
+                mock_conn, territory_id, service_type_id, buffer_type_id, False
+            )
+    with patch(
+        "idu_api.urban_api.logic.impl.helpers.territories_buffers._service_coverage_refresh_requests", set()
+    ) as requests:
+        result = await get_service_coverage_by_territory_id_from_db(
+            mock_conn, territory_id, service_type_id, buffer_type_id, False
+        )
+        await get_service_coverage_by_territory_id_from_db(
+            mock_conn, territory_id, service_type_id, buffer_type_id, True
+        )
+        actual_requests = set(requests)
+        with patch("idu_api.urban_api.logic.impl.helpers.territories_buffers.check_existence") as mock_check_existence:
+            mock_check_existence.return_value = True
+            outdated_result = await get_service_coverage_by_territory_id_from_db(
+                outdated_conn, territory_id, service_type_id, buffer_type_id, True
+            )
+
+    # Assert
+    assert isinstance(result, ServiceCoverageDTO), "Result should be a ServiceCoverageDTO."
+    assert isinstance(outdated_result, ServiceCoverageDTO), "Result should be a ServiceCoverageDTO."
+    assert isinstance(ServiceCoverage.from_dto(result), ServiceCoverage), "Couldn't create pydantic model from DTO."
+    assert not actual_requests, "Actual coverage should not be requested to be rebuilt."
+    assert requests == {(territory_id, service_type_id, buffer_type_id)}, "Out of date coverage should be requested."
+    mock_conn.execute_mock.assert_any_call(str(actual_statement))
+    mock_conn.execute_mock.assert_any_call(str(coverage_statement(coverage)))
+    mock_conn.execute_mock.assert_any_call(str(hexagons_statement))
+    outdated_conn.execute_mock.assert_any_call(str(coverage_statement(calculated_coverage)))
+    outdated_conn.execute_mock.assert_any_call(str(hexagons_statement))
+    assert (
+        sum("calculate_service_coverage" in call.args[0] for call in outdated_conn.execute_mock.call_args_list) == 1
+    ), "Out of date coverage should be calculated once."
+    mock_conn.commit_mock.assert_not_called()
+    outdated_conn.commit_mock.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_refresh_service_coverages(mock_conn: MockConnection):
+    """Test the refresh_service_coverages function."""
+
+    # Arrange
+    requests = {(2, 1, 1), (1, 2, 1)}
+    statements = [
+        select(func.public.refresh_service_coverage(territory_id, service_type_id, buffer_type_id, type_=Boolean))
+        for territory_id, service_type_id, buffer_type_id in sorted(requests)
+    ]
+
+    # Act
+    with patch("idu_api.urban_api.logic.impl.helpers.territories_buffers._service_coverage_refresh_requests", requests):
+        result = await refresh_service_coverages(mock_conn)
+
+    # Assert
+    assert result == 2, "Result should be the number of rebuilt coverages."
+    assert not requests, "Requests should be taken by the rebuild."
+    assert [call.args[0] for call in mock_conn.execute_mock.call_args_list] == [
+        str(statement) for statement in statements
+    ], "Requested coverages should be rebuilt in order."
+    assert mock_conn.commit_mock.call_count == 2, "Every rebuilt coverage should be committed."
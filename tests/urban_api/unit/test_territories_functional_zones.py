@@ -4,7 +4,7 @@ from datetime import datetime
 from unittest.mock import patch
 
 import pytest
-from geoalchemy2.functions import ST_AsEWKB
+from geoalchemy2.functions import ST_AsEWKB, ST_MakeEnvelope
 from sqlalchemy import delete, select
 
 from idu_api.common.db.entities import functional_zone_types_dict, functional_zones_data, territories_data
@@ -112,6 +112,12 @@ async def test_get_functional_zones_by_territory_id_from_db(mock_conn: MockConne
         functional_zones_data.c.functional_zone_type_id == functional_zone_type_id
     )
     statement = statement.where(functional_zones_data.c.functional_zone_type_id == functional_zone_type_id)
+    bbox, limit = (30.0, 59.0, 31.0, 60.0), 100
+    bbox_statement = (
+        statement.where(functional_zones_data.c.geometry.intersects(ST_MakeEnvelope(*bbox, 4326)))
+        .order_by(functional_zones_data.c.functional_zone_id)
+        .limit(limit)
+    )
 
     # Act
     with patch(
@@ -129,6 +135,17 @@ async def test_get_functional_zones_by_territory_id_from_db(mock_conn: MockConne
         mock_conn, territory_id, year, source, functional_zone_type_id, include_child_territories, cities_only
     )
     geojson_result = await GeoJSONResponse.from_list([r.to_geojson_dict() for r in result])
+    await get_functional_zones_by_territory_id_from_db(
+        mock_conn,
+        territory_id,
+        year,
+        source,
+        functional_zone_type_id,
+        include_child_territories,
+        cities_only,
+        bbox=bbox,
+        limit=limit,
+    )
 
     # Assert
     assert isinstance(result, list), "Result should be a list."
@@ -139,6 +156,7 @@ async def test_get_functional_zones_by_territory_id_from_db(mock_conn: MockConne
     ), "Couldn't create pydantic model from geojson properties."
     mock_conn.execute_mock.assert_any_call(str(statement))
     mock_conn.execute_mock.assert_any_call(str(recursive_statement))
+    mock_conn.execute_mock.assert_any_call(str(bbox_statement))
 
 
 @pytest.mark.asyncio
@@ -14,17 +14,26 @@ from idu_api.common.db.entities import (
     physical_object_types_dict,
     service_types_dict,
     territories_data,
+    territory_indicators_aggregates_data,
     territory_indicators_data,
 )
-from idu_api.urban_api.dto import IndicatorDTO, IndicatorValueDTO, TerritoryWithIndicatorsDTO
+from idu_api.urban_api.dto import (
+    AggregatedIndicatorValueDTO,
+    IndicatorDTO,
+    IndicatorValueDTO,
+    TerritoryWithIndicatorsDTO,
+)
 from idu_api.urban_api.exceptions.logic.common import EntityNotFoundById
 from idu_api.urban_api.logic.impl.helpers.territories_indicators import (
+    _aggregate_indicator_values_query,
+    _get_target_territories_cte,
+    get_aggregated_indicator_values_by_territory_id_from_db,
     get_indicator_values_by_parent_id_from_db,
     get_indicator_values_by_territory_id_from_db,
     get_indicators_by_territory_id_from_db,
 )
 from idu_api.urban_api.logic.impl.helpers.utils import include_child_territories_cte
-from idu_api.urban_api.schemas import Indicator, IndicatorValue, TerritoryWithIndicators
+from idu_api.urban_api.schemas import AggregatedIndicatorValue, Indicator, IndicatorValue, TerritoryWithIndicators
 from idu_api.urban_api.schemas.geometries import GeoJSONResponse
 from tests.urban_api.helpers.connection import MockConnection
 
@@ -353,3 +362,118 @@ async def test_get_indicator_values_by_parent_id_from_db(mock_conn: MockConnecti
     ), "Couldn't create pydantic model from geojson properties."
     mock_conn.execute_mock.assert_any_call(str(statement))
     mock_conn.execute_mock.assert_any_call(str(last_only_statement))
+
+
+@pytest.mark.asyncio
+async def test_get_aggregated_indicator_values_by_territory_id_from_db(mock_conn: MockConnection):
+    """Test the get_aggregated_indicator_values_by_territory_id_from_db function."""
+
+    # Arrange
+    territory_id, indicator_ids, level = 1, {1, 2}, 2
+    value_type, aggregation_type, weight_indicator_id = "real", "weighted_avg", 1
+    date_value = date.today()
+    targets_cte = _get_target_territories_cte(territory_id, level)
+    source = _aggregate_indicator_values_query(
+        targets_cte, indicator_ids, value_type, aggregation_type, weight_indicator_id, date_value
+    ).subquery("aggregates")
+    persisted_source = (
+        select(
+            territory_indicators_aggregates_data.c.territory_id,
+            territory_indicators_aggregates_data.c.indicator_id,
+            territory_indicators_aggregates_data.c.value_type,
+            territory_indicators_aggregates_data.c.aggregation_type,
+            territory_indicators_aggregates_data.c.weight_indicator_id,
+            territory_indicators_aggregates_data.c.value,
+            territory_indicators_aggregates_data.c.territories_count,
+            territory_indicators_aggregates_data.c.date_value,
+        )
+        .where(
+            territory_indicators_aggregates_data.c.territory_id.in_(select(targets_cte.c.territory_id)),
+            territory_indicators_aggregates_data.c.indicator_id.in_(indicator_ids),
+            territory_indicators_aggregates_data.c.value_type == value_type,
+            territory_indicators_aggregates_data.c.aggregation_type == aggregation_type,
+            territory_indicators_aggregates_data.c.weight_indicator_id.is_not_distinct_from(weight_indicator_id),
+        )
+        .subquery("aggregates")
+    )
+
+    def build_statement(src):
+        return (
+            select(
+                src.c.territory_id,
+                territories_data.c.name.label("territory_name"),
+                src.c.indicator_id,
+                indicators_dict.c.parent_id,
+                indicators_dict.c.name_full,
+                measurement_units_dict.c.measurement_unit_id,
+                measurement_units_dict.c.name.label("measurement_unit_name"),
+                indicators_dict.c.level,
+                indicators_dict.c.list_label,
+                src.c.value_type,
+                src.c.aggregation_type,
+                src.c.weight_indicator_id,
+                src.c.value,
+                src.c.territories_count,
+                src.c.date_value,
+            )
+            .select_from(
+                src.join(territories_data, territories_data.c.territory_id == src.c.territory_id)
+                .join(indicators_dict, indicators_dict.c.indicator_id == src.c.indicator_id)
+                .outerjoin(
+                    measurement_units_dict,
+                    measurement_units_dict.c.measurement_unit_id == indicators_dict.c.measurement_unit_id,
+                )
+            )
+            .order_by(src.c.territory_id, src.c.indicator_id)
+        )
+
+    # Act
+    with patch("idu_api.urban_api.logic.impl.helpers.territories_indicators.check_existence") as mock_check_existence:
+        mock_check_existence.return_value = False
+        with pytest.raises(EntityNotFoundById):
+            await get_aggregated_indicator_values_by_territory_id_from_db(
+                mock_conn,
+                territory_id,
+                indicator_ids,
+                level,
+                value_type,
+                aggregation_type,
+                weight_indicator_id,
+                date_value,
+                False,
+            )
+    result = await get_aggregated_indicator_values_by_territory_id_from_db(
+        mock_conn,
+        territory_id,
+        indicator_ids,
+        level,
+        value_type,
+        aggregation_type,
+        weight_indicator_id,
+        date_value,
+        False,
+    )
+    mock_conn.commit_mock.assert_not_called()
+    await get_aggregated_indicator_values_by_territory_id_from_db(
+        mock_conn,
+        territory_id,
+        indicator_ids,
+        level,
+        value_type,
+        aggregation_type,
+        weight_indicator_id,
+        None,
+        True,
+    )
+
+    # Assert
+    assert isinstance(result, list), "Result should be a list."
+    assert all(
+        isinstance(item, AggregatedIndicatorValueDTO) for item in result
+    ), "Each item should be a AggregatedIndicatorValueDTO."
+    assert all(
+        isinstance(AggregatedIndicatorValue.from_dto(item), AggregatedIndicatorValue) for item in result
+    ), "Couldn't create pydantic model from DTO."
+    mock_conn.execute_mock.assert_any_call(str(build_statement(source)))
+    mock_conn.execute_mock.assert_any_call(str(build_statement(persisted_source)))
+    mock_conn.commit_mock.assert_called_once()
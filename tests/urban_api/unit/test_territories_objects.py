@@ -1,9 +1,10 @@
 """Unit tests for territory objects are defined here."""
 
 from collections.abc import Callable
-from datetime import date, datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from unittest.mock import AsyncMock, patch
 
+import numpy as np
 import pytest
 from fastapi_pagination.bases import CursorRawParams, RawParams
 from geoalchemy2.functions import ST_AsEWKB, ST_GeomFromWKB
@@ -23,11 +24,19 @@ from idu_api.urban_api.logic.impl.helpers.territories_objects import (
     get_intersecting_territories_for_geometry,
     get_territories_by_ids,
     get_territories_by_parent_id_from_db,
+    get_territories_for_points_from_db,
     get_territories_without_geometry_by_parent_id_from_db,
     patch_territory_to_db,
     put_territory_to_db,
 )
-from idu_api.urban_api.logic.impl.helpers.utils import OBJECTS_NUMBER_LIMIT, SRID, build_recursive_query
+from idu_api.urban_api.logic.impl.helpers.territories_spatial_index import TerritoriesSpatialIndex
+from idu_api.urban_api.logic.impl.helpers.territories_tree import TerritoriesTree
+from idu_api.urban_api.logic.impl.helpers.utils import (
+    OBJECTS_NUMBER_LIMIT,
+    SRID,
+    build_recursive_query,
+    intersecting_territories_ids,
+)
 from idu_api.urban_api.schemas import Territory, TerritoryPatch, TerritoryPost, TerritoryPut, TerritoryWithoutGeometry
 from idu_api.urban_api.schemas.geometries import GeoJSONResponse
 from tests.urban_api.helpers.connection import MockConnection
@@ -519,24 +528,38 @@ async def test_get_territories_without_geometry_by_parent_id_from_db(mock_conn:
 
     # Arrange
     parent_id = 1
+    territory = {
+        "territory_type_id": 1,
+        "territory_type_name": "mock_string",
+        "parent_name": "mock_string",
+        "name": "Test Territory",
+        "level": 2,
+        "properties": {},
+        "admin_center_id": None,
+        "admin_center_name": None,
+        "target_city_type_id": None,
+        "target_city_type_name": None,
+        "target_city_type_description": None,
+        "okato_code": None,
+        "oktmo_code": None,
+        "is_city": True,
+        "created_at": datetime.now(timezone.utc),
+        "updated_at": datetime.now(timezone.utc),
+    }
     filters = {
         "territory_type_id": 1,
         "name": "Test Territory",
         "cities_only": True,
-        "created_at": date.today(),
+        "created_at": territory["created_at"].date(),
         "order_by": None,
         "ordering": "asc",
     }
     limit, offset = 10, 0
     statement = select(territories_data)
-    recursive_statement = build_recursive_query(
-        statement, territories_data, parent_id, "territories_recursive", "territory_id"
-    )
     statement = statement.where(territories_data.c.parent_id == parent_id)
     territories_data_parents = territories_data.alias("territories_data_parents")
     admin_centers = territories_data.alias("admin_centers")
     requested_territories = statement.cte("requested_territories")
-    requested_recursive_territories = recursive_statement.cte("requested_territories")
     statement = (
         select(
             requested_territories.c.territory_id,
@@ -575,49 +598,14 @@ async def test_get_territories_without_geometry_by_parent_id_from_db(mock_conn:
         )
         .order_by(requested_territories.c.territory_id)
     )
-    recursive_statement = (
-        select(
-            requested_recursive_territories.c.territory_id,
-            requested_recursive_territories.c.territory_type_id,
-            territory_types_dict.c.name.label("territory_type_name"),
-            requested_recursive_territories.c.parent_id,
-            territories_data_parents.c.name.label("parent_name"),
-            requested_recursive_territories.c.name,
-            requested_recursive_territories.c.level,
-            requested_recursive_territories.c.properties,
-            requested_recursive_territories.c.admin_center_id,
-            admin_centers.c.name.label("admin_center_name"),
-            requested_recursive_territories.c.target_city_type_id,
-            target_city_types_dict.c.name.label("target_city_type_name"),
-            target_city_types_dict.c.description.label("target_city_type_description"),
-            requested_recursive_territories.c.okato_code,
-            requested_recursive_territories.c.oktmo_code,
-            requested_recursive_territories.c.is_city,
-            requested_recursive_territories.c.created_at,
-            requested_recursive_territories.c.updated_at,
-        )
-        .select_from(
-            requested_recursive_territories.join(
-                territory_types_dict,
-                territory_types_dict.c.territory_type_id == requested_recursive_territories.c.territory_type_id,
-            )
-            .outerjoin(
-                target_city_types_dict,
-                target_city_types_dict.c.target_city_type_id == requested_recursive_territories.c.target_city_type_id,
-            )
-            .outerjoin(
-                territories_data_parents,
-                territories_data_parents.c.territory_id == requested_recursive_territories.c.parent_id,
-            )
-            .outerjoin(admin_centers, admin_centers.c.territory_id == requested_recursive_territories.c.admin_center_id)
-        )
-        .order_by(requested_recursive_territories.c.territory_id)
-    )
-    statement_with_filters = statement.where(
-        requested_territories.c.is_city.is_(filters["cities_only"]),
-        requested_territories.c.name.ilike(f"%{filters['name']}%"),
-        func.date(requested_territories.c.created_at) == filters["created_at"],
-        requested_territories.c.territory_type_id == filters["territory_type_id"],
+    tree = TerritoriesTree(
+        1,
+        [
+            TerritoryWithoutGeometryDTO(**(territory | {"territory_id": parent_id, "parent_id": None})),
+            TerritoryWithoutGeometryDTO(**(territory | {"territory_id": 2, "parent_id": parent_id})),
+            TerritoryWithoutGeometryDTO(**(territory | {"territory_id": 3, "parent_id": 2, "is_city": False})),
+            TerritoryWithoutGeometryDTO(**(territory | {"territory_id": 4, "parent_id": parent_id, "name": "Other"})),
+        ],
     )
 
     # Act
@@ -625,7 +613,7 @@ async def test_get_territories_without_geometry_by_parent_id_from_db(mock_conn:
         mock_check_existence.return_value = False
         with pytest.raises(EntityNotFoundById):
             await get_territories_without_geometry_by_parent_id_from_db(
-                mock_conn, parent_id, False, **filters, paginate=False
+                mock_conn, parent_id, False, **filters, paginate=True
             )
 
     with patch("idu_api.urban_api.utils.pagination.verify_params") as mock_verify_params:
@@ -651,12 +639,29 @@ async def test_get_territories_without_geometry_by_parent_id_from_db(mock_conn:
                 mock_conn, parent_id, False, **filters, paginate=True
             )
 
-    await get_territories_without_geometry_by_parent_id_from_db(
-        mock_conn, parent_id, True, None, None, None, None, None, "asc", paginate=False
-    )
-    list_result = await get_territories_without_geometry_by_parent_id_from_db(
-        mock_conn, parent_id, False, **filters, paginate=False
-    )
+    with (
+        patch(
+            "idu_api.urban_api.logic.impl.helpers.territories_objects.get_territories_tree", new=AsyncMock()
+        ) as mock_get_territories_tree,
+        patch(
+            "idu_api.urban_api.logic.impl.helpers.territories_objects._get_day_bounds", new=AsyncMock()
+        ) as mock_get_day_bounds,
+    ):
+        mock_get_territories_tree.return_value = tree
+        mock_get_day_bounds.return_value = (
+            territory["created_at"] - timedelta(hours=1),
+            territory["created_at"] + timedelta(hours=1),
+        )
+        with pytest.raises(EntityNotFoundById):
+            await get_territories_without_geometry_by_parent_id_from_db(
+                mock_conn, 5, False, None, None, False, None, None, None, paginate=False
+            )
+        all_levels_result = await get_territories_without_geometry_by_parent_id_from_db(
+            mock_conn, parent_id, True, None, None, False, None, None, "desc", paginate=False
+        )
+        list_result = await get_territories_without_geometry_by_parent_id_from_db(
+            mock_conn, parent_id, False, **filters, paginate=False
+        )
 
     # Assert
     assert isinstance(page_result, PageDTO), "Result should be a PageDTO."
@@ -683,9 +688,10 @@ async def test_get_territories_without_geometry_by_parent_id_from_db(mock_conn:
     assert isinstance(
         TerritoryWithoutGeometry.from_dto(list_result[0]), TerritoryWithoutGeometry
     ), "Couldn't create pydantic model from DTO."
+    assert [item.territory_id for item in all_levels_result] == [4, 3, 2], "All levels should be returned."
+    assert [item.territory_id for item in list_result] == [2], "Only filtered children should be returned."
+    mock_get_day_bounds.assert_awaited_once_with(mock_conn, filters["created_at"])
     mock_conn.execute_mock.assert_any_call(str(statement))
-    mock_conn.execute_mock.assert_any_call(str(recursive_statement))
-    mock_conn.execute_mock.assert_any_call(str(statement_with_filters))
 
 
 @pytest.mark.asyncio
@@ -693,9 +699,18 @@ async def test_get_common_territory_for_geometry(mock_conn: MockConnection, shap
     """Test the get_common_territory_for_geometry function."""
 
     # Arrange
+    given_geometry = select(ST_GeomFromWKB(shapely_geometry.wkb, text(str(SRID))).label("geometry")).cte(
+        "given_geometry"
+    )
     statement = (
         select(territories_data.c.territory_id)
-        .where(func.ST_Covers(territories_data.c.geometry, ST_GeomFromWKB(shapely_geometry.wkb, text(str(SRID)))))
+        .where(
+            territories_data.c.territory_id.in_(
+                intersecting_territories_ids(select(given_geometry.c.geometry).scalar_subquery())
+            ),
+            territories_data.c.geometry.op("~")(select(given_geometry.c.geometry).scalar_subquery()),
+            func.ST_Covers(territories_data.c.geometry, select(given_geometry.c.geometry).scalar_subquery()),
+        )
         .order_by(territories_data.c.level.desc())
         .limit(1)
     )
@@ -720,13 +735,13 @@ async def test_get_intersecting_territories_for_geometry(mock_conn: MockConnecti
         .where(territories_data.c.territory_id == parent_territory)
         .scalar_subquery()
     )
-    given_geometry = select(ST_GeomFromWKB(shapely_geometry.wkb, text(str(SRID)))).cte("given_geometry")
+    given_geometry = select(ST_GeomFromWKB(shapely_geometry.wkb, text(str(SRID))).label("geometry")).cte(
+        "given_geometry"
+    )
     statement = select(territories_data.c.territory_id).where(
         territories_data.c.level == level_subquery,
-        (
-            func.ST_Intersects(territories_data.c.geometry, select(given_geometry).scalar_subquery())
-            | func.ST_Covers(select(given_geometry).scalar_subquery(), territories_data.c.geometry)
-            | func.ST_Covers(territories_data.c.geometry, select(given_geometry).scalar_subquery())
+        territories_data.c.territory_id.in_(
+            intersecting_territories_ids(select(given_geometry.c.geometry).scalar_subquery())
         ),
     )
 
@@ -742,3 +757,58 @@ async def test_get_intersecting_territories_for_geometry(mock_conn: MockConnecti
     assert all(isinstance(item, TerritoryDTO) for item in result), "Each item should be a TerritoryDTO."
     assert isinstance(Territory.from_dto(result[0]), Territory), "Couldn't create pydantic model from DTO."
     mock_conn.execute_mock.assert_any_call(str(statement))
+
+
+@pytest.mark.asyncio
+async def test_get_territories_for_points_from_db(mock_conn: MockConnection):
+    """Test the get_territories_for_points_from_db function."""
+
+    # Arrange
+    territory = {
+        "territory_type_id": 1,
+        "territory_type_name": "mock_string",
+        "parent_name": None,
+        "name": "mock_string",
+        "properties": {},
+        "admin_center_id": None,
+        "admin_center_name": None,
+        "target_city_type_id": None,
+        "target_city_type_name": None,
+        "target_city_type_description": None,
+        "okato_code": None,
+        "oktmo_code": None,
+        "is_city": False,
+        "created_at": datetime.now(timezone.utc),
+        "updated_at": datetime.now(timezone.utc),
+    }
+    tree = TerritoriesTree(
+        1,
+        [
+            TerritoryWithoutGeometryDTO(**(territory | {"territory_id": 2, "parent_id": 1, "level": 2})),
+            TerritoryWithoutGeometryDTO(**(territory | {"territory_id": 1, "parent_id": None, "level": 1})),
+        ],
+    )
+    index = TerritoriesSpatialIndex(
+        1, np.array([1, 2]), np.array([Polygon([(0, 0), (0, 2), (2, 2), (2, 0)]), Point(1, 1).buffer(0.5)])
+    )
+    points = [(1, 1), (0.1, 0.1), (5, 5)]
+
+    # Act
+    with (
+        patch(
+            "idu_api.urban_api.logic.impl.helpers.territories_objects.get_territories_tree", new=AsyncMock()
+        ) as mock_get_territories_tree,
+        patch(
+            "idu_api.urban_api.logic.impl.helpers.territories_objects.get_territories_spatial_index", new=AsyncMock()
+        ) as mock_get_territories_spatial_index,
+    ):
+        mock_get_territories_tree.return_value = tree
+        mock_get_territories_spatial_index.return_value = index
+        result = await get_territories_for_points_from_db(mock_conn, points)
+
+    # Assert
+    assert [[t.territory_id for t in chain] for chain in result] == [
+        [1, 2],
+        [1],
+        [],
+    ], "Each point should be resolved to the chain of covering territories from the top level."
@@ -0,0 +1,69 @@
+"""Unit tests for territory-related services provision are defined here."""
+
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import func, select
+
+from idu_api.common.db.entities import tables_versions_data, territory_services_rollup_data
+from idu_api.urban_api.dto import ServiceProvisionDTO
+from idu_api.urban_api.exceptions.logic.common import EntityNotFoundById
+from idu_api.urban_api.logic.impl.helpers.territories_provision import (
+    PROVISION_SOURCE_TABLES,
+    _provision_cache,
+    get_services_provision_by_territory_id_from_db,
+)
+from idu_api.urban_api.schemas import ServiceProvision
+from tests.urban_api.helpers import MockConnection
+
+####################################################################################
+#                           Default use-case tests                                 #
+####################################################################################
+
+
+@pytest.mark.asyncio
+async def test_get_services_provision_by_territory_id_from_db(mock_conn: MockConnection):
+    """Test the get_services_provision_by_territory_id_from_db function."""
+
+    # Arrange
+    territory_id, level, year, service_type_id = 1, 1, 2024, None
+    version_statement = select(func.coalesce(func.sum(tables_versions_data.c.version), 0)).where(
+        tables_versions_data.c.table_name.in_(PROVISION_SOURCE_TABLES)
+    )
+    rollup_statement = select(
+        territory_services_rollup_data.c.territory_id,
+        territory_services_rollup_data.c.service_type_id,
+        territory_services_rollup_data.c.count,
+        territory_services_rollup_data.c.capacity,
+    ).where(
+        territory_services_rollup_data.c.territory_id.in_([territory_id]),
+        territory_services_rollup_data.c.service_type_id.in_([1]),
+    )
+    _provision_cache.clear()
+
+    # Act
+    with patch("idu_api.urban_api.logic.impl.helpers.territories_provision.check_existence") as mock_check_existence:
+        mock_check_existence.return_value = False
+        with pytest.raises(EntityNotFoundById):
+            await get_services_provision_by_territory_id_from_db(mock_conn, territory_id, level, year, service_type_id)
+    result = await get_services_provision_by_territory_id_from_db(mock_conn, territory_id, level, year, service_type_id)
+    calls_count = mock_conn.execute_mock.call_count
+    cached_result = await get_services_provision_by_territory_id_from_db(
+        mock_conn, territory_id, level, year, service_type_id
+    )
+
+    # Assert
+    assert isinstance(result, list), "Result should be a list."
+    assert all(isinstance(item, ServiceProvisionDTO) for item in result), "Each item should be a ServiceProvisionDTO."
+    assert all(
+        isinstance(ServiceProvision.from_dto(item), ServiceProvision) for item in result
+    ), "Couldn't create pydantic model from DTO."
+    assert len(result) == 1, "Provision should be calculated for one pair of territory and service type."
+    assert result[0].required_count == result[0].population / 1000, "Required count is calculated incorrectly."
+    assert result[0].provision == 1000.0, "Provision is calculated incorrectly."
+    assert cached_result is result, "Result should be taken from cache for the same source version."
+    assert (
+        mock_conn.execute_mock.call_count == calls_count + 2
+    ), "Only existence and version should be checked for cached result."
+    mock_conn.execute_mock.assert_any_call(str(version_statement))
+    mock_conn.execute_mock.assert_any_call(str(rollup_statement))
@@ -13,6 +13,7 @@ from idu_api.common.db.entities import (
     service_types_dict,
     services_data,
     territories_data,
+    territory_services_rollup_data,
     territory_types_dict,
     urban_functions_dict,
     urban_objects_data,
@@ -408,34 +409,31 @@ async def test_get_services_capacity_by_territory_id_from_db(mock_conn: MockConn
     level = 2
     service_type_id = 1
     territories_cte = (
-        select(territories_data.c.territory_id, territories_data.c.parent_id, territories_data.c.level)
+        select(territories_data.c.territory_id, territories_data.c.level)
         .where(territories_data.c.territory_id == territory_id)
         .cte(recursive=True)
     )
     territories_cte = territories_cte.union_all(
-        select(territories_data.c.territory_id, territories_data.c.parent_id, territories_data.c.level).where(
-            territories_data.c.parent_id == territories_cte.c.territory_id
+        select(territories_data.c.territory_id, territories_data.c.level).where(
+            territories_data.c.parent_id == territories_cte.c.territory_id,
+            territories_cte.c.level < level,
         )
     )
-    level_territories = select(territories_cte).where(territories_cte.c.level >= level).alias("level_territories")
     statement = (
         select(
-            level_territories.c.territory_id,
-            func.count(services_data.c.service_id).label("count"),
-            func.coalesce(func.sum(services_data.c.capacity), 0).label("capacity"),
+            territories_cte.c.territory_id,
+            func.coalesce(func.sum(territory_services_rollup_data.c.count), 0).label("count"),
+            func.coalesce(func.sum(territory_services_rollup_data.c.capacity), 0).label("capacity"),
         )
         .select_from(
-            level_territories.outerjoin(
-                object_geometries_data, level_territories.c.territory_id == object_geometries_data.c.territory_id
+            territories_cte.outerjoin(
+                territory_services_rollup_data,
+                (territories_cte.c.territory_id == territory_services_rollup_data.c.territory_id)
+                & (territory_services_rollup_data.c.service_type_id == service_type_id),
             )
-            .outerjoin(
-                urban_objects_data,
-                urban_objects_data.c.object_geometry_id == object_geometries_data.c.object_geometry_id,
-            )
-            .outerjoin(services_data, services_data.c.service_id == urban_objects_data.c.service_id)
         )
-        .group_by(level_territories.c.territory_id)
-        .where(services_data.c.service_type_id == service_type_id)
+        .where(territories_cte.c.level == level)
+        .group_by(territories_cte.c.territory_id)
     )
 
     # Act
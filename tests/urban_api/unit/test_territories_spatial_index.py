@@ -0,0 +1,62 @@
+"""Unit tests for territories spatial index are defined here."""
+
+import asyncio
+
+import numpy as np
+import pytest
+import shapely
+from sqlalchemy import func, select
+
+from idu_api.common.db.entities import territories_subdivided_data
+from idu_api.urban_api.logic.impl.helpers import territories_spatial_index
+from idu_api.urban_api.logic.impl.helpers.territories_spatial_index import (
+    TerritoriesSpatialIndex,
+    get_territories_spatial_index,
+)
+from tests.urban_api.helpers.connection import MockConnection
+
+####################################################################################
+#                           Default use-case tests                                 #
+####################################################################################
+
+
+def test_territories_spatial_index():
+    """Test the TerritoriesSpatialIndex class."""
+
+    # Arrange
+    territory_ids = np.array([1, 1, 2])
+    geometries = np.array([shapely.box(0, 0, 1, 1), shapely.box(1, 0, 2, 1), shapely.box(0, 0, 0.5, 0.5)])
+    points = shapely.points([(0.25, 0.25), (1, 0.5), (1.5, 0.5), (3, 3)])
+
+    # Act
+    index = TerritoriesSpatialIndex(1, territory_ids, geometries)
+    result = index.covering_territories_ids(points)
+
+    # Assert
+    assert len(index) == 3, "All pieces should be indexed."
+    assert result == [[1, 2], [1], [1], []], "Each point should be resolved to all territories covering it."
+
+
+@pytest.mark.asyncio
+async def test_get_territories_spatial_index(mock_conn: MockConnection, monkeypatch: pytest.MonkeyPatch):
+    """Test the get_territories_spatial_index function."""
+
+    # Arrange
+    monkeypatch.setattr(territories_spatial_index, "_territories_spatial_index", None)
+    statement = select(
+        territories_subdivided_data.c.territory_id,
+        func.ST_AsBinary(territories_subdivided_data.c.geometry).label("geometry"),
+    )
+
+    # Act
+    index, concurrent_index = await asyncio.gather(
+        get_territories_spatial_index(mock_conn), get_territories_spatial_index(mock_conn)
+    )
+    cached_index = await get_territories_spatial_index(mock_conn)
+
+    # Assert
+    assert isinstance(index, TerritoriesSpatialIndex), "Result should be a TerritoriesSpatialIndex."
+    assert concurrent_index is index, "Index should be built once for concurrent requests."
+    assert cached_index is index, "Index should not be rebuilt if territories were not changed."
+    mock_conn.execute_mock.assert_any_call(str(statement))
+    assert mock_conn.execute_mock.call_count == 4, "Territories pieces should be loaded only once."
@@ -0,0 +1,88 @@
+"""Unit tests for territories tree index are defined here."""
+
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import func, select
+
+from idu_api.common.db.entities import tables_versions_data
+from idu_api.urban_api.dto import TerritoryTreeWithoutGeometryDTO, TerritoryWithoutGeometryDTO
+from idu_api.urban_api.logic.impl.helpers import territories_tree
+from idu_api.urban_api.logic.impl.helpers.territories_tree import (
+    TERRITORIES_TREE_SOURCE_TABLES,
+    TerritoriesTree,
+    get_territories_tree,
+)
+from tests.urban_api.helpers.connection import MockConnection
+
+####################################################################################
+#                           Default use-case tests                                 #
+####################################################################################
+
+
+def _territory(territory_id: int, parent_id: int | None, level: int):
+    return TerritoryWithoutGeometryDTO(
+        territory_id=territory_id,
+        territory_type_id=1,
+        territory_type_name="mock_string",
+        parent_id=parent_id,
+        parent_name=None,
+        name=f"territory {territory_id}",
+        level=level,
+        properties={},
+        admin_center_id=None,
+        admin_center_name=None,
+        target_city_type_id=None,
+        target_city_type_name=None,
+        target_city_type_description=None,
+        okato_code=None,
+        oktmo_code=None,
+        is_city=False,
+        created_at=datetime.now(timezone.utc),
+        updated_at=datetime.now(timezone.utc),
+    )
+
+
+def test_territories_tree():
+    """Test the TerritoriesTree class."""
+
+    # Arrange
+    territories = [
+        _territory(5, 2, 3),
+        _territory(1, None, 1),
+        _territory(3, 1, 2),
+        _territory(2, 1, 2),
+        _territory(4, 2, 3),
+    ]
+
+    # Act
+    tree = TerritoriesTree(1, territories)
+
+    # Assert
+    assert len(tree) == 5 and 4 in tree and 6 not in tree, "All territories should be indexed."
+    assert [t.territory_id for t in tree.children(1)] == [2, 3], "Children should be ordered by identifier."
+    assert [t.territory_id for t in tree.descendants(None)] == [1, 2, 4, 5, 3], "Parents should go first."
+    hierarchy = tree.hierarchy(None)
+    assert isinstance(hierarchy[0], TerritoryTreeWithoutGeometryDTO), "Nodes should be tree DTOs."
+    assert [t.territory_id for t in hierarchy[0].children[0].children] == [4, 5], "Subtrees should be nested."
+
+
+@pytest.mark.asyncio
+async def test_get_territories_tree(mock_conn: MockConnection, monkeypatch: pytest.MonkeyPatch):
+    """Test the get_territories_tree function."""
+
+    # Arrange
+    monkeypatch.setattr(territories_tree, "_territories_tree", None)
+    version_statement = select(func.coalesce(func.sum(tables_versions_data.c.version), 0)).where(
+        tables_versions_data.c.table_name.in_(TERRITORIES_TREE_SOURCE_TABLES)
+    )
+
+    # Act
+    tree = await get_territories_tree(mock_conn)
+    cached_tree = await get_territories_tree(mock_conn)
+
+    # Assert
+    assert isinstance(tree, TerritoriesTree), "Result should be a TerritoriesTree."
+    assert cached_tree is tree, "Tree should not be reloaded if the source tables were not changed."
+    assert mock_conn.execute_mock.call_count == 3, "Territories should be loaded only once."
+    mock_conn.execute_mock.assert_any_call(str(version_statement))
@@ -0,0 +1,170 @@
+"""Unit tests for vector tiles are defined here."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy import BigInteger, String, cast, delete, exists, func, select
+
+from idu_api.common.db.entities import (
+    projects_functional_zones,
+    territories_data,
+    tiles_invalidations_data,
+)
+from idu_api.urban_api.logic.impl.helpers.tiles import (
+    TILES_INVALIDATIONS_TTL,
+    build_mvt_statement,
+    delete_outdated_tiles_invalidations_from_db,
+    get_scenario_tile_from_db,
+    get_tile_from_db,
+    get_tiles_invalidation_state_from_db,
+    tile_bounds,
+    tile_simplify_tolerance,
+)
+from idu_api.urban_api.logic.impl.helpers.utils import simplified_territory_geometry
+from idu_api.urban_api.utils.tiles_cache import CachedTile, TilesCache
+from tests.urban_api.helpers.connection import MockConnection
+
+####################################################################################
+#                           Default use-case tests                                 #
+####################################################################################
+
+
+def test_tile_simplify_tolerance():
+    """Test the tile_simplify_tolerance function."""
+
+    # Act
+    world = tile_simplify_tolerance(0)
+    city = tile_simplify_tolerance(9)
+    street = tile_simplify_tolerance(14)
+
+    # Assert
+    assert world == 0.01, "The largest tolerance should be used for the lowest zoom levels."
+    assert city == 0.0001, "Tolerance should not exceed the tile grid cell size."
+    assert street is None, "Geometry should not be simplified at high zoom levels."
+
+
+@pytest.mark.asyncio
+async def test_get_tile_from_db(mock_conn: MockConnection):
+    """Test the get_tile_from_db function."""
+
+    # Arrange
+    z, x, y = 2, 2, 1
+    features = select(
+        simplified_territory_geometry(territories_data, 0.01).label("geometry"),
+        territories_data.c.territory_id,
+        territories_data.c.name,
+        territories_data.c.territory_type_id,
+        territories_data.c.parent_id,
+        territories_data.c.level,
+        territories_data.c.is_city,
+    ).where(territories_data.c.geometry.intersects(tile_bounds(z, x, y)))
+    statement = build_mvt_statement(features, "territories", "territory_id", z, x, y)
+
+    # Act
+    await get_tile_from_db(mock_conn, "territories", z, x, y)
+    empty = await get_tile_from_db(mock_conn, "services", z, x, y)
+
+    # Assert
+    assert empty == b"", "Tile should be empty below the layer minimal zoom level."
+    mock_conn.execute_mock.assert_called_once_with(str(statement))
+
+
+@pytest.mark.asyncio
+async def test_get_scenario_tile_from_db(mock_conn: MockConnection):
+    """Test the get_scenario_tile_from_db function."""
+
+    # Arrange
+    scenario_id, z, x, y = 1, 14, 9572, 4760
+    features = select(
+        projects_functional_zones.c.geometry,
+        projects_functional_zones.c.functional_zone_id,
+        projects_functional_zones.c.functional_zone_type_id,
+        projects_functional_zones.c.name,
+        projects_functional_zones.c.year,
+        projects_functional_zones.c.source,
+    ).where(
+        projects_functional_zones.c.scenario_id == scenario_id,
+        projects_functional_zones.c.geometry.intersects(tile_bounds(z, x, y)),
+    )
+    statement = build_mvt_statement(features, "functional_zones", "functional_zone_id", z, x, y)
+
+    # Act
+    await get_scenario_tile_from_db(mock_conn, scenario_id, "functional_zones", z, x, y)
+
+    # Assert
+    mock_conn.execute_mock.assert_called_once_with(str(statement))
+
+
+@pytest.mark.asyncio
+async def test_get_tiles_invalidation_state_from_db(mock_conn: MockConnection):
+    """Test the get_tiles_invalidation_state_from_db function."""
+
+    # Arrange
+    tables, z, x, y, watermark = ("public.functional_zones_data",), 10, 598, 297, 1
+    current_watermark = cast(cast(func.pg_snapshot_xmin(func.pg_current_snapshot()), String), BigInteger).label(
+        "watermark"
+    )
+    is_stale = (
+        exists()
+        .where(
+            tiles_invalidations_data.c.transaction_id >= watermark,
+            tiles_invalidations_data.c.table_name.in_(tables),
+            tiles_invalidations_data.c.bbox.intersects(tile_bounds(z, x, y)),
+        )
+        .label("is_stale")
+    )
+    statement = select(current_watermark, is_stale)
+
+    # Act
+    _, not_cached_is_stale = await get_tiles_invalidation_state_from_db(mock_conn, tables, z, x, y, None)
+    mock_conn.execute_mock.reset_mock()
+    await get_tiles_invalidation_state_from_db(mock_conn, tables, z, x, y, watermark)
+
+    # Assert
+    assert not_cached_is_stale, "Tile without watermark should always be stale."
+    mock_conn.execute_mock.assert_called_once_with(str(statement))
+
+
+@pytest.mark.asyncio
+async def test_delete_outdated_tiles_invalidations_from_db(mock_conn: MockConnection):
+    """Test the delete_outdated_tiles_invalidations_from_db function."""
+
+    # Arrange
+    statement = delete(tiles_invalidations_data).where(
+        tiles_invalidations_data.c.created_at < func.now() - TILES_INVALIDATIONS_TTL
+    )
+
+    # Act
+    result = await delete_outdated_tiles_invalidations_from_db(mock_conn)
+
+    # Assert
+    assert isinstance(result, int), "Result should be an integer."
+    mock_conn.execute_mock.assert_called_once_with(str(statement))
+    mock_conn.commit_mock.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_tiles_cache():
+    """Test the TilesCache class."""
+
+    # Arrange
+    logger = AsyncMock()
+    storage = AsyncMock()
+    storage.load_tile.return_value = (b"stored", 3, 0.0)
+    cache = TilesCache(size=1, ttl=float("inf"), storage=storage)
+    expired_cache = TilesCache(size=1, ttl=0)
+
+    # Act
+    await cache.put("a", CachedTile(b"a", 1, 0.0), logger)
+    await cache.put("b", CachedTile(b"b", 2, 0.0), logger)
+    memory_hit = await cache.get("b", logger)
+    storage_hit = await cache.get("a", logger)
+    await expired_cache.put("a", CachedTile(b"a", 1, 0.0), logger)
+    expired = await expired_cache.get("a", logger)
+
+    # Assert
+    assert memory_hit == CachedTile(b"b", 2, 0.0), "Recently put tile should be returned from memory."
+    assert storage_hit == CachedTile(b"stored", 3, 0.0), "Evicted tile should be loaded from storage."
+    assert storage.save_tile.await_count == 2, "Every put tile should be saved to storage."
+    storage.load_tile.assert_awaited_once_with("a", logger)
+    assert expired is None, "Tile older than TTL should not be returned."
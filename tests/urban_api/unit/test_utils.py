@@ -4,21 +4,41 @@ from datetime import datetime, timezone
 from unittest.mock import AsyncMock, patch
 
 import pytest
-from geoalchemy2.functions import ST_GeomFromWKB, ST_Union
-from sqlalchemy import select, text
+from geoalchemy2 import Geography, Geometry
+from geoalchemy2.functions import ST_AsEWKB, ST_GeomFromWKB, ST_SimplifyPreserveTopology
+from sqlalchemy import Boolean, Float, Integer, cast, column, func, null, select, text
 from sqlalchemy.sql.selectable import CTE, ScalarSelect, Select
 
-from idu_api.common.db.entities import projects_data, scenarios_data, territories_data
-from idu_api.urban_api.dto import UserDTO
+from idu_api.common.db.entities import (
+    projects_context_buffers_data,
+    projects_context_cache_data,
+    projects_context_data,
+    projects_context_subdivided_data,
+    projects_data,
+    scenarios_data,
+    territories_data,
+    territories_simplified_data,
+    territories_subdivided_data,
+)
+from idu_api.urban_api.dto import ServiceTypeDTO, ServiceTypesHierarchyDTO, UserDTO
 from idu_api.urban_api.exceptions.logic.projects import NotAllowedInRegionalScenario
 from idu_api.urban_api.logic.impl.helpers.utils import (
     SRID,
     build_hierarchy,
     build_recursive_query,
+    build_types_hierarchy,
     check_existence,
+    distance_order,
     extract_values_from_model,
+    geometry_columns,
+    get_context_layer_cache,
     get_context_territories_geometry,
     include_child_territories_cte,
+    intersecting_territories_ids,
+    lod_geometry,
+    refresh_context_layers_caches,
+    simplified_territory_geometry,
+    within_distance,
 )
 from idu_api.urban_api.schemas import TerritoryPatch, TerritoryPost, TerritoryPut
 from tests.urban_api.helpers.connection import MockConnection, MockResult, MockRow
@@ -66,6 +86,86 @@ def test_build_recursive_query():
     assert str(result) == str(final_query), "Expected result not found."
 
 
+def test_geometry_columns():
+    """Test the geometry_columns function."""
+
+    # Arrange
+    expected_geometry = ST_AsEWKB(territories_data.c.geometry).label("geometry")
+    expected_centre_point = ST_AsEWKB(territories_data.c.centre_point).label("centre_point")
+
+    # Act
+    full = geometry_columns(territories_data)
+    centers = geometry_columns(territories_data, centers_only=True)
+    empty = geometry_columns(territories_data, with_geometry=False)
+    reduced = geometry_columns(territories_data, simplify_tolerance=0.01, precision=5)
+
+    # Assert
+    assert [str(col) for col in full] == [
+        str(expected_geometry),
+        str(expected_centre_point),
+    ], "Expected both geometry columns."
+    assert [str(col) for col in centers] == [
+        str(null().label("geometry")),
+        str(expected_centre_point),
+    ], "Geometry should not be selected if only centers are requested."
+    assert [str(col) for col in empty] == [
+        str(null().label("geometry")),
+        str(null().label("centre_point")),
+    ], "No geometry should be selected if it is not requested."
+    assert [col.name for col in empty] == ["geometry", "centre_point"], "Columns should keep their labels."
+    assert [str(col) for col in reduced] == [
+        str(ST_AsEWKB(lod_geometry(territories_data.c.geometry, 0.01, 5)).label("geometry")),
+        str(ST_AsEWKB(lod_geometry(territories_data.c.centre_point, precision=5)).label("centre_point")),
+    ], "Geometry should be simplified and both columns should be rounded."
+
+
+def test_lod_geometry():
+    """Test the lod_geometry function."""
+
+    # Arrange
+    column = territories_data.c.geometry
+    expected_simplified = ST_SimplifyPreserveTopology(column, 0.001)
+    expected_reduced = func.ST_ReducePrecision(expected_simplified, 10**-6)
+
+    # Act
+    unchanged = lod_geometry(column)
+    simplified = lod_geometry(column, simplify_tolerance=0.001)
+    reduced = lod_geometry(column, simplify_tolerance=0.001, precision=6)
+
+    # Assert
+    assert unchanged is column, "Geometry should not be changed if no reduction is requested."
+    assert str(simplified) == str(expected_simplified), "Simplified geometry expression is different from expected."
+    assert str(reduced) == str(expected_reduced), "Reduced geometry expression is different from expected."
+
+
+def test_simplified_territory_geometry():
+    """Test the simplified_territory_geometry function."""
+
+    # Arrange
+    precomputed_tolerance = 0.001
+    other_tolerance = 0.005
+    expected_precomputed = func.coalesce(
+        select(territories_simplified_data.c.geometry)
+        .where(
+            territories_simplified_data.c.territory_id == territories_data.c.territory_id,
+            territories_simplified_data.c.tolerance == precomputed_tolerance,
+        )
+        .scalar_subquery(),
+        ST_SimplifyPreserveTopology(territories_data.c.geometry, precomputed_tolerance),
+    )
+    expected_on_the_fly = ST_SimplifyPreserveTopology(territories_data.c.geometry, other_tolerance)
+
+    # Act
+    not_requested = simplified_territory_geometry(territories_data, None)
+    precomputed = simplified_territory_geometry(territories_data, precomputed_tolerance)
+    on_the_fly = simplified_territory_geometry(territories_data, other_tolerance)
+
+    # Assert
+    assert not_requested is None, "Nothing should be returned if simplification is not requested."
+    assert str(precomputed) == str(expected_precomputed), "Precomputed geometry should be used for fixed tolerances."
+    assert str(on_the_fly) == str(expected_on_the_fly), "Geometry should be simplified on the fly for other tolerances."
+
+
 def test_include_child_territories_cte():
     """Test the include_child_territories_cte function."""
 
@@ -93,6 +193,48 @@ def test_include_child_territories_cte():
     assert str(result) == str(filtered_cte), "Expected result not found."
 
 
+def test_intersecting_territories_ids():
+    """Test the intersecting_territories_ids function."""
+
+    # Arrange
+    geometry = ST_GeomFromWKB(b"", text(str(SRID)))
+    expected_statement = (
+        select(territories_subdivided_data.c.territory_id)
+        .where(func.ST_Intersects(territories_subdivided_data.c.geometry, geometry))
+        .distinct()
+    )
+
+    # Act
+    result = intersecting_territories_ids(geometry)
+
+    # Assert
+    assert isinstance(result, Select), "Result should be a SQLAlchemy Select object."
+    assert str(result) == str(expected_statement), "Expected result not found."
+
+
+def test_within_distance_and_distance_order():
+    """Test the within_distance and distance_order functions."""
+
+    # Arrange
+    geometry = ST_GeomFromWKB(b"", text(str(SRID)))
+    column = territories_data.c.geometry
+    expected_intersects = func.ST_Intersects(column, geometry)
+    expected_dwithin = func.ST_DWithin(cast(column, Geography(srid=SRID)), cast(geometry, Geography(srid=SRID)), 100)
+    expected_order = cast(column, Geography(srid=SRID)).op("<->", return_type=Float)(
+        cast(geometry, Geography(srid=SRID))
+    )
+
+    # Act
+    intersects = within_distance(column, geometry, 0)
+    dwithin = within_distance(column, geometry, 100)
+    order = distance_order(column, geometry)
+
+    # Assert
+    assert str(intersects) == str(expected_intersects), "Zero distance should fall back to ST_Intersects."
+    assert str(dwithin) == str(expected_dwithin), "Expected ST_DWithin on geography not found."
+    assert str(order) == str(expected_order), "Expected KNN distance expression not found."
+
+
 def test_extract_values_from_model(
     territory_post_req: TerritoryPost,
     territory_put_req: TerritoryPut,
@@ -155,9 +297,12 @@ async def test_get_all_context_territories(mock_conn: MockConnection):
         .where(scenarios_data.c.scenario_id == 1)
     )
     unified_geometry = (
-        select(ST_Union(territories_data.c.geometry).label("geometry"))
-        .where(territories_data.c.territory_id.in_([1]))
-        .scalar_subquery()
+        select(projects_context_data.c.geometry).where(projects_context_data.c.project_id == 1).scalar_subquery()
+    )
+    context_pieces = (
+        select(projects_context_subdivided_data.c.geometry)
+        .where(projects_context_subdivided_data.c.project_id == 1)
+        .cte(name="context_pieces")
     )
 
     # Act
@@ -169,6 +314,7 @@ async def test_get_all_context_territories(mock_conn: MockConnection):
                 [
                     MockRow(
                         **{
+                            "project_id": 1,
                             "user_id": "mock_string",
                             "public": True,
                             "is_regional": False,
@@ -188,11 +334,93 @@ async def test_get_all_context_territories(mock_conn: MockConnection):
         result[1], ScalarSelect
     ), "The second item in result should be a ScalarSelect object (unified geometry)."
     assert str(result[1]) == str(unified_geometry), "The ScalarSelect should be a unified geometry."
-    assert isinstance(result[2], list), "The third item in result should be a list of context identifiers."
-    assert all(isinstance(idx, int) for idx in result[2]), "Each item in list of identifiers should be an integer."
+    assert isinstance(result[2], CTE), "The third item in result should be a CTE of subdivided context geometry."
+    assert str(result[2]) == str(context_pieces), "The CTE should select subdivided context geometry pieces."
     mock_conn.execute_mock.assert_any_call(str(statement))
 
 
+@pytest.mark.asyncio
+async def test_get_context_layer_cache():
+    """Test the get_context_layer_cache function."""
+
+    # Arrange
+    scenario_id, project_id = 1, 1
+    layer = "buffers"
+    cache = projects_context_cache_data
+    statement = (
+        select(
+            scenarios_data.c.project_id,
+            func.coalesce(
+                (cache.c.built_version == cache.c.version)
+                & cache.c.context_updated_at.is_not_distinct_from(projects_context_data.c.updated_at),
+                False,
+                type_=Boolean,
+            ).label("is_actual"),
+        )
+        .select_from(
+            scenarios_data.outerjoin(
+                projects_context_data, projects_context_data.c.project_id == scenarios_data.c.project_id
+            ).outerjoin(cache, (cache.c.project_id == scenarios_data.c.project_id) & (cache.c.layer == layer))
+        )
+        .where(scenarios_data.c.scenario_id == scenario_id)
+    )
+    cached_buffers = (
+        select(
+            projects_context_buffers_data.c.buffer_type_id,
+            projects_context_buffers_data.c.urban_object_id,
+            projects_context_buffers_data.c.geometry,
+        )
+        .where(projects_context_buffers_data.c.project_id == project_id)
+        .cte(name="context_buffers")
+    )
+    calculated_buffers = func.user_projects.calculate_project_context_buffers(project_id).table_valued(
+        column("buffer_type_id", Integer), column("urban_object_id", Integer), column("geometry", Geometry)
+    )
+    calculated_buffers = select(*calculated_buffers.c).cte(name="context_buffers")
+    actual_conn = MockConnection()
+    outdated_conn = MockConnection([MockResult([MockRow(project_id=project_id, is_actual=False)])])
+
+    # Act
+    with patch("idu_api.urban_api.logic.impl.helpers.utils._context_layers_refresh_requests", set()) as requests:
+        actual_result = await get_context_layer_cache(actual_conn, scenario_id, layer)
+        actual_requests = set(requests)
+        outdated_result = await get_context_layer_cache(outdated_conn, scenario_id, layer)
+
+    # Assert
+    assert isinstance(actual_result, CTE), "Result should be a CTE."
+    assert str(actual_result) == str(cached_buffers), "The CTE should select cached layer of the project."
+    assert str(outdated_result) == str(calculated_buffers), "Out of date layer should be calculated on the fly."
+    assert not actual_requests, "Actual layer should not be requested to be rebuilt."
+    assert requests == {(project_id, layer)}, "Out of date layer should be requested to be rebuilt."
+    actual_conn.execute_mock.assert_called_once_with(str(statement))
+    actual_conn.commit_mock.assert_not_called()
+    outdated_conn.commit_mock.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_refresh_context_layers_caches(mock_conn: MockConnection):
+    """Test the refresh_context_layers_caches function."""
+
+    # Arrange
+    requests = {(2, "functional_zones"), (1, "buffers")}
+    statements = [
+        select(func.user_projects.refresh_project_context_cache(project_id, layer, type_=Boolean))
+        for project_id, layer in sorted(requests)
+    ]
+
+    # Act
+    with patch("idu_api.urban_api.logic.impl.helpers.utils._context_layers_refresh_requests", requests):
+        result = await refresh_context_layers_caches(mock_conn)
+
+    # Assert
+    assert result == 2, "Result should be the number of rebuilt layers."
+    assert not requests, "Requests should be taken by the rebuild."
+    assert [call.args[0] for call in mock_conn.execute_mock.call_args_list] == [
+        str(statement) for statement in statements
+    ], "Requested layers should be rebuilt in order."
+    assert mock_conn.commit_mock.call_count == 2, "Every rebuilt layer should be committed."
+
+
 def test_build_hierarchy(sample_dtos, expected_hierarchy):
     """Test the build_hierarchy function."""
 
@@ -218,3 +446,44 @@ def test_build_hierarchy(sample_dtos, expected_hierarchy):
     expected_serialized = [serialize(item) for item in expected_result]
 
     assert actual_serialized == expected_serialized, "Hierarchy structure does not match expected result."
+
+
+def test_build_types_hierarchy():
+    """Test the build_types_hierarchy function."""
+
+    # Arrange
+    def urban_function(urban_function_id: int, parent_id: int | None) -> dict:
+        return {
+            "urban_function_id": urban_function_id,
+            "parent_id": parent_id,
+            "name": f"function {urban_function_id}",
+            "level": 1 if parent_id is None else 2,
+            "list_label": str(urban_function_id),
+            "code": str(urban_function_id),
+        }
+
+    def service_type(service_type_id: int, urban_function_id: int) -> ServiceTypeDTO:
+        return ServiceTypeDTO(
+            service_type_id=service_type_id,
+            urban_function_id=urban_function_id,
+            urban_function_name=f"function {urban_function_id}",
+            name=f"type {service_type_id}",
+            capacity_modeled=None,
+            code=str(service_type_id),
+            infrastructure_type=None,
+            properties={},
+        )
+
+    functions = [urban_function(1, None), urban_function(3, None), urban_function(2, 1)]
+    types = [service_type(1, 2), service_type(2, 1), service_type(3, 2)]
+    expected_result = [
+        ServiceTypesHierarchyDTO(
+            **functions[0], children=[ServiceTypesHierarchyDTO(**functions[2], children=types[::2])]
+        )
+    ]
+
+    # Act
+    result = build_types_hierarchy(functions, types, "urban_function_id", ServiceTypesHierarchyDTO)
+
+    # Assert
+    assert result == expected_result, "Functions without types should be skipped, child functions take precedence."